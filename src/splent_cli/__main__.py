@@ -1,7 +1,17 @@
-from splent_cli.cli import cli
+import sys
+
+from splent_cli.services import daemon
 
 
 def main():
+    # A running `splent daemon` answers without this process importing the
+    # CLI, its commands or the product's app. Checked before any of that.
+    code = daemon.forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    from splent_cli.cli import cli
+
     cli()
 
 
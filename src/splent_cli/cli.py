@@ -1,8 +1,10 @@
 import os
+import sys
 
 import click
 from dotenv import load_dotenv
 
+from splent_cli.utils import metrics, trace
 from splent_cli.utils.command_loader import load_commands
 
 load_dotenv()
@@ -88,6 +90,20 @@ class SPLENTCLI(click.Group):
 
     def invoke(self, ctx):
         cmd_name = ctx.protected_args[0] if ctx.protected_args else None
+        # A --help is not a run of the command; it would only drag its p50 down.
+        measured = None if "--help" in ctx.args else cmd_name
+        # The outer span of a --trace: everything the command does nests in it.
+        with (
+            metrics.timed(measured),
+            trace.span(
+                f"splent {cmd_name}" if cmd_name else "splent",
+                "command",
+                argv=" ".join(sys.argv[1:]),
+            ),
+        ):
+            return self._invoke(ctx, cmd_name)
+
+    def _invoke(self, ctx, cmd_name):
         command = self.get_command(ctx, cmd_name)
 
         if command and getattr(command, "requires_app", False):
@@ -136,13 +152,22 @@ class SPLENTCLI(click.Group):
             "🧰 Utilities": [
                 cmd
                 for cmd in all_cmds
-                if cmd.startswith(("clear:", "command:", "env:", "env"))
-                or cmd in ("doctor", "tokens:setup", "version")
+                if cmd.startswith(("clear:", "command:", "daemon", "env:", "env"))
+                or cmd
+                in ("batch", "doctor", "run-many", "stats", "tokens:setup", "version")
             ],
             "🐍 Development & QA": [
                 cmd
                 for cmd in all_cmds
-                if cmd in ("lint", "coverage", "selenium", "locust", "locust:stop")
+                if cmd
+                in (
+                    "lint",
+                    "coverage",
+                    "selenium",
+                    "locust",
+                    "locust:stop",
+                    "locust:compare",
+                )
             ],
             "🔌 Feature Commands": [cmd for cmd in all_cmds if cmd in feat_cmds],
         }
@@ -165,7 +190,23 @@ class SPLENTCLI(click.Group):
         formatter.write(f"\n  {total} commands available.\n")
 
 
+def _enable_trace(ctx, param, value):
+    if value:
+        trace.enable(value)
+
+
 @click.group(cls=SPLENTCLI)
+@click.option(
+    "--trace",
+    metavar="OUT.json",
+    envvar=trace.TRACE_ENV,
+    type=click.Path(dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=_enable_trace,
+    help="Record a Chrome trace of every subprocess and HTTP call to OUT.json "
+    "(open it in ui.perfetto.dev). Also SPLENT_TRACE.",
+)
 def cli():
     """Command-line interface for managing SPLENT products, features, environments, and development workflows."""
     pass
@@ -0,0 +1,175 @@
+import shlex
+
+import click
+
+from splent_cli.utils import metrics
+
+SEPARATOR = ";"
+
+
+def split_steps(args) -> list[list[str]]:
+    """``["db:upgrade", ";", "db:seed", "-y"]`` → one argv per command."""
+    steps, current = [], []
+    for arg in args:
+        if arg == SEPARATOR:
+            if current:
+                steps.append(current)
+            current = []
+        else:
+            current.append(arg)
+    if current:
+        steps.append(current)
+    return steps
+
+
+def _logical_lines(text: str):
+    """``(number, line)`` with ``\\`` continuations joined; ``number`` is the
+    physical line the command starts on, for error messages."""
+    start, parts = None, []
+    for number, line in enumerate(text.splitlines(), 1):
+        if start is None:
+            start = number
+        if line.endswith("\\"):
+            parts.append(line[:-1])
+            continue
+        parts.append(line)
+        yield start, " ".join(parts)
+        start, parts = None, []
+    if parts:
+        yield start, " ".join(parts)
+
+
+def _split_line(line: str) -> list[str]:
+    """Shell words, with ``;`` a word of its own even when nothing spaces it."""
+    lexer = shlex.shlex(line, posix=True, punctuation_chars=SEPARATOR)
+    lexer.whitespace_split = True
+    return list(lexer)
+
+
+def parse_script(text: str) -> list[list[str]]:
+    """One command per line, shell-quoted. ``#`` comments, blank lines and
+    ``\\`` continuations as in sh; ``;`` separates commands on one line."""
+    steps = []
+    for number, line in _logical_lines(text):
+        try:
+            args = _split_line(line)
+        except ValueError as exc:
+            raise click.ClickException(f"Line {number}: {exc}")
+        # A script may prefix its lines with the program name, as in sh.
+        for step in split_steps(args):
+            steps.append(step[1:] if step[0] == "splent" else step)
+    return [step for step in steps if step]
+
+
+def run_step(root: click.Command, argv: list[str]) -> int:
+    """Run one command line through the CLI group, in this process."""
+    try:
+        result = root.main(args=argv, prog_name="splent", standalone_mode=False)
+    except click.ClickException as exc:
+        exc.show()
+        return exc.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as exc:
+        return metrics.exit_code(exc)
+    # With standalone_mode off, ctx.exit(n) comes back as the return value.
+    return result if isinstance(result, int) else 0
+
+
+def run_steps(ctx: click.Context, steps: list[list[str]], keep_going: bool) -> None:
+    if not steps:
+        click.secho("ℹ️  Nothing to run.", fg="yellow")
+        return
+
+    root = ctx.find_root().command
+    failed = []
+    ran = 0
+    for argv in steps:
+        ran += 1
+        line = shlex.join(argv)
+        click.secho(f"\n▶ [{ran}/{len(steps)}] splent {line}", bold=True)
+        code = run_step(root, argv)
+        if code:
+            failed.append(code)
+            click.secho(f"❌ splent {line} failed (exit {code}).", fg="red")
+            if not keep_going:
+                break
+
+    click.echo()
+    if not failed:
+        click.secho(f"✅ {ran} command(s) ran.", fg="green")
+        return
+    skipped = len(steps) - ran
+    click.secho(
+        f"❌ {len(failed)} of {ran} command(s) failed"
+        + (f", {skipped} not run." if skipped else "."),
+        fg="red",
+    )
+    raise SystemExit(failed[0])
+
+
+@click.command(
+    "batch",
+    short_help="Run the splent commands in a file (or stdin) in one process.",
+)
+@click.argument("script", type=click.File("r"))
+@click.option(
+    "--keep-going",
+    "-k",
+    is_flag=True,
+    help="Run every command even after one fails.",
+)
+@click.pass_context
+def batch(ctx, script, keep_going):
+    """
+    Run a script of splent commands, one per line, in a single process.
+
+    Each `splent` call pays interpreter start-up, command loading and, for
+    commands that need the product, building the Flask app with every
+    feature. Here that happens once: the app is built by the first command
+    that needs it and shared by the rest.
+
+    SCRIPT is a file, or - for stdin. Lines are split as a shell would;
+    blank lines and # comments are skipped, and a leading `splent` is
+    optional. It stops at the first command that fails and exits with its
+    status, unless --keep-going.
+
+    \b
+      splent batch - <<'EOF'
+      db:upgrade
+      db:seed -y
+      EOF
+    """
+    run_steps(ctx, parse_script(script.read()), keep_going)
+
+
+@click.command(
+    "run-many",
+    short_help="Run several splent commands, separated by ';', in one process.",
+    context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False},
+)
+@click.option(
+    "--keep-going",
+    "-k",
+    is_flag=True,
+    help="Run every command even after one fails.",
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+@click.pass_context
+def run_many(ctx, keep_going, args):
+    """
+    Run splent commands one after the other in a single process.
+
+    Separate the commands with a quoted ';' so the shell passes it on:
+
+    \b
+      splent run-many db:upgrade ';' db:seed -y
+
+    Like batch: one start-up and one app for all of them, stopping at the
+    first failure unless --keep-going.
+    """
+    run_steps(ctx, split_steps(args), keep_going)
+
+
+cli_commands = [batch, run_many]
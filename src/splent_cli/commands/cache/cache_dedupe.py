@@ -0,0 +1,61 @@
+from splent_cli.services import context, cache_index
+from splent_cli.utils import blob_store
+import click
+
+
+@click.command(
+    "cache:dedupe",
+    short_help="Hardlink identical files across cached versions into one blob.",
+)
+def cache_dedupe():
+    """
+    Converts the versioned snapshots already in the cache to the
+    content-addressed blob store: every file identical to one in another
+    version (or another feature) becomes a hardlink to a single read-only
+    blob, then blobs no snapshot links any more are removed.
+
+    Editable cache entries are left alone, they are edited in place. Safe to
+    run again: files already linked are skipped. New snapshots are deduplicated
+    as they are cached when SPLENT_CACHE_DEDUPE=1 is set.
+    """
+    workspace = context.workspace()
+    index = cache_index.CacheIndex(workspace)
+    snapshots = [e for e in index.entries() if e["is_versioned"]]
+    if not snapshots:
+        index.save()
+        click.secho("ℹ️  No versioned snapshots in cache.", fg="yellow")
+        return
+
+    store = blob_store.store_path(workspace)
+    stats = blob_store.DedupeStats()
+    click.echo(f"Deduplicating {len(snapshots)} snapshot(s)...")
+    for entry in snapshots:
+        blob_store.dedupe_tree(entry["path"], store, stats)
+        if stats.unsupported:
+            break
+        # Sizes are shared out among the snapshots that link each blob, so
+        # every measured size changes; let the index measure them again.
+        index.remeasure(cache_index.entry_key(entry))
+    index.save()
+
+    if stats.unsupported:
+        click.secho(
+            "⚠️  This filesystem does not support hardlinks inside "
+            f"{store.parent}; deduplication stopped there.",
+            fg="yellow",
+        )
+
+    removed, freed = blob_store.gc(store)
+    click.secho(
+        f"🔗 {stats.linked} of {stats.files} file(s) now share a blob "
+        f"({cache_index.human_size(stats.bytes_saved)} saved).",
+        fg="green",
+    )
+    if removed:
+        click.secho(
+            f"🧹 Removed {removed} unused blob(s) ({cache_index.human_size(freed)}).",
+            fg="green",
+        )
+
+
+cli_command = cache_dedupe
@@ -1,65 +1,18 @@
-from splent_cli.services import context
+from splent_cli.services import context, cache_index
 import click
 from pathlib import Path
 
 
 def _get_cache_entries(cache_root: Path) -> list:
-    """Returns list of {namespace, name, version, is_versioned} dicts."""
-    entries = []
-    if not cache_root.exists():
-        return entries
-    for ns_dir in sorted(cache_root.iterdir()):
-        if not ns_dir.is_dir():
-            continue
-        for feat_dir in sorted(ns_dir.iterdir()):
-            if not feat_dir.is_dir():
-                continue
-            feat = feat_dir.name
-            if "@" in feat:
-                name, version = feat.split("@", 1)
-                entries.append(
-                    {
-                        "namespace": ns_dir.name,
-                        "name": name,
-                        "version": version,
-                        "is_versioned": True,
-                    }
-                )
-            else:
-                entries.append(
-                    {
-                        "namespace": ns_dir.name,
-                        "name": feat,
-                        "version": None,
-                        "is_versioned": False,
-                    }
-                )
-    return entries
+    """Returns list of {namespace, name, version, is_versioned, path} dicts."""
+    return cache_index.scan(cache_root)
 
 
 def _get_all_product_refs(workspace: Path) -> set:
     """Returns set of 'name' and 'name@version' (no namespace) from all products' pyproject.toml."""
-    import tomllib
-
     refs = set()
-    for product_dir in sorted(workspace.iterdir()):
-        if not product_dir.is_dir() or product_dir.name.startswith("."):
-            continue
-        pyproject = product_dir / "pyproject.toml"
-        if not pyproject.exists():
-            continue
-        try:
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
-            splent = data.get("tool", {}).get("splent", {})
-            feats = list(splent.get("features", []))
-            feats += list(splent.get("features_dev", []))
-            feats += list(splent.get("features_prod", []))
-            for entry in feats:
-                ref = entry.split("/", 1)[1] if "/" in entry else entry
-                refs.add(ref)
-        except (OSError, tomllib.TOMLDecodeError):
-            continue
+    for product_refs in cache_index.product_refs(workspace).values():
+        refs.update(product_refs)
     return refs
 
 
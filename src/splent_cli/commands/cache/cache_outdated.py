@@ -1,5 +1,4 @@
-from splent_cli.services import context
-import re
+from splent_cli.services import context, cache_index
 import click
 from pathlib import Path
 from collections import defaultdict
@@ -9,16 +8,9 @@ from packaging.version import Version, InvalidVersion
 def _get_cache_versions(cache_root: Path) -> dict:
     """Returns {name: [version, ...]} with all versioned snapshots in cache."""
     versions = defaultdict(list)
-    if not cache_root.exists():
-        return versions
-    for ns_dir in cache_root.iterdir():
-        if not ns_dir.is_dir():
-            continue
-        for feat_dir in ns_dir.iterdir():
-            if not feat_dir.is_dir() or "@" not in feat_dir.name:
-                continue
-            name, version = feat_dir.name.split("@", 1)
-            versions[name].append(version)
+    for entry in cache_index.scan(cache_root):
+        if entry["is_versioned"]:
+            versions[entry["name"]].append(entry["version"])
     return versions
 
 
@@ -37,32 +29,13 @@ def _latest(versions: list) -> str:
 def _get_product_features(workspace: Path) -> dict:
     """Returns {product_name: {feature_name: version_or_None}}."""
     products = {}
-    for product_dir in sorted(workspace.iterdir()):
-        if not product_dir.is_dir() or product_dir.name.startswith("."):
-            continue
-        pyproject = product_dir / "pyproject.toml"
-        if not pyproject.exists():
-            continue
-        content = pyproject.read_text()
-        m = re.search(
-            r"\[project\.optional-dependencies\].*?features\s*=\s*\[(.*?)\]",
-            content,
-            re.DOTALL,
-        )
-        if not m:
-            continue
+    for product, refs in cache_index.product_refs(workspace).items():
         features = {}
-        for raw in re.findall(r'"([^"]+)"|\'([^\']+)\'', m.group(1)):
-            ref = raw[0] or raw[1]
-            if "/" in ref:
-                ref = ref.split("/", 1)[1]
-            if "@" in ref:
-                name, version = ref.split("@", 1)
-                features[name] = version
-            else:
-                features[ref] = None
+        for ref in refs:
+            name, _, version = ref.partition("@")
+            features[name] = version or None
         if features:
-            products[product_dir.name] = features
+            products[product] = features
     return products
 
 
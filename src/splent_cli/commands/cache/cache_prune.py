@@ -1,115 +1,139 @@
-from splent_cli.services import context, compose
-import re
-import shutil
+from splent_cli.services import context, compose, cache_index
 import click
 from pathlib import Path
 
+from splent_cli.utils import blob_store
+from splent_cli.utils.cache_utils import git_mirror_path, rmtree_force
 
-def _get_cache_entries(cache_root: Path) -> list:
-    entries = []
-    if not cache_root.exists():
-        return entries
-    for ns_dir in sorted(cache_root.iterdir()):
-        if not ns_dir.is_dir():
-            continue
-        for feat_dir in sorted(ns_dir.iterdir()):
-            if not feat_dir.is_dir():
-                continue
-            feat = feat_dir.name
-            if "@" in feat:
-                name, version = feat.split("@", 1)
-                entries.append(
-                    {
-                        "namespace": ns_dir.name,
-                        "name": name,
-                        "version": version,
-                        "is_versioned": True,
-                        "path": feat_dir,
-                    }
-                )
-            else:
-                entries.append(
-                    {
-                        "namespace": ns_dir.name,
-                        "name": feat,
-                        "version": None,
-                        "is_versioned": False,
-                        "path": feat_dir,
-                    }
-                )
-    return entries
 
+def _label(e: dict) -> str:
+    if e["is_versioned"]:
+        return f"{e['namespace']}/{e['name']}@{e['version']}"
+    return f"{e['namespace']}/{e['name']}  (editable)"
 
-def _get_all_product_refs(workspace: Path) -> set:
-    refs = set()
-    for product_dir in sorted(workspace.iterdir()):
-        if not product_dir.is_dir() or product_dir.name.startswith("."):
-            continue
-        pyproject = product_dir / "pyproject.toml"
-        if not pyproject.exists():
-            continue
-        content = pyproject.read_text()
-        m = re.search(
-            r"\[project\.optional-dependencies\].*?features\s*=\s*\[(.*?)\]",
-            content,
-            re.DOTALL,
-        )
-        if not m:
-            continue
-        for raw in re.findall(r'"([^"]+)"|\'([^\']+)\'', m.group(1)):
-            ref = raw[0] or raw[1]
-            if "/" in ref:
-                ref = ref.split("/", 1)[1]
-            refs.add(ref)
-    return refs
+
+def _over_budget(entries: list, orphans: list, budget: int) -> tuple[list, int]:
+    """Least recently used orphans to evict until the cache fits ``budget``.
+
+    Entries a product references are never evicted, so the cache can stay
+    over budget; the second value is the size it ends up at.
+    """
+    total = sum(e["size"] for e in entries)
+    evict = []
+    for e in sorted(orphans, key=lambda e: e["last_used"]):
+        if total <= budget:
+            break
+        evict.append(e)
+        total -= e["size"]
+    return evict, total
+
+
+def _remove_unused_mirrors(workspace: Path, removed: list, remaining: list) -> None:
+    """Drop the git mirror of every repo that no longer has a cached version."""
+    still_cached = {(e["namespace"], e["name"]) for e in remaining}
+    for ns, name in {(e["namespace"], e["name"]) for e in removed}:
+        if (ns, name) not in still_cached:
+            rmtree_force(git_mirror_path(str(workspace), ns, name))
 
 
 @click.command(
     "cache:prune", short_help="Remove orphaned cache entries not used by any product."
 )
 @click.option("--yes", is_flag=True, help="Skip confirmation prompt.")
-def cache_prune(yes):
+@click.option(
+    "--max-size",
+    default=None,
+    metavar="SIZE",
+    help="Only evict unused entries, least recently used first, until the "
+    "cache fits in SIZE (e.g. 500M, 5G).",
+)
+def cache_prune(yes, max_size):
     """
     Removes cache entries that no product references in its pyproject.toml,
     then cleans up broken symlinks in products.
+
+    With --max-size the cache is treated as a bounded LRU instead: unreferenced
+    entries are evicted oldest-use first (as stamped by feature:clone,
+    product:resolve and feature:upgrade), and only as many as it takes to get
+    under the budget. Referenced entries are never evicted.
     """
+    budget = None
+    if max_size is not None:
+        try:
+            budget = cache_index.parse_size(max_size)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--max-size")
+
     workspace = context.workspace()
-    cache_root = workspace / ".splent_cache" / "features"
+    index = cache_index.CacheIndex(workspace)
 
-    entries = _get_cache_entries(cache_root)
+    entries = index.entries(sizes=budget is not None)
     if not entries:
+        index.save()
         click.secho("ℹ️  Feature cache is empty.", fg="yellow")
         return
 
-    refs = _get_all_product_refs(workspace)
+    refs = set()
+    for product_refs in index.product_refs().values():
+        refs.update(product_refs)
+
+    orphans = [e for e in entries if cache_index.entry_ref(e) not in refs]
 
-    orphans = [
-        e
-        for e in entries
-        if (f"{e['name']}@{e['version']}" if e["is_versioned"] else e["name"])
-        not in refs
-    ]
+    if budget is not None:
+        total = sum(e["size"] for e in entries)
+        orphans, final = _over_budget(entries, orphans, budget)
+        click.echo(
+            f"Cache: {cache_index.human_size(total)}, "
+            f"budget: {cache_index.human_size(budget)}."
+        )
+        if not orphans:
+            index.save()
+            if total <= budget:
+                click.secho("✅ Cache is within budget — nothing to evict.", fg="green")
+            else:
+                click.secho(
+                    "⚠️  Over budget, but every entry is used by a product.",
+                    fg="yellow",
+                )
+            return
+        if final > budget:
+            click.secho(
+                "⚠️  Evicting every unused entry still leaves the cache at "
+                f"{cache_index.human_size(final)}.",
+                fg="yellow",
+            )
 
     if not orphans:
+        index.save()
         click.secho("✅ Nothing to prune — no orphaned entries.", fg="green")
         return
 
-    click.secho(f"Orphaned entries to remove ({len(orphans)}):", fg="yellow")
-    for e in orphans:
-        label = (
-            f"{e['name']}@{e['version']}"
-            if e["is_versioned"]
-            else f"{e['name']}  (editable)"
+    if budget is not None:
+        click.secho(
+            f"Least recently used entries to evict ({len(orphans)}):", fg="yellow"
         )
-        click.echo(f"  - {e['namespace']}/{label}")
+        for e in orphans:
+            click.echo(f"  - {_label(e)}  {cache_index.human_size(e['size'])}")
+    else:
+        click.secho(f"Orphaned entries to remove ({len(orphans)}):", fg="yellow")
+        for e in orphans:
+            click.echo(f"  - {_label(e)}")
 
     click.echo()
     if not yes and not click.confirm("Remove all of the above?"):
+        index.save()
         click.echo("❎ Cancelled.")
         raise SystemExit(0)
 
     for e in orphans:
-        shutil.rmtree(e["path"])
+        rmtree_force(e["path"])
+        index.forget(cache_index.entry_key(e))
+    index.save()
+    removed_paths = {e["path"] for e in orphans}
+    _remove_unused_mirrors(
+        workspace, orphans, [e for e in entries if e["path"] not in removed_paths]
+    )
+    blob_store.gc(blob_store.store_path(workspace))
 
     click.secho(f"🧹 Pruned {len(orphans)} orphaned cache entry/entries.", fg="green")
 
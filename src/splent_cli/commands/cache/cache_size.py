@@ -1,54 +1,48 @@
-from splent_cli.services import context
+from splent_cli.services import context, cache_index
 import click
+from itertools import groupby
 from pathlib import Path
 
 
 def _dir_size(path: Path) -> int:
-    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return cache_index.dir_size(path)
 
 
 def _human(size: int) -> str:
-    for unit in ("B", "KB", "MB", "GB"):
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    return cache_index.human_size(size)
 
 
 @click.command("cache:size", short_help="Show disk usage of the feature cache.")
 def cache_size():
-    """Shows disk usage per namespace and feature entry in the cache."""
+    """Shows disk usage per namespace and feature entry in the cache.
+
+    Sizes of versioned entries come from the cache index (they are read-only,
+    so they are measured once); editable entries are measured every time.
+    """
     workspace = context.workspace()
-    cache_root = workspace / ".splent_cache" / "features"
+    index = cache_index.CacheIndex(workspace)
+    entries = index.entries(sizes=True)
+    index.save()
 
-    if not cache_root.exists():
+    if not entries:
         click.secho("ℹ️  Feature cache is empty.", fg="yellow")
         return
 
     total = 0
-    namespaces = sorted(d for d in cache_root.iterdir() if d.is_dir())
-
-    if not namespaces:
-        click.secho("ℹ️  Feature cache is empty.", fg="yellow")
-        return
-
-    for ns_dir in namespaces:
-        ns_size = _dir_size(ns_dir)
+    for namespace, group in groupby(entries, key=lambda e: e["namespace"]):
+        group = list(group)
+        ns_size = sum(e["size"] for e in group)
         total += ns_size
-        click.secho(f"  {ns_dir.name}  {_human(ns_size)}", bold=True)
+        click.secho(f"  {namespace}  {_human(ns_size)}", bold=True)
 
-        entries = sorted(d for d in ns_dir.iterdir() if d.is_dir())
-        for i, feat_dir in enumerate(entries):
-            size = _dir_size(feat_dir)
-            connector = "└──" if i == len(entries) - 1 else "├──"
-            name = feat_dir.name
+        for i, e in enumerate(group):
+            connector = "└──" if i == len(group) - 1 else "├──"
             label = (
-                click.style(f"@{name.split('@')[1]}", fg="green")
-                if "@" in name
+                click.style(f"@{e['version']}", fg="green")
+                if e["is_versioned"]
                 else click.style("editable", fg="blue")
             )
-            base = name.split("@")[0] if "@" in name else name
-            click.echo(f"    {connector} {base}  {label}  {_human(size)}")
+            click.echo(f"    {connector} {e['name']}  {label}  {_human(e['size'])}")
         click.echo()
 
     click.secho(f"  Total: {_human(total)}", fg="cyan", bold=True)
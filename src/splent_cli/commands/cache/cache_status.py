@@ -1,4 +1,4 @@
-from splent_cli.services import context
+from splent_cli.services import context, cache_index
 import click
 from pathlib import Path
 from collections import defaultdict
@@ -7,20 +7,8 @@ from collections import defaultdict
 def _get_cache_grouped(cache_root: Path) -> dict:
     """Returns {namespace/name: [version_or_None, ...]} from cache."""
     grouped = defaultdict(list)
-    if not cache_root.exists():
-        return grouped
-    for ns_dir in sorted(cache_root.iterdir()):
-        if not ns_dir.is_dir():
-            continue
-        for feat_dir in sorted(ns_dir.iterdir()):
-            if not feat_dir.is_dir():
-                continue
-            feat = feat_dir.name
-            if "@" in feat:
-                name, version = feat.split("@", 1)
-                grouped[f"{ns_dir.name}/{name}"].append(version)
-            else:
-                grouped[f"{ns_dir.name}/{feat}"].append(None)
+    for entry in cache_index.scan(cache_root):
+        grouped[f"{entry['namespace']}/{entry['name']}"].append(entry["version"])
     return grouped
 
 
@@ -1,5 +1,4 @@
-from splent_cli.services import context
-import re
+from splent_cli.services import context, cache_index
 import click
 from pathlib import Path
 from collections import defaultdict
@@ -8,25 +7,9 @@ from collections import defaultdict
 def _get_feature_usage(workspace: Path) -> dict:
     """Returns {feature_ref: [product_name, ...]} from all products' pyproject.toml."""
     usage = defaultdict(list)
-    for product_dir in sorted(workspace.iterdir()):
-        if not product_dir.is_dir() or product_dir.name.startswith("."):
-            continue
-        pyproject = product_dir / "pyproject.toml"
-        if not pyproject.exists():
-            continue
-        content = pyproject.read_text()
-        m = re.search(
-            r"\[project\.optional-dependencies\].*?features\s*=\s*\[(.*?)\]",
-            content,
-            re.DOTALL,
-        )
-        if not m:
-            continue
-        for raw in re.findall(r'"([^"]+)"|\'([^\']+)\'', m.group(1)):
-            ref = raw[0] or raw[1]
-            if "/" in ref:
-                ref = ref.split("/", 1)[1]
-            usage[ref].append(product_dir.name)
+    for product, refs in cache_index.product_refs(workspace).items():
+        for ref in refs:
+            usage[ref].append(product)
     return usage
 
 
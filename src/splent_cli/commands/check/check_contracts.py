@@ -14,49 +14,35 @@ the same reality from two sides. This check reports:
 from pathlib import Path
 
 import click
-import tomllib
 
 from splent_cli.services import context, marketplace, spl_store
+from splent_cli.services.feature_index import FeatureIndex, version_key
 
 
-def _snapshot_version_key(pyproject_path: Path) -> tuple:
-    """Semver sort key for a cache snapshot dir like splent_feature_x@v1.10.0."""
-    import re
-
-    _, _, version = pyproject_path.parent.name.partition("@")
-    m = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version)
-    if not m:
-        return (-1, -1, -1)
-    return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
-
-
-def _local_contract_requires(workspace: str, package: str) -> list[str] | None:
+def _local_contract_requires(
+    workspace: str, package: str, index: FeatureIndex | None = None
+) -> list[str] | None:
     """requires.features of a feature found locally (workspace root, else the
-    newest cache snapshot by semver). None when not available locally."""
-    candidates = [Path(workspace) / package / "pyproject.toml"]
-    cache = Path(workspace) / ".splent_cache" / "features"
-    if cache.is_dir():
-        candidates.extend(
-            sorted(
-                cache.glob(f"*/{package}@*/pyproject.toml"),
-                key=_snapshot_version_key,
-                reverse=True,
-            )
-        )
+    newest cache snapshot by semver). None when not available locally.
 
-    for path in candidates:
-        if not path.is_file():
+    A copy whose pyproject.toml does not parse is reported and passed over
+    for the next one, never read as a contract that requires nothing.
+    """
+    index = index or FeatureIndex(workspace)
+    found = index.lookup(package)
+    candidates = [r for r in found if r.source == "workspace"] + sorted(
+        (r for r in found if r.source == "cache" and r.version),
+        key=lambda r: version_key(r.version),
+        reverse=True,
+    )
+
+    for record in candidates:
+        if record.parse_error:
+            click.secho(f"  ⚠️  {record.parse_error}", fg="yellow")
             continue
-        try:
-            data = tomllib.loads(path.read_text())
-        except (OSError, tomllib.TOMLDecodeError):
+        if not record.raw:
             continue
-        requires = (
-            data.get("tool", {})
-            .get("splent", {})
-            .get("contract", {})
-            .get("requires", {})
-        )
+        requires = record.requires
         return {
             "features": requires.get("features", []),
             "optional": requires.get("features_optional", []),
@@ -118,6 +104,7 @@ def check_contracts(spl_name):
         click.echo("  Start one with: splent spl:create <name>")
         raise SystemExit(1)
 
+    index = FeatureIndex(workspace)
     total_errors = 0
     total_warnings = 0
 
@@ -153,7 +140,9 @@ def check_contracts(spl_name):
 
         contracts: dict[str, list[str] | None] = {}
         for short, meta in shorts.items():
-            contracts[short] = _local_contract_requires(workspace, meta["package"])
+            contracts[short] = _local_contract_requires(
+                workspace, meta["package"], index
+            )
 
         missing_local = sorted(s for s, req in contracts.items() if req is None)
 
@@ -19,19 +19,35 @@ exit non zero, because not knowing is not the same as being in sync.
 
 Every version comparison is done through services/registry.py, the single
 GitHub and PyPI boundary. This command reads, it never publishes.
+
+The lookups for all packages (tags, PyPI releases and GitHub Releases, plus
+the git process that reads each origin remote) are put in flight together on
+a thread pool and read back in package order, so a workspace of fifty
+packages costs about as long as its slowest repository, not the sum of all
+of them. Each host has its own concurrency cap and rate-limit backoff
+(services/host_gate.py): once GitHub says the token is out of requests, the
+remaining packages are reported as unanswered without asking again.
 """
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
 from splent_cli.services import context, registry, release_gate
+from splent_cli.services.host_gate import HostGate, resolved
 from splent_cli.services.release import extract_repo, read_project_name
 
 
 CORE_PACKAGES = ("splent_cli", "splent_framework")
 
+# Lookups allowed in flight per host, whatever --jobs says. GitHub counts an
+# anonymous token's requests per hour and punishes bursts with a secondary
+# limit; PyPI's JSON API is served from a CDN and takes more.
+GITHUB_CONCURRENCY = 4
+PYPI_CONCURRENCY = 8
+
 
 # ── Pure comparison, so the interesting part is testable ──────────────
 
@@ -137,6 +153,89 @@ def discover_packages(
     return found
 
 
+# ── Lookups ───────────────────────────────────────────────────────────
+
+
+def _snapshots(repos: list[str], token) -> dict:
+    """Tags and releases of every repo one GraphQL batch answers completely.
+
+    Needs a token, GraphQL has no anonymous access. A repo with more tags
+    than the batch holds is left out, as is everything when the batch fails:
+    those go through the REST lookups.
+    """
+    if not token or not repos:
+        return {}
+    try:
+        snapshots = registry.fetch_repo_snapshots(repos, token, releases=True)
+    except registry.RegistryError:
+        return {}
+    return {ref: snap for ref, snap in snapshots.items() if snap and snap.tags_complete}
+
+
+def _start_lookups(pool, packages, token) -> list[dict]:
+    """Put every channel lookup of every package in flight on ``pool``.
+
+    Returns one dict per package, in package order: ``channels`` and ``repo``
+    (or ``declaration_error``), and the futures ``tags``, ``pypi`` and
+    ``releases``, the last two None when the package does not publish there.
+    The origin remotes are read concurrently first (one git process each).
+    With a token, the GitHub side of every repo is then asked in GraphQL
+    batches, and only what the batches could not answer goes out over REST.
+    The registry lookups go through one :class:`HostGate` per host, so they
+    share a concurrency limit and a rate-limit backoff.
+    """
+    github = HostGate("api.github.com", GITHUB_CONCURRENCY)
+    pypi = HostGate("pypi.org", PYPI_CONCURRENCY)
+
+    repos = list(pool.map(_repo_of, [path for _, path in packages]))
+    snapshots = _snapshots([r for r in repos if r], token)
+
+    lookups: list[dict] = []
+    for (name, path), repo in zip(packages, repos):
+        pyproject = os.path.join(path, "pyproject.toml")
+        try:
+            channels = release_gate.declared_channels(pyproject)
+        except release_gate.ChannelDeclarationError as e:
+            lookups.append({"declaration_error": e})
+            continue
+        lookup = {"channels": channels, "repo": repo}
+        lookups.append(lookup)
+        if not repo:
+            continue
+
+        org, repo_name = repo.split("/", 1)
+        package = read_project_name(pyproject) or name
+        snapshot = snapshots.get(repo)
+        lookup["tags"] = (
+            resolved(registry.semver_sorted(snapshot.tags))
+            if snapshot
+            else pool.submit(
+                github.call,
+                registry.list_semver_tags,
+                org,
+                repo_name,
+                token,
+                quiet=False,
+            )
+        )
+        lookup["pypi"] = (
+            pool.submit(pypi.call, registry.pypi_versions, package, strict=True)
+            if release_gate.PYPI in channels
+            else None
+        )
+        # Asked at the same time as the tags rather than after them; the
+        # answer is only used when the repository turns out to have tags.
+        if release_gate.GITHUB not in channels:
+            lookup["releases"] = None
+        elif snapshot:
+            lookup["releases"] = resolved(snapshot.release_tags)
+        else:
+            lookup["releases"] = pool.submit(
+                github.call, registry.list_release_tags, org, repo_name, token
+            )
+    return lookups
+
+
 # ── Command ───────────────────────────────────────────────────────────
 
 
@@ -165,8 +264,20 @@ def discover_packages(
     default=False,
     help="Print only the packages that have a problem.",
 )
-def check_releases(only, include_core, include_products, divergent_only):
-    """Compare git tags against PyPI releases for the whole workspace."""
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=16,
+    show_default=True,
+    help="Lookups to run at once (each host is also capped on its own).",
+)
+def check_releases(only, include_core, include_products, divergent_only, jobs):
+    """Compare git tags against PyPI releases for the whole workspace.
+
+    The lookups for all packages run concurrently; the report is printed in
+    package order all the same.
+    """
     workspace = str(context.workspace())
     token = os.getenv("GITHUB_TOKEN")
 
@@ -202,105 +313,104 @@ def check_releases(only, include_core, include_products, divergent_only):
             return f"{channel} answered HTTP {e.status}"
         return f"{channel} could not be reached ({e})"
 
-    for name, path in packages:
-        pyproject = os.path.join(path, "pyproject.toml")
-        package = read_project_name(pyproject) or name
-        try:
-            channels = release_gate.declared_channels(pyproject)
-        except release_gate.ChannelDeclarationError as e:
-            unanswered.append((name, f"unreadable channel declaration, {e}"))
-            click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {e}")
-            continue
-        repo = _repo_of(path)
+    def _unanswered(name: str, reason: str) -> None:
+        unanswered.append((name, reason))
+        click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {reason}")
 
-        if not repo:
-            no_remote.append(name)
-            if not divergent_only:
-                click.echo(
-                    click.style("  [.] ", fg="bright_black")
-                    + f"{name}: no origin remote, nothing to compare"
-                )
-            continue
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        lookups = _start_lookups(pool, packages, token)
 
-        org, repo_name = repo.split("/", 1)
-        wants_pypi = release_gate.PYPI in channels
-        wants_github = release_gate.GITHUB in channels
+        # Every lookup is already in flight; the report is read back in
+        # package order, so the output does not depend on who answered first.
+        for name, lookup in zip((n for n, _ in packages), lookups):
+            if "declaration_error" in lookup:
+                e = lookup["declaration_error"]
+                unanswered.append((name, f"unreadable channel declaration, {e}"))
+                click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {e}")
+                continue
 
-        try:
-            tags = registry.list_semver_tags(org, repo_name, token, quiet=False)
-        except registry.RegistryError as e:
-            reason = _reason(e, "GitHub")
-            unanswered.append((name, reason))
-            click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {reason}")
-            continue
+            if not lookup["repo"]:
+                no_remote.append(name)
+                if not divergent_only:
+                    click.echo(
+                        click.style("  [.] ", fg="bright_black")
+                        + f"{name}: no origin remote, nothing to compare"
+                    )
+                continue
 
-        try:
-            pypi_versions = (
-                registry.pypi_versions(package, strict=True) if wants_pypi else []
-            )
-        except registry.RegistryError as e:
-            reason = _reason(e, "PyPI")
-            unanswered.append((name, reason))
-            click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {reason}")
-            continue
+            channels = lookup["channels"]
+            wants_pypi = release_gate.PYPI in channels
 
-        release_tags = None
-        if wants_github and tags:
             try:
-                release_tags = registry.list_release_tags(org, repo_name, token)
+                tags = lookup["tags"].result()
             except registry.RegistryError as e:
-                reason = _reason(e, "GitHub") + " when listing releases"
-                unanswered.append((name, reason))
-                click.echo(click.style("  [!] ", fg="yellow") + f"{name}: {reason}")
+                _unanswered(name, _reason(e, "GitHub"))
                 continue
 
-        buckets = compare_channels(tags, pypi_versions)
+            try:
+                pypi_versions = lookup["pypi"].result() if lookup["pypi"] else []
+            except registry.RegistryError as e:
+                _unanswered(name, _reason(e, "PyPI"))
+                continue
 
-        problems: list[str] = []
-        if wants_pypi and buckets["tag_only"]:
-            tag_not_on_pypi.append((name, buckets["tag_only"]))
-            problems.append(
-                f"{len(buckets['tag_only'])} tag(s) not on PyPI: "
-                + ", ".join(buckets["tag_only"][:6])
-                + (" ..." if len(buckets["tag_only"]) > 6 else "")
-            )
-        if wants_pypi and buckets["pypi_only"]:
-            pypi_not_tagged.append((name, buckets["pypi_only"]))
-            problems.append(
-                f"{len(buckets['pypi_only'])} PyPI release(s) with no tag: "
-                + ", ".join(buckets["pypi_only"][:6])
-                + (" ..." if len(buckets["pypi_only"]) > 6 else "")
-            )
+            release_tags = None
+            if lookup["releases"] and tags:
+                try:
+                    release_tags = lookup["releases"].result()
+                except registry.RegistryError as e:
+                    _unanswered(name, _reason(e, "GitHub") + " when listing releases")
+                    continue
 
-        if release_tags is not None:
-            missing = tags_without_release(tags, release_tags)
-            if missing:
-                tag_without_release.append((name, missing))
-                problems.append(
-                    f"{len(missing)} tag(s) with no GitHub release: "
-                    + ", ".join(missing[:6])
-                    + (" ..." if len(missing) > 6 else "")
-                )
+            buckets = compare_channels(tags, pypi_versions)
 
-        if problems:
-            click.echo(click.style("  [X] ", fg="red") + click.style(name, bold=True))
-            for problem in problems:
-                click.secho(f"      {problem}", fg="red")
-        elif not divergent_only:
-            if not wants_pypi:
-                click.echo(
-                    click.style("  [OK] ", fg="green")
-                    + f"{name}: github only by declaration, {len(tags)} tag(s)"
+            problems: list[str] = []
+            if wants_pypi and buckets["tag_only"]:
+                tag_not_on_pypi.append((name, buckets["tag_only"]))
+                problems.append(
+                    f"{len(buckets['tag_only'])} tag(s) not on PyPI: "
+                    + ", ".join(buckets["tag_only"][:6])
+                    + (" ..." if len(buckets["tag_only"]) > 6 else "")
                 )
-            elif not tags and not pypi_versions:
-                click.echo(
-                    click.style("  [.] ", fg="bright_black") + f"{name}: never released"
+            if wants_pypi and buckets["pypi_only"]:
+                pypi_not_tagged.append((name, buckets["pypi_only"]))
+                problems.append(
+                    f"{len(buckets['pypi_only'])} PyPI release(s) with no tag: "
+                    + ", ".join(buckets["pypi_only"][:6])
+                    + (" ..." if len(buckets["pypi_only"]) > 6 else "")
                 )
-            else:
+
+            if release_tags is not None:
+                missing = tags_without_release(tags, release_tags)
+                if missing:
+                    tag_without_release.append((name, missing))
+                    problems.append(
+                        f"{len(missing)} tag(s) with no GitHub release: "
+                        + ", ".join(missing[:6])
+                        + (" ..." if len(missing) > 6 else "")
+                    )
+
+            if problems:
                 click.echo(
-                    click.style("  [OK] ", fg="green")
-                    + f"{name}: {len(buckets['both'])} version(s) on both channels"
+                    click.style("  [X] ", fg="red") + click.style(name, bold=True)
                 )
+                for problem in problems:
+                    click.secho(f"      {problem}", fg="red")
+            elif not divergent_only:
+                if not wants_pypi:
+                    click.echo(
+                        click.style("  [OK] ", fg="green")
+                        + f"{name}: github only by declaration, {len(tags)} tag(s)"
+                    )
+                elif not tags and not pypi_versions:
+                    click.echo(
+                        click.style("  [.] ", fg="bright_black")
+                        + f"{name}: never released"
+                    )
+                else:
+                    click.echo(
+                        click.style("  [OK] ", fg="green")
+                        + f"{name}: {len(buckets['both'])} version(s) on both channels"
+                    )
 
     # ── Summary ───────────────────────────────────────────────────────
     click.echo()
@@ -0,0 +1,120 @@
+import os
+import subprocess
+import sys
+import time
+
+import click
+
+from splent_cli.services import context, daemon
+
+
+def _describe(status: dict) -> str:
+    uptime = int(time.time() - status.get("started", time.time()))
+    return (
+        f"pid {status.get('pid')}, product {status.get('product') or '(none)'}, "
+        f"up {uptime}s, {status.get('served', 0)} command(s) served"
+    )
+
+
+@click.command(
+    "daemon",
+    short_help="Keep a warm splent (commands and app loaded) for this product.",
+)
+@click.option(
+    "--foreground",
+    is_flag=True,
+    help="Serve in this terminal instead of detaching.",
+)
+@click.option(
+    "--timeout",
+    default=120,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Seconds to wait for a detached daemon to finish warming up.",
+)
+def daemon_start(foreground, timeout):
+    """
+    Start a resident splent for the workspace and the active product.
+
+    The daemon imports every command and builds the product's app once.
+    From then on `splent` hands each invocation to it over a Unix socket
+    under .splent_cache/daemon/ and the command answers in milliseconds;
+    the output still lands in your terminal. When the product's pyproject,
+    .env or any feature or CLI source changes, the daemon warms up again
+    and that one call runs the usual way.
+
+    With no daemon, or SPLENT_DAEMON=0, nothing changes.
+    """
+    workspace = str(context.workspace())
+    product = os.getenv("SPLENT_APP") or None
+
+    running = daemon.request(workspace, product, "status")
+    if running:
+        click.secho(f"ℹ️  A daemon is already running: {_describe(running)}.")
+        return
+
+    if foreground:
+        click.secho(
+            f"🔥 Warming up splent for {product or 'the workspace'}...", fg="cyan"
+        )
+        try:
+            daemon.serve(workspace, product)
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc))
+        except KeyboardInterrupt:
+            click.echo()
+        return
+
+    log = daemon.log_path(workspace, product)
+    os.makedirs(os.path.dirname(log), mode=0o700, exist_ok=True)
+    with open(log, "ab") as handle:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "splent_cli", "daemon", "--foreground"],
+            stdin=subprocess.DEVNULL,
+            stdout=handle,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = daemon.request(workspace, product, "status")
+        if status:
+            click.secho(f"✅ Daemon ready: {_describe(status)}.", fg="green")
+            return
+        if process.poll() is not None:
+            raise click.ClickException(
+                f"The daemon exited while warming up; see {log}."
+            )
+        time.sleep(0.2)
+    raise click.ClickException(
+        f"The daemon did not come up within {timeout}s; see {log}."
+    )
+
+
+@click.command("daemon:status", short_help="Show whether a splent daemon is running.")
+def daemon_status():
+    """Show the daemon serving this workspace and product, if any."""
+    workspace = str(context.workspace())
+    product = os.getenv("SPLENT_APP") or None
+    status = daemon.request(workspace, product, "status")
+    if not status:
+        click.secho("ℹ️  No daemon running. Start one with: splent daemon")
+        return
+    click.secho(f"✅ {_describe(status)}", fg="green")
+    click.echo(f"   Socket: {daemon.socket_path(workspace, product)}")
+
+
+@click.command("daemon:stop", short_help="Stop the splent daemon.")
+def daemon_stop():
+    """Stop the daemon serving this workspace and product."""
+    workspace = str(context.workspace())
+    product = os.getenv("SPLENT_APP") or None
+    reply = daemon.request(workspace, product, "stop")
+    if not reply:
+        click.secho("ℹ️  No daemon running.")
+        return
+    click.secho(f"🛑 Daemon {reply.get('pid')} stopped.", fg="green")
+
+
+cli_commands = [daemon_start, daemon_status, daemon_stop]
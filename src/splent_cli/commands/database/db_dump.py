@@ -7,7 +7,7 @@ import shutil
 import tempfile
 from datetime import datetime
 
-from splent_cli.services import context
+from splent_cli.services import context, parallel_dump
 from splent_cli.utils.proc import run, require_tool
 
 # A dump below this size cannot be a real database export (even an empty
@@ -21,6 +21,7 @@ MIN_DUMP_BYTES = 1024
 # shared by every product, so a prefix of just "dump" would make one product's
 # retention delete every other product's dumps. Retention only ever deletes
 # files matching this exact shape, so unrelated files are never touched.
+# Parallel dumps are directories named the same way, without the extension.
 _TIMESTAMP_RE = re.compile(r"_\d{8}_\d{6}$")
 
 
@@ -33,18 +34,71 @@ def _prune_old_dumps(directory, kept_basename, retention):
             stem = stem[: -len(ext)]
             break
     prefix = _TIMESTAMP_RE.sub("", stem)
-    pattern = re.compile(re.escape(prefix) + r"_\d{8}_\d{6}\.sql(\.gz)?")
-    candidates = [
-        os.path.join(directory, name)
-        for name in os.listdir(directory)
-        if pattern.fullmatch(name)
-    ]
+    file_pattern = re.compile(re.escape(prefix) + r"_\d{8}_\d{6}\.sql(\.gz)?")
+    dir_pattern = re.compile(re.escape(prefix) + r"_\d{8}_\d{6}")
+    candidates = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if file_pattern.fullmatch(name) and os.path.isfile(path):
+            candidates.append(path)
+        elif dir_pattern.fullmatch(name) and parallel_dump.is_dump_directory(path):
+            candidates.append(path)
     candidates.sort(key=os.path.getmtime, reverse=True)
     for stale in candidates[retention:]:
-        os.remove(stale)
+        if os.path.isdir(stale):
+            shutil.rmtree(stale)
+        else:
+            os.remove(stale)
         click.echo(click.style(f"Pruned old dump {os.path.basename(stale)}", dim=True))
 
 
+def _report_table(result, done, total):
+    click.echo(
+        f"  [{done}/{total}] {result.name}: {result.rows} rows, "
+        f"{result.bytes / 1e6:.1f} MB in {result.seconds:.1f}s "
+        f"({result.throughput / 1e6:.1f} MB/s)"
+    )
+
+
+def _dump_parallel(creds, directory, jobs):
+    """Write a parallel dump to ``directory`` and return its parent.
+
+    The dump is built in a hidden sibling directory and renamed into place
+    once the manifest is written, so ``directory`` either holds a complete
+    dump or does not exist. mkdtemp creates it 0700: the chunks carry every
+    password hash in the user table.
+    """
+    directory = directory.rstrip(os.sep)
+    if os.path.exists(directory):
+        raise click.ClickException(
+            f"'{directory}' already exists. A parallel dump writes a new "
+            "directory; choose another name or remove it first."
+        )
+    target_dir = os.path.dirname(os.path.abspath(directory)) or "."
+    tmp_dir = tempfile.mkdtemp(prefix=".db_dump_", dir=target_dir)
+    click.secho(
+        f"📦 Dumping {creds['MARIADB_DATABASE']} with {jobs} connections...",
+        fg="cyan",
+    )
+    try:
+        manifest = parallel_dump.dump_database(
+            creds, tmp_dir, jobs, on_table=_report_table
+        )
+        os.replace(tmp_dir, directory)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    rows = sum(t["rows"] for t in manifest["tables"].values())
+    click.echo(
+        click.style(
+            f"Database dump created successfully: {directory} "
+            f"({len(manifest['tables'])} tables, {rows} rows)",
+            fg="green",
+        )
+    )
+    return target_dir
+
+
 @click.command(
     "db:dump",
     short_help="Create a SQL dump of the MariaDB database.",
@@ -54,7 +108,10 @@ def _prune_old_dumps(directory, kept_basename, retention):
     "--gzip",
     "gzip_output",
     is_flag=True,
-    help="Compress the dump with gzip (the file gets a .sql.gz extension).",
+    help=(
+        "Compress the dump with gzip (the file gets a .sql.gz extension). "
+        "Not with --parallel, whose chunks are always compressed."
+    ),
 )
 @click.option(
     "--retention",
@@ -65,8 +122,25 @@ def _prune_old_dumps(directory, kept_basename, retention):
         "in the target directory. 0 keeps everything."
     ),
 )
+@click.option(
+    "--parallel",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Dump with N concurrent connections into a directory of compressed "
+        "per-table chunks. Restore it with db:restore DIRECTORY."
+    ),
+)
 @context.requires_product
-def db_dump(filename, gzip_output, retention):
+def db_dump(filename, gzip_output, retention, jobs):
+    if jobs and gzip_output:
+        raise click.UsageError(
+            "--gzip does not apply to --parallel: a parallel dump's per-table "
+            "chunks are always gzip-compressed. Drop --gzip."
+        )
+
     load_dotenv()
 
     mariadb_hostname = os.getenv("MARIADB_HOSTNAME")
@@ -88,6 +162,21 @@ def db_dump(filename, gzip_output, retention):
         click.secho(f"❌ Missing env vars: {', '.join(missing)}", fg="red")
         raise SystemExit(1)
 
+    if jobs:
+        creds = {
+            "MARIADB_HOSTNAME": mariadb_hostname,
+            "MARIADB_USER": mariadb_user,
+            "MARIADB_PASSWORD": mariadb_password,
+            "MARIADB_DATABASE": mariadb_database,
+        }
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"dump_{mariadb_database}_{timestamp}"
+        target_dir = _dump_parallel(creds, filename, jobs)
+        if retention:
+            _prune_old_dumps(target_dir, os.path.basename(filename), retention)
+        return
+
     # Generate default filename if not provided
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -9,7 +9,8 @@ from flask_migrate import upgrade as alembic_upgrade
 from sqlalchemy import text, MetaData
 
 from splent_cli.utils.decorators import requires_db
-from splent_cli.services import context
+from splent_cli.services import context, db_template
+from splent_cli.services.migration_graph import filesystem_head
 from splent_cli.utils.lifecycle import advance_state, resolve_feature_key_from_entry
 from splent_framework.db import db
 from splent_framework.managers.migration_manager import (
@@ -113,12 +114,24 @@ def _entry_lookup() -> dict:
 )
 @click.argument("feature_name", required=False)
 @click.option("-y", "--yes", is_flag=True, help="Confirm without prompting.")
+@click.option(
+    "--from-template",
+    is_flag=True,
+    help="Load the snapshot saved by 'db:seed --save-template' instead of "
+    "migrating, when no feature's migrations changed since.",
+)
 @context.requires_product
-def db_reset(feature_name, yes):
+def db_reset(feature_name, yes, from_template):
     """Reset the database.
 
     With no argument: drops ALL tables and re-applies every feature migration.
 
+    With --from-template: drops ALL tables and loads the product's template,
+    a migrated and seeded database saved by ``db:seed --save-template``, in
+    one bulk load. Migrations and seeders are skipped. When a feature's
+    migrations changed since the template was saved, the template no longer
+    matches the code and the reset migrates as usual.
+
     With FEATURE_NAME (e.g. ``db:reset projects``): drops only the tables that
     feature owns, clears their migration tracking, and re-applies that
     feature's migrations plus any feature that refines it — leaving every other
@@ -129,10 +142,15 @@ def db_reset(feature_name, yes):
     product_name = os.getenv("SPLENT_APP", "")
 
     if feature_name:
+        if from_template:
+            raise click.UsageError(
+                "--from-template resets the whole database; it cannot be "
+                "combined with FEATURE_NAME."
+            )
         _reset_one_feature(app, feature_name, yes, product_path, product_name)
         return
 
-    _reset_everything(app, yes, product_path, product_name)
+    _reset_everything(app, yes, product_path, product_name, from_template)
 
 
 def _reset_one_feature(app, feature_name, yes, product_path, product_name):
@@ -186,13 +204,7 @@ def _reset_one_feature(app, feature_name, yes, product_path, product_name):
     click.secho(f"\n🎉 Feature '{feature_full}' reset complete.", fg="green")
 
 
-def _reset_everything(app, yes, product_path, product_name):
-    if not yes and not click.confirm(
-        "⚠️  WARNING: This will DROP all tables and clear uploads. Are you sure?",
-        abort=True,
-    ):
-        return
-
+def _drop_all_tables():
     click.echo(click.style("🗑️  Dropping all tables...", fg="yellow"))
     try:
         with db.engine.begin() as conn:
@@ -219,6 +231,89 @@ def _reset_everything(app, yes, product_path, product_name):
         )
         raise SystemExit(1)
 
+
+def _current_template(product_name) -> bool:
+    """True when the product has a template that matches the migrations on disk."""
+    workspace = str(context.workspace())
+    meta = db_template.read_template(workspace, product_name)
+    if meta is None:
+        click.secho(
+            "⚠️  No template saved for this product "
+            "(create one with 'splent db:seed --save-template'). "
+            "Resetting with migrations.",
+            fg="yellow",
+        )
+        return False
+    heads = {
+        feat: filesystem_head(mdir)
+        for feat, mdir in MigrationManager.get_all_feature_migration_dirs().items()
+    }
+    changed = db_template.stale_features(meta, heads)
+    if changed:
+        click.secho(
+            f"⚠️  The template predates migration changes in: {', '.join(changed)}. "
+            "Resetting with migrations.",
+            fg="yellow",
+        )
+        return False
+    return True
+
+
+def _reset_from_template(product_path, product_name):
+    """Drop everything and load the template. Returns False if it could not."""
+    try:
+        creds = db_template.mariadb_credentials()
+    except click.ClickException as e:
+        click.secho(f"⚠️  {e.format_message()}. Resetting with migrations.", fg="yellow")
+        return False
+
+    _drop_all_tables()
+    click.echo(click.style("📦 Loading template...", fg="cyan"))
+    try:
+        db_template.load_template(str(context.workspace()), product_name, creds)
+    except click.ClickException as e:
+        click.secho(f"❌ Could not load the template: {e.format_message()}", fg="red")
+        click.secho(
+            "   The database is empty. Run 'splent db:reset' to migrate it again.",
+            fg="yellow",
+        )
+        raise SystemExit(1)
+
+    lookup = _entry_lookup()
+    for feat in MigrationManager.get_all_feature_migration_dirs():
+        info = lookup.get(feat)
+        if info:
+            key, ns, name, version = info
+            advance_state(
+                product_path,
+                product_name,
+                key,
+                to="migrated",
+                namespace=ns,
+                name=name,
+                version=version,
+            )
+    return True
+
+
+def _reset_everything(app, yes, product_path, product_name, from_template=False):
+    if not yes and not click.confirm(
+        "⚠️  WARNING: This will DROP all tables and clear uploads. Are you sure?",
+        abort=True,
+    ):
+        return
+
+    if from_template and _current_template(product_name):
+        if _reset_from_template(product_path, product_name):
+            # Uploads are kept: the template's rows may point at files the
+            # seeders wrote when the template was saved.
+            click.echo(
+                click.style("\n🎉 Database reset from template complete.", fg="green")
+            )
+            return
+
+    _drop_all_tables()
+
     click.echo(click.style("📋 Recreating splent_migrations table...", fg="cyan"))
     try:
         with db.engine.begin() as conn:
@@ -9,20 +9,81 @@ import click
 from datetime import datetime
 from dotenv import load_dotenv
 
-from splent_cli.services import context
+from splent_cli.services import context, parallel_dump
 from splent_cli.utils.proc import run
 
 
+def _report_table(result, done, total):
+    click.echo(
+        f"  [{done}/{total}] {result.name}: {result.rows} rows "
+        f"in {result.seconds:.1f}s ({result.throughput / 1e6:.1f} MB/s)"
+    )
+
+
+def _restore_parallel(creds, directory, jobs):
+    """Restore a parallel dump directory, backing up the live database first.
+
+    The safety-net backup is itself a parallel dump, so taking it costs as
+    little as the restore that follows, and it is restored the same way.
+    """
+    database = creds["MARIADB_DATABASE"]
+    # Fail on an unreadable or incomplete dump before touching anything.
+    parallel_dump.load_manifest(directory)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_dir = f"pre_restore_{database}_{timestamp}"
+    tmp_dir = tempfile.mkdtemp(prefix=".db_restore_", dir=".")
+    try:
+        parallel_dump.dump_database(creds, tmp_dir, jobs)
+        os.replace(tmp_dir, backup_dir)
+    except click.ClickException as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        click.secho(
+            f"❌ Could not create a pre-restore backup of '{database}' "
+            f"({e.format_message()}).\n"
+            "Aborting before overwriting the live database.",
+            fg="red",
+        )
+        raise SystemExit(1)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    click.secho(f"🛟 Pre-restore backup saved to: {backup_dir}", fg="cyan")
+
+    click.secho(f"📥 Restoring {database} with {jobs} loaders...", fg="cyan")
+    try:
+        parallel_dump.restore_database(creds, directory, jobs, on_table=_report_table)
+    except click.ClickException as e:
+        click.secho(f"❌ Error restoring database: {e.format_message()}", fg="red")
+        click.secho(
+            "The database may be in an inconsistent state. To roll back, restore "
+            f"the pre-restore backup:\n  splent db:restore {backup_dir} --yes",
+            fg="yellow",
+        )
+        raise SystemExit(1)
+    click.secho(f"✅ Database restored from: {directory}", fg="green")
+
+
 @click.command(
     "db:restore",
     short_help="Restore a MariaDB database from a SQL dump file.",
 )
 @click.argument("filename")
 @click.option("--yes", is_flag=True, help="Skip confirmation prompt.")
+@click.option(
+    "--parallel",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Concurrent loaders when FILENAME is a parallel dump directory.",
+)
 @context.requires_product
-def db_restore(filename, yes):
+def db_restore(filename, yes, jobs):
     """
-    Restore the database from FILENAME (a .sql or .sql.gz dump).
+    Restore the database from FILENAME (a .sql or .sql.gz dump, or a
+    directory written by 'db:dump --parallel').
 
     Reads connection credentials from the workspace .env file
     (MARIADB_HOSTNAME, MARIADB_USER, MARIADB_PASSWORD, MARIADB_DATABASE).
@@ -30,6 +91,7 @@ def db_restore(filename, yes):
     \b
     Example:
         splent db:restore dump_20250101_120000.sql
+        splent db:restore dump_mydb_20250101_120000 -j 8
     """
     load_dotenv()
 
@@ -66,6 +128,23 @@ def db_restore(filename, yes):
             click.echo("❎ Cancelled.")
             raise SystemExit(0)
 
+    if os.path.isdir(filename):
+        if not parallel_dump.is_dump_directory(filename):
+            click.secho(
+                f"❌ '{filename}' is a directory without a {parallel_dump.MANIFEST}; "
+                "it is not a dump written by 'db:dump --parallel'.",
+                fg="red",
+            )
+            raise SystemExit(1)
+        creds = {
+            "MARIADB_HOSTNAME": host,
+            "MARIADB_USER": user,
+            "MARIADB_PASSWORD": password,
+            "MARIADB_DATABASE": database,
+        }
+        _restore_parallel(creds, filename, jobs)
+        return
+
     env = {**os.environ, "MYSQL_PWD": password or ""}
 
     restore_path = filename
@@ -1,10 +1,12 @@
 import inspect
 import importlib
 import os
+import time
 import click
 
 from splent_cli.utils.decorators import requires_db
-from splent_cli.services import context
+from splent_cli.services import context, db_template, seeding
+from splent_cli.utils.db_utils import bulk_insert, truncate_data_tables
 from splent_cli.utils.feature_utils import (
     get_features_from_pyproject,
     normalize_namespace,
@@ -14,35 +16,54 @@ from splent_framework.managers.feature_order import FeatureLoadOrderResolver
 from splent_framework.utils.pyproject_reader import PyprojectReader
 
 
+def _product_uvl_path() -> str | None:
+    """The active product's UVL model, or None if it has none."""
+    splent_app = os.getenv("SPLENT_APP", "")
+    working_dir = os.getenv("WORKING_DIR", "/workspace")
+    if not splent_app:
+        return None
+    product_dir = os.path.join(working_dir, splent_app)
+
+    from splent_cli.services import spl_store
+
+    try:
+        # Offline on purpose: seeding must not depend on UVLHub being up.
+        uvl_path = spl_store.product_uvl(working_dir, splent_app)
+        if not uvl_path:
+            reader = PyprojectReader.for_product(product_dir)
+            uvl_file = reader.uvl_config.get("file")
+            if uvl_file:
+                uvl_path = os.path.join(product_dir, "uvl", uvl_file)
+        return uvl_path
+    except (OSError, KeyError, AttributeError):
+        return None
+
+
 def _resolve_feature_order(features_raw: list[str]) -> list[str]:
     """Return features in topological order using the product's UVL constraints.
 
     Falls back to the declared order in pyproject.toml if no UVL is available.
     """
-    splent_app = os.getenv("SPLENT_APP", "")
-    working_dir = os.getenv("WORKING_DIR", "/workspace")
-    product_dir = os.path.join(working_dir, splent_app) if splent_app else ""
+    return FeatureLoadOrderResolver().resolve(features_raw, _product_uvl_path())
 
-    uvl_path = None
-    if product_dir:
-        from splent_cli.services import spl_store
 
-        try:
-            # Offline on purpose: seeding must not depend on UVLHub being up.
-            uvl_path = spl_store.product_uvl(working_dir, splent_app)
-            if not uvl_path:
-                reader = PyprojectReader.for_product(product_dir)
-                uvl_file = reader.uvl_config.get("file")
-                if uvl_file:
-                    uvl_path = os.path.join(product_dir, "uvl", uvl_file)
-        except (OSError, KeyError, AttributeError):
-            pass
+def _requires_map() -> dict[str, list[str]]:
+    """{package: [packages it requires]} from the product's UVL, {} without one."""
+    from splent_cli.commands.feature.feature_order import _build_requires_map
 
-    return FeatureLoadOrderResolver().resolve(features_raw, uvl_path)
+    try:
+        return _build_requires_map(_product_uvl_path())
+    except Exception:
+        return {}
 
 
 def _collect_seeders(module_name):
-    """Import a module and return instances of its BaseSeeder subclasses."""
+    """Import a module and return instances of its BaseSeeder subclasses.
+
+    Each instance gets ``self.bulk_insert(Model, rows)`` (see
+    ``db_utils.bulk_insert``) unless its class already defines one, so a
+    seeder can insert thousands of rows without building an ORM object each.
+    """
     seeder_module = importlib.import_module(module_name)
     importlib.reload(seeder_module)
 
@@ -54,7 +75,10 @@ def _collect_seeders(module_name):
             and issubclass(obj, BaseSeeder)
             and obj is not BaseSeeder
         ):
-            found.append(obj())
+            seeder = obj()
+            if not hasattr(seeder, "bulk_insert"):
+                seeder.bulk_insert = bulk_insert
+            found.append(seeder)
     return found
 
 
@@ -87,7 +111,13 @@ def _product_seeders(specific_module=None):
         return []
 
 
-def get_installed_seeders(specific_module=None):
+def get_seeder_groups(specific_module=None) -> list[tuple[str, list]]:
+    """Seeders grouped by the package that ships them, in seeding order.
+
+    Features come in topological order; the product's own seeders come last,
+    as one group named after the product, once the shared content they build
+    on is in place.
+    """
     features_raw = get_features_from_pyproject()
     if not features_raw:
         click.echo(click.style("⚠️  No features found in pyproject.toml", fg="yellow"))
@@ -102,7 +132,7 @@ def get_installed_seeders(specific_module=None):
         for prefix in getattr(seeder, "replaces", ())
     )
 
-    seeders = []
+    groups = []
     for feature in ordered:
         # Handle "splent-io/splent_feature_auth@v1.0.0" → org_safe.base_name.seeders
         base_name = feature.split("@")[0]
@@ -125,7 +155,7 @@ def get_installed_seeders(specific_module=None):
             continue
 
         try:
-            seeders.extend(_collect_seeders(module_name))
+            found = _collect_seeders(module_name)
         except ModuleNotFoundError:
             # feature simply has no seeders.py
             continue
@@ -136,33 +166,116 @@ def get_installed_seeders(specific_module=None):
                 ),
                 err=True,
             )
+            continue
+        if found:
+            groups.append((base_name, found))
+
+    if product_seeders:
+        groups.append((os.getenv("SPLENT_APP", "product"), product_seeders))
+    return groups
 
-    # Feature order is already topological; the product seeds last, once the
-    # shared content it builds on is in place.
-    return seeders + product_seeders
+
+def get_installed_seeders(specific_module=None):
+    """Every seeder, flattened in seeding order."""
+    return [
+        seeder
+        for _, seeders in get_seeder_groups(specific_module)
+        for seeder in seeders
+    ]
+
+
+def _seeding_levels(groups: list[tuple[str, list]]) -> list[list[str]]:
+    """Levels of features that can seed concurrently; the product seeds alone, last.
+
+    Only the UVL's requires constraints say two features are independent.
+    Without any (no UVL, or one with no requires), nothing is known, so the
+    features seed one at a time in the declared order, as they always did.
+    """
+    product = os.getenv("SPLENT_APP", "")
+    features = [name for name, _ in groups if name != product]
+    requires = _requires_map()
+    if requires:
+        levels = seeding.dependency_levels(features, requires)
+    else:
+        levels = [[name] for name in features]
+    if any(name == product for name, _ in groups):
+        levels.append([product])
+    return levels
+
+
+def _isolated_runner():
+    """A ``run_group`` for seeding.run_levels that gives every feature its own
+    app context, and with it its own session and connection: a scoped session
+    is shared by everything in one app context, and a Session is not safe to
+    use from two threads."""
+    from flask import current_app
+    from splent_framework.db import db
+
+    app = current_app._get_current_object()
+
+    def run_group(feature, seeders):
+        with app.app_context():
+            try:
+                return seeding.run_seeders(feature, seeders)
+            finally:
+                db.session.remove()
+
+    return run_group
+
+
+def _report(timings):
+    from sqlalchemy.exc import IntegrityError
+
+    for t in timings:
+        if t.error is None:
+            click.echo(
+                click.style(f"✔ {t.name} completed in {t.seconds:.2f}s.", fg="blue")
+            )
+        elif isinstance(t.error, IntegrityError):
+            click.echo(
+                click.style(
+                    f"❌ {t.name}: duplicate data detected.\n"
+                    f"   The database already contains seeded data.\n"
+                    f"   Run: splent db:seed --reset",
+                    fg="red",
+                )
+            )
+        else:
+            click.echo(click.style(f"❌ Error in {t.name}: {t.error}", fg="red"))
 
 
 def _truncate_data():
-    """Delete all row data from feature tables, preserving schema and migrations."""
+    """Empty all feature tables, preserving schema and migrations."""
     from splent_framework.db import db
-    from sqlalchemy import text, MetaData
     from splent_framework.managers.migration_manager import SPLENT_MIGRATIONS_TABLE
 
-    skip_prefixes = ("alembic_",)
-    skip_names = (SPLENT_MIGRATIONS_TABLE,)
+    cleared = truncate_data_tables(db.engine, skip_names=(SPLENT_MIGRATIONS_TABLE,))
+    for name in cleared:
+        click.echo(click.style(f"  🗑️  Cleared {name}", fg="bright_black"))
 
-    meta = MetaData()
-    meta.reflect(bind=db.engine)
 
-    with db.engine.connect() as conn:
-        conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-        for table in reversed(meta.sorted_tables):
-            if table.name.startswith(skip_prefixes) or table.name in skip_names:
-                continue
-            conn.execute(table.delete())
-            click.echo(click.style(f"  🗑️  Cleared {table.name}", fg="bright_black"))
-        conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
-        conn.commit()
+def _save_template():
+    """Snapshot the freshly seeded database as the product's reset template."""
+    from splent_cli.services.migration_graph import filesystem_head
+    from splent_framework.managers.migration_manager import MigrationManager
+
+    workspace = str(context.workspace())
+    product = context.require_app()
+    heads = {
+        feat: filesystem_head(mdir)
+        for feat, mdir in MigrationManager.get_all_feature_migration_dirs().items()
+    }
+    path = db_template.save_template(
+        workspace, product, heads, db_template.mariadb_credentials()
+    )
+    click.echo(click.style(f"📸 Template saved: {path}", fg="cyan"))
+    click.echo(
+        click.style(
+            "   'splent db:reset --from-template' restores it while the "
+            "migrations stay as they are now.",
+            fg="bright_black",
+        )
+    )
 
 
 @requires_db
@@ -174,10 +287,26 @@ def _truncate_data():
     is_flag=True,
     help="Clear all data before seeding (keeps schema and migrations).",
 )
+@click.option(
+    "--save-template",
+    is_flag=True,
+    help="After seeding, snapshot the database so 'db:reset --from-template' "
+    "can restore it without migrating and seeding again.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Features seeded at the same time when the UVL's requires "
+    "constraints say they are independent. Without them, or with 1, features "
+    "seed one after another.",
+)
 @click.option("-y", "--yes", is_flag=True, help="Skip confirmation prompts.")
 @click.argument("module", required=False)
 @context.requires_product
-def db_seed(reset, yes, module):
+def db_seed(reset, save_template, jobs, yes, module):
     if reset:
         if yes or click.confirm(
             click.style(
@@ -193,47 +322,35 @@ def db_seed(reset, yes, module):
             click.echo(click.style("❌ Cancelled.", fg="yellow"))
             return
 
-    seeders = get_installed_seeders(specific_module=module)
-    if not seeders:
+    groups = get_seeder_groups(specific_module=module)
+    if not groups:
         click.echo(click.style("⚠️  No seeders found.", fg="yellow"))
         return
 
+    levels = _seeding_levels(groups)
     click.echo(
         click.style(
-            f"🌱 Seeding {'feature ' + module if module else 'all features'}...",
+            f"🌱 Seeding {'feature ' + module if module else 'all features'}"
+            f" ({len(levels)} level(s), up to {jobs} at a time)...",
             fg="green",
         )
     )
 
-    from sqlalchemy.exc import IntegrityError
+    started = time.monotonic()
+    timings = seeding.run_levels(
+        levels, dict(groups), _isolated_runner(), jobs, on_done=_report
+    )
 
-    success = True
-    for seeder in seeders:
-        try:
-            seeder.run()
-            click.echo(
-                click.style(f"✔ {seeder.__class__.__name__} completed.", fg="blue")
-            )
-        except IntegrityError:
-            click.echo(
-                click.style(
-                    f"❌ {seeder.__class__.__name__}: duplicate data detected.\n"
-                    f"   The database already contains seeded data.\n"
-                    f"   Run: splent db:seed --reset",
-                    fg="red",
-                )
-            )
-            success = False
-            break
-        except Exception as e:
-            click.echo(
-                click.style(f"❌ Error in {seeder.__class__.__name__}: {e}", fg="red")
+    if not any(t.error for t in timings):
+        click.echo(
+            click.style(
+                f"✅ Database successfully populated in "
+                f"{time.monotonic() - started:.1f}s.",
+                fg="green",
             )
-            success = False
-            break
-
-    if success:
-        click.echo(click.style("✅ Database successfully populated.", fg="green"))
+        )
+        if save_template:
+            _save_template()
 
 
 cli_command = db_seed
@@ -1,45 +1,23 @@
 import os
-import re
 
 import click
 from flask import current_app
 
 from splent_cli.utils.decorators import requires_db
-from splent_cli.services import context
+from splent_cli.services import context, migration_graph
 from splent_framework.managers.migration_manager import MigrationManager
 
 
-def _get_filesystem_head(mdir: str) -> str | None:
-    """Walk the migration chain on disk and return the head revision."""
-    versions_dir = os.path.join(mdir, "versions")
-    if not os.path.isdir(versions_dir):
-        return None
-
-    # Parse all migration files: revision + down_revision
-    revisions: dict[str, str | None] = {}  # {revision: down_revision}
-    for f in os.listdir(versions_dir):
-        if not f.endswith(".py"):
-            continue
-        path = os.path.join(versions_dir, f)
-        try:
-            with open(path, "r", encoding="utf-8") as fh:
-                content = fh.read()
-            rev_m = re.search(r"^revision\s*=\s*['\"](\w+)['\"]", content, re.MULTILINE)
-            down_m = re.search(
-                r"^down_revision\s*=\s*['\"](\w+)['\"]", content, re.MULTILINE
-            )
-            if rev_m:
-                revisions[rev_m.group(1)] = down_m.group(1) if down_m else None
-        except Exception:
-            continue
-
-    if not revisions:
-        return None
+def _behind(graph: migration_graph.RevisionGraph | None, db_rev: str | None) -> str:
+    """`` (N)``: how many revisions the database is from the head, when known.
 
-    # Head = revision that is not a down_revision of any other
-    all_down = set(v for v in revisions.values() if v)
-    heads = [r for r in revisions if r not in all_down]
-    return heads[0] if heads else None
+    Empty when the feature has no scripts, or when the database sits at a
+    revision the scripts do not have (counting from there would be a guess).
+    """
+    if graph is None or (db_rev is not None and db_rev not in graph.revisions):
+        return ""
+    count = len(graph.pending(db_rev))
+    return f" ({count})" if count else ""
 
 
 @requires_db
@@ -49,7 +27,10 @@ def _get_filesystem_head(mdir: str) -> str | None:
 )
 @context.requires_product
 def db_status():
-    """Show migration status: DB revision vs filesystem head for each feature."""
+    """Show migration status: DB revision vs filesystem head for each feature.
+
+    A feature behind its head shows how many revisions it has left to apply.
+    """
     app = current_app
 
     click.echo(click.style("\n📊 Migration Status\n", fg="cyan", bold=True))
@@ -87,6 +68,9 @@ def db_status():
         return
 
     db_revisions = {feat: rev for feat, rev in rows}
+    graphs = migration_graph.load_graphs(
+        dirs, migration_graph.cache_path_for(str(context.workspace()))
+    )
 
     col_feat = max(len(f) for f in all_features)
     col_feat = max(col_feat, len("Feature"))
@@ -101,8 +85,7 @@ def db_status():
     orphans = []
     for feat in sorted(all_features):
         db_rev = db_revisions.get(feat)
-        mdir = dirs.get(feat)
-        fs_head = _get_filesystem_head(mdir) if mdir else None
+        fs_head = graphs[feat].head if feat in graphs else None
 
         db_display = db_rev[:12] if db_rev else "—"
         fs_display = fs_head[:12] if fs_head else "—"
@@ -110,7 +93,9 @@ def db_status():
         if db_rev and fs_head and db_rev == fs_head:
             status = click.style("✔ synced", fg="green")
         elif db_rev and fs_head and db_rev != fs_head:
-            status = click.style("⚠ pending", fg="yellow")
+            status = click.style(
+                f"⚠ pending{_behind(graphs.get(feat), db_rev)}", fg="yellow"
+            )
             issues += 1
         elif db_rev and not fs_head and feat not in declared_features:
             # Feature has a DB entry but is no longer declared — orphan
@@ -120,7 +105,9 @@ def db_status():
             status = click.style("⚠ no files", fg="yellow")
             issues += 1
         elif not db_rev and fs_head:
-            status = click.style("⚠ not applied", fg="yellow")
+            status = click.style(
+                f"⚠ not applied{_behind(graphs.get(feat), None)}", fg="yellow"
+            )
             issues += 1
         else:
             status = click.style("— none", fg="bright_black")
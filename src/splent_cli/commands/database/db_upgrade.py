@@ -2,15 +2,19 @@ import contextlib
 import logging
 import os
 import re
+import time
 
 import click
 from flask import current_app
 from flask_migrate import upgrade as alembic_upgrade
 
 from splent_cli.utils.decorators import requires_db
-from splent_cli.services import context
+from splent_cli.services import context, migration_graph
 from splent_cli.utils.lifecycle import advance_state, resolve_feature_key_from_entry
-from splent_framework.managers.migration_manager import MigrationManager
+from splent_framework.managers.migration_manager import (
+    MigrationManager,
+    alembic_version_table,
+)
 from splent_framework.utils.feature_utils import get_features_from_pyproject
 from splent_framework.utils.path_utils import PathUtils
 
@@ -22,9 +26,6 @@ def _resolve_product():
     return product_path, product
 
 
-# Alembic revision ids as declared at the top of every migration script.
-_REVISION_RE = re.compile(r"^revision(?::\s*str)?\s*=\s*['\"]([^'\"]+)['\"]", re.M)
-
 # The error alembic raises when the database points at a script it cannot find.
 _MISSING_REVISION_RE = re.compile(r"[Cc]an't locate revision identified by '([^']+)'")
 
@@ -61,19 +62,62 @@ def _collect_alembic_errors():
 
 def _script_revisions(migrations_dir: str) -> set[str]:
     """Return every revision id shipped under <migrations_dir>/versions."""
-    versions_dir = os.path.join(migrations_dir, "versions")
-    revisions: set[str] = set()
-    if not os.path.isdir(versions_dir):
-        return revisions
-    for fname in sorted(os.listdir(versions_dir)):
-        if not fname.endswith(".py"):
-            continue
-        try:
-            with open(os.path.join(versions_dir, fname), encoding="utf-8") as f:
-                revisions.update(_REVISION_RE.findall(f.read()))
-        except OSError:
-            continue
-    return revisions
+    return set(migration_graph.load_graphs({"": migrations_dir})[""].revisions)
+
+
+def _db_revisions(app, features) -> dict[str, str | None]:
+    """Read every feature's alembic_<feature> revision over one connection.
+
+    Features whose table does not exist yet map to None. Returns an empty
+    dict when the database cannot be read this way at all, which leaves
+    every feature to Alembic exactly as before.
+    """
+    try:
+        from sqlalchemy import inspect, text
+
+        engine = app.extensions["migrate"].db.engine
+        with engine.connect() as conn:
+            tables = set(inspect(conn).get_table_names())
+            revisions: dict[str, str | None] = {}
+            for feat in features:
+                table = alembic_version_table(feat)
+                if table not in tables:
+                    revisions[feat] = None
+                    continue
+                row = conn.execute(text(f"SELECT version_num FROM `{table}`")).first()
+                revisions[feat] = row[0] if row else None
+            return revisions
+    except Exception:
+        return {}
+
+
+def _recorded_revisions(app) -> dict[str, str | None]:
+    """What splent_migrations says each feature is at, {} if unreadable."""
+    try:
+        return {feat: rev for feat, rev in MigrationManager.get_all_status(app)}
+    except Exception:
+        return {}
+
+
+def _dependency_order(features: list[str]) -> list[str]:
+    """Sort ``features`` so that the ones others build on come first.
+
+    Uses the product's UVL constraints, as seeding does. Features the model
+    says nothing about keep their declared order, after the ordered ones;
+    without a model the declared order is all there is, and the retry loop
+    in db:upgrade covers what it gets wrong.
+    """
+    try:
+        from splent_cli.commands.database.db_seed import _resolve_feature_order
+
+        ordered = _resolve_feature_order(get_features_from_pyproject() or [])
+    except Exception:
+        return features
+    rank: dict[str, int] = {}
+    for entry in ordered:
+        name = entry.split("@")[0].split("/")[-1]
+        rank.setdefault(name, len(rank))
+    return sorted(features, key=lambda f: rank.get(f, len(rank)))
 
 
 def _db_revision(app, feature: str) -> str | None:
@@ -168,6 +212,21 @@ def db_upgrade(feature):
     logging.getLogger("alembic").setLevel(logging.WARNING)
     logging.getLogger("alembic.runtime.migration").setLevel(logging.WARNING)
 
+    def _mark_migrated(feat: str) -> None:
+        """Advance the feature's lifecycle state to "migrated"."""
+        info = entry_lookup.get(feat)
+        if info:
+            key, ns, name, version = info
+            advance_state(
+                product_path,
+                product_name,
+                key,
+                to="migrated",
+                namespace=ns,
+                name=name,
+                version=version,
+            )
+
     def _upgrade_one(feat: str, mdir: str) -> str | None:
         """Run one feature's upgrade. Returns None on success, else the
         message that explains the failure (printed only when final)."""
@@ -188,20 +247,7 @@ def db_upgrade(feature):
             )
             MigrationManager.update_feature_status(app, feat, revision)
             click.echo(click.style(f"    {feat} -> {revision or 'head'}", fg="green"))
-
-            # Advance lifecycle state to "migrated"
-            info = entry_lookup.get(feat)
-            if info:
-                key, ns, name, version = info
-                advance_state(
-                    product_path,
-                    product_name,
-                    key,
-                    to="migrated",
-                    namespace=ns,
-                    name=name,
-                    version=version,
-                )
+            _mark_migrated(feat)
             return None
         except ImportError as e:
             if "models" in str(e):
@@ -211,14 +257,51 @@ def db_upgrade(feature):
         except Exception as e:
             return _diagnose_upgrade_failure(app, feat, mdir, e)
 
+    # Decide what needs Alembic at all before asking it anything. The
+    # revision graphs come from the cache, every feature's database revision
+    # comes from one connection, and a feature already at its head is done:
+    # no script directory, no env.py, no status write unless splent_migrations
+    # disagrees. On an entrypoint restart that is every feature.
+    started = time.monotonic()
+    graphs = migration_graph.load_graphs(
+        dirs, migration_graph.cache_path_for(str(context.workspace()))
+    )
+    db_revisions = _db_revisions(app, dirs)
+    current = [
+        feat
+        for feat in dirs
+        if feat in db_revisions and graphs[feat].is_current(db_revisions[feat])
+    ]
+    if current:
+        recorded = _recorded_revisions(app)
+        for feat in current:
+            if recorded.get(feat) != db_revisions[feat]:
+                MigrationManager.update_feature_status(app, feat, db_revisions[feat])
+            _mark_migrated(feat)
+
     # Features migrate one Alembic branch each, and a branch may create a
     # foreign key onto a table another feature's branch creates (slider and
-    # partners reference media_item). The declaration order in pyproject is
-    # not a dependency order, so on a fresh database the first pass can fail
-    # for the dependents and succeed for their dependencies. Whatever failed
-    # is retried while a pass still makes progress; only what fails when
-    # nothing else can move is reported.
-    pending = dict(dirs)
+    # partners reference media_item). The UVL order puts dependencies first
+    # when the product has a model; when it does not, or the model does not
+    # say, the first pass can fail for the dependents and succeed for their
+    # dependencies. Whatever failed is retried while a pass still makes
+    # progress; only what fails when nothing else can move is reported.
+    order = _dependency_order([feat for feat in dirs if feat not in current])
+    pending = {feat: dirs[feat] for feat in order}
+    if not pending:
+        click.echo(
+            click.style(
+                f"✅ {len(current)} feature(s) already at head "
+                f"({(time.monotonic() - started) * 1000:.0f} ms).",
+                fg="green",
+            )
+        )
+        return
+    if current:
+        click.echo(
+            click.style(f"    {len(current)} feature(s) already at head", dim=True)
+        )
+
     failures: dict[str, str] = {}
     while pending:
         failures = {}
@@ -1,9 +1,11 @@
 import os
 import re
 import shutil
+from dataclasses import dataclass
+
 import click
-from splent_cli.services import context, registry
-from splent_cli.utils.cache_utils import make_feature_readonly
+from splent_cli.services import cache_index, context, registry
+from splent_cli.utils.cache_utils import git_mirror_path, seal_feature
 from splent_cli.utils.feature_utils import normalize_namespace
 from splent_cli.utils.proc import require_tool
 
@@ -41,6 +43,66 @@ def _validate_identifier_part(value: str, label: str):
         )
 
 
+@dataclass
+class CloneResult:
+    """What clone_to_cache did, for the caller to report."""
+
+    ok: bool
+    path: str
+    used_url: str = ""
+    # The requested version does not exist and the default branch was cloned.
+    fell_back: bool = False
+    error: str = ""
+
+
+def clone_to_cache(
+    workspace: str, namespace: str, repo: str, version: str, *, quiet: bool = False
+) -> CloneResult:
+    """Clone <namespace>/<repo>@<version> into the workspace cache, read-only.
+
+    Prints nothing of its own (``quiet`` silences the transport fallback note
+    too), so it can run on a worker thread while the caller reports results.
+    A failed clone leaves no directory behind.
+    """
+    from splent_cli.utils.git_url import (
+        clone_shared,
+        CLONE_SUCCESS,
+        CLONE_REF_NOT_FOUND,
+    )
+
+    namespace_safe = normalize_namespace(namespace)
+    cache_dir = os.path.join(workspace, ".splent_cache", "features", namespace_safe)
+    os.makedirs(cache_dir, exist_ok=True)
+    local_path = os.path.join(cache_dir, f"{repo}@{version}")
+    mirror = git_mirror_path(workspace, namespace_safe, repo)
+
+    # Always try SSH first, then HTTPS (GITHUB_TOKEN if set, else anonymous). The
+    # transport is decided per repo from the real clone result (see
+    # git_url.clone), so a working SSH key that simply can't read THIS repo no
+    # longer blocks the HTTPS path. Versions are fetched into one mirror per
+    # repo, so a new version only downloads what the cached ones lack.
+    outcome, used_url, stderr = clone_shared(
+        namespace, repo, local_path, mirror, ref=version, quiet=quiet
+    )
+
+    # A genuinely missing tag/branch is the ONLY case where falling back to the
+    # default branch is correct (the repo itself was reachable).
+    fell_back = outcome == CLONE_REF_NOT_FOUND
+    if fell_back:
+        outcome, used_url, stderr = clone_shared(
+            namespace, repo, local_path, mirror, ref=None, quiet=quiet
+        )
+
+    if outcome != CLONE_SUCCESS:
+        shutil.rmtree(local_path, ignore_errors=True)
+        return CloneResult(False, local_path, fell_back=fell_back, error=stderr)
+
+    # Lock files as read-only to prevent accidental edits on pinned features
+    # (deduplicated into the blob store first, when that is enabled).
+    seal_feature(local_path)
+    return CloneResult(True, local_path, used_url=used_url, fell_back=fell_back)
+
+
 # =====================================================================
 # MAIN
 # =====================================================================
@@ -98,31 +160,17 @@ def feature_clone(full_name):
         "Install Git from https://git-scm.com/downloads and make sure it is on your PATH.",
     )
 
-    from splent_cli.utils.git_url import (
-        clone as git_clone,
-        CLONE_SUCCESS,
-        CLONE_REF_NOT_FOUND,
-    )
-
     click.secho(f"⬇️ Cloning {namespace}/{repo}@{version}", fg="cyan")
 
-    # Always try SSH first, then HTTPS (GITHUB_TOKEN if set, else anonymous). The
-    # transport is decided per repo from the real clone result (see
-    # git_url.clone), so a working SSH key that simply can't read THIS repo no
-    # longer blocks the HTTPS path.
-    outcome, used_url, stderr = git_clone(namespace, repo, local_path, ref=version)
+    result = clone_to_cache(workspace, namespace, repo, version)
 
-    # A genuinely missing tag/branch is the ONLY case where falling back to the
-    # default branch is correct (the repo itself was reachable).
-    if outcome == CLONE_REF_NOT_FOUND:
+    if result.fell_back:
         click.secho(
             f"⚠️ Version '{version}' not found. Cloning default branch instead.",
             fg="yellow",
         )
-        outcome, used_url, stderr = git_clone(namespace, repo, local_path, ref=None)
 
-    if outcome != CLONE_SUCCESS:
-        shutil.rmtree(local_path, ignore_errors=True)
+    if not result.ok:
         click.secho(
             f"❌ Repository '{namespace}/{repo}' not found or not accessible "
             "(tried SSH and HTTPS).",
@@ -134,15 +182,14 @@ def feature_clone(full_name):
             "read scope in your .env.",
             fg="red",
         )
-        if stderr:
-            click.secho(stderr, fg="red")
+        if result.error:
+            click.secho(result.error, fg="red")
         raise SystemExit(1)
 
-    # Lock files as read-only to prevent accidental edits on pinned features
-    make_feature_readonly(local_path)
-
+    cache_index.touch(workspace, [f"{namespace_safe}/{repo}@{version}"])
     click.secho(
-        f"✅ Feature '{namespace}/{repo}@{version}' cloned successfully ({used_url}).",
+        f"✅ Feature '{namespace}/{repo}@{version}' cloned successfully "
+        f"({result.used_url}).",
         fg="green",
     )
-    click.secho(f"🔒 Cached (read-only) at: {local_path}", fg="blue")
+    click.secho(f"🔒 Cached (read-only) at: {result.path}", fg="blue")
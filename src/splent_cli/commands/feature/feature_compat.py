@@ -11,6 +11,7 @@ import click
 from pathlib import Path
 
 from splent_cli.services import context
+from splent_cli.services.feature_index import FeatureIndex, FeatureRecord
 from splent_cli.utils.feature_utils import normalize_namespace
 from splent_cli.utils.io_utils import load_toml
 
@@ -75,11 +76,15 @@ def _read_contract(cache_path: Path) -> dict:
     """Read [tool.splent.contract] from a feature's pyproject.toml."""
     pyproject = cache_path / "pyproject.toml"
     if not pyproject.exists():
-        return {"description": "", "provides": {}, "requires": {}}
+        return _contract_shape({})
 
     data = load_toml(pyproject, what=f"pyproject.toml for {cache_path.name}")
 
-    raw = data.get("tool", {}).get("splent", {}).get("contract", {})
+    return _contract_shape(data.get("tool", {}).get("splent", {}).get("contract", {}))
+
+
+def _contract_shape(raw: dict) -> dict:
+    """The parts of a [tool.splent.contract] table the analysis compares."""
     return {
         "description": raw.get("description", ""),
         "provides": {
@@ -228,8 +233,9 @@ def _parse_pyproject_entry(entry: str) -> tuple[str, str, str | None]:
 
 def _resolve_all_product_features(
     product_dir: str, workspace: str
-) -> list[tuple[str, Path]]:
-    """Read all features from the product and resolve to (label, path)."""
+) -> list[tuple[str, FeatureRecord]]:
+    """Read all features from the product and resolve them in the workspace's
+    feature index, as (label, record)."""
     from splent_framework.utils.pyproject_reader import PyprojectReader
 
     try:
@@ -240,17 +246,18 @@ def _resolve_all_product_features(
     if not features_raw:
         raise SystemExit("  No features declared in pyproject.toml.")
 
+    index = FeatureIndex(workspace)
     resolved = []
     for entry in features_raw:
         ns, name, version = _parse_pyproject_entry(entry)
         label = f"{name}@{version}" if version else name
-        try:
-            path, _, _, _ = _resolve_feature(
-                f"{ns}/{name}@{version}" if version else f"{ns}/{name}", workspace
-            )
-            resolved.append((label, path))
-        except SystemExit:
+        record = index.find(name, namespace=ns, version=version)
+        if record is None:
             click.secho(f"  ⚠️  {label} not found — skipped.", fg="yellow")
+            continue
+        if record.parse_error:
+            raise click.ClickException(record.parse_error)
+        resolved.append((label, record))
 
     return resolved
 
@@ -381,12 +388,14 @@ def _analyse_all(labeled_contracts: list[tuple[str, dict]]) -> list[dict]:
 def run_all_product_check(workspace: str, product_dir: str) -> list[dict]:
     """Run the full product compatibility check. Returns findings list."""
     try:
-        labeled_paths = _resolve_all_product_features(product_dir, workspace)
+        labeled_records = _resolve_all_product_features(product_dir, workspace)
     except SystemExit:
         return []
-    if not labeled_paths:
+    if not labeled_records:
         return []
-    labeled_contracts = [(lbl, _read_contract(path)) for lbl, path in labeled_paths]
+    labeled_contracts = [
+        (lbl, _contract_shape(record.contract)) for lbl, record in labeled_records
+    ]
     return _analyse_all(labeled_contracts)
 
 
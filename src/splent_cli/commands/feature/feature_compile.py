@@ -6,6 +6,7 @@ import subprocess
 import click
 
 from splent_cli.services import compose, context
+from splent_cli.utils import asset_build
 from splent_cli.utils.proc import run
 from splent_cli.utils.feature_utils import (
     get_features_from_pyproject,
@@ -38,7 +39,24 @@ def _is_product_container() -> bool:
 @click.option("--watch", is_flag=True, help="Enable watch mode for development.")
 @click.option("--dev", "env_dev", is_flag=True, help="Use development environment.")
 @click.option("--prod", "env_prod", is_flag=True, help="Use production environment.")
-def feature_compile(feature_name, watch, env_dev, env_prod):
+@click.option(
+    "--per-feature",
+    is_flag=True,
+    help="Start one webpack (or watcher) per feature instead of one for all.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Rebuild features whose assets have not changed since the last build.",
+)
+def feature_compile(feature_name, watch, env_dev, env_prod, per_feature, force):
+    """Compile the webpack bundles of editable features.
+
+    Without a feature name every editable feature of the product is built in
+    one webpack process, and a feature whose assets/ tree is unchanged since
+    its last successful build is skipped. With --watch, that one process
+    keeps watching all of them and rebuilds only the bundle a change affects.
+    """
     production = os.getenv("FLASK_ENV", "develop") == "production" or env_prod
 
     features = (
@@ -75,10 +93,61 @@ def feature_compile(feature_name, watch, env_dev, env_prod):
                 f"No running container found for {product} ({env}) — run: splent product:up --{env}"
             )
 
+    if watch:
+        targets = []
+        for feature in features:
+            webpack_file = _resolve_webpack(feature, workspace, product)
+            if webpack_file:
+                targets.append((feature, webpack_file))
+        if len(targets) > 1 and not per_feature:
+            _watch_many(container_id, targets, production, workspace, product)
+            return
+        for feature, webpack_file in targets:
+            _run_webpack(
+                container_id,
+                feature,
+                webpack_file,
+                True,
+                production,
+                workspace,
+                product,
+            )
+        return
+
+    mode = "production" if production else "development"
+    stamps = {} if force else asset_build.load_stamps(workspace, product)
+    pending = []
     for feature in features:
-        _compile_in_container(
-            container_id, feature, watch, production, workspace, product
-        )
+        webpack_file = _resolve_webpack(feature, workspace, product)
+        if not webpack_file:
+            continue
+        digest = asset_build.tree_hash(asset_build.assets_root(webpack_file))
+        if asset_build.is_fresh(stamps, feature, mode, digest, webpack_file):
+            click.echo(
+                click.style(
+                    f"    {feature} unchanged since its last build, skipping.",
+                    fg="bright_black",
+                )
+            )
+            continue
+        pending.append((feature, webpack_file, digest))
+
+    if len(pending) > 1 and not per_feature:
+        built = _compile_many(container_id, pending, production, workspace, product)
+    else:
+        built = {}
+        for feature, webpack_file, digest in pending:
+            if _run_webpack(
+                container_id,
+                feature,
+                webpack_file,
+                False,
+                production,
+                workspace,
+                product,
+            ):
+                built[feature] = digest
+    asset_build.record_builds(workspace, product, mode, built)
 
 
 def _find_webpack(workspace, product, org_safe, base_name, version):
@@ -98,7 +167,8 @@ def _find_webpack(workspace, product, org_safe, base_name, version):
     return None
 
 
-def _compile_in_container(container_id, feature, watch, production, workspace, product):
+def _resolve_webpack(feature, workspace, product):
+    """webpack.config.js of an editable feature, or None (reported) to skip it."""
     parts = feature.split("/")
     if len(parts) == 2:
         org_raw, name_version = parts
@@ -118,7 +188,7 @@ def _compile_in_container(container_id, feature, watch, production, workspace, p
                 fg="bright_black",
             )
         )
-        return
+        return None
 
     webpack_file = _find_webpack(workspace, product, org_safe, base_name, version)
 
@@ -128,8 +198,28 @@ def _compile_in_container(container_id, feature, watch, production, workspace, p
                 f"⚠ No webpack.config.js found in {feature}, skipping...", fg="yellow"
             )
         )
-        return
+        return None
+    return webpack_file
+
 
+def _run_cmd(container_id, cd_cmd):
+    """The argv that runs *cd_cmd* where webpack lives, and a hint if it can't."""
+    # Inside a container: run webpack directly.
+    # From the host: run via `docker exec` so webpack uses the container's
+    # node_modules.
+    if container_id:
+        return (
+            ["docker", "exec", container_id, "bash", "-c", cd_cmd],
+            "Install Docker Desktop or Docker Engine: "
+            "https://docs.docker.com/get-docker/",
+        )
+    return ["bash", "-c", cd_cmd], "Install 'bash' and make sure it is on your PATH."
+
+
+def _run_webpack(
+    container_id, feature, webpack_file, watch, production, workspace, product
+):
+    """Build one feature. Returns True when webpack succeeded."""
     click.echo(click.style(f"🚀 Compiling {feature}...", fg="cyan"))
 
     mode = "production" if production else "development"
@@ -143,19 +233,7 @@ def _compile_in_container(container_id, feature, watch, production, workspace, p
 
     shell_cmd = " ".join(shlex.quote(p) for p in cmd_parts)
     cd_cmd = f"cd {shlex.quote(product_root)} && {shell_cmd}"
-
-    # Inside a container: run webpack directly.
-    # From the host: run via `docker exec` so webpack uses the container's
-    # node_modules.
-    if container_id:
-        run_cmd = ["docker", "exec", container_id, "bash", "-c", cd_cmd]
-        tool_hint = (
-            "Install Docker Desktop or Docker Engine: "
-            "https://docs.docker.com/get-docker/"
-        )
-    else:
-        run_cmd = ["bash", "-c", cd_cmd]
-        tool_hint = "Install 'bash' and make sure it is on your PATH."
+    run_cmd, tool_hint = _run_cmd(container_id, cd_cmd)
 
     if watch:
         try:
@@ -167,19 +245,111 @@ def _compile_in_container(container_id, feature, watch, production, workspace, p
                 f"'{run_cmd[0]}' is not installed or not on PATH.\n{tool_hint}"
             )
         click.echo(click.style(f"👀 Watching {feature} in {mode} mode...", fg="blue"))
-    else:
-        result = run(run_cmd, check=False, tool_hint=tool_hint)
-        if result.returncode != 0:
-            click.echo(
-                click.style(
-                    f"❌ Error compiling {feature}: webpack exited with "
-                    f"code {result.returncode}",
-                    fg="red",
-                )
+        return False
+
+    result = run(run_cmd, check=False, tool_hint=tool_hint)
+    if result.returncode != 0:
+        click.echo(
+            click.style(
+                f"❌ Error compiling {feature}: webpack exited with "
+                f"code {result.returncode}",
+                fg="red",
             )
-            return
+        )
+        return False
+    click.echo(
+        click.style(f"✅ Successfully compiled {feature} in {mode} mode!", fg="green")
+    )
+    return True
+
+
+def _multi_cmd(container_id, targets, production, watch, workspace, product):
+    """argv running one webpack over every ``(feature, webpack_file)``."""
+    mode = "production" if production else "development"
+    config = asset_build.write_multi_config(
+        workspace,
+        product,
+        [(feature.split("/")[-1], webpack_file) for feature, webpack_file in targets],
+        mode,
+    )
+    cmd_parts = ["npx", "webpack", "--config", str(config), "--mode", mode, "--color"]
+    if watch and not production:
+        cmd_parts.append("--watch")
+    if not production:
+        cmd_parts.append("--devtool=source-map")
+
+    product_root = os.path.join(workspace, product)
+    shell_cmd = " ".join(shlex.quote(p) for p in cmd_parts)
+    cd_cmd = f"cd {shlex.quote(product_root)} && {shell_cmd}"
+    return _run_cmd(container_id, cd_cmd)
+
+
+def _compile_many(container_id, pending, production, workspace, product):
+    """Build every ``(feature, webpack_file, digest)`` in one webpack process.
+
+    Returns ``{feature: digest}`` for what was built. webpack reports a
+    multi-compiler run as one exit code, so a failure records no feature as
+    built and every one of them is tried again next time.
+    """
+    mode = "production" if production else "development"
+    names = [feature for feature, _, _ in pending]
+    click.echo(
+        click.style(
+            f"🚀 Compiling {len(pending)} features in one webpack run: "
+            + ", ".join(names),
+            fg="cyan",
+        )
+    )
+
+    run_cmd, tool_hint = _multi_cmd(
+        container_id,
+        [(feature, webpack_file) for feature, webpack_file, _ in pending],
+        production,
+        False,
+        workspace,
+        product,
+    )
+    result = run(run_cmd, check=False, tool_hint=tool_hint)
+    if result.returncode != 0:
         click.echo(
             click.style(
-                f"✅ Successfully compiled {feature} in {mode} mode!", fg="green"
+                f"❌ Error compiling {', '.join(names)}: webpack exited with "
+                f"code {result.returncode}",
+                fg="red",
             )
         )
+        return {}
+    click.echo(
+        click.style(
+            f"✅ Successfully compiled {len(pending)} features in {mode} mode!",
+            fg="green",
+        )
+    )
+    return {feature: digest for feature, _, digest in pending}
+
+
+def _watch_many(container_id, targets, production, workspace, product):
+    """Watch every ``(feature, webpack_file)`` with a single webpack process.
+
+    One multi-compiler in watch mode keeps one Node process and one module
+    graph per feature in memory. A change under a feature's assets/ rebuilds
+    that feature's bundle alone, incrementally; the others are not touched.
+    """
+    mode = "production" if production else "development"
+    run_cmd, tool_hint = _multi_cmd(
+        container_id, targets, production, True, workspace, product
+    )
+    try:
+        subprocess.Popen(run_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        raise click.ClickException(
+            f"'{run_cmd[0]}' is not installed or not on PATH.\n{tool_hint}"
+        )
+    names = ", ".join(feature for feature, _ in targets)
+    click.echo(
+        click.style(
+            f"👀 Watching {len(targets)} features in one webpack process "
+            f"({mode} mode): {names}",
+            fg="blue",
+        )
+    )
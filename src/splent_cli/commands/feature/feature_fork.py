@@ -3,7 +3,7 @@ import time
 import click
 import requests
 from splent_cli.commands.feature.feature_clone import feature_clone
-from splent_cli.utils.cache_utils import make_feature_writable
+from splent_cli.utils.cache_utils import detach_shared_files, make_feature_writable
 from splent_cli.services import context
 from splent_cli.utils.feature_utils import normalize_namespace
 
@@ -105,5 +105,8 @@ def feature_fork(feature_name, version):
         workspace, ".splent_cache", "features", ns_safe, f"{feature_name}@{version}"
     )
     if os.path.exists(forked_path):
+        # Files shared with other cached versions get a copy of their own
+        # first, so editing the fork cannot change those versions.
+        detach_shared_files(forked_path)
         make_feature_writable(forked_path)
         click.secho("🔓 Fork unlocked for editing.", fg="green")
@@ -2,30 +2,18 @@
 splent feature:outdated
 
 Check if any pinned features have newer versions available on GitHub.
+
+The versions are resolved once, all at the same time, by the same planner
+feature:upgrade uses (services/upgrade_plan.py), and --upgrade applies that
+plan directly instead of asking GitHub again feature by feature.
 """
 
 import os
-import re
+from pathlib import Path
 
 import click
 
-from splent_cli.services import context, registry
-from splent_cli.utils.feature_utils import parse_feature_entry
-from splent_cli.utils.io_utils import load_toml
-from splent_cli.utils.proc import run
-
-
-def _fetch_latest_tag(namespace: str, repo: str) -> str | None:
-    """Fetch the latest semver tag from GitHub, sorted properly."""
-    tags = registry.list_semver_tags(
-        namespace, repo, token=registry.github_token(), limit=1
-    )
-    return tags[0] if tags else None
-
-
-def _parse_semver(tag: str) -> tuple[int, ...] | None:
-    m = re.match(r"v?(\d+)\.(\d+)\.(\d+)", tag)
-    return (int(m.group(1)), int(m.group(2)), int(m.group(3))) if m else None
+from splent_cli.services import context, registry, upgrade_plan
 
 
 @click.command(
@@ -37,8 +25,16 @@ def _parse_semver(tag: str) -> tuple[int, ...] | None:
     is_flag=True,
     help="Upgrade all outdated features to their latest version.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=upgrade_plan.DEFAULT_JOBS,
+    show_default=True,
+    help="Version lookups and clones to run at once.",
+)
 @context.requires_product
-def feature_outdated(upgrade):
+def feature_outdated(upgrade, jobs):
     """Compare pinned feature versions against the latest on GitHub.
 
     \b
@@ -48,24 +44,15 @@ def feature_outdated(upgrade):
     Use --upgrade to automatically update all outdated features:
       splent feature:outdated --upgrade
     """
-    workspace = str(context.workspace())
+    workspace = context.workspace()
     product = context.require_app()
-    pyproject_path = os.path.join(workspace, product, "pyproject.toml")
-
-    data = load_toml(pyproject_path, what="product pyproject.toml")
-
-    from splent_cli.utils.feature_utils import read_features_from_data
-
-    env = os.getenv("SPLENT_ENV")
-    features = read_features_from_data(data, env)
+    product_path = workspace / product
 
+    features = upgrade_plan.read_features(
+        Path(product_path, "pyproject.toml"), os.getenv("SPLENT_ENV")
+    )
     # Only pinned features (with @version)
-    pinned = []
-    for entry in features:
-        ns_safe, name, version = parse_feature_entry(entry)
-        if version:
-            ns_raw = entry.split("/", 1)[0] if "/" in entry else "splent-io"
-            pinned.append((ns_raw, ns_safe, name, version, entry))
+    pinned = [f for f in features if f["version"]]
 
     if not pinned:
         click.echo()
@@ -79,8 +66,10 @@ def feature_outdated(upgrade):
     click.echo(f"  Checking {len(pinned)} pinned feature(s) against GitHub...")
     click.echo()
 
+    plan = upgrade_plan.resolve(pinned, registry.github_token(), jobs=jobs)
+
     # Column widths
-    shorts = [n.removeprefix("splent_feature_") for _, _, n, _, _ in pinned]
+    shorts = [f["name"].removeprefix("splent_feature_") for f in pinned]
     col_name = max(len(s) for s in shorts)
     col_name = max(col_name, len("Feature"))
     col_ver = 12
@@ -90,25 +79,23 @@ def feature_outdated(upgrade):
     )
     click.echo(f"  {'-' * col_name}  {'-' * col_ver}  {'-' * col_ver}  {'-' * 12}")
 
-    to_upgrade = []
-    for ns_raw, ns_safe, name, current, entry in pinned:
-        short = name.removeprefix("splent_feature_")
-        latest = _fetch_latest_tag(ns_raw, name)
+    to_upgrade = plan.upgrades
+    upgrading = {u["name"] for u in to_upgrade}
+
+    for feat in pinned:
+        short = feat["name"].removeprefix("splent_feature_")
+        current = feat["version"]
+        latest = plan.latest.get(f"{feat['ns_github']}/{feat['name']}")
 
         if not latest:
             status = click.style("? unreachable", fg="yellow")
             latest_col = f"{'—':<{col_ver}}"
+        elif feat["name"] in upgrading:
+            status = click.style("⬆ update", fg="green", bold=True)
+            latest_col = f"{click.style(latest, fg='green'):<{col_ver + 9}}"
         else:
-            cur_sem = _parse_semver(current)
-            lat_sem = _parse_semver(latest)
-
-            if cur_sem and lat_sem and lat_sem > cur_sem:
-                status = click.style("⬆ update", fg="green", bold=True)
-                latest_col = f"{click.style(latest, fg='green'):<{col_ver + 9}}"
-                to_upgrade.append((ns_raw, name, latest))
-            else:
-                status = click.style("✔ latest", fg="bright_black")
-                latest_col = f"{latest:<{col_ver}}"
+            status = click.style("✔ latest", fg="bright_black")
+            latest_col = f"{latest:<{col_ver}}"
 
         click.echo(
             f"  {short:<{col_name}}  {current:<{col_ver}}  {latest_col}  {status}"
@@ -140,26 +127,23 @@ def feature_outdated(upgrade):
         click.echo()
         return
 
-    # Upgrade all outdated features via feature:upgrade --yes
+    # Apply the plan just shown: no second lookup, one pyproject rewrite.
     click.secho("  Upgrading...", bold=True)
     click.echo()
-    upgraded = 0
-    for ns_raw, name, version in to_upgrade:
-        short = name.removeprefix("splent_feature_")
-        click.echo(f"  ⬆  {short} → {version}")
-        result = run(
-            ["splent", "feature:upgrade", f"{ns_raw}/{name}", "--yes"],
-            check=False,
-        )
-        if result.returncode == 0:
-            upgraded += 1
-        else:
-            click.secho(f"  ❌ Failed to upgrade {short}", fg="red")
+    done, failed = upgrade_plan.apply(to_upgrade, product_path, workspace, jobs=jobs)
+    for u in done:
+        short = u["name"].removeprefix("splent_feature_")
+        click.echo(f"  ⬆  {short} → {u['latest']}")
+    for u, reason in failed:
+        short = u["name"].removeprefix("splent_feature_")
+        click.secho(f"  ❌ Failed to upgrade {short}: {reason}", fg="red")
 
     click.echo()
-    if upgraded:
-        click.secho(f"  ✅ Upgraded {upgraded} feature(s).", fg="green")
-        click.secho("  Run 'splent product:resolve' to update symlinks.", dim=True)
+    if done:
+        click.secho(f"  ✅ Upgraded {len(done)} feature(s).", fg="green")
+        click.secho(
+            "  Run 'splent product:resolve' to reinstall pip dependencies.", dim=True
+        )
     click.echo()
 
 
@@ -13,6 +13,7 @@ import tomllib
 import click
 
 from splent_cli.services import context
+from splent_cli.services.feature_index import FeatureIndex
 from splent_cli.utils.feature_utils import normalize_namespace, read_features_from_data
 from splent_cli.utils.io_utils import atomic_write, backup_file, load_toml
 
@@ -77,9 +78,12 @@ def _read_extensible_contract(feature_path: str) -> dict:
     if not os.path.isfile(pyproject):
         return {}
     data = load_toml(pyproject, what="feature pyproject.toml")
-    ext = (
+    return _extensible_shape(
         data.get("tool", {}).get("splent", {}).get("contract", {}).get("extensible", {})
     )
+
+
+def _extensible_shape(ext: dict) -> dict:
     return {
         "services": ext.get("services", []),
         "templates": ext.get("templates", []),
@@ -142,19 +146,34 @@ def _get_product_features(workspace: str, product: str) -> list[dict]:
     data = load_toml(pyproject, what="product pyproject.toml")
 
     features = read_features_from_data(data)
+    index = FeatureIndex(workspace)
     result = []
     for entry in features:
         # Parse name and detect pinned vs editable
-        raw_name = entry.split("/")[-1] if "/" in entry else entry
+        ns_raw, _, raw_name = entry.rpartition("/")
         pinned = "@" in raw_name
-        name = raw_name.split("@")[0]
+        name, _, version = raw_name.partition("@")
         short = name.replace("splent_feature_", "")
 
-        path = _resolve_feature_path(workspace, name, product)
-        if not path:
-            continue
-
-        ext = _read_extensible_contract(path)
+        # The index has the workspace root and the cache entry the product's
+        # symlink points to; anything else is looked up the slow way.
+        record = index.find(
+            name,
+            namespace=normalize_namespace(ns_raw) if ns_raw else None,
+            version=version or None,
+        )
+        if record is not None and (record.source == "workspace" or pinned):
+            path = str(record.path)
+            ext = (
+                _extensible_shape(record.contract.get("extensible", {}))
+                if record.raw
+                else {}
+            )
+        else:
+            path = _resolve_feature_path(workspace, name, product)
+            if not path:
+                continue
+            ext = _read_extensible_contract(path)
         has_extensible = (
             ext.get("services")
             or ext.get("templates")
@@ -14,6 +14,7 @@ from pathlib import Path
 
 from splent_cli.commands.feature.feature_attach import feature_attach
 from splent_cli.services import context, release, release_gate
+from splent_cli.services.feature_index import FeatureIndex
 from splent_cli.utils.archetype import detect_archetype
 from splent_cli.utils.feature_utils import normalize_namespace
 from splent_cli.utils.proc import run
@@ -438,13 +439,8 @@ def build_service_map(workspace: str) -> dict[str, str]:
         else:
             mapping[svc] = short
 
-    ws = Path(workspace)
-    pyprojects = list(ws.glob("splent_feature_*/pyproject.toml")) + list(
-        ws.glob(".splent_cache/features/*/*/pyproject.toml")
-    )
-    for py_path in pyprojects:
-        feature_dir = py_path.parent
-        dir_name = feature_dir.name.split("@", 1)[0]
+    for record in FeatureIndex(workspace).records():
+        dir_name = record.name
         if not dir_name.startswith("splent_feature_"):
             continue
         short = dir_name.removeprefix("splent_feature_")
@@ -452,22 +448,11 @@ def build_service_map(workspace: str) -> dict[str, str]:
         # Primary signal: register_service calls in the feature's __init__.py
         # (what service_proxy can actually resolve). The contract's
         # provides.services complements it for features without sources.
-        for init_path in feature_dir.glob(f"src/*/{dir_name}/__init__.py"):
+        for init_path in record.path.glob(f"src/*/{dir_name}/__init__.py"):
             for svc in _extract_registered_services(init_path):
                 _add(svc, short)
 
-        try:
-            data = tomllib.loads(py_path.read_text())
-        except (OSError, tomllib.TOMLDecodeError):
-            continue
-        services = (
-            data.get("tool", {})
-            .get("splent", {})
-            .get("contract", {})
-            .get("provides", {})
-            .get("services", [])
-        )
-        for svc in services:
+        for svc in record.provides.get("services", []):
             _add(svc, short)
 
     return {k: v for k, v in mapping.items() if k not in ambiguous}
@@ -845,9 +830,9 @@ def create_versioned_snapshot(namespace, feature_name, version, workspace):
         )
         raise SystemExit(1)
 
-    from splent_cli.utils.cache_utils import make_feature_readonly
+    from splent_cli.utils.cache_utils import seal_feature
 
-    make_feature_readonly(snapshot_path)
+    seal_feature(snapshot_path)
 
     click.echo(f"  snapshot {snapshot_path} (read-only)")
 
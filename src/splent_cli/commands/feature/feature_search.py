@@ -56,11 +56,28 @@ def _live_search(query: str | None, org: str, show_all: bool, token: str | None)
 
     click.secho(f"Found {len(repos)} feature(s) in {org}:\n", fg="cyan")
 
+    # The latest tag of every listed repo in one batched lookup; if that
+    # fails, each repo is asked on its own as before (quietly, a repo that
+    # does not answer shows as unreleased).
+    try:
+        snapshots = registry.fetch_repo_snapshots(
+            [f"{org}/{r['name']}" for r in repos],
+            token,
+            with_meta=False,
+        )
+    except registry.RegistryError:
+        snapshots = {}
+
     col = max(len(r["name"]) for r in repos) + 2
     for repo in sorted(repos, key=lambda r: r["name"]):
         name = repo["name"]
         desc = repo.get("description") or ""
-        latest = registry.latest_semver_tag(org, name, token)
+        snapshot = snapshots.get(f"{org}/{name}")
+        latest = (
+            snapshot.latest_tag
+            if snapshot
+            else registry.latest_semver_tag(org, name, token)
+        )
         version_label = (
             click.style(latest, fg="green")
             if latest
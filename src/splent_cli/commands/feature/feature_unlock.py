@@ -220,6 +220,26 @@ def _warn_no_push_access(ns_git: str, name: str):
         pass  # network error — don't block
 
 
+def copy_out_of_cache(versioned_path: str, editable_path: str) -> None:
+    """Copy a cached version to ``editable_path`` as a self-contained repo.
+
+    The cached checkout borrows its git objects from the repo's mirror under
+    .splent_cache/git through a relative path that does not resolve from the
+    workspace root, so the copy is given its own objects before anything runs
+    git in it.
+    """
+    import shutil
+
+    from splent_cli.utils.git_url import dissociate
+
+    shutil.copytree(versioned_path, editable_path, symlinks=True)
+    make_feature_writable(editable_path)
+    if not dissociate(editable_path, source=versioned_path):
+        raise click.ClickException(
+            f"could not copy the git objects of {versioned_path} from its mirror"
+        )
+
+
 # =====================================================================
 # CORE LOGIC (single feature)
 # =====================================================================
@@ -260,11 +280,13 @@ def _edit_one(
     if not os.path.exists(editable_path):
         click.echo(click.style("    copying to workspace root...", dim=True))
         try:
-            shutil.copytree(versioned_path, editable_path, symlinks=True)
+            copy_out_of_cache(versioned_path, editable_path)
             copied_here = True
-        except OSError as e:
+        except (OSError, click.ClickException) as e:
+            make_feature_writable(editable_path)
             shutil.rmtree(editable_path, ignore_errors=True)
-            click.secho(f"    failed to copy feature: {e}", fg="red")
+            message = e.format_message() if isinstance(e, click.ClickException) else e
+            click.secho(f"    failed to copy feature: {message}", fg="red")
             return False
 
     def _rollback():
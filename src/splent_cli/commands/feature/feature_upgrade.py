@@ -1,142 +1,8 @@
 import os
-import tomllib
-from pathlib import Path
 
 import click
-from packaging.version import Version, InvalidVersion
 
-from splent_cli.services import context, registry
-from splent_cli.utils.feature_utils import (
-    normalize_namespace,
-    read_features_from_data,
-)
-
-
-# ── GitHub helpers ────────────────────────────────────────────────────────────
-
-
-def _latest_remote_version(org: str, repo: str, token: str | None) -> str | None:
-    """Return the latest tag from GitHub, or None if the repo has no tags."""
-    try:
-        tags = registry.list_tags(org, repo, token, max_pages=1)
-    except registry.RegistryError as e:
-        if e.status == 403 or e.rate_limited:
-            # Most commonly GitHub rate-limiting an unauthenticated request.
-            click.secho(
-                f"  ⚠  GitHub rate limit hit for {repo} (HTTP {e.status or 403}); skipping. "
-                "Set GITHUB_TOKEN to raise the limit.",
-                fg="yellow",
-            )
-            return None
-        click.secho(f"  ⚠  {e} fetching {repo}; skipping.", fg="yellow")
-        return None
-    if not tags:
-        return None
-    ordered = registry.semver_sorted(tags)
-    return ordered[0] if ordered else tags[0]
-
-
-# ── Pyproject helpers ─────────────────────────────────────────────────────────
-
-
-def _read_features(pyproject_path: Path) -> list[dict]:
-    """Return list of {name, version, ns_github, ns_fs} from the product's pyproject."""
-    if not pyproject_path.exists():
-        return []
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-    refs = read_features_from_data(data)
-    result = []
-    for ref in refs:
-        if "/" in ref:
-            ns_part, rest = ref.split("/", 1)
-            ns_fs = normalize_namespace(ns_part)
-            # A pyproject writes the namespace the way a Python package
-            # needs it, splent_io, and GitHub serves it as splent-io. Taking
-            # it verbatim asked the API about an organisation that does not
-            # exist, and every feature was then reported as already up to
-            # date.
-            ns_github = ns_fs.replace("_", "-")
-        else:
-            ns_github = "splent-io"
-            ns_fs = "splent_io"
-            rest = ref
-        if "@" in rest:
-            name, version = rest.split("@", 1)
-        else:
-            name, version = rest, None
-        result.append(
-            {
-                "name": name,
-                "version": version,
-                "ns_github": ns_github,
-                "ns_fs": ns_fs,
-            }
-        )
-    return result
-
-
-def _update_pyproject(
-    pyproject_path: Path,
-    ns_github: str,
-    name: str,
-    old_ver: str | None,
-    new_ver: str,
-):
-    content = pyproject_path.read_text()
-    if old_ver:
-        content = content.replace(f"{name}@{old_ver}", f"{name}@{new_ver}")
-    else:
-        # editable entry: append version
-        content = content.replace(
-            f"{ns_github}/{name}", f"{ns_github}/{name}@{new_ver}"
-        )
-    pyproject_path.write_text(content)
-
-
-# ── Cache / clone helpers ─────────────────────────────────────────────────────
-
-
-def _clone_if_missing(ns_fs: str, name: str, version: str, cache_root: Path):
-    target = cache_root / ns_fs / f"{name}@{version}"
-    if target.exists():
-        return
-    ns_github = ns_fs.replace("_", "-")
-    from splent_cli.utils.git_url import clone as git_clone, CLONE_SUCCESS
-
-    click.echo(f"  ⬇️  Cloning {ns_fs}/{name}@{version}...")
-    # SSH first, then HTTPS. A pinned version that doesn't exist stays an error
-    # here — upgrade must not silently fall back to a different ref.
-    outcome, _used, err = git_clone(ns_github, name, str(target), ref=version)
-    if outcome != CLONE_SUCCESS:
-        raise click.ClickException(
-            f"Could not clone {ns_fs}/{name}@{version} (tried SSH and HTTPS). {err}".strip()
-        )
-    from splent_cli.utils.cache_utils import make_feature_readonly
-
-    make_feature_readonly(str(target))
-
-
-def _update_symlink(
-    product_path: Path,
-    ns_fs: str,
-    name: str,
-    old_ver: str | None,
-    new_ver: str,
-    cache_root: Path,
-):
-    features_dir = product_path / "features" / ns_fs
-    features_dir.mkdir(parents=True, exist_ok=True)
-    if old_ver:
-        old_link = features_dir / f"{name}@{old_ver}"
-        if old_link.is_symlink():
-            old_link.unlink()
-    new_link = features_dir / f"{name}@{new_ver}"
-    target = cache_root / ns_fs / f"{name}@{new_ver}"
-    if new_link.is_symlink():
-        new_link.unlink()
-    rel_target = os.path.relpath(str(target), str(features_dir))
-    new_link.symlink_to(rel_target)
+from splent_cli.services import context, upgrade_plan
 
 
 # ── Command ───────────────────────────────────────────────────────────────────
@@ -148,12 +14,25 @@ def _update_symlink(
 )
 @click.argument("feature_ref", required=False)
 @click.option("--yes", is_flag=True, help="Skip confirmation prompt.")
-def feature_upgrade(feature_ref, yes):
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=upgrade_plan.DEFAULT_JOBS,
+    show_default=True,
+    help="Version lookups and clones to run at once.",
+)
+def feature_upgrade(feature_ref, yes, jobs):
     """
     Upgrade one or all features declared in the active product to the latest
     version available on GitHub. Clones the new version if not already cached,
     then updates pyproject.toml and the feature symlink.
 
+    \b
+    The latest versions are looked up all at once and the whole plan is shown
+    before anything changes. Applying it clones the new versions in parallel
+    and rewrites pyproject.toml once.
+
     \b
     With no arguments, checks all declared features.
     With <feature_name> (e.g. splent_feature_auth), upgrades only that one.
@@ -164,9 +43,8 @@ def feature_upgrade(feature_ref, yes):
 
     product_path = workspace / product
     pyproject_path = product_path / "pyproject.toml"
-    cache_root = workspace / ".splent_cache" / "features"
 
-    features = _read_features(pyproject_path)
+    features = upgrade_plan.read_features(pyproject_path)
     if not features:
         click.secho("ℹ️  No features declared in pyproject.toml.", fg="yellow")
         return
@@ -182,29 +60,8 @@ def feature_upgrade(feature_ref, yes):
     click.echo()
     click.secho("  Checking latest versions on GitHub...", fg="bright_black")
 
-    upgrades = []
-    unchecked = []
-    for feat in features:
-        latest = _latest_remote_version(feat["ns_github"], feat["name"], token)
-        if not latest:
-            # Not the same as being up to date, and saying so would be a
-            # lie about the one thing this command is for.
-            unchecked.append(feat["name"])
-            continue
-
-        current = feat["version"]
-        if current is None:
-            # editable → offer to pin to latest
-            upgrades.append({**feat, "latest": latest})
-            continue
-
-        try:
-            is_newer = Version(latest.lstrip("v")) > Version(current.lstrip("v"))
-        except InvalidVersion:
-            is_newer = latest != current
-
-        if is_newer:
-            upgrades.append({**feat, "latest": latest})
+    plan = upgrade_plan.resolve(features, token, jobs=jobs)
+    upgrades, unchecked = plan.upgrades, plan.unchecked
 
     if unchecked:
         click.echo()
@@ -243,37 +100,11 @@ def feature_upgrade(feature_ref, yes):
         raise SystemExit(0)
 
     click.echo()
-    from splent_cli.utils.lifecycle import require_state
-    from splent_cli.utils.manifest import feature_key
-
-    for u in upgrades:
-        # Guard: cannot upgrade a feature with applied migrations
-        key = feature_key(u["ns_fs"], u["name"], u["version"])
-        try:
-            require_state(str(product_path), key, command="feature:upgrade")
-        except SystemExit:
-            continue
-
-        try:
-            _clone_if_missing(u["ns_fs"], u["name"], u["latest"], cache_root)
-            _update_pyproject(
-                pyproject_path,
-                u["ns_github"],
-                u["name"],
-                u["version"],
-                u["latest"],
-            )
-            _update_symlink(
-                product_path,
-                u["ns_fs"],
-                u["name"],
-                u["version"],
-                u["latest"],
-                cache_root,
-            )
-            click.secho(f"  ✔  {u['ns_fs']}/{u['name']} → {u['latest']}", fg="green")
-        except Exception as e:
-            click.secho(f"  ✖  {u['ns_fs']}/{u['name']}: {e}", fg="red")
+    done, failed = upgrade_plan.apply(upgrades, product_path, workspace, jobs=jobs)
+    for u in done:
+        click.secho(f"  ✔  {u['ns_fs']}/{u['name']} → {u['latest']}", fg="green")
+    for u, reason in failed:
+        click.secho(f"  ✖  {u['ns_fs']}/{u['name']}: {reason}", fg="red")
 
     click.echo()
     click.secho(
@@ -1,8 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
 from splent_cli.services import compose, registry
+from splent_cli.services.host_gate import resolved
 from splent_cli.utils.feature_utils import load_product_features
 
 
@@ -25,6 +27,24 @@ def _github_versions(org: str, repo: str, token: str | None) -> list[str]:
         raise SystemExit(1)
 
 
+def _tags_through(
+    org: str, repo: str, token: str | None, declared: str | None
+) -> list[str]:
+    """Tags newest first, fetched only as far as the status needs.
+
+    The latest tag is on the first page, and so is the declared version of
+    any feature that is not far behind; further pages are requested only
+    while ``declared`` has not turned up. Raises RegistryError.
+    """
+    wanted = _strip_v(declared) if declared else None
+    tags: list[str] = []
+    for batch in registry.iter_tag_pages(org, repo, token):
+        tags.extend(batch)
+        if wanted is None or any(_strip_v(t) == wanted for t in batch):
+            break
+    return tags
+
+
 def _pypi_versions(package: str) -> list[str]:
     """Return all PyPI release versions, newest first."""
     return registry.pypi_versions(package)
@@ -231,6 +251,14 @@ def _print_diff_table(
     default=False,
     help="Check all features declared in the active product.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --all, how many features to look up at once.",
+)
 def feature_versions(
     feature_identifier,
     only_github,
@@ -239,6 +267,7 @@ def feature_versions(
     show_latest,
     show_status,
     show_all,
+    jobs,
 ):
     """
     List all released versions of a feature from GitHub tags and PyPI.
@@ -259,7 +288,7 @@ def feature_versions(
     if show_all:
         if feature_identifier:
             raise click.UsageError("Cannot pass a feature name with --all.")
-        _cmd_all(token, show_status)
+        _cmd_all(token, show_status, jobs)
         return
 
     if not feature_identifier:
@@ -355,7 +384,38 @@ def feature_versions(
 # ── --all table ───────────────────────────────────────────────────────────────
 
 
-def _cmd_all(token: str | None, show_status: bool) -> None:
+def _batched_tags(rows, token: str | None) -> dict[str, list[str]]:
+    """Tags of every row's repo that one GraphQL batch can answer for.
+
+    Only with a token (GraphQL needs one; without it the per-repo lookups
+    below are the REST calls anyway, and they run concurrently). A repo is
+    answered when the batch holds all its tags or reaches back to the
+    declared version; the rest, and everything if the batch fails, go
+    through :func:`_tags_through`.
+    """
+    if not token:
+        return {}
+    refs = [f"{ns_gh}/{bare}" for bare, ns_gh, _ in rows]
+    try:
+        snapshots = registry.fetch_repo_snapshots(refs, token, with_meta=False)
+    except registry.RegistryError:
+        return {}
+    known: dict[str, list[str]] = {}
+    for ref, (_, _, declared) in zip(refs, rows):
+        snapshot = snapshots.get(ref)
+        if snapshot is None:
+            continue
+        wanted = _strip_v(declared) if declared else None
+        if (
+            snapshot.tags_complete
+            or wanted is None
+            or any(_strip_v(t) == wanted for t in snapshot.tags)
+        ):
+            known[ref] = snapshot.tags
+    return known
+
+
+def _cmd_all(token: str | None, show_status: bool, jobs: int = 8) -> None:
     features = _load_active_product_features()
     if not features:
         click.secho(
@@ -384,22 +444,52 @@ def _cmd_all(token: str | None, show_status: bool) -> None:
         )
     )
 
+    rows = []
     for entry in features:
         bare = entry.split("@")[0].split("/")[-1]
         _, ns_gh, _, _ = compose.parse_feature_identifier(entry.split("@")[0])
-        declared = _declared_version(features, bare)
-
-        gh_versions = _github_versions(ns_gh, bare, token)
-        latest_gh = gh_versions[0] if gh_versions else None
-        label, color = _status_label(declared, gh_versions)
-
-        col_name = f"{bare:<{COL_NAME}}"
-        col_declared = f"{(declared or '(editable)'):<{COL_DECLARED}}"
-        col_latest = f"{(latest_gh or '(none)'):<{COL_LATEST}}"
-
-        click.echo(
-            f"  {col_name}{col_declared}{col_latest}" + click.style(label, fg=color)
-        )
+        rows.append((bare, ns_gh, _declared_version(features, bare)))
+
+    known = _batched_tags(rows, token)
+
+    # Every lookup goes out at once; rows are printed in product order, each
+    # as soon as it and the rows above it have answered.
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(rows)))) as pool:
+        futures = [
+            resolved(known[f"{ns_gh}/{bare}"])
+            if f"{ns_gh}/{bare}" in known
+            else pool.submit(_tags_through, ns_gh, bare, token, declared)
+            for bare, ns_gh, declared in rows
+        ]
+        warned = False
+        for (bare, _, declared), future in zip(rows, futures):
+            try:
+                gh_versions = future.result()
+            except registry.RegistryError as e:
+                if not (e.rate_limited or e.status in (403, 429)):
+                    for pending in futures:
+                        pending.cancel()
+                    click.secho(f"❌ {e}.", fg="red")
+                    raise SystemExit(1)
+                if not warned:
+                    hint = "" if token else " Set GITHUB_TOKEN to raise the limit."
+                    click.secho(
+                        f"⚠️  GitHub API rate limit or access denied (HTTP {e.status}).{hint}",
+                        fg="yellow",
+                    )
+                    warned = True
+                gh_versions = []
+
+            latest_gh = gh_versions[0] if gh_versions else None
+            label, color = _status_label(declared, gh_versions)
+
+            col_name = f"{bare:<{COL_NAME}}"
+            col_declared = f"{(declared or '(editable)'):<{COL_DECLARED}}"
+            col_latest = f"{(latest_gh or '(none)'):<{COL_LATEST}}"
+
+            click.echo(
+                f"  {col_name}{col_declared}{col_latest}" + click.style(label, fg=color)
+            )
 
     click.echo()
     if not token:
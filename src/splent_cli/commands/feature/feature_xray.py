@@ -7,32 +7,22 @@ import os
 import click
 
 from splent_cli.services import context, compose
+from splent_cli.services.feature_index import FeatureIndex
 from splent_cli.utils.feature_utils import read_features_from_data
 from splent_cli.utils.io_utils import load_toml
 
 
-def _read_feature_splent(workspace: str, feature_name: str) -> dict:
+def _read_feature_splent(
+    workspace: str, feature_name: str, index: FeatureIndex | None = None
+) -> dict:
     """Read [tool.splent] from a feature's pyproject.toml."""
-    for candidate_dir in [
-        os.path.join(workspace, feature_name),
-        os.path.join(workspace, ".splent_cache", "features", "splent_io", feature_name),
-    ]:
-        pyproject = os.path.join(candidate_dir, "pyproject.toml")
-        if os.path.isfile(pyproject):
-            data = load_toml(pyproject, what=f"{feature_name} pyproject.toml")
-            return data.get("tool", {}).get("splent", {})
-
-    # Try versioned entries in cache
-    cache_dir = os.path.join(workspace, ".splent_cache", "features", "splent_io")
-    if os.path.isdir(cache_dir):
-        for entry in sorted(os.listdir(cache_dir)):
-            if entry.startswith(feature_name + "@"):
-                pyproject = os.path.join(cache_dir, entry, "pyproject.toml")
-                if os.path.isfile(pyproject):
-                    data = load_toml(pyproject, what=f"{feature_name} pyproject.toml")
-                    return data.get("tool", {}).get("splent", {})
-
-    return {}
+    index = index or FeatureIndex(workspace)
+    record = index.find(feature_name, namespace="splent_io")
+    if record is None:
+        return {}
+    if record.parse_error:
+        raise click.ClickException(record.parse_error)
+    return record.splent
 
 
 def _bare_name(feature_ref: str) -> str:
@@ -136,7 +126,7 @@ def feature_xray(feature_ref, filter_cat, validate, full):
         click.secho("❌ pyproject.toml not found.", fg="red")
         raise SystemExit(1)
 
-    data = load_toml(pyproject_path, what=f"{product} pyproject.toml")
+    data = load_toml(pyproject_path, what=f"{product} pyproject.toml", copy=False)
 
     env = os.getenv("SPLENT_ENV", "dev")
     features = read_features_from_data(data, env)
@@ -147,10 +137,11 @@ def feature_xray(feature_ref, filter_cat, validate, full):
     check_and_refresh_contracts(workspace, features)
 
     # Collect data for all features
+    index = FeatureIndex(workspace)
     feature_data = {}  # bare_name -> {extensible, refinement, contract}
     for feat in features:
         name = _bare_name(feat)
-        splent = _read_feature_splent(workspace, name)
+        splent = _read_feature_splent(workspace, name, index)
         feature_data[name] = {
             "extensible": splent.get("contract", {}).get("extensible", {}),
             "refinement": splent.get("refinement", {}),
@@ -9,6 +9,19 @@ through SPLENT_LOCUSTFILES.
 The web interface listens on port 8089 inside the container. Products
 scaffolded by this CLI publish that port; for an older product add
 "8089:8089" to the web service's ports and recreate the container.
+
+With --headless there is no web interface: Locust runs for --run-time and
+writes its stats into <product>/.splent_bench/<timestamp>/, and
+locust:compare tells whether a later run got slower (services/bench.py).
+
+One Locust process is one core, so a single process saturates long before
+a multi-core machine does. --workers N makes the process in the web
+container a master that only coordinates and aggregates, and starts N
+worker processes beside it with ``docker exec``. They run where every
+feature and locustfile is installed, with the product's environment (a
+fresh container from the same image would have neither: the features are
+installed by the container's entrypoint, at start). The stats the master
+writes are the aggregate of all of them.
 """
 
 import os
@@ -16,7 +29,7 @@ import shlex
 
 import click
 
-from splent_cli.services import context
+from splent_cli.services import bench, context
 from splent_cli.utils.proc import require_docker, run
 
 # Feature locustfile locations, relative to the workspace. Kept in sync with
@@ -30,10 +43,19 @@ FEATURE_LOCUSTFILE_PATTERNS = (
 
 # Resolved inside the container: the framework bootstrap that discovers and
 # re-exports every feature's HttpUser classes.
-BOOTSTRAP_SNIPPET = (
+LOCUSTFILE_SNIPPET = (
     "locust -f \"$(python -c 'import splent_framework.bootstraps.locustfile_bootstrap as m; "
-    "print(m.__file__)')\" --web-host 0.0.0.0"
+    "print(m.__file__)')\""
 )
+BOOTSTRAP_SNIPPET = f"{LOCUSTFILE_SNIPPET} --web-host 0.0.0.0"
+
+# Where the workspace is mounted in the product's web container.
+CONTAINER_WORKSPACE = "/workspace"
+
+# Matches the worker processes of _start_workers and nothing else.
+WORKER_PATTERN = "locust.*--worker"
+# How long a headless master waits for its workers before giving up.
+WORKER_WAIT = 60
 
 
 def _web_container() -> str:
@@ -73,8 +95,54 @@ def _feature_has_locustfile(workspace: str, feature: str) -> bool:
     "locust", short_help="Run Locust load tests inside the product web container."
 )
 @click.argument("feature", required=False)
+@click.option(
+    "--headless",
+    is_flag=True,
+    help="Run to completion without the web UI and store the results.",
+)
+@click.option(
+    "--users",
+    "-u",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --headless, peak number of concurrent users.",
+)
+@click.option(
+    "--spawn-rate",
+    "-r",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="With --headless, users started per second.",
+)
+@click.option(
+    "--run-time",
+    "-t",
+    default="1m",
+    show_default=True,
+    help="With --headless, how long to run (e.g. 30s, 5m, 1h).",
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=0,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Generate load from N worker processes, one Locust process coordinating.",
+)
 @context.requires_product
-def locust(feature):
+def locust(feature, headless, users, spawn_rate, run_time, workers):
+    """Start Locust against the product, or run it headless and keep the results.
+
+    \b
+    Examples:
+        splent locust
+        splent locust --headless -u 50 -r 5 -t 2m
+        splent locust splent_feature_auth --headless
+        splent locust --headless -u 500 -r 50 --workers 4
+        splent locust:compare
+    """
     require_docker()
     container = _web_container()
 
@@ -101,6 +169,29 @@ def locust(feature):
             )
         env_args += ["-e", f"SPLENT_LOCUSTFILES={_feature_patterns(feature)}"]
 
+    if headless:
+        master_flags = _master_flags(workers, headless=True) if workers else []
+        try:
+            if workers:
+                # Inside the try: a failure starting worker k still stops
+                # the ones before it.
+                _start_workers(container, env_args, workers)
+            _run_headless(
+                container,
+                env_args,
+                workspace,
+                feature,
+                users,
+                spawn_rate,
+                run_time,
+                master_flags=master_flags,
+                workers=workers,
+            )
+        finally:
+            if workers:
+                _remove_workers(container)
+        return
+
     check = run(
         ["docker", "exec", container, "sh", "-c", "pgrep -f 'locust' >/dev/null"],
         check=False,
@@ -110,13 +201,153 @@ def locust(feature):
         click.echo("Locust is already running in the product container.")
         return
 
-    cmd = ["docker", "exec", "-d", *env_args, container, "sh", "-c", BOOTSTRAP_SNIPPET]
+    snippet = BOOTSTRAP_SNIPPET
+    if workers:
+        snippet += " " + " ".join(
+            shlex.quote(f) for f in _master_flags(workers, headless=False)
+        )
+    cmd = ["docker", "exec", "-d", *env_args, container, "sh", "-c", snippet]
     click.echo(f"Command: {' '.join(shlex.quote(c) for c in cmd)}")
     run(cmd)
+    if workers:
+        _start_workers(container, env_args, workers)
     click.echo(click.style("Locust is running at http://localhost:8089", fg="green"))
     click.echo("Stop it with: splent locust:stop")
 
 
+# ── Distributed mode ─────────────────────────────────────────────────
+
+
+def _master_flags(workers: int, *, headless: bool) -> list[str]:
+    """Flags that make the web container's Locust a master for *workers*.
+
+    No ``--host``: the workers share the container's environment, so each
+    locustfile's own host (``LOCUST_TARGET_URL`` included) applies as it
+    does without workers, and ``--host`` would override it.
+    """
+    flags = ["--master"]
+    if headless:
+        # A headless master starts the test when the workers are there, and
+        # not before: started earlier, the first seconds run on fewer cores.
+        flags += [
+            "--expect-workers",
+            str(workers),
+            "--expect-workers-max-wait",
+            str(WORKER_WAIT),
+        ]
+    return flags
+
+
+def _start_workers(container: str, env_args: list[str], workers: int) -> None:
+    """Start *workers* Locust worker processes in the web container.
+
+    ``docker exec`` runs them in the container's environment, with
+    splent_framework and the features the entrypoint installed, and they
+    reach the master on localhost. Leftovers from an interrupted run are
+    stopped first.
+    """
+    _remove_workers(container)
+    snippet = f"exec {LOCUSTFILE_SNIPPET} --worker --master-host 127.0.0.1"
+    for _ in range(workers):
+        run(
+            ["docker", "exec", "-d", *env_args, container, "sh", "-c", snippet],
+            capture=True,
+        )
+    click.echo(f"Started {workers} Locust worker process(es) in {container}.")
+
+
+def _remove_workers(container: str) -> int:
+    """Stop the Locust workers in *container*. Returns how many there were."""
+    result = run(
+        ["docker", "exec", container, "pgrep", "-f", WORKER_PATTERN],
+        check=False,
+        capture=True,
+    )
+    pids = (result.stdout or "").split() if result.returncode == 0 else []
+    if pids:
+        run(["docker", "exec", container, "kill", *pids], check=False, capture=True)
+    return len(pids)
+
+
+def _run_headless(
+    container,
+    env_args,
+    workspace,
+    feature,
+    users,
+    spawn_rate,
+    run_time,
+    *,
+    master_flags=(),
+    workers=0,
+):
+    """Run Locust headless in the container and store the results in the product."""
+    product = context.require_app()
+    run_dir = bench.new_run_dir(os.path.join(workspace, product))
+    csv_prefix = "/".join(
+        (
+            CONTAINER_WORKSPACE,
+            product,
+            bench.BENCH_DIRNAME,
+            run_dir.name,
+            bench.CSV_PREFIX,
+        )
+    )
+    flags = [
+        "--headless",
+        "--users",
+        str(users),
+        "--spawn-rate",
+        f"{spawn_rate:g}",
+        "--run-time",
+        run_time,
+        "--csv",
+        csv_prefix,
+        "--only-summary",
+        *master_flags,
+    ]
+    snippet = f"{LOCUSTFILE_SNIPPET} " + " ".join(shlex.quote(f) for f in flags)
+    cmd = ["docker", "exec", *env_args, container, "sh", "-c", snippet]
+    click.echo(f"Command: {' '.join(shlex.quote(c) for c in cmd)}")
+    click.echo(
+        f"Running {users} user(s), {spawn_rate:g}/s spawn rate, for {run_time}..."
+    )
+    # Locust exits 1 when any request failed. That is a result to record,
+    # not a reason to throw the run away; the stats are read either way.
+    result = run(cmd, check=False)
+
+    summary = bench.write_summary(
+        run_dir,
+        {
+            "feature": feature,
+            "users": users,
+            "spawn_rate": spawn_rate,
+            "run_time": run_time,
+            "workers": workers,
+            "exit_code": result.returncode,
+        },
+    )
+    _print_summary(summary)
+    click.echo(click.style(f"Results stored in {run_dir}", fg="green"))
+    if result.returncode not in (0, 1):
+        raise click.ClickException(f"Locust exited with code {result.returncode}.")
+
+
+def _print_summary(summary: dict) -> None:
+    click.echo()
+    click.echo(
+        f"  {'Endpoint':<40} {'reqs':>7} {'fail':>6} {'RPS':>8} "
+        f"{'p50':>7} {'p95':>7} {'p99':>7}"
+    )
+    for e in summary.get("endpoints", []):
+        click.echo(
+            f"  {bench.endpoint_key(e)[:40]:<40} {e['requests']:>7} "
+            f"{e['failures']:>6} {e['rps']:>8.1f} {e['p50']:>7.0f} "
+            f"{e['p95']:>7.0f} {e['p99']:>7.0f}"
+        )
+    click.echo()
+
+
 @click.command(
     "locust:stop", short_help="Stop the Locust process in the product web container."
 )
@@ -129,6 +360,10 @@ def locust_stop():
         click.echo(f"Container '{container}' is not running; nothing to stop.")
         return
 
+    removed = _remove_workers(container)
+    if removed:
+        click.echo(f"Stopped {removed} Locust worker process(es).")
+
     result = run(
         ["docker", "exec", container, "sh", "-c", "pkill -f 'locust' || true"],
         check=False,
@@ -138,3 +373,106 @@ def locust_stop():
         click.echo("Locust stopped.")
     else:
         click.echo("No Locust process was running.")
+
+
+@click.command(
+    "locust:compare",
+    short_help="Compare two stored headless Locust runs; fail on a regression.",
+)
+@click.argument("base", required=False)
+@click.argument("head", required=False)
+@click.option(
+    "--threshold",
+    default=10.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Percent a percentile may grow, or RPS drop, before it is a regression.",
+)
+@click.option(
+    "--min-ms",
+    default=5.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="A slower percentile must also be this many ms slower to count.",
+)
+@click.option(
+    "--max-failure-increase",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Percentage points the failure rate may rise before it is a regression.",
+)
+@context.requires_product
+def locust_compare(base, head, threshold, min_ms, max_failure_increase):
+    """Diff two runs of `splent locust --headless` per endpoint.
+
+    BASE and HEAD are run names under <product>/.splent_bench/ (or paths to
+    run directories). Without them the two most recent runs are compared;
+    with BASE alone, BASE is compared with the most recent run.
+    Exits 1 when any endpoint regressed past the thresholds, so the command
+    can gate a release.
+    """
+    product_path = os.path.join(str(context.workspace()), context.require_app())
+
+    if head and not base:
+        raise click.UsageError("Pass both BASE and HEAD, or neither.")
+    if base:
+        base_dir = bench.resolve_run(product_path, base)
+        if head:
+            head_dir = bench.resolve_run(product_path, head)
+        else:
+            runs = bench.list_runs(product_path)
+            if not runs:
+                raise click.ClickException(
+                    f"No stored run to compare {base} with. "
+                    "Run: splent locust --headless"
+                )
+            head_dir = runs[-1]
+        if base_dir.resolve() == head_dir.resolve():
+            raise click.ClickException(
+                f"{base_dir.name} is the run it would be compared with. "
+                "Pass an older BASE, or HEAD as well."
+            )
+    else:
+        runs = bench.list_runs(product_path)
+        if len(runs) < 2:
+            raise click.ClickException(
+                "Need two stored runs to compare. Run: splent locust --headless"
+            )
+        base_dir, head_dir = runs[-2], runs[-1]
+
+    diffs = bench.compare(
+        bench.load_summary(base_dir),
+        bench.load_summary(head_dir),
+        threshold=threshold,
+        min_ms=min_ms,
+        max_failure_increase=max_failure_increase,
+    )
+
+    click.echo()
+    click.secho(f"  locust:compare  {base_dir.name} → {head_dir.name}", bold=True)
+    click.echo()
+    regressed = 0
+    for diff in diffs:
+        if diff.base is None:
+            click.secho(f"  ➕ {diff.key}: only in {head_dir.name}", fg="bright_black")
+        elif diff.head is None:
+            click.secho(f"  ➖ {diff.key}: only in {base_dir.name}", fg="bright_black")
+        elif diff.regressions:
+            regressed += 1
+            click.secho(f"  ❌ {diff.key}: " + "; ".join(diff.regressions), fg="red")
+        else:
+            old, new = diff.base, diff.head
+            click.secho(
+                f"  ✅ {diff.key}: p95 {old['p95']:.0f} → {new['p95']:.0f} ms, "
+                f"RPS {old['rps']:.1f} → {new['rps']:.1f}",
+                fg="green",
+            )
+    click.echo()
+
+    if regressed:
+        click.secho(f"  {regressed} endpoint(s) regressed.", fg="red")
+        click.echo()
+        raise SystemExit(1)
+    click.secho("  No regressions.", fg="green")
+    click.echo()
@@ -344,18 +344,177 @@ def _collect_feature_assets(workspace, declared_features, docker_path, env="prod
     return copied
 
 
+# File product:build writes next to the deploy compose. Its presence tells
+# product:deploy that every image was built ahead of time, so the deploy does
+# not rebuild them.
+BAKE_FILE = "docker-bake.json"
+
+
+def _bake_target_name(name: str) -> str:
+    """A bake target name for a product or compose service.
+
+    Bake accepts letters, digits, ``_`` and ``-`` only, and compose service
+    names may also carry dots.
+    """
+    return "".join(c if c.isalnum() or c in "_-" else "-" for c in name)
+
+
+def bake_definition(
+    product: str,
+    version: str,
+    compose_data: dict,
+    cache_root: str | None = None,
+) -> dict:
+    """The ``docker buildx bake`` file for the product and its feature images.
+
+    One target per image: the product image (context: the workspace, exactly
+    as ``docker build`` used it) and every service of the deploy compose that
+    still has a ``build:`` section after ``merge_compose``, tagged with the
+    image name the compose file will look for. Paths are relative to the
+    product's docker/ directory, where bake runs, so the file stays portable
+    like the compose file beside it.
+
+    ``cache_root`` (relative to that same directory) gives each target its
+    own local cache-from/cache-to directory. None leaves caching to the
+    builder, for drivers that cannot export a cache.
+    """
+    targets: dict[str, dict] = {}
+
+    def _add(name: str, target: dict) -> None:
+        if cache_root:
+            cache_dir = f"{cache_root}/{name}"
+            target["cache-from"] = [f"type=local,src={cache_dir}"]
+            target["cache-to"] = [f"type=local,dest={cache_dir},mode=max"]
+        target["output"] = ["type=docker"]
+        targets[name] = target
+
+    _add(
+        _bake_target_name(product),
+        {
+            "context": "../..",
+            "dockerfile": f"{product}/docker/Dockerfile.{product}.prod",
+            "tags": [f"{product}:{version}", f"{product}:latest"],
+        },
+    )
+
+    for svc_name, svc_def in (compose_data.get("services") or {}).items():
+        build_cfg = svc_def.get("build")
+        if not isinstance(build_cfg, dict):
+            continue
+        _add(
+            _bake_target_name(svc_name),
+            {
+                "context": build_cfg.get("context", "."),
+                "dockerfile": build_cfg.get("dockerfile", "Dockerfile"),
+                "tags": [svc_def.get("image") or f"splent/{svc_name}:latest"],
+            },
+        )
+
+    return {
+        "group": {"default": {"targets": list(targets)}},
+        "target": targets,
+    }
+
+
+def _buildx_driver() -> str | None:
+    """The driver of the current buildx builder, or None without buildx.
+
+    The ``docker`` driver cannot import or export a local cache, so whether
+    the bake file carries cache entries depends on this.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "buildx", "inspect"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "driver":
+            return value.strip()
+    return ""
+
+
+def _build_images_with_bake(
+    product: str,
+    version: str,
+    workspace: str,
+    docker_path: str,
+    compose_data: dict,
+    driver: str,
+) -> None:
+    """Build the product image and every feature image in one bake run.
+
+    Bake builds the targets concurrently, so a product with several images
+    takes as long as its slowest image rather than the sum of them, and the
+    deploy finds every image already there.
+    """
+    import json
+
+    cache_root = None
+    if driver != "docker":
+        cache_dir = os.path.join(workspace, ".splent_cache", "buildx", product)
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_root = os.path.relpath(cache_dir, docker_path).replace(os.sep, "/")
+
+    definition = bake_definition(product, version, compose_data, cache_root)
+    bake_path = os.path.join(docker_path, BAKE_FILE)
+    with open(bake_path, "w", encoding="utf-8") as f:
+        json.dump(definition, f, indent=2)
+        f.write("\n")
+    click.echo(f"✅ Created: {bake_path}")
+
+    targets = definition["group"]["default"]["targets"]
+    click.echo(
+        f"\n🐳 Building {len(targets)} image(s) with docker buildx bake: "
+        f"{', '.join(targets)}..."
+    )
+    if cache_root is None:
+        click.secho(
+            "  The active buildx builder uses the 'docker' driver, which "
+            "cannot keep a local build cache; building without one.",
+            fg="yellow",
+        )
+
+    try:
+        subprocess.run(
+            ["docker", "buildx", "bake", "-f", BAKE_FILE],
+            check=True,
+            cwd=docker_path,
+        )
+    except subprocess.CalledProcessError:
+        # Left behind, it would tell product:deploy the images are current.
+        os.remove(bake_path)
+        click.secho("❌ Docker image build failed.", fg="red")
+        raise SystemExit(1)
+    click.echo(
+        f"✅ Images built: {product}:{version} + {len(targets) - 1} feature image(s)"
+    )
+
+
 @click.command(
     "product:build",
     short_help="Build deployment artifacts: env, compose, and Docker image.",
 )
 @click.option("--no-image", is_flag=True, help="Skip Docker image build.")
+@click.option(
+    "--no-bake",
+    is_flag=True,
+    help="Build only the product image with plain 'docker build' and leave "
+    "feature images to compose.",
+)
 @click.option(
     "--skip-preflight",
     is_flag=True,
     hidden=True,
     help="Skip pre-flight checks (used internally by product:derive).",
 )
-def product_build(no_image, skip_preflight):
+def product_build(no_image, no_bake, skip_preflight):
     product = context.require_app()
     workspace = str(context.workspace())
     product_path = os.path.join(workspace, product)
@@ -396,7 +555,7 @@ def product_build(no_image, skip_preflight):
     feature_defaults: dict[str, str] = {}
 
     # Read declared features from pyproject.toml (not glob)
-    pydata = load_toml(pyproject_path, what="pyproject.toml")
+    pydata = load_toml(pyproject_path, what="pyproject.toml", copy=False)
     declared_features = read_features_from_data(pydata, "prod")
 
     # Unversioned features, and what actually happens to them.
@@ -628,6 +787,14 @@ def product_build(no_image, skip_preflight):
     # ---------------------------------------------------------
     # 3) Docker image build
     # ---------------------------------------------------------
+    # The bake file tells product:deploy that every feature image is
+    # current. One from an earlier build goes now, whatever this build does
+    # (--no-image, no Dockerfile, plain docker build); a bake that runs and
+    # succeeds writes it again.
+    stale_bake = os.path.join(docker_path, BAKE_FILE)
+    if os.path.isfile(stale_bake):
+        os.remove(stale_bake)
+
     if no_image:
         click.echo("\n⏩ Skipping Docker image build (--no-image).")
     else:
@@ -639,9 +806,19 @@ def product_build(no_image, skip_preflight):
                 fg="yellow",
             )
         else:
-            data = load_toml(pyproject_path, what="pyproject.toml")
+            data = load_toml(pyproject_path, what="pyproject.toml", copy=False)
             version = data.get("project", {}).get("version", "latest")
 
+            driver = None if no_bake else _buildx_driver()
+            if driver is not None:
+                _build_images_with_bake(
+                    product, version, workspace, docker_path, compose_result, driver
+                )
+                click.echo("\n🎯 product:build completed successfully.")
+                return
+
+            # Without buildx the product image is built on its own and the
+            # feature images are left to compose, as they always were.
             click.echo(f"\n🐳 Building Docker image: {product}:{version}...")
 
             try:
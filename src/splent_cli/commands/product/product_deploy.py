@@ -8,6 +8,7 @@ from splent_cli.utils.io_utils import env_line
 import yaml
 from splent_cli.services import compose, context
 from splent_cli.commands.product.product_build import (
+    BAKE_FILE,
     USER_TUNABLE_COMMENT,
     host_docker_dir_env,
     load_env_file_with_markers,
@@ -401,23 +402,30 @@ def product_deploy(down, ci):
 
     click.echo(click.style("  deploying ", dim=True) + f"{product} (prod)...")
 
+    up_cmd = [
+        "docker",
+        "compose",
+        # Without this, Compose names the project after the directory
+        # holding the compose file, which is 'docker' in every product.
+        "-p",
+        compose.deploy_project_name(product),
+        "-f",
+        compose_path,
+        "--env-file",
+        env_path,
+        "up",
+        "-d",
+    ]
+    # product:build leaves a bake file behind when it built the product image
+    # and every feature image together. Those images are current, so the
+    # deploy starts them instead of rebuilding each one in turn. Compose
+    # still builds an image that is missing.
+    if not os.path.isfile(os.path.join(docker_dir, BAKE_FILE)):
+        up_cmd.append("--build")
+
     try:
         subprocess.run(
-            [
-                "docker",
-                "compose",
-                # Without this, Compose names the project after the directory
-                # holding the compose file, which is 'docker' in every product.
-                "-p",
-                compose.deploy_project_name(product),
-                "-f",
-                compose_path,
-                "--env-file",
-                env_path,
-                "up",
-                "-d",
-                "--build",
-            ],
+            up_cmd,
             check=True,
             capture_output=True,
             text=True,
@@ -5,7 +5,7 @@ import shutil
 import click
 from splent_cli.services import context, compose
 from splent_cli.utils.feature_utils import read_features_from_data
-from splent_cli.utils.io_utils import atomic_write, env_line
+from splent_cli.utils.io_utils import atomic_write, env_line, read_toml
 
 
 def _parse_env_line(line: str):
@@ -56,8 +56,7 @@ def _declared_config(pyproject_path: str) -> dict:
     is what every config.py in this workspace already parses.
     """
     try:
-        with open(pyproject_path, "rb") as handle:
-            data = tomllib.load(handle)
+        data = read_toml(pyproject_path)
     except (OSError, tomllib.TOMLDecodeError):
         return {}
 
@@ -195,8 +194,7 @@ def product_env(generate, merge, env_name, process_all):
             return
 
         # Process all declared features
-        with open(py_path, "rb") as f:
-            data = tomllib.load(f)
+        data = read_toml(py_path)
 
         features = read_features_from_data(data, env_name)
         if not features:
@@ -257,8 +255,7 @@ def product_env(generate, merge, env_name, process_all):
         if base_env != target_env:
             shutil.copyfile(base_env, target_env)
 
-        with open(py_path, "rb") as f:
-            data = tomllib.load(f)
+        data = read_toml(py_path)
         features = read_features_from_data(data, env_name)
         if not features:
             return
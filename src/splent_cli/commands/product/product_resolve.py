@@ -1,9 +1,12 @@
 import os
 import tomllib
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import click
-from splent_cli.services import context
-from splent_cli.commands.feature.feature_clone import feature_clone
+from splent_cli.services import cache_index, context
+from splent_cli.commands.feature.feature_clone import clone_to_cache
+from splent_cli.utils.proc import require_tool
 from splent_cli.utils.feature_utils import (
     normalize_namespace,
     parse_feature_entry,
@@ -52,7 +55,15 @@ def _feature_env_tag(entry: str, dev_set: set[str], prod_set: set[str]) -> str:
     is_flag=True,
     help="Skip confirmation prompts (e.g. when deleting cache folders with --force).",
 )
-def product_sync(ctx, force, yes):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Missing features cloned at the same time.",
+)
+def product_sync(ctx, force, yes, jobs):
     workspace = str(context.workspace())
     product = context.require_app()
 
@@ -142,38 +153,88 @@ def product_sync(ctx, force, yes):
             names_r.append((_short_name(repo), entry, ns_safe, ns_raw, repo, version))
         max_w_r = max(len(n[0]) for n in names_r)
 
+        # Plan every pinned feature first: which are cached, which must be
+        # cloned. --force removals happen here, one by one, because they may
+        # ask for confirmation.
+        planned = []
         for short, entry, ns_safe, ns_raw, repo, version in names_r:
             cache_dir = os.path.join(
                 workspace, ".splent_cache", "features", ns_safe, f"{repo}@{version}"
             )
-            product_features_dir = os.path.join(workspace, product, "features", ns_safe)
-            link_path = os.path.join(product_features_dir, f"{repo}@{version}")
-
-            # Force reclone
             if os.path.exists(cache_dir) and force:
                 _force_remove_cache_dir(workspace, cache_dir, yes)
-
-            # Clone if missing
-            cloned = False
-            if not os.path.exists(cache_dir):
-                try:
-                    ctx.invoke(feature_clone, full_name=f"{ns_raw}/{repo}@{version}")
-                    cloned = True
-                except SystemExit as e:
-                    if e.code != 0:
-                        marker = click.style("  ✗", fg="red")
-                        label = click.style(f"  {short:<{max_w_r}}", fg="red")
-                        ver = click.style(f"  {version}", fg="red", dim=True)
-                        click.echo(f"  {marker}{label}{ver}  clone failed")
+            planned.append((short, entry, ns_safe, ns_raw, repo, version, cache_dir))
+
+        def line(short, version, entry, status, ok=True):
+            if ok:
+                marker = click.style("  ✓", fg="green")
+                label = f"  {short:<{max_w_r}}"
+                ver = click.style(f"  {version}", dim=True)
+                tag = _feature_env_tag(entry, dev_set, prod_set)
+                click.echo(
+                    f"  {marker}{label}{ver}{click.style(status, dim=True)}{tag}"
+                )
+            else:
+                marker = click.style("  ✗", fg="red")
+                label = click.style(f"  {short:<{max_w_r}}", fg="red")
+                ver = click.style(f"  {version}", fg="red", dim=True)
+                click.echo(f"  {marker}{label}{ver}{status}")
+
+        missing = [p for p in planned if not os.path.exists(p[6])]
+        for short, entry, _, _, _, version, cache_dir in planned:
+            if os.path.exists(cache_dir):
+                line(short, version, entry, "  cached")
+
+        # Clones are network-bound and independent, so they all run at once:
+        # a fresh checkout resolves in the time of the slowest clone rather
+        # than the sum of them. Each result is printed as it lands.
+        failed: set[str] = set()
+        if missing:
+            require_tool(
+                "git",
+                "Install Git from https://git-scm.com/downloads and make sure it "
+                "is on your PATH.",
+            )
+            with ThreadPoolExecutor(max_workers=min(jobs, len(missing))) as pool:
+                futures = {
+                    pool.submit(
+                        clone_to_cache, workspace, ns_raw, repo, version, quiet=True
+                    ): (short, entry, version, cache_dir)
+                    for short, entry, _, ns_raw, repo, version, cache_dir in missing
+                }
+                for future in as_completed(futures):
+                    short, entry, version, cache_dir = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = None
+                        error = str(e)
+                    else:
+                        error = result.error
+                    if result is None or not result.ok:
+                        failed.add(cache_dir)
+                        line(short, version, entry, "  clone failed", ok=False)
+                        if error:
+                            click.secho(
+                                f"        {error.splitlines()[-1]}", fg="red", dim=True
+                            )
                         continue
-
+                    status = "  cloned"
+                    if result.fell_back:
+                        status += " (version not found, default branch)"
+                    line(short, version, entry, status)
+
+        # Links for everything that is now in the cache, in one pass.
+        used = []
+        for _, _, ns_safe, _, repo, version, cache_dir in planned:
+            if cache_dir in failed:
+                continue
+            product_features_dir = os.path.join(workspace, product, "features", ns_safe)
+            link_path = os.path.join(product_features_dir, f"{repo}@{version}")
             _create_symlink(cache_dir, product_features_dir, link_path)
-            marker = click.style("  ✓", fg="green")
-            label = f"  {short:<{max_w_r}}"
-            ver = click.style(f"  {version}", dim=True)
-            src = click.style("  cached" if not cloned else "  cloned", dim=True)
-            tag = _feature_env_tag(entry, dev_set, prod_set)
-            click.echo(f"  {marker}{label}{ver}{src}{tag}")
+            used.append(f"{ns_safe}/{repo}@{version}")
+        # What cache:prune --max-size evicts last.
+        cache_index.touch(workspace, used)
 
     click.echo()
 
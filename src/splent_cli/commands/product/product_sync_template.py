@@ -6,6 +6,7 @@ from splent_cli.utils.template_drift import (
     PRODUCT_GROUPS,
     count_changed_lines,
     file_diff,
+    gitignore_update,
     product_ctx,
     render_template,
     resolve_product_rel,
@@ -52,6 +53,8 @@ def product_sync_template(
     """
     Update SPLENT-owned files in a product to match the current templates.
     Never touches developer-owned files (config.py, errors.py, src/, templates/).
+    The .gitignore is shared: patterns newer templates ignore are appended to
+    it, and nothing in it is changed.
 
     \b
     Examples:
@@ -94,6 +97,15 @@ def product_sync_template(
                 n = count_changed_lines(diff)
                 changes[rel_path] = (abs_path, expected, n)
 
+    if not filter_active:
+        gitignore = product_path / ".gitignore"
+        expected = gitignore_update(
+            gitignore, render_template("product/product_.gitignore.j2", ctx)
+        )
+        if expected is not None:
+            diff = file_diff(gitignore, expected)
+            changes[".gitignore"] = (gitignore, expected, count_changed_lines(diff))
+
     if not changes:
         click.echo()
         click.secho("  ✅ All SPLENT-owned files are already up to date.", fg="green")
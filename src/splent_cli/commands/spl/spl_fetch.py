@@ -3,22 +3,76 @@ import click
 from splent_cli.services import context, spl_store
 
 
+def _fetch_all(workspace: str, force: bool, jobs: int) -> None:
+    """Fetch the model every product in the workspace pins, all at once."""
+    pinned = spl_store.product_pins(workspace)
+    if not pinned:
+        click.secho("  No product in this workspace pins an SPL model.", fg="yellow")
+        return
+
+    results = spl_store.fetch_many(
+        workspace, [pin for _, pin in pinned], force=force, jobs=jobs
+    )
+    failed = 0
+    for (product, pin), (_, path, error) in zip(pinned, results):
+        label = f"{pin.name}@{pin.version or pin.doi}"
+        if error:
+            failed += 1
+            click.secho(f"  ❌ {product:<24} {label}: {error}", fg="red")
+        else:
+            click.secho(f"  ✅ {product:<24} {label} at {path}", fg="green")
+
+    if failed:
+        raise click.ClickException(f"{failed} model(s) could not be fetched.")
+
+
 @click.command(
     "spl:fetch",
     short_help="Download an SPL model from UVLHub into the local cache.",
 )
-@click.argument("spl_name")
+@click.argument("spl_name", required=False)
 @click.option("--force", is_flag=True, help="Redownload even if already cached.")
+@click.option(
+    "--all",
+    "fetch_all",
+    is_flag=True,
+    help="Fetch the model pinned by every product in the workspace.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=spl_store.FETCH_JOBS,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --all, how many models to download at once.",
+)
 @context.requires_detached
-def spl_fetch(spl_name, force):
+def spl_fetch(spl_name, force, fetch_all, jobs):
     """Download the UVL model for the SPL and cache it.
 
     The DOI comes from whatever records it: the product that pins the model,
     the working copy, or a previous fetch. The file lands under
     .splent_cache/spls/ and nowhere else, so a working copy you are editing is
     never overwritten and deleting the cache costs one download.
+
+    With --all, every version pinned by any product is fetched in one
+    parallel pass, which is what a fresh clone of a workspace needs before it
+    can work offline. --force then revalidates each cached model against
+    UVLHub and downloads only the ones that changed.
     """
     workspace = str(context.workspace())
+
+    if fetch_all:
+        if spl_name:
+            raise click.UsageError("Cannot pass an SPL name with --all.")
+        _fetch_all(workspace, force, jobs)
+        return
+
+    if not spl_name:
+        raise click.UsageError(
+            "Missing argument 'SPL_NAME'. Use --all to fetch every pinned model."
+        )
+
     pin = spl_store.read_pin(workspace, spl_name)
 
     if not pin.fetchable:
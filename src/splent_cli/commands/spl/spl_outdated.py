@@ -10,10 +10,17 @@ Two questions, and they are not the same one:
     pins, because someone published from the working copy here. No network.
   * Remote drift. The line itself has moved on somewhere else. That needs the
     concept DOI, which is exactly why it is recorded.
+
+Remote lookups for every line are made at the same time, before anything is
+printed, and what UVLHub answers is remembered for a while (see
+spl_store.cached_latest), so a workspace with many products and several
+lines is not a chain of mirror requests on every run.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 
 from splent_cli.services import context, spl_store
@@ -67,6 +74,46 @@ def latest_version_doi(mirror: str, concept_doi: str) -> tuple[str, str] | None:
     return doi, version
 
 
+def latest_versions(
+    workspace: str,
+    lines: list[tuple[str, str]],
+    *,
+    refresh: bool = False,
+    jobs: int = spl_store.FETCH_JOBS,
+) -> dict[tuple[str, str], tuple[str, str] | None]:
+    """Newest version of every ``(mirror, concept_doi)`` line, asked at once.
+
+    Fresh cached answers are used unless *refresh*. Every line is asked
+    before any failure is raised, so one unreachable line does not throw
+    away what the others answered.
+    """
+    answers: dict[tuple[str, str], tuple[str, str] | None] = {}
+    ask = []
+    for line in dict.fromkeys(lines):
+        cached = None if refresh else spl_store.cached_latest(workspace, *line)
+        if cached:
+            answers[line] = cached
+        else:
+            ask.append(line)
+    if not ask:
+        return answers
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(ask)))) as pool:
+        futures = {line: pool.submit(latest_version_doi, *line) for line in ask}
+    failure = None
+    for line, future in futures.items():
+        try:
+            answers[line] = future.result()
+        except click.ClickException as exc:
+            failure = failure or exc
+    spl_store.remember_latest(
+        workspace, {line: answers[line] for line in ask if answers.get(line)}
+    )
+    if failure is not None:
+        raise failure
+    return answers
+
+
 def _report(product: str, pin: spl_store.SplPin, message: str, colour: str) -> None:
     click.secho(f"  {product:<24} {message}", fg=colour)
 
@@ -80,8 +127,21 @@ def _report(product: str, pin: spl_store.SplPin, message: str, colour: str) -> N
     is_flag=True,
     help="Also ask UVLHub whether the line itself has moved on.",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="With --remote, ask UVLHub again instead of using recent answers.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=spl_store.FETCH_JOBS,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --remote, how many lines to ask about at once.",
+)
 @context.requires_detached
-def spl_outdated(remote):
+def spl_outdated(remote, refresh, jobs):
     """Compare what each product pins against what exists."""
     workspace = str(context.workspace())
     names = spl_store.known_spls(workspace)
@@ -99,15 +159,27 @@ def spl_outdated(remote):
     unknown = 0
     checked = 0
 
+    pinned = []
     for name in names:
         products = spl_store.products_pinning(workspace, name)
-        if not products:
-            continue
+        if products:
+            pinned.append((name, products, spl_store.read_pin(workspace, name)))
+
+    answers = {}
+    if remote:
+        answers = latest_versions(
+            workspace,
+            [
+                (available.mirror, available.concept_doi)
+                for _, _, available in pinned
+                if available.concept_doi
+            ],
+            refresh=refresh,
+            jobs=jobs,
+        )
 
-        available = spl_store.read_pin(workspace, name)
-        latest = None
-        if remote and available.concept_doi:
-            latest = latest_version_doi(available.mirror, available.concept_doi)
+    for name, products, available in pinned:
+        latest = answers.get((available.mirror, available.concept_doi))
 
         click.secho(f"  {name}", bold=True)
         for product, _ in products:
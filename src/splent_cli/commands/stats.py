@@ -0,0 +1,112 @@
+import json
+import time
+
+import click
+
+from splent_cli.services import context
+from splent_cli.utils import metrics
+
+
+def _seconds(ms: float) -> str:
+    return f"{ms / 1000:.2f}s" if ms >= 1000 else f"{ms:.0f}ms"
+
+
+@click.command(
+    "stats",
+    short_help="Show how long each CLI command takes, per CLI version.",
+)
+@click.option(
+    "--command", "-c", "command_filter", help="Only commands starting with this."
+)
+@click.option("--product", help="Only runs made for this product.")
+@click.option(
+    "--days",
+    type=click.IntRange(min=1),
+    help="Only runs from the last N days.",
+)
+@click.option(
+    "--threshold",
+    default=20.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Flag a command whose p95 grew by more than this percent.",
+)
+@click.option(
+    "--min-runs",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Runs each version needs before its p95 is compared.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Output in JSON format.")
+def stats(command_filter, product, days, threshold, min_runs, as_json):
+    """
+    Report p50/p95 durations of every command run in this workspace.
+
+    Every splent invocation records its duration, and how much of it went to
+    subprocesses and HTTP, under .splent_cache/metrics/. One row per command
+    and CLI version, oldest version first, so a command that got slower
+    after an upgrade shows it in its last row; when its p95 grew by more than
+    --threshold it is flagged.
+
+    Set SPLENT_METRICS=0 to stop recording.
+    """
+    workspace = context.workspace()
+    records = metrics.load(workspace)
+    if command_filter:
+        records = [r for r in records if r["cmd"].startswith(command_filter)]
+    if product:
+        records = [r for r in records if r.get("product") == product]
+    if days:
+        since = time.time() - days * 86400
+        records = [r for r in records if (r.get("ts") or 0) >= since]
+
+    summary = metrics.summarize(records)
+    flagged = metrics.regressions(summary, threshold=threshold, min_runs=min_runs)
+
+    if as_json:
+        payload = {
+            "commands": [vars(entry) for entry in summary],
+            "regressions": {
+                cmd: {"from": old.version, "to": new.version}
+                for cmd, (old, new) in flagged.items()
+            },
+        }
+        click.echo(json.dumps(payload, indent=2))
+        return
+
+    if not summary:
+        click.secho("ℹ️  No command runs recorded yet.", fg="yellow")
+        if not metrics.enabled():
+            click.echo(f"   Recording is off ({metrics.METRICS_ENV}=0).")
+        return
+
+    header = (
+        f"  {'COMMAND':<28} {'VERSION':<12} {'RUNS':>5} {'FAIL':>5} "
+        f"{'P50':>8} {'P95':>8} {'SUBPROC':>8} {'HTTP':>8}"
+    )
+    click.secho(f"\n{header}", bold=True)
+    click.echo("  " + "─" * (len(header) - 2))
+    for entry in summary:
+        line = (
+            f"  {entry.cmd:<28} {entry.version:<12} {entry.runs:>5} "
+            f"{entry.failures:>5} {_seconds(entry.p50):>8} {_seconds(entry.p95):>8} "
+            f"{_seconds(entry.subprocess_ms):>8} {_seconds(entry.http_ms):>8}"
+        )
+        regressed = flagged.get(entry.cmd)
+        if regressed and regressed[1] is entry:
+            click.secho(line + "  ⚠️", fg="red")
+        else:
+            click.echo(line)
+    click.echo()
+
+    for cmd, (old, new) in flagged.items():
+        growth = 100.0 * (new.p95 - old.p95) / old.p95
+        click.secho(
+            f"⚠️  {cmd}: p95 {_seconds(old.p95)} → {_seconds(new.p95)} "
+            f"(+{growth:.0f}%) since {old.version} → {new.version}.",
+            fg="red",
+        )
+
+
+cli_command = stats
@@ -0,0 +1,209 @@
+"""
+Stored load-test runs and the comparison between two of them.
+
+``splent locust --headless`` runs Locust to completion inside the product's
+web container and has it write its CSV stats into the product, under
+``.splent_bench/<timestamp>/`` (the workspace is mounted in the container,
+so the CLI reads back exactly what Locust wrote). The web UI is good for
+poking at a product; it keeps nothing once it stops, so nothing can be
+compared and no release can be held back because it got slower.
+
+Each run directory holds Locust's own files (``stats_stats.csv``,
+``stats_failures.csv``, ...) and a ``summary.json`` this module derives
+from them: per endpoint, requests, failures, RPS and the p50/p95/p99
+response times, plus how the run was made. ``locust:compare`` diffs two
+summaries endpoint by endpoint.
+
+A regression is what a gate should fail on, and only that:
+
+  * a percentile slower by more than ``threshold`` percent AND by more than
+    ``min_ms`` milliseconds, so a 2 ms endpoint going to 3 ms is not news;
+  * RPS lower by more than ``threshold`` percent;
+  * a failure rate up by more than ``max_failure_increase`` percentage
+    points.
+
+An endpoint present in only one of the runs is listed, never a regression.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import click
+
+from splent_cli.utils.io_utils import atomic_write
+
+BENCH_DIRNAME = ".splent_bench"
+CSV_PREFIX = "stats"
+SUMMARY_FILENAME = "summary.json"
+PERCENTILES = ("p50", "p95", "p99")
+
+# Locust's column for each percentile we keep.
+_PERCENTILE_COLUMNS = {"p50": "50%", "p95": "95%", "p99": "99%"}
+
+
+def bench_root(product_path: str | os.PathLike) -> Path:
+    return Path(product_path) / BENCH_DIRNAME
+
+
+def new_run_dir(product_path: str | os.PathLike) -> Path:
+    """A fresh, empty ``.splent_bench/<UTC timestamp>/`` for one run."""
+    root = bench_root(product_path)
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    run_dir = root / stamp
+    suffix = 1
+    while run_dir.exists():
+        suffix += 1
+        run_dir = root / f"{stamp}-{suffix}"
+    run_dir.mkdir(parents=True)
+    return run_dir
+
+
+def list_runs(product_path: str | os.PathLike) -> list[Path]:
+    """Every run that produced a summary, oldest first."""
+    root = bench_root(product_path)
+    if not root.is_dir():
+        return []
+    return sorted(
+        entry
+        for entry in root.iterdir()
+        if entry.is_dir() and (entry / SUMMARY_FILENAME).is_file()
+    )
+
+
+def resolve_run(product_path: str | os.PathLike, ref: str) -> Path:
+    """A run named by its directory name under .splent_bench, or by a path."""
+    for candidate in (bench_root(product_path) / ref, Path(ref)):
+        if (candidate / SUMMARY_FILENAME).is_file():
+            return candidate
+    raise click.ClickException(
+        f"No benchmark run '{ref}' (looked in {bench_root(product_path)})."
+    )
+
+
+# ── Reading Locust's output ─────────────────────────────────────────
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        # Locust writes "N/A" for a percentile with no samples.
+        return 0.0
+
+
+def parse_stats_csv(path: str | os.PathLike) -> list[dict]:
+    """Endpoints from a Locust ``*_stats.csv``, the Aggregated row included."""
+    endpoints = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            name = row.get("Name") or ""
+            entry = {
+                "method": row.get("Type") or "",
+                "name": name,
+                "requests": int(_number(row.get("Request Count"))),
+                "failures": int(_number(row.get("Failure Count"))),
+                "rps": _number(row.get("Requests/s")),
+                "avg": _number(row.get("Average Response Time")),
+            }
+            for key, column in _PERCENTILE_COLUMNS.items():
+                entry[key] = _number(row.get(column))
+            endpoints.append(entry)
+    return endpoints
+
+
+def write_summary(run_dir: str | os.PathLike, run: dict) -> dict:
+    """Derive ``summary.json`` from the run's stats CSV. Returns the summary.
+
+    *run* records how the run was made (users, spawn rate, run time, ...).
+    """
+    run_dir = Path(run_dir)
+    stats = run_dir / f"{CSV_PREFIX}_stats.csv"
+    if not stats.is_file():
+        raise click.ClickException(f"Locust wrote no stats to {run_dir}.")
+    summary = {"run": run, "endpoints": parse_stats_csv(stats)}
+    atomic_write(run_dir / SUMMARY_FILENAME, json.dumps(summary, indent=2) + "\n")
+    return summary
+
+
+def load_summary(run_dir: str | os.PathLike) -> dict:
+    try:
+        data = json.loads(
+            (Path(run_dir) / SUMMARY_FILENAME).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError) as exc:
+        raise click.ClickException(f"Could not read {run_dir}: {exc}")
+    return data if isinstance(data, dict) else {}
+
+
+# ── Comparing two runs ──────────────────────────────────────────────
+
+
+def endpoint_key(entry: dict) -> str:
+    return f"{entry.get('method') or ''} {entry.get('name') or ''}".strip()
+
+
+def failure_rate(entry: dict) -> float:
+    """Failures as a percentage of requests."""
+    requests = entry.get("requests") or 0
+    return 100.0 * (entry.get("failures") or 0) / requests if requests else 0.0
+
+
+def _change(base: float, head: float) -> float | None:
+    """Relative change in percent, None when there is no base to compare to."""
+    if not base:
+        return None
+    return 100.0 * (head - base) / base
+
+
+@dataclass
+class EndpointDiff:
+    key: str
+    base: dict | None
+    head: dict | None
+    regressions: list[str] = field(default_factory=list)
+
+
+def compare(
+    base: dict,
+    head: dict,
+    *,
+    threshold: float = 10.0,
+    min_ms: float = 5.0,
+    max_failure_increase: float = 1.0,
+) -> list[EndpointDiff]:
+    """Endpoint-by-endpoint diff of two summaries, in the head run's order."""
+    base_by_key = {endpoint_key(e): e for e in base.get("endpoints", [])}
+    head_by_key = {endpoint_key(e): e for e in head.get("endpoints", [])}
+    keys = list(head_by_key) + [k for k in base_by_key if k not in head_by_key]
+
+    diffs = []
+    for key in keys:
+        old, new = base_by_key.get(key), head_by_key.get(key)
+        diff = EndpointDiff(key=key, base=old, head=new)
+        if old is not None and new is not None:
+            for p in PERCENTILES:
+                change = _change(old[p], new[p])
+                if (
+                    change is not None
+                    and change > threshold
+                    and new[p] - old[p] > min_ms
+                ):
+                    diff.regressions.append(
+                        f"{p} {old[p]:.0f} → {new[p]:.0f} ms (+{change:.0f}%)"
+                    )
+            change = _change(old["rps"], new["rps"])
+            if change is not None and -change > threshold:
+                diff.regressions.append(
+                    f"RPS {old['rps']:.1f} → {new['rps']:.1f} ({change:.0f}%)"
+                )
+            old_rate, new_rate = failure_rate(old), failure_rate(new)
+            if new_rate - old_rate > max_failure_increase:
+                diff.regressions.append(f"failures {old_rate:.1f}% → {new_rate:.1f}%")
+        diffs.append(diff)
+    return diffs
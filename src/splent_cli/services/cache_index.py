@@ -0,0 +1,317 @@
+"""
+A maintained index of ``.splent_cache/features`` for the ``cache:*`` commands.
+
+Every cache command used to rebuild its picture of the cache from scratch:
+list the entries, re-read every product's pyproject.toml (with two different
+parsers, one of which only knew the legacy ``[project.optional-dependencies]``
+list), and, for ``cache:size``, stat every file of every entry. On a CI runner
+whose cache has grown to hundreds of versions that is a full scan for what is
+usually a question about a handful of entries.
+
+The index lives in ``.splent_cache/index.json`` and remembers, per entry, its
+size and when it was last used, and per product, the feature entries its
+pyproject declares. Listing the entries is still two ``scandir`` calls (the
+index never pretends an entry exists), but:
+
+  * a versioned entry is read-only and never changes, so its size is measured
+    once, when it first shows up, and then read from the index. Editable
+    entries are measured each time, they are few and they change.
+  * a pyproject is parsed again only when its mtime or size changed.
+  * ``last_used`` is stamped by feature:clone, product:resolve and
+    feature:upgrade, which is what ``cache:prune --max-size`` evicts by.
+
+A missing or unreadable index is rebuilt from the disk, so deleting it is
+always safe.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import tomllib
+from pathlib import Path
+
+from splent_cli.utils.io_utils import atomic_write
+
+INDEX_SCHEMA = 1
+
+
+def index_path(workspace: str | os.PathLike) -> Path:
+    return Path(workspace) / ".splent_cache" / "index.json"
+
+
+def features_root(workspace: str | os.PathLike) -> Path:
+    return Path(workspace) / ".splent_cache" / "features"
+
+
+# ── The disk ──────────────────────────────────────────────────────────
+
+
+def scan(cache_root: Path) -> list[dict]:
+    """Every entry under ``cache_root`` (``.splent_cache/features``).
+
+    Returns ``{namespace, name, version, is_versioned, path}`` dicts, sorted
+    by namespace and then entry name; ``version`` is None for an editable
+    entry.
+    """
+    entries: list[dict] = []
+    if not cache_root.is_dir():
+        return entries
+    for ns_dir in sorted(cache_root.iterdir()):
+        if not ns_dir.is_dir():
+            continue
+        for feat_dir in sorted(ns_dir.iterdir()):
+            if not feat_dir.is_dir():
+                continue
+            name, _, version = feat_dir.name.partition("@")
+            entries.append(
+                {
+                    "namespace": ns_dir.name,
+                    "name": name,
+                    "version": version or None,
+                    "is_versioned": bool(version),
+                    "path": feat_dir,
+                }
+            )
+    return entries
+
+
+def entry_key(entry: dict) -> str:
+    """``<namespace>/<name>[@<version>]``, the index key of an entry."""
+    return f"{entry['namespace']}/{entry_ref(entry)}"
+
+
+def entry_ref(entry: dict) -> str:
+    """``<name>[@<version>]``, how a product's pyproject names the entry."""
+    return (
+        f"{entry['name']}@{entry['version']}"
+        if entry["is_versioned"]
+        else entry["name"]
+    )
+
+
+def dir_size(path: str | os.PathLike) -> int:
+    """Bytes in the regular files under ``path``; symlinks are not followed.
+
+    A file hardlinked into the blob store (utils/blob_store) counts for its
+    share only: its size split among the snapshots that link it, the store's
+    own link left out. Summed over the cache, shared files count once.
+    """
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for item in it:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            stack.append(item.path)
+                        elif item.is_file(follow_symlinks=False):
+                            st = item.stat(follow_symlinks=False)
+                            if st.st_nlink > 2:
+                                total += st.st_size // (st.st_nlink - 1)
+                            else:
+                                total += st.st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_product_entries(pyproject: Path) -> list[str]:
+    from splent_cli.utils.feature_utils import FEATURE_LIST_KEYS, read_feature_list
+
+    try:
+        with open(pyproject, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return []
+    found: list[str] = []
+    for key in FEATURE_LIST_KEYS:
+        for entry in read_feature_list(data, key):
+            if entry not in found:
+                found.append(entry)
+    return found
+
+
+# ── The index ─────────────────────────────────────────────────────────
+
+
+class CacheIndex:
+    """The index of one workspace's cache. Call :meth:`save` when done."""
+
+    def __init__(self, workspace: str | os.PathLike):
+        self.workspace = Path(workspace)
+        self.path = index_path(workspace)
+        self._data = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get("schema") != INDEX_SCHEMA:
+            data = {"schema": INDEX_SCHEMA}
+        data.setdefault("entries", {})
+        data.setdefault("products", {})
+        return data
+
+    def save(self) -> None:
+        """Write the index back if anything changed. Never fails the command."""
+        if not self._dirty:
+            return
+        try:
+            atomic_write(self.path, json.dumps(self._data, indent=1, sort_keys=True))
+        except OSError:
+            return
+        self._dirty = False
+
+    def _record(self, key: str) -> dict:
+        record = self._data["entries"].setdefault(key, {})
+        self._dirty = True
+        return record
+
+    # ── Entries ──
+
+    def entries(self, *, sizes: bool = False) -> list[dict]:
+        """:func:`scan` of the cache, each entry with ``size`` and ``last_used``.
+
+        ``size`` is None unless ``sizes`` is asked for. Entries the index
+        knows about but the disk no longer has are dropped from it.
+        """
+        found = scan(features_root(self.workspace))
+        known = self._data["entries"]
+        present = set()
+        for entry in found:
+            key = entry_key(entry)
+            present.add(key)
+            record = known.get(key, {})
+            stamp = _stamp(entry["path"])
+            if "last_used" not in record:
+                record = self._record(key)
+                record["last_used"] = stamp[0] / 1e9 if stamp else 0.0
+            entry["last_used"] = record["last_used"]
+            entry["size"] = None
+            if sizes:
+                if entry["is_versioned"] and record.get("stamp") == stamp:
+                    entry["size"] = record["size"]
+                else:
+                    entry["size"] = dir_size(entry["path"])
+                    if entry["is_versioned"]:
+                        record = self._record(key)
+                        record.update(size=entry["size"], stamp=stamp)
+        for key in [k for k in known if k not in present]:
+            del known[key]
+            self._dirty = True
+        return found
+
+    def touch(self, keys, when: float | None = None) -> None:
+        """Mark entries (``<namespace>/<name>@<version>``) as just used."""
+        now = time.time() if when is None else when
+        for key in keys:
+            self._record(key)["last_used"] = now
+
+    def remeasure(self, key: str) -> None:
+        """Measure the entry again next time, keeping its last-used time."""
+        record = self._data["entries"].get(key)
+        if record and record.pop("stamp", None) is not None:
+            self._dirty = True
+
+    def forget(self, key: str) -> None:
+        if self._data["entries"].pop(key, None) is not None:
+            self._dirty = True
+
+    # ── Products ──
+
+    def product_entries(self) -> dict[str, list[str]]:
+        """``{product: [feature entry, ...]}`` for every product in the workspace.
+
+        A product is a visible top-level directory with a pyproject.toml; the
+        entries come from every features list (base, dev and prod), as
+        written, namespace included.
+        """
+        cached = self._data["products"]
+        result: dict[str, list[str]] = {}
+        try:
+            children = sorted(self.workspace.iterdir())
+        except OSError:
+            children = []
+        for product_dir in children:
+            if not product_dir.is_dir() or product_dir.name.startswith("."):
+                continue
+            pyproject = product_dir / "pyproject.toml"
+            stamp = _stamp(pyproject)
+            if stamp is None:
+                continue
+            record = cached.get(product_dir.name)
+            if not record or record.get("stamp") != stamp:
+                record = {"stamp": stamp, "features": _read_product_entries(pyproject)}
+                cached[product_dir.name] = record
+                self._dirty = True
+            result[product_dir.name] = list(record["features"])
+        for name in [n for n in cached if n not in result]:
+            del cached[name]
+            self._dirty = True
+        return result
+
+    def product_refs(self) -> dict[str, list[str]]:
+        """Like :meth:`product_entries`, with the namespace stripped, which is
+        how the cache commands match entries (``name`` or ``name@version``)."""
+        return {
+            product: [e.split("/", 1)[1] if "/" in e else e for e in entries]
+            for product, entries in self.product_entries().items()
+        }
+
+
+def product_refs(workspace: str | os.PathLike) -> dict[str, list[str]]:
+    """:meth:`CacheIndex.product_refs` of ``workspace``, saving the index."""
+    index = CacheIndex(workspace)
+    refs = index.product_refs()
+    index.save()
+    return refs
+
+
+def touch(workspace: str | os.PathLike, keys) -> None:
+    """Stamp cache entries as used now. Never fails the calling command."""
+    keys = list(keys)
+    if not keys:
+        return
+    index = CacheIndex(workspace)
+    index.touch(keys)
+    index.save()
+
+
+def parse_size(text: str) -> int:
+    """``"5G"``, ``"500MB"``, ``"1.5g"`` or a byte count, in bytes (1024-based)."""
+    raw = text.strip().upper().removesuffix("B").removesuffix("I")
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    factor = 1
+    if raw and raw[-1] in units:
+        factor = units[raw[-1]]
+        raw = raw[:-1]
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"not a size: {text!r} (try 500M or 5G)") from None
+    if value < 0:
+        raise ValueError(f"not a size: {text!r}")
+    return int(value * factor)
+
+
+def human_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
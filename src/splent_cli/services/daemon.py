@@ -0,0 +1,501 @@
+"""
+A warm ``splent`` that stays resident between commands.
+
+Every ``splent`` call imports Click and every command module, and for a
+``requires_app`` command builds the product's Flask app with all of its
+features, then throws it away. ``splent daemon`` does that once and keeps
+the result: a process per workspace and product that has loaded the
+commands and built the app, listening on a Unix socket under
+``.splent_cache/daemon/``.
+
+When it runs, the ``splent`` entry point (``__main__.main``) connects before
+importing anything heavy and sends argv, environment and working directory.
+Its stdin, stdout and stderr travel with the request as file descriptors
+(SCM_RIGHTS), so the command writes straight to the caller's terminal:
+colours, prompts and pipes behave as they do in-process, and nothing is
+copied through the socket. The daemon forks per command, so each command
+starts from the same warm state and none can leak into the next; the child
+sends back its pid (so Ctrl-C can be passed on) and its exit status.
+
+When there is no daemon, or it cannot serve this call, the entry point
+runs the command in-process as before. The daemon declines when:
+
+  * the caller's SPLENT_APP or SPLENT_ENV differ from the ones it warmed;
+  * anything the warm state was built from changed since: the product's
+    pyproject.toml and .env, the workspace .env, and the Python and TOML
+    files of the product, its features and the CLI itself. It then
+    re-executes itself to warm again, and the call runs in-process.
+
+The request carries the caller's environment, tokens and passwords
+included, and its terminal. So the entry point only talks to a socket this
+user owns, served by a process of this user, and a socket that does not fit
+under the workspace goes to a directory only this user can enter
+(``$XDG_RUNTIME_DIR/splent``, else ``<tmp>/splent-<uid>``), never to a bare
+name in the shared temp directory that anyone could bind first.
+
+``SPLENT_DAEMON=0`` makes the entry point ignore a running daemon.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+
+DAEMON_ENV = "SPLENT_DAEMON"
+DIR_PARTS = (".splent_cache", "daemon")
+NO_PRODUCT = "_workspace"
+
+# Environment that decided how the warm state was built.
+_PINNED_ENV = ("SPLENT_APP", "SPLENT_ENV")
+_WATCHED_SUFFIXES = (".py", ".toml")
+_SKIPPED_DIRS = {"node_modules", ".git", "__pycache__", "dist", "assets"}
+# AF_UNIX paths are limited to ~108 bytes.
+_MAX_SOCKET_PATH = 100
+
+
+def workspace_dir() -> str:
+    return os.getenv("WORKING_DIR", "/workspace")
+
+
+def current_product(workspace: str) -> str | None:
+    """SPLENT_APP from the environment, or as product:select left it in .env."""
+    product = os.getenv("SPLENT_APP")
+    if product:
+        return product
+    try:
+        with open(os.path.join(workspace, ".env"), encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("SPLENT_APP="):
+                    return line.split("=", 1)[1].strip().strip("\"'") or None
+    except OSError:
+        pass
+    return None
+
+
+def runtime_dir() -> str:
+    """This user's directory for sockets that do not fit under the workspace."""
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return os.path.join(runtime, "splent")
+    return os.path.join(tempfile.gettempdir(), f"splent-{os.getuid()}")
+
+
+def socket_path(workspace: str, product: str | None) -> str:
+    name = f"{product or NO_PRODUCT}.sock"
+    path = os.path.join(workspace, *DIR_PARTS, name)
+    if len(path) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha256(path.encode()).hexdigest()[:12]
+    return os.path.join(runtime_dir(), f"{digest}.sock")
+
+
+def _private_dir(path: str) -> None:
+    """Create *path* 0700, or make sure the one there is ours and closed."""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(
+            f"{path} is not a directory only this user can enter; "
+            "refusing to put the daemon's socket there."
+        )
+
+
+def log_path(workspace: str, product: str | None) -> str:
+    return os.path.join(workspace, *DIR_PARTS, f"{product or NO_PRODUCT}.log")
+
+
+# ── Client side: the entry point ────────────────────────────────────
+
+
+def _is_daemon_command(argv: list[str]) -> bool:
+    return any(arg == "daemon" or arg.startswith("daemon:") for arg in argv[:3])
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """The uid of the process behind *sock*, where the platform says (Linux)."""
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, option, struct.calcsize("3i"))
+    return struct.unpack("3i", creds)[1]
+
+
+def _connect(path: str, timeout: float | None = None) -> socket.socket | None:
+    """A connection to the daemon at *path*, if this user's daemon is there."""
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        peer = _peer_uid(sock)
+    except OSError:
+        sock.close()
+        return None
+    if peer is not None and peer != os.getuid():
+        sock.close()
+        return None
+    return sock
+
+
+def _lines(sock: socket.socket):
+    buffer = b""
+    while True:
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            yield line.decode()
+        chunk = sock.recv(4096)
+        if not chunk:
+            return
+        buffer += chunk
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* in the daemon. Its exit status, or None to run in-process."""
+    if os.getenv(DAEMON_ENV) == "0" or _is_daemon_command(argv):
+        return None
+    workspace = workspace_dir()
+    sock = _connect(socket_path(workspace, current_product(workspace)))
+    if sock is None:
+        return None
+
+    request = {
+        "op": "run",
+        "argv": argv,
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+    }
+    pid = None
+    buffer = b""
+    with sock:
+        try:
+            socket.send_fds(sock, [b"R"], [0, 1, 2])
+            sock.sendall(json.dumps(request).encode() + b"\n")
+        except OSError:
+            return None
+        while True:
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                kind, _, value = line.decode().partition(" ")
+                if kind == "fallback":
+                    return None
+                if kind == "pid":
+                    pid = int(value)
+                elif kind == "exit":
+                    return int(value)
+            try:
+                chunk = sock.recv(4096)
+            except KeyboardInterrupt:
+                # The command runs outside this terminal's process group.
+                if pid:
+                    os.kill(pid, signal.SIGINT)
+                continue
+            except OSError:
+                chunk = b""
+            if not chunk:
+                if pid is None:
+                    return None
+                sys.stderr.write("splent: the daemon lost this command.\n")
+                return 1
+            buffer += chunk
+
+
+def request(workspace: str, product: str | None, op: str) -> dict | None:
+    """Send a control request (``status``, ``stop``). None: no daemon."""
+    sock = _connect(socket_path(workspace, product), timeout=5)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            socket.send_fds(sock, [b"C"], [])
+            sock.sendall(json.dumps({"op": op}).encode() + b"\n")
+            line = next(_lines(sock), None)
+        except OSError:
+            return None
+    return json.loads(line) if line else None
+
+
+# ── Server side ─────────────────────────────────────────────────────
+
+
+def watched_roots(workspace: str, product: str | None) -> list[str]:
+    """Directories whose sources the warm state depends on."""
+    roots = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    if product:
+        product_dir = os.path.join(workspace, product)
+        roots += [
+            os.path.join(product_dir, "src"),
+            os.path.join(product_dir, "features"),
+        ]
+    return roots
+
+
+def fingerprint(workspace: str, product: str | None) -> str:
+    """Paths and mtimes of everything the warm state was built from."""
+    digest = hashlib.sha256()
+    singles = [os.path.join(workspace, ".env")]
+    if product:
+        singles += [
+            os.path.join(workspace, product, "pyproject.toml"),
+            os.path.join(workspace, product, ".env"),
+        ]
+    for path in singles:
+        try:
+            digest.update(f"{path}:{os.stat(path).st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{path}:-\n".encode())
+    for root in watched_roots(workspace, product):
+        # Features are symlinks into the cache or the workspace root.
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+            dirnames[:] = sorted(
+                d for d in dirnames if d not in _SKIPPED_DIRS and not d.startswith(".")
+            )
+            for filename in sorted(filenames):
+                if not filename.endswith(_WATCHED_SUFFIXES):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                digest.update(f"{path}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+class Daemon:
+    def __init__(self, workspace: str, product: str | None):
+        self.workspace = workspace
+        self.product = product
+        self.path = socket_path(workspace, product)
+        self.started = time.time()
+        self.served = 0
+        self.env = dict(os.environ)
+        self.pinned = {key: os.getenv(key) for key in _PINNED_ENV}
+        self.fingerprint = ""
+        self.listener: socket.socket | None = None
+        self.pid: int | None = None
+        self.restart = False
+
+    def warm(self) -> None:
+        """Load every command and, with a product, build its app."""
+        from splent_cli.cli import cli
+
+        if self.product:
+            # Builds the app through dynamic_imports and keeps it cached;
+            # a product whose app cannot be built still gets warm commands.
+            cli._load_feature_commands()
+        self.fingerprint = fingerprint(self.workspace, self.product)
+
+    def bind(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory == runtime_dir():
+            _private_dir(directory)
+        else:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            if _connect(self.path, timeout=1) is not None:
+                raise RuntimeError(f"A daemon is already listening on {self.path}.")
+            os.unlink(self.path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o077)
+        try:
+            listener.bind(self.path)
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        listener.settimeout(1.0)
+        self.listener = listener
+        self.pid = os.getpid()
+
+    def close(self) -> None:
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+        # The socket path belongs to the server. A forked command child that
+        # got here has only closed its copy of the listener.
+        if os.getpid() != self.pid:
+            return
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def serve_forever(self) -> None:
+        try:
+            while self.listener is not None:
+                _reap()
+                try:
+                    conn, _ = self.listener.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    # Closed under us by SIGTERM.
+                    break
+                conn.settimeout(None)
+                self.handle(conn)
+                if self.restart:
+                    break
+        finally:
+            self.close()
+        if self.restart:
+            sys.stdout.flush()
+            os.execve(
+                sys.executable,
+                [sys.executable, "-m", "splent_cli", "daemon", "--foreground"],
+                self.env,
+            )
+
+    def handle(self, conn: socket.socket) -> None:
+        fds: list[int] = []
+        try:
+            _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+            line = next(_lines(conn), None)
+            message = json.loads(line) if line else {}
+            op = message.get("op")
+            if op == "status":
+                self._reply(conn, self.status())
+            elif op == "stop":
+                self._reply(conn, {"stopped": True, "pid": os.getpid()})
+                self.close()
+            elif op == "run" and len(fds) == 3:
+                self.run(conn, message, fds)
+        except (OSError, ValueError):
+            pass
+        finally:
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "product": self.product,
+            "workspace": self.workspace,
+            "started": self.started,
+            "served": self.served,
+        }
+
+    @staticmethod
+    def _reply(conn: socket.socket, payload: dict) -> None:
+        conn.sendall(json.dumps(payload).encode() + b"\n")
+
+    def declines(self, message: dict) -> str | None:
+        env = message.get("env") or {}
+        for key, value in self.pinned.items():
+            if env.get(key) and env.get(key) != value:
+                return f"{key} differs"
+        if fingerprint(self.workspace, self.product) != self.fingerprint:
+            self.restart = True
+            return "sources changed"
+        return None
+
+    def run(self, conn: socket.socket, message: dict, fds: list[int]) -> None:
+        reason = self.declines(message)
+        if reason:
+            conn.sendall(f"fallback {reason}\n".encode())
+            return
+        self.served += 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                self.listener.close()
+                code = _run_child(conn, message, fds, self.env)
+            finally:
+                os._exit(code)
+
+
+def _reap() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _after_fork() -> None:
+    """Give the child its own database connections, never the parent's."""
+    try:
+        from splent_cli.utils import dynamic_imports
+
+        app = dynamic_imports._app_instance
+        ext = app.extensions.get("sqlalchemy") if app is not None else None
+        if ext is not None:
+            with app.app_context():
+                for engine in ext.engines.values():
+                    engine.dispose(close=False)
+    except Exception:
+        pass
+
+
+def _child_signals() -> None:
+    """Signals as a plain ``splent`` process has them, not as the server does:
+    Ctrl-C interrupts the command and SIGTERM ends it."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _run_child(conn, message: dict, fds: list[int], base_env: dict) -> int:
+    """One command, in the forked child, on the caller's terminal."""
+    for target, fd in zip((0, 1, 2), fds):
+        os.dup2(fd, target)
+    os.environ.clear()
+    os.environ.update(base_env)
+    # The caller's shell wins over the .env files the daemon loaded.
+    os.environ.update(message.get("env") or {})
+    try:
+        os.chdir(message.get("cwd") or "/")
+    except OSError:
+        pass
+    _child_signals()
+    _after_fork()
+
+    from splent_cli.cli import cli
+    from splent_cli.utils import metrics, trace
+
+    argv = list(message.get("argv") or [])
+    sys.argv = ["splent", *argv]
+    conn.sendall(f"pid {os.getpid()}\n".encode())
+    code = 0
+    try:
+        cli.main(args=argv, prog_name="splent")
+    except BaseException as exc:
+        code = metrics.exit_code(exc)
+        if not isinstance(exc, SystemExit):
+            import traceback
+
+            traceback.print_exc()
+    finally:
+        if trace.enabled():
+            trace.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    try:
+        conn.sendall(f"exit {code}\n".encode())
+    except OSError:
+        pass
+    return code
+
+
+def serve(workspace: str, product: str | None) -> None:
+    """Warm up, then answer until stopped. Runs in the foreground."""
+    daemon = Daemon(workspace, product)
+    daemon.warm()
+    daemon.bind()
+    signal.signal(signal.SIGTERM, lambda *_: daemon.close())
+    daemon.serve_forever()
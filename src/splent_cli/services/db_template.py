@@ -0,0 +1,174 @@
+"""
+Database templates: a snapshot of a freshly migrated and seeded database.
+
+``db:seed --save-template`` dumps the active product's database once it has
+been migrated and seeded, together with the migration head of every feature
+at that moment. ``db:reset --from-template`` loads that dump back in one bulk
+SQL load instead of running every feature's migrations and seeders again,
+which is what makes a demo reset or a functional test setup take seconds.
+
+A template is only used while it still describes the code: when any feature's
+migration head differs from the one recorded, the template is stale and the
+reset runs the migrations as it always did.
+
+Templates live in the workspace cache, one per product:
+
+    .splent_cache/db_templates/<product>.sql   the dump (0600, it holds hashes)
+    .splent_cache/db_templates/<product>.json  {"heads": {...}, "created": ...}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+import click
+
+from splent_cli.utils.io_utils import atomic_write
+from splent_cli.utils.proc import run
+
+_CLIENT_HINT = (
+    "Install the MariaDB/MySQL client tools (provides 'mysqldump' and 'mysql')."
+)
+
+_CREDENTIAL_VARS = (
+    "MARIADB_HOSTNAME",
+    "MARIADB_USER",
+    "MARIADB_PASSWORD",
+    "MARIADB_DATABASE",
+)
+
+
+def mariadb_credentials() -> dict[str, str]:
+    """The connection settings db:dump and db:restore read from the env.
+
+    Raises a ClickException naming every variable that is missing.
+    """
+    values = {k: os.getenv(k, "") for k in _CREDENTIAL_VARS}
+    missing = [k for k, v in values.items() if not v]
+    if missing:
+        raise click.ClickException(f"Missing env vars: {', '.join(missing)}")
+    return values
+
+
+def client_env(creds: dict[str, str]) -> dict:
+    """Environment for the mysql/mysqldump clients.
+
+    The password travels in the environment, never on the command line,
+    where any user on the machine could read it from the process list.
+    """
+    return {**os.environ, "MYSQL_PWD": creds["MARIADB_PASSWORD"]}
+
+
+def template_paths(workspace: str, product: str) -> tuple[str, str]:
+    """(dump path, metadata path) of the product's template."""
+    base = os.path.join(workspace, ".splent_cache", "db_templates")
+    return os.path.join(base, f"{product}.sql"), os.path.join(base, f"{product}.json")
+
+
+def read_template(workspace: str, product: str) -> dict | None:
+    """The template's metadata, or None when there is no usable template."""
+    sql_path, meta_path = template_paths(workspace, product)
+    if not os.path.isfile(sql_path) or not os.path.isfile(meta_path):
+        return None
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(meta, dict) or not isinstance(meta.get("heads"), dict):
+        return None
+    return meta
+
+
+def stale_features(meta: dict, heads: dict[str, str | None]) -> list[str]:
+    """Features whose migration head is not the one the template recorded.
+
+    A feature added or removed since the snapshot counts as changed too.
+    """
+    recorded = meta.get("heads", {})
+    return sorted(
+        feat
+        for feat in set(recorded) | set(heads)
+        if recorded.get(feat) != heads.get(feat)
+    )
+
+
+def save_template(
+    workspace: str,
+    product: str,
+    heads: dict[str, str | None],
+    creds: dict[str, str],
+) -> str:
+    """Dump the database as the product's template. Returns the dump path.
+
+    The dump is written to a temp file and only replaces the previous
+    template once mysqldump succeeded, so a failed snapshot leaves the old
+    template in place.
+    """
+    sql_path, meta_path = template_paths(workspace, product)
+    os.makedirs(os.path.dirname(sql_path), exist_ok=True)
+
+    # mkstemp creates the file 0600, which os.replace keeps: the dump holds
+    # every password hash in the user table.
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{product}.", suffix=".sql.tmp", dir=os.path.dirname(sql_path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as out:
+            run(
+                [
+                    "mysqldump",
+                    "--single-transaction",
+                    "--quick",
+                    "--default-character-set=utf8mb4",
+                    # One multi-row INSERT per batch of rows and keys disabled
+                    # while they load: the dump restores as a bulk load.
+                    "--extended-insert",
+                    "--disable-keys",
+                    "--add-drop-table",
+                    f"-h{creds['MARIADB_HOSTNAME']}",
+                    f"-u{creds['MARIADB_USER']}",
+                    creds["MARIADB_DATABASE"],
+                ],
+                stdout=out,
+                text=False,
+                env=client_env(creds),
+                tool_hint=_CLIENT_HINT,
+            )
+        os.replace(tmp_path, sql_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    meta = {
+        "heads": heads,
+        "database": creds["MARIADB_DATABASE"],
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    atomic_write(meta_path, json.dumps(meta, indent=2, sort_keys=True) + "\n")
+    return sql_path
+
+
+def load_template(workspace: str, product: str, creds: dict[str, str]) -> None:
+    """Load the product's template into the database in one SQL stream.
+
+    The caller empties the schema first; the dump recreates every table it
+    holds, data included, along with the migration tracking tables.
+    """
+    sql_path, _ = template_paths(workspace, product)
+    with open(sql_path, "rb") as sql_file:
+        run(
+            [
+                "mysql",
+                f"-h{creds['MARIADB_HOSTNAME']}",
+                f"-u{creds['MARIADB_USER']}",
+                creds["MARIADB_DATABASE"],
+            ],
+            stdin=sql_file,
+            env=client_env(creds),
+            tool_hint=_CLIENT_HINT,
+        )
@@ -0,0 +1,325 @@
+"""
+One index of the feature metadata in a workspace.
+
+feature:xray, feature:compat (and product:validate through it),
+feature:refine, check:contracts, the release's service inference and the
+marketplace's workspace scan all need the same thing: every feature within
+reach, where it lives, and what its pyproject.toml says (contract,
+refinement, provides and requires). Each found it its own way, globbing the
+workspace root and ``.splent_cache/features/<ns>/<name>@*`` and parsing
+every pyproject again, so a product with forty features paid forty parses
+per command, and a little more for each of those commands it ran.
+
+The index is a SQLite database, ``.splent_cache/features.db``, with one row
+per feature directory:
+
+  * ``splent_feature_*`` directories at the workspace root (editable), and
+  * every entry of ``.splent_cache/features/<namespace>/`` (an editable
+    ``<name>`` or a versioned ``<name>@<version>`` snapshot).
+
+Each row keeps the directory's location, namespace, name and version, and
+the parsed pyproject as JSON. Opening the index lists those directories
+(three or four ``scandir`` calls) and brings the rows up to date:
+
+  * a versioned snapshot is read-only, so once its row is stored it is not
+    even stat'ed again;
+  * any other pyproject is parsed again only when its mtime or size
+    changed; one modified within the last couple of seconds is stored
+    without a stamp and parsed again next time, since a second write in the
+    same clock tick would not show (the rule utils/io_utils uses);
+  * rows for directories that are gone are dropped.
+
+A directory with no pyproject, or one that does not parse, still has a row;
+its document is empty. A pyproject that does not parse also leaves its
+error on the row (``parse_error``), worded as ``io_utils.load_toml`` words
+it, so a command that validates features reports the broken file instead
+of reading it as a contract that provides and requires nothing. The
+database is only a cache: if it cannot be read or written it is rebuilt, or
+the index is built in memory for this command, so deleting it is always
+safe.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import time
+import tomllib
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from pathlib import Path
+
+from splent_cli.utils import io_utils
+
+INDEX_SCHEMA = 2
+FEATURE_PREFIX = "splent_feature_"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    path TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    namespace TEXT,
+    name TEXT NOT NULL,
+    version TEXT,
+    mtime_ns INTEGER,
+    size INTEGER,
+    document TEXT,
+    parse_error TEXT
+)
+"""
+
+
+def index_path(workspace: str | os.PathLike) -> Path:
+    return Path(workspace) / ".splent_cache" / "features.db"
+
+
+def version_key(version: str | None) -> tuple:
+    """Semver sort key for ``v1.10.0``; anything else sorts first."""
+    m = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version or "")
+    if not m:
+        return (-1, -1, -1)
+    return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+@dataclass(frozen=True)
+class FeatureRecord:
+    """One feature directory and its pyproject.toml.
+
+    ``source`` is ``"workspace"`` (an editable feature at the workspace root,
+    ``namespace`` None) or ``"cache"``; ``version`` is None for an editable
+    entry. ``parse_error`` says why a pyproject.toml that is there could not
+    be read; the document is then empty.
+    """
+
+    path: Path
+    source: str
+    namespace: str | None
+    name: str
+    version: str | None
+    raw: str | None = field(default=None, repr=False, compare=False)
+    parse_error: str | None = field(default=None, compare=False)
+
+    @property
+    def entry(self) -> str:
+        """The directory name: ``<name>`` or ``<name>@<version>``."""
+        return self.path.name
+
+    @property
+    def short(self) -> str:
+        return self.name.removeprefix(FEATURE_PREFIX)
+
+    @cached_property
+    def document(self) -> dict:
+        """The parsed pyproject.toml, read-only; empty if it had none."""
+        return io_utils.freeze(json.loads(self.raw) if self.raw else {})
+
+    @property
+    def project_version(self) -> str | None:
+        return self.document.get("project", {}).get("version")
+
+    @property
+    def splent(self) -> dict:
+        """``[tool.splent]``."""
+        return self.document.get("tool", {}).get("splent", {})
+
+    @property
+    def contract(self) -> dict:
+        return self.splent.get("contract", {})
+
+    @property
+    def refinement(self) -> dict:
+        return self.splent.get("refinement", {})
+
+    @property
+    def provides(self) -> dict:
+        return self.contract.get("provides", {})
+
+    @property
+    def requires(self) -> dict:
+        return self.contract.get("requires", {})
+
+
+# ── The disk ──────────────────────────────────────────────────────────
+
+
+def _subdirs(path: Path) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return [e for e in it if e.is_dir() and not e.name.startswith(".")]
+    except OSError:
+        return []
+
+
+def scan(workspace: str | os.PathLike) -> list[FeatureRecord]:
+    """Every feature directory in reach, without reading any pyproject."""
+    ws = Path(workspace)
+    found = [
+        FeatureRecord(Path(e.path), "workspace", None, e.name, None)
+        for e in _subdirs(ws)
+        if e.name.startswith(FEATURE_PREFIX)
+    ]
+    for ns_dir in _subdirs(ws / ".splent_cache" / "features"):
+        for e in _subdirs(Path(ns_dir.path)):
+            name, _, version = e.name.partition("@")
+            found.append(
+                FeatureRecord(Path(e.path), "cache", ns_dir.name, name, version or None)
+            )
+    return found
+
+
+def _parse(
+    pyproject: Path,
+) -> tuple[int | None, int | None, str | None, str | None]:
+    """``(mtime_ns, size, document JSON, parse error)``; no stamp while the
+    file is racy."""
+    try:
+        st = pyproject.stat()
+    except OSError:
+        return None, None, None, None
+    raw = error = None
+    label = f"{pyproject.parent.name} pyproject.toml"
+    try:
+        raw = json.dumps(io_utils.read_toml(pyproject), default=str)
+    except tomllib.TOMLDecodeError as e:
+        error = f"{label} is not valid TOML ({pyproject}):\n  {e}"
+    except OSError as e:
+        error = f"Could not read {label} ({pyproject}): {e}"
+    if time.time_ns() - st.st_mtime_ns <= io_utils.RACY_NS:
+        return None, None, raw, error
+    return st.st_mtime_ns, st.st_size, raw, error
+
+
+# ── The index ─────────────────────────────────────────────────────────
+
+
+class FeatureIndex:
+    """The features of one workspace, brought up to date when opened."""
+
+    def __init__(self, workspace: str | os.PathLike):
+        self.workspace = Path(workspace)
+        self.path = index_path(workspace)
+        self._records = self._refresh()
+
+    def _connect(self) -> sqlite3.Connection:
+        """The database, rebuilt if unreadable; in memory if the disk refuses."""
+        for fresh in (False, True):
+            conn = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if fresh:
+                    self.path.unlink(missing_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5)
+                if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_SCHEMA:
+                    conn.execute("DROP TABLE IF EXISTS features")
+                    conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA}")
+                conn.execute(_SCHEMA)
+                return conn
+            except (OSError, sqlite3.Error):
+                if conn is not None:
+                    conn.close()
+        conn = sqlite3.connect(":memory:")
+        conn.execute(_SCHEMA)
+        return conn
+
+    def _refresh(self) -> list[FeatureRecord]:
+        found = scan(self.workspace)
+        conn = self._connect()
+        try:
+            try:
+                return self._sync(conn, found)
+            except sqlite3.Error:
+                conn.close()
+                conn = sqlite3.connect(":memory:")
+                conn.execute(_SCHEMA)
+                return self._sync(conn, found)
+        finally:
+            conn.close()
+
+    def _sync(
+        self, conn: sqlite3.Connection, found: list[FeatureRecord]
+    ) -> list[FeatureRecord]:
+        stored = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT path, mtime_ns, size, document, parse_error FROM features"
+            )
+        }
+        records = []
+        with conn:
+            for record in found:
+                key = str(record.path)
+                row = stored.pop(key, None)
+                pyproject = record.path / "pyproject.toml"
+                if row is not None and row[0] is not None:
+                    if record.version is not None and record.source == "cache":
+                        records.append(replace(record, raw=row[2], parse_error=row[3]))
+                        continue
+                    try:
+                        st = pyproject.stat()
+                    except OSError:
+                        st = None
+                    if st and (st.st_mtime_ns, st.st_size) == (row[0], row[1]):
+                        records.append(replace(record, raw=row[2], parse_error=row[3]))
+                        continue
+                mtime_ns, size, raw, error = _parse(pyproject)
+                conn.execute(
+                    "INSERT OR REPLACE INTO features VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        record.source,
+                        record.namespace,
+                        record.name,
+                        record.version,
+                        mtime_ns,
+                        size,
+                        raw,
+                        error,
+                    ),
+                )
+                records.append(replace(record, raw=raw, parse_error=error))
+            conn.executemany(
+                "DELETE FROM features WHERE path = ?", [(key,) for key in stored]
+            )
+        return sorted(records, key=_order)
+
+    # ── Queries ──
+
+    def records(self, source: str | None = None) -> list[FeatureRecord]:
+        """Every feature, workspace first, then the cache by namespace and entry."""
+        return [r for r in self._records if source is None or r.source == source]
+
+    def lookup(self, name: str, namespace: str | None = None) -> list[FeatureRecord]:
+        """The directories of feature ``name``, in the order they are preferred:
+        the workspace root, the cache's editable entry, then its snapshots.
+        ``namespace`` only narrows the cache entries."""
+        return [
+            r
+            for r in self._records
+            if r.name == name
+            and (
+                namespace is None or r.source == "workspace" or r.namespace == namespace
+            )
+        ]
+
+    def find(
+        self, name: str, namespace: str | None = None, version: str | None = None
+    ) -> FeatureRecord | None:
+        """Where ``name`` resolves: the workspace root if it is there, else the
+        cache entry for ``version`` (any entry, editable first, without one)."""
+        for record in self.lookup(name, namespace):
+            if record.source == "workspace" or version in (None, record.version):
+                return record
+        return None
+
+
+def _order(record: FeatureRecord) -> tuple:
+    return (
+        record.source != "workspace",
+        record.namespace or "",
+        record.name,
+        record.version is not None,
+        record.entry,
+    )
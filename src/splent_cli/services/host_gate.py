@@ -0,0 +1,119 @@
+"""
+Per-host concurrency limit and shared rate-limit backoff for registry lookups.
+
+Commands that ask GitHub or PyPI about every package of a workspace
+(check:releases first) run their lookups on a thread pool. Without a gate,
+that pool is also how fast we hit each API: sixteen threads on
+api.github.com is sixteen requests in flight against a 60-per-hour
+anonymous budget, and when the limit is reached every thread finds out on
+its own, each one spending another request to learn the same thing.
+
+A :class:`HostGate` sits in front of one host:
+
+  * at most ``limit`` calls are in flight at once; the rest wait their turn.
+  * when a call comes back rate limited, the host is paused for everyone,
+    for as long as the server asked (Retry-After / X-RateLimit-Reset) or a
+    short exponential backoff when it did not say, and the call is retried.
+  * when the wait would be longer than ``max_wait``, or the retries are used
+    up, the gate gives up on the host: every later call fails at once with
+    the same :class:`~splent_cli.services.registry.RegistryError`, without
+    asking the server again. A primary GitHub limit resets within the hour,
+    no CLI run should sit there waiting for it.
+
+Only rate limiting is handled here. Any other RegistryError goes straight
+back to the caller, which decides how loud to be, as with direct calls.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+
+from splent_cli.services.registry import RegistryError
+
+# First wait, in seconds, after a rate-limited answer that did not say how
+# long to wait; doubled on each retry.
+BACKOFF = 2.0
+
+
+class HostGate:
+    """Serialises calls to one host down to ``limit`` at a time. Thread safe."""
+
+    def __init__(
+        self,
+        host: str,
+        limit: int,
+        *,
+        retries: int = 2,
+        max_wait: float = 30.0,
+        backoff: float | None = None,
+    ):
+        self.host = host
+        self.retries = retries
+        self.max_wait = max_wait
+        self.backoff = BACKOFF if backoff is None else backoff
+        self._slots = threading.BoundedSemaphore(max(1, limit))
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._gave_up: RegistryError | None = None
+        # Overridable so tests need not sleep.
+        self.sleep = time.sleep
+        self.clock = time.monotonic
+
+    @property
+    def exhausted(self) -> bool:
+        """Has this gate given up on its host for the rest of the run?"""
+        return self._gave_up is not None
+
+    def _pause(self) -> None:
+        """Wait out a backoff another call started; raise if the host is gone."""
+        while True:
+            with self._lock:
+                if self._gave_up is not None:
+                    raise self._gave_up
+                delay = self._resume_at - self.clock()
+            if delay <= 0:
+                return
+            self.sleep(delay)
+
+    def _rate_limited(self, error: RegistryError, attempt: int) -> None:
+        """Pause the host for everyone, or give up on it. Called with no slot held."""
+        wait = error.retry_after
+        if wait is None:
+            wait = self.backoff * (2**attempt)
+        with self._lock:
+            if self._gave_up is not None:
+                raise self._gave_up
+            if attempt >= self.retries or wait > self.max_wait:
+                self._gave_up = error
+                raise error
+            self._resume_at = max(self._resume_at, self.clock() + wait)
+
+    def call(self, fn, *args, **kwargs):
+        """``fn(*args, **kwargs)`` within the host's limit and backoff."""
+        attempt = 0
+        while True:
+            self._pause()
+            with self._slots:
+                # A call that waited for a slot may have waited through a
+                # backoff that ended with the gate giving up.
+                with self._lock:
+                    if self._gave_up is not None:
+                        raise self._gave_up
+                try:
+                    return fn(*args, **kwargs)
+                except RegistryError as e:
+                    if not e.rate_limited:
+                        raise
+                    error = e
+            self._rate_limited(error, attempt)
+            attempt += 1
+
+
+def resolved(value) -> Future:
+    """A Future already holding *value*: a lookup a batched answer already
+    settled, where the rest of the lookups are still in flight on a pool."""
+    future: Future = Future()
+    future.set_result(value)
+    return future
@@ -32,6 +32,9 @@ from pathlib import Path
 
 import click
 
+from splent_cli.services.feature_index import FeatureIndex
+from splent_cli.utils.io_utils import thaw
+
 INDEX_SCHEMA = 1
 FEATURE_PREFIX = "splent_feature_"
 
@@ -63,7 +66,26 @@ def feature_entry_from_pyproject(
     ``source`` is ``"github"`` (contract read at a released tag) or
     ``"workspace"`` (editable feature scanned locally).
     """
-    data = tomllib.loads(pyproject_text)
+    return feature_entry_from_data(
+        tomllib.loads(pyproject_text),
+        org=org,
+        repo=repo,
+        source=source,
+        version=version,
+        github=github,
+    )
+
+
+def feature_entry_from_data(
+    data: dict,
+    *,
+    org: str,
+    repo: str,
+    source: str,
+    version: str | None,
+    github: dict | None = None,
+) -> dict:
+    """:func:`feature_entry_from_pyproject` for an already parsed pyproject."""
     project = data.get("project", {})
     splent = data.get("tool", {}).get("splent", {})
     contract = splent.get("contract", {})
@@ -136,34 +158,35 @@ def build_remote_features(
     for ref in extra_repos:
         targets.append((ref, None))
 
+    refs = list(dict.fromkeys(ref for ref, _ in targets))
+    known_meta = {ref: meta for ref, meta in targets if meta is not None}
+    _note(f"fetching {len(refs)} repositories")
+    # Metadata, the newest tags and pyproject.toml at the latest one, for
+    # every repo at once (GraphQL in batches with a token, REST without).
+    # Resolved loudly: a rate limit here must abort the build (propagating
+    # RegistryError) instead of masquerading as "no released tags" and
+    # silently producing a truncated index.
+    snapshots = registry.fetch_repo_snapshots(
+        refs, token, file="pyproject.toml", known_meta=known_meta
+    )
+
     entries: list[dict] = []
-    seen: set[str] = set()
-    for ref, repo_meta in targets:
-        if ref in seen:
-            continue
-        seen.add(ref)
+    for ref in refs:
         org, _, repo = ref.partition("/")
         _note(f"indexing {ref}")
 
-        if repo_meta is None:
-            repo_meta = registry.fetch_repo(org, repo, token)
-            if repo_meta is None:
-                problems.append(f"{ref}: repo not found")
-                continue
+        snapshot = snapshots.get(ref)
+        if snapshot is None:
+            problems.append(f"{ref}: repo not found")
+            continue
+        repo_meta = snapshot.meta
 
-        # Resolve the version loudly: a rate limit here must abort the build
-        # (propagating RegistryError) instead of masquerading as "no released
-        # tags" and silently producing a truncated index.
-        tags = registry.list_tags(org, repo, token, max_pages=1)
-        ordered = registry.semver_sorted(tags)
-        version = ordered[0] if ordered else (tags[0] if tags else None)
+        version = snapshot.latest_tag
         if not version:
             problems.append(f"{ref}: no released tags — skipped (release it first)")
             continue
 
-        pyproject_text = registry.fetch_file(
-            org, repo, "pyproject.toml", ref=version, token=token
-        )
+        pyproject_text = snapshot.file_text
         if pyproject_text is None:
             problems.append(f"{ref}@{version}: pyproject.toml not found at tag")
             continue
@@ -202,24 +225,18 @@ def build_remote_features(
 
 def build_workspace_features(workspace: str) -> list[dict]:
     """Index the editable features present at the workspace root (no network)."""
-    entries = []
-    for pyproject in sorted(Path(workspace).glob(f"{FEATURE_PREFIX}*/pyproject.toml")):
-        repo = pyproject.parent.name
-        try:
-            text = pyproject.read_text()
-            entry = feature_entry_from_pyproject(
-                text,
-                org=os.getenv("SPLENT_DEFAULT_NAMESPACE", "splent_io").replace(
-                    "_", "-"
-                ),
-                repo=repo,
-                source="workspace",
-                version=None,
-            )
-        except (OSError, tomllib.TOMLDecodeError):
-            continue
-        entries.append(entry)
-    return entries
+    org = os.getenv("SPLENT_DEFAULT_NAMESPACE", "splent_io").replace("_", "-")
+    return [
+        feature_entry_from_data(
+            thaw(record.document),
+            org=org,
+            repo=record.name,
+            source="workspace",
+            version=None,
+        )
+        for record in FeatureIndex(workspace).records("workspace")
+        if record.raw
+    ]
 
 
 # ── Computed relations ────────────────────────────────────────────────
@@ -29,6 +29,7 @@ import re
 import requests
 
 from splent_cli.services.marketplace_url import normalize_registry_url
+from splent_cli.utils import trace
 
 USER_AGENT = "splent-cli"
 
@@ -452,31 +453,36 @@ class MarketplaceClient:
         transport failure, so callers only ever deal with one exception type.
         """
         url = self._url(path)
-        try:
-            response = requests.request(
-                method,
-                url,
-                headers=self._headers(auth=auth),
-                json=json_body,
-                files=files,
-                data=data,
-                timeout=timeout or self.timeout,
-            )
-        except requests.Timeout:
-            raise MarketplaceError(
-                f"The marketplace at {self.base_url} did not answer in time.",
-                status=None,
-                code=CODE_UNREACHABLE,
-                reason=f"no answer within {timeout or self.timeout} seconds",
-            )
-        except requests.RequestException as e:
-            reason = _transport_reason(e)
-            raise MarketplaceError(
-                f"Could not reach the marketplace at {self.base_url} ({reason}).",
-                status=None,
-                code=CODE_UNREACHABLE,
-                reason=reason,
-            )
+        with trace.span(f"{method.upper()} {url}", "http", url=url) as span:
+            try:
+                response = requests.request(
+                    method,
+                    url,
+                    headers=self._headers(auth=auth),
+                    json=json_body,
+                    files=files,
+                    data=data,
+                    timeout=timeout or self.timeout,
+                )
+            except requests.Timeout:
+                raise MarketplaceError(
+                    f"The marketplace at {self.base_url} did not answer in time.",
+                    status=None,
+                    code=CODE_UNREACHABLE,
+                    reason=f"no answer within {timeout or self.timeout} seconds",
+                )
+            except requests.RequestException as e:
+                reason = _transport_reason(e)
+                raise MarketplaceError(
+                    f"Could not reach the marketplace at {self.base_url} ({reason}).",
+                    status=None,
+                    code=CODE_UNREACHABLE,
+                    reason=reason,
+                )
+            span["status"] = getattr(response, "status_code", None)
+            content = getattr(response, "content", None)
+            if isinstance(content, (bytes, str)):
+                span["bytes"] = len(content)
 
         status = getattr(response, "status_code", 0) or 0
         if 200 <= status < 300:
@@ -0,0 +1,214 @@
+"""
+Feature revision graphs, read from the migration scripts on disk and cached.
+
+Every feature ships its own Alembic branch under <feature>/migrations/versions.
+Knowing a branch's head used to mean regex-parsing every script in it, on
+every call, and asking Alembic whether a feature had anything to apply meant
+building its whole script directory and running its env.py. Container
+entrypoints run ``splent db:upgrade`` on every start, almost always with
+nothing to do, so that cost was paid over and over to learn nothing.
+
+A graph here is just ``{revision: (down_revision, ...)}``. It is cached in
+this process and, across processes, in .splent_cache/migration_graphs.json,
+keyed by the versions directory and invalidated by the name, size and mtime
+of every script in it: listing a directory is all it takes to know the cached
+graph still holds, and nothing is parsed unless a script changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+
+from splent_cli.utils.io_utils import atomic_write
+
+CACHE_FILE = "migration_graphs.json"
+_CACHE_FORMAT = 1
+
+# Both the plain and the annotated form Alembic's templates have used:
+#   revision = "abc"          revision: str = "abc"
+#   down_revision = None      down_revision: Union[str, None] = ("a", "b")
+_REVISION_RE = re.compile(r"^revision(?::[^=\n]+)?\s*=\s*['\"]([^'\"]+)['\"]", re.M)
+_DOWN_REVISION_RE = re.compile(r"^down_revision(?::[^=\n]+)?\s*=\s*(.+)$", re.M)
+_QUOTED_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+
+
+@dataclass(frozen=True)
+class RevisionGraph:
+    """One feature's migration scripts: each revision and the ones below it."""
+
+    revisions: dict[str, tuple[str, ...]]
+
+    @property
+    def heads(self) -> list[str]:
+        """Revisions no other revision builds on, sorted."""
+        below = {down for downs in self.revisions.values() for down in downs}
+        return sorted(rev for rev in self.revisions if rev not in below)
+
+    @property
+    def head(self) -> str | None:
+        """The head revision, or None for a feature without scripts."""
+        heads = self.heads
+        return heads[0] if heads else None
+
+    def is_current(self, db_revision: str | None) -> bool:
+        """True if a database at ``db_revision`` has nothing left to apply.
+
+        A branch with several heads is never current: which of them the
+        database should end up at is for Alembic to work out.
+        """
+        heads = self.heads
+        return len(heads) == 1 and db_revision == heads[0]
+
+    def pending(self, db_revision: str | None) -> list[str]:
+        """Revisions between ``db_revision`` and the head, oldest first."""
+        applied: set[str] = set()
+        stack = [db_revision] if db_revision in self.revisions else []
+        while stack:
+            rev = stack.pop()
+            if rev not in applied:
+                applied.add(rev)
+                stack.extend(self.revisions.get(rev, ()))
+
+        ordered: list[str] = []
+        seen: set[str] = set()
+
+        def visit(rev: str) -> None:
+            if rev in seen or rev in applied or rev not in self.revisions:
+                return
+            seen.add(rev)
+            for down in self.revisions[rev]:
+                visit(down)
+            ordered.append(rev)
+
+        for head in self.heads:
+            visit(head)
+        return ordered
+
+
+def _versions_dir(mdir: str) -> str:
+    return os.path.join(mdir, "versions")
+
+
+def _fingerprint(versions_dir: str) -> list[list] | None:
+    """Name, size and mtime of every script, or None if there is no directory."""
+    try:
+        entries = list(os.scandir(versions_dir))
+    except OSError:
+        return None
+    prints = []
+    for entry in entries:
+        if not entry.name.endswith(".py"):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        prints.append([entry.name, st.st_size, st.st_mtime_ns])
+    return sorted(prints)
+
+
+def parse_versions(versions_dir: str) -> RevisionGraph:
+    """Build the graph from the scripts in ``versions_dir``, uncached."""
+    revisions: dict[str, tuple[str, ...]] = {}
+    try:
+        names = os.listdir(versions_dir)
+    except OSError:
+        names = []
+    for name in names:
+        if not name.endswith(".py"):
+            continue
+        try:
+            with open(os.path.join(versions_dir, name), encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        rev = _REVISION_RE.search(content)
+        if not rev:
+            continue
+        down = _DOWN_REVISION_RE.search(content)
+        downs = tuple(_QUOTED_RE.findall(down.group(1))) if down else ()
+        revisions[rev.group(1)] = downs
+    return RevisionGraph(revisions)
+
+
+# versions dir -> (fingerprint, graph), for the life of this process.
+_memo: dict[str, tuple[list, RevisionGraph]] = {}
+
+
+def _graph(versions_dir: str, fingerprint: list, disk: dict) -> RevisionGraph:
+    """The graph for ``fingerprint``, from memory, the disk cache, or the scripts."""
+    memo = _memo.get(versions_dir)
+    if memo and memo[0] == fingerprint:
+        return memo[1]
+    cached = disk.get(versions_dir)
+    if cached and cached.get("fingerprint") == fingerprint:
+        graph = RevisionGraph(
+            {rev: tuple(downs) for rev, downs in cached["revisions"].items()}
+        )
+    else:
+        graph = parse_versions(versions_dir)
+    _memo[versions_dir] = (fingerprint, graph)
+    return graph
+
+
+def _read_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+        return {}
+    graphs = data.get("graphs")
+    return graphs if isinstance(graphs, dict) else {}
+
+
+def load_graphs(
+    dirs: dict[str, str], cache_path: str | None = None
+) -> dict[str, RevisionGraph]:
+    """Graphs for ``{feature: migrations_dir}``, through the caches.
+
+    With ``cache_path``, graphs are also read from and written back to that
+    file, which is only rewritten when something in it changed. A cache
+    that cannot be read or written is ignored: it only ever saves time.
+    """
+    disk = _read_cache(cache_path) if cache_path else {}
+    graphs: dict[str, RevisionGraph] = {}
+    fresh: dict[str, dict] = {}
+    for feature, mdir in dirs.items():
+        versions_dir = _versions_dir(mdir)
+        fingerprint = _fingerprint(versions_dir)
+        if fingerprint is None:
+            graphs[feature] = RevisionGraph({})
+            continue
+        graph = _graph(versions_dir, fingerprint, disk)
+        graphs[feature] = graph
+        fresh[versions_dir] = {
+            "fingerprint": fingerprint,
+            "revisions": {rev: list(downs) for rev, downs in graph.revisions.items()},
+        }
+
+    if cache_path and any(disk.get(k) != v for k, v in fresh.items()):
+        try:
+            atomic_write(
+                cache_path,
+                json.dumps(
+                    {"format": _CACHE_FORMAT, "graphs": {**disk, **fresh}}, indent=1
+                ),
+            )
+        except OSError:
+            pass
+    return graphs
+
+
+def filesystem_head(mdir: str) -> str | None:
+    """Head revision of the scripts under ``mdir``/versions, or None."""
+    return load_graphs({"": mdir})[""].head
+
+
+def cache_path_for(workspace: str) -> str:
+    """Where a workspace keeps its graph cache."""
+    return os.path.join(workspace, ".splent_cache", CACHE_FILE)
@@ -0,0 +1,597 @@
+"""
+Parallel, chunked database dumps: ``db:dump --parallel N`` and the matching
+``db:restore`` of a dump directory.
+
+A plain ``db:dump`` is one mysqldump stream into one file, compressed on one
+core afterwards, and restoring it replays that stream statement by statement.
+On a large product both ends take long enough to overlap with traffic.
+
+The parallel dump is a directory instead:
+
+    dump_<db>_<timestamp>/
+      manifest.json            tables, their schema, chunk files, row counts,
+                               and the views, routines and triggers
+      <table>.00001.sql.gz     INSERT statements, one per line, gzip'd
+      <table>.00002.sql.gz     ...a new chunk every CHUNK_BYTES of SQL
+
+Consistency: N worker connections each read the tables inside their own
+transaction, and those transactions must all see the same data. A control
+connection takes ``LOCK TABLES ... READ`` on every table, which stops writers
+but not readers, the workers open ``START TRANSACTION WITH CONSISTENT
+SNAPSHOT`` while it holds them, and the locks are released as soon as the
+last snapshot exists, a matter of milliseconds. ``LOCK TABLES`` needs only the
+database-level privilege the product's user already has, unlike ``FLUSH
+TABLES WITH READ LOCK``.
+
+Each worker compresses what it dumps, so compression runs on as many cores
+as there are workers.
+
+The restore creates every table without its secondary indexes and foreign
+keys, loads the chunks concurrently through the ``mysql`` client with
+foreign key and unique checks off, then builds each table's indexes in one
+``ALTER TABLE`` once its rows are in, and adds the foreign keys last. Building
+an index over loaded rows is much cheaper than maintaining it row by row.
+Views, stored functions and procedures, and triggers are created after that,
+functions first so a view can call them and triggers last so they never fire
+on restored rows. Their DEFINER clause is left out: the objects belong to
+the user that restores them, who may not be allowed to name another one.
+
+Dumping reads rows through PyMySQL, the driver the product already talks to
+the database with; restoring needs only the ``mysql`` client.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import queue
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+import click
+
+from splent_cli.services.db_template import client_env
+from splent_cli.utils.proc import run
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 2
+# Format 1 had no views, routines or triggers; it restores the same way.
+_RESTORABLE_FORMATS = (1, 2)
+
+# SQL text per chunk file before a new one starts. Bounded so restore can
+# hand a whole chunk to one mysql process, and so a big table is loaded by
+# several workers at once instead of being the one job everyone waits for.
+CHUNK_BYTES = 64 * 1024 * 1024
+
+# Upper bound for one multi-row INSERT, well below the server's default
+# max_allowed_packet (16 MB on MariaDB).
+INSERT_BYTES = 1024 * 1024
+
+_CLIENT_HINT = "Install the MariaDB/MySQL client tools (provides 'mysql')."
+
+# Secondary index clauses in SHOW CREATE TABLE output.
+_INDEX_RE = re.compile(r"^(UNIQUE |FULLTEXT |SPATIAL )?KEY ")
+_FOREIGN_KEY_RE = re.compile(r"^CONSTRAINT .* FOREIGN KEY ")
+# The DEFINER clause of SHOW CREATE VIEW/FUNCTION/PROCEDURE/TRIGGER output.
+_DEFINER_RE = re.compile(r" DEFINER=`(?:[^`]|``)*`@`(?:[^`]|``)*`")
+
+# Sent ahead of every data chunk. The rows came out of a consistent database,
+# so re-checking them is wasted work, and one commit per chunk instead of one
+# per statement is what makes the load a bulk load.
+_LOAD_HEADER = (
+    b"SET NAMES utf8mb4;\n"
+    b"SET FOREIGN_KEY_CHECKS=0;\n"
+    b"SET UNIQUE_CHECKS=0;\n"
+    b"SET autocommit=0;\n"
+)
+_LOAD_FOOTER = b"COMMIT;\n"
+
+
+@dataclass
+class TableSchema:
+    """A table's CREATE statement, split into what can wait until the rows are in."""
+
+    create: str
+    indexes: list[str] = field(default_factory=list)
+    foreign_keys: list[str] = field(default_factory=list)
+
+
+@dataclass
+class TableResult:
+    """What one table took to dump or restore."""
+
+    name: str
+    rows: int
+    bytes: int
+    seconds: float
+    chunks: list[str] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes of SQL per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def split_create_table(create_sql: str) -> TableSchema:
+    """Separate secondary indexes and foreign keys from a CREATE TABLE.
+
+    Works on the one-clause-per-line layout SHOW CREATE TABLE produces. The
+    primary key and CHECK constraints stay in the CREATE. A table whose
+    AUTO_INCREMENT column has no primary key keeps all its indexes, because
+    the server refuses an auto-increment column that is not indexed.
+    """
+    lines = create_sql.strip().splitlines()
+    if len(lines) < 3:
+        return TableSchema(create=create_sql)
+
+    head, body, tail = lines[0], lines[1:-1], lines[-1]
+    kept: list[str] = []
+    indexes: list[str] = []
+    foreign_keys: list[str] = []
+    for line in body:
+        clause = line.strip().rstrip(",")
+        if _INDEX_RE.match(clause):
+            indexes.append(clause)
+        elif _FOREIGN_KEY_RE.match(clause):
+            foreign_keys.append(clause)
+        else:
+            kept.append(clause)
+
+    has_primary = any(c.startswith("PRIMARY KEY") for c in kept)
+    if not has_primary and any("AUTO_INCREMENT" in c for c in kept):
+        kept.extend(indexes)
+        indexes = []
+
+    create = "\n".join([head, ",\n".join(f"  {c}" for c in kept), tail])
+    return TableSchema(create=create, indexes=indexes, foreign_keys=foreign_keys)
+
+
+def _connect(creds: dict[str, str]):
+    """A PyMySQL connection whose cursors stream rows instead of buffering them."""
+    try:
+        import pymysql
+        import pymysql.cursors
+    except ModuleNotFoundError:
+        raise click.ClickException(
+            "A parallel dump reads rows through PyMySQL, and this environment "
+            "has no 'pymysql' package.\n"
+            "Install it (pip install pymysql) or use db:dump without --parallel."
+        )
+    return pymysql.connect(
+        host=creds["MARIADB_HOSTNAME"],
+        user=creds["MARIADB_USER"],
+        password=creds["MARIADB_PASSWORD"],
+        database=creds["MARIADB_DATABASE"],
+        charset="utf8mb4",
+        cursorclass=pymysql.cursors.SSCursor,
+        autocommit=True,
+    )
+
+
+def _query(conn, sql: str) -> list[tuple]:
+    cur = conn.cursor()
+    try:
+        cur.execute(sql)
+        return list(cur.fetchall())
+    finally:
+        cur.close()
+
+
+def _list_tables(conn) -> list[tuple[str, int]]:
+    """Base tables with their approximate size, largest first.
+
+    Starting the largest tables first keeps one big table from being the
+    last job left while every other worker sits idle.
+    """
+    rows = _query(
+        conn,
+        "SELECT TABLE_NAME, COALESCE(DATA_LENGTH, 0) FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'",
+    )
+    return sorted(((str(n), int(s)) for n, s in rows), key=lambda t: (-t[1], t[0]))
+
+
+def _list_objects(conn) -> list[tuple[str, str]]:
+    """Views, routines and triggers as ``(kind, name)``, in restore order."""
+    functions = []
+    procedures = []
+    for kind, name in _query(
+        conn,
+        "SELECT ROUTINE_TYPE, ROUTINE_NAME FROM information_schema.ROUTINES "
+        "WHERE ROUTINE_SCHEMA = DATABASE() ORDER BY ROUTINE_NAME",
+    ):
+        (functions if kind == "FUNCTION" else procedures).append((str(kind), str(name)))
+    views = _query(
+        conn,
+        "SELECT TABLE_NAME FROM information_schema.VIEWS "
+        "WHERE TABLE_SCHEMA = DATABASE() ORDER BY TABLE_NAME",
+    )
+    triggers = _query(
+        conn,
+        "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS "
+        "WHERE TRIGGER_SCHEMA = DATABASE() ORDER BY EVENT_OBJECT_TABLE, ACTION_ORDER",
+    )
+    return [
+        *functions,
+        *procedures,
+        *(("VIEW", str(name)) for (name,) in views),
+        *(("TRIGGER", str(name)) for (name,) in triggers),
+    ]
+
+
+def _object_definition(conn, kind: str, name: str) -> dict:
+    """One object's CREATE statement, without its DEFINER, and its sql_mode.
+
+    SHOW CREATE answers ``(name, create, ...)`` for a view and ``(name,
+    sql_mode, create, ...)`` for a routine or trigger. The statement is NULL
+    when the user may not read the object's body, and a dump that quietly
+    left it out would restore a database that is missing it.
+    """
+    row = _query(conn, f"SHOW CREATE {kind} `{name}`")[0]
+    create, sql_mode = (row[1], None) if kind == "VIEW" else (row[2], row[1])
+    if create is None:
+        raise click.ClickException(
+            f"Cannot read the definition of {kind.lower()} '{name}': the database "
+            "user lacks the privilege to see it."
+        )
+    return {
+        "kind": kind,
+        "name": name,
+        "create": _DEFINER_RE.sub("", str(create), count=1),
+        "sql_mode": None if sql_mode is None else str(sql_mode),
+    }
+
+
+def _object_sql(obj: dict) -> bytes:
+    """Replace one view, routine or trigger. Its body may hold semicolons."""
+    mode = obj.get("sql_mode")
+    head = f"SET SESSION sql_mode = '{mode}';\n" if mode is not None else ""
+    return (
+        f"{head}DROP {obj['kind']} IF EXISTS `{obj['name']}`;\n"
+        "DELIMITER ;;\n"
+        f"{obj['create']}\n;;\n"
+        "DELIMITER ;\n"
+    ).encode("utf-8")
+
+
+def _open_snapshots(creds, tables: list[str], jobs: int, connect) -> list:
+    """Open ``jobs`` connections that all read the database at the same instant."""
+    control = connect(creds)
+    snapshots = []
+    try:
+        if tables:
+            locks = ", ".join(f"`{t}` READ" for t in tables)
+            _query(control, f"LOCK TABLES {locks}")
+        try:
+            for _ in range(jobs):
+                conn = connect(creds)
+                snapshots.append(conn)
+                _query(conn, "SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                _query(conn, "START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        finally:
+            if tables:
+                _query(control, "UNLOCK TABLES")
+    except BaseException:
+        for conn in snapshots:
+            conn.close()
+        raise
+    finally:
+        control.close()
+    return snapshots
+
+
+class _ChunkWriter:
+    """Write a table's INSERT lines into size-bounded gzip chunk files."""
+
+    def __init__(self, directory: str, table: str, chunk_bytes: int):
+        self.directory = directory
+        self.table = table
+        self.chunk_bytes = chunk_bytes
+        self.chunks: list[str] = []
+        self.bytes = 0
+        self._file = None
+        self._in_chunk = 0
+
+    def write(self, line: bytes) -> None:
+        if self._file is None or self._in_chunk >= self.chunk_bytes:
+            self._next_chunk()
+        self._file.write(line)
+        self._in_chunk += len(line)
+        self.bytes += len(line)
+
+    def _next_chunk(self) -> None:
+        self.close()
+        name = f"{self.table}.{len(self.chunks) + 1:05d}.sql.gz"
+        self._file = gzip.open(os.path.join(self.directory, name), "wb")
+        self.chunks.append(name)
+        self._in_chunk = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _dump_table(
+    conn, table: str, directory: str, chunk_bytes: int, insert_bytes: int
+) -> TableResult:
+    """Stream one table's rows into chunk files as multi-row INSERTs.
+
+    Values are escaped by the connection itself, which turns newlines into
+    ``\\n``, so every statement is exactly one line. Binary values decode
+    with surrogateescape and are written back byte for byte.
+    """
+    started = time.monotonic()
+    writer = _ChunkWriter(directory, table, chunk_bytes)
+    prefix = f"INSERT INTO `{table}` VALUES "
+    rows = 0
+    batch: list[str] = []
+    batch_len = 0
+
+    def flush():
+        nonlocal batch, batch_len
+        if batch:
+            line = prefix + ",".join(batch) + ";\n"
+            writer.write(line.encode("utf-8", "surrogateescape"))
+            batch, batch_len = [], 0
+
+    cur = conn.cursor()
+    try:
+        cur.execute(f"SELECT * FROM `{table}`")
+        for row in cur:
+            values = "(" + ",".join(conn.escape(v) for v in row) + ")"
+            if batch and batch_len + len(values) > insert_bytes:
+                flush()
+            batch.append(values)
+            batch_len += len(values) + 1
+            rows += 1
+        flush()
+    finally:
+        cur.close()
+        writer.close()
+
+    return TableResult(
+        name=table,
+        rows=rows,
+        bytes=writer.bytes,
+        seconds=time.monotonic() - started,
+        chunks=writer.chunks,
+    )
+
+
+def dump_database(
+    creds: dict[str, str],
+    directory: str,
+    jobs: int,
+    on_table: Callable[[TableResult, int, int], None] | None = None,
+    *,
+    connect=_connect,
+    chunk_bytes: int = CHUNK_BYTES,
+    insert_bytes: int = INSERT_BYTES,
+) -> dict:
+    """Dump every base table into ``directory`` with ``jobs`` workers.
+
+    Views, routines and triggers have no rows; their definitions go into the
+    manifest with the tables' CREATE statements.
+
+    ``on_table(result, done, total)`` is called from the calling thread as
+    each table finishes. Returns the manifest, which is also written to
+    ``directory/manifest.json`` once every table is complete: a directory
+    without one is an unfinished dump.
+    """
+    control = connect(creds)
+    try:
+        sizes = _list_tables(control)
+        tables = [name for name, _ in sizes]
+        schemas = {
+            name: _query(control, f"SHOW CREATE TABLE `{name}`")[0][1]
+            for name in tables
+        }
+        objects = [
+            _object_definition(control, kind, name)
+            for kind, name in _list_objects(control)
+        ]
+    finally:
+        control.close()
+
+    jobs = max(1, min(jobs, len(tables) or 1))
+    snapshots = _open_snapshots(creds, tables, jobs, connect)
+    idle: queue.Queue = queue.Queue()
+    for conn in snapshots:
+        idle.put(conn)
+
+    def work(table: str) -> TableResult:
+        conn = idle.get()
+        try:
+            return _dump_table(conn, table, directory, chunk_bytes, insert_bytes)
+        finally:
+            idle.put(conn)
+
+    results: dict[str, TableResult] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(work, table) for table in tables]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.name] = result
+                if on_table:
+                    on_table(result, len(results), len(tables))
+    finally:
+        for conn in snapshots:
+            conn.close()
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "database": creds["MARIADB_DATABASE"],
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "tables": {
+            name: {
+                "create": schemas[name],
+                "rows": results[name].rows,
+                "bytes": results[name].bytes,
+                "chunks": results[name].chunks,
+            }
+            for name in tables
+        },
+        "objects": objects,
+    }
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return manifest
+
+
+def is_dump_directory(path: str) -> bool:
+    """True if ``path`` is a directory written by ``dump_database``."""
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+
+def load_manifest(directory: str) -> dict:
+    """Read and check a dump directory's manifest."""
+    path = os.path.join(directory, MANIFEST)
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise click.ClickException(f"Cannot read {path}: {e}")
+    if manifest.get("format") not in _RESTORABLE_FORMATS or not isinstance(
+        manifest.get("tables"), dict
+    ):
+        raise click.ClickException(
+            f"{path} is not a dump this version of the CLI can restore."
+        )
+    for name, table in manifest["tables"].items():
+        for chunk in table.get("chunks", []):
+            if not os.path.isfile(os.path.join(directory, chunk)):
+                raise click.ClickException(
+                    f"The dump is incomplete: {chunk} of table '{name}' is missing."
+                )
+    return manifest
+
+
+def _mysql(creds: dict[str, str], sql: bytes) -> None:
+    run(
+        [
+            "mysql",
+            "--default-character-set=utf8mb4",
+            f"-h{creds['MARIADB_HOSTNAME']}",
+            f"-u{creds['MARIADB_USER']}",
+            creds["MARIADB_DATABASE"],
+        ],
+        input=sql,
+        text=False,
+        capture=True,
+        env=client_env(creds),
+        tool_hint=_CLIENT_HINT,
+    )
+
+
+def restore_database(
+    creds: dict[str, str],
+    directory: str,
+    jobs: int,
+    on_table: Callable[[TableResult, int, int], None] | None = None,
+    *,
+    execute: Callable[[dict, bytes], None] = _mysql,
+) -> list[TableResult]:
+    """Restore a dump directory with ``jobs`` concurrent loaders.
+
+    Tables are recreated without their secondary indexes and foreign keys,
+    loaded chunk by chunk, indexed once their rows are in, and tied together
+    with their foreign keys; the views, routines and triggers come last.
+    ``on_table`` is called from the calling thread as each table is loaded
+    and indexed.
+    """
+    manifest = load_manifest(directory)
+    tables = manifest["tables"]
+    schemas = {name: split_create_table(t["create"]) for name, t in tables.items()}
+
+    ddl = ["SET FOREIGN_KEY_CHECKS=0;"]
+    for name, schema in schemas.items():
+        ddl.append(f"DROP TABLE IF EXISTS `{name}`;")
+        ddl.append(schema.create + ";")
+    execute(creds, ("\n".join(ddl) + "\n").encode("utf-8"))
+
+    def load_chunk(chunk: str) -> None:
+        with gzip.open(os.path.join(directory, chunk), "rb") as f:
+            execute(creds, _LOAD_HEADER + f.read() + _LOAD_FOOTER)
+
+    def index(name: str) -> None:
+        clauses = schemas[name].indexes
+        if clauses:
+            adds = ", ".join(f"ADD {c}" for c in clauses)
+            execute(creds, f"ALTER TABLE `{name}` {adds};\n".encode("utf-8"))
+
+    results: list[TableResult] = []
+    started: dict[str, float] = {}
+    remaining = {name: len(t.get("chunks", [])) for name, t in tables.items()}
+
+    def table_done(name: str) -> TableResult:
+        table = tables[name]
+        return TableResult(
+            name=name,
+            rows=table.get("rows", 0),
+            bytes=table.get("bytes", 0),
+            seconds=time.monotonic() - started[name],
+            chunks=list(table.get("chunks", [])),
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        # Chunks of different tables interleave, so one large table is loaded
+        # by several workers while the small ones finish around it.
+        loads: dict = {}
+        indexing: dict = {}
+        for name, table in tables.items():
+            started[name] = time.monotonic()
+            for chunk in table.get("chunks", []):
+                loads[pool.submit(load_chunk, chunk)] = name
+            if remaining[name] == 0:
+                indexing[pool.submit(index, name)] = name
+
+        while loads or indexing:
+            done, _ = wait([*loads, *indexing], return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+                if future in loads:
+                    name = loads.pop(future)
+                    remaining[name] -= 1
+                    if remaining[name] == 0:
+                        indexing[pool.submit(index, name)] = name
+                    continue
+                result = table_done(indexing.pop(future))
+                results.append(result)
+                if on_table:
+                    on_table(result, len(results), len(tables))
+
+    foreign_keys = [
+        f"ALTER TABLE `{name}` " + ", ".join(f"ADD {c}" for c in schema.foreign_keys)
+        for name, schema in schemas.items()
+        if schema.foreign_keys
+    ]
+    if foreign_keys:
+        sql = "SET FOREIGN_KEY_CHECKS=0;\n" + ";\n".join(foreign_keys) + ";\n"
+        execute(creds, sql.encode("utf-8"))
+
+    # A view over another view fails until that one exists, and the server
+    # does not say which views depend on which. Whatever failed is retried
+    # while a pass still creates something.
+    waiting = list(manifest.get("objects", []))
+    while waiting:
+        failed = []
+        error = None
+        for obj in waiting:
+            try:
+                execute(creds, _object_sql(obj))
+            except click.ClickException as e:
+                failed.append(obj)
+                error = e
+        if len(failed) == len(waiting):
+            raise error
+        waiting = failed
+
+    return results
@@ -34,14 +34,24 @@ def _check_tag_exists(namespace: str, repo: str, tag: str) -> bool:
     credentials, since a wrong namespace spelling over HTTPS is answered with
     a username prompt rather than an error.
     """
+    from splent_cli.utils import transport_cache
     from splent_cli.utils.git_url import (
+        HOST,
         _non_interactive_env,
         https_url,
         namespace_spellings,
     )
     from splent_cli.utils.proc import run
 
-    for spelling in namespace_spellings(namespace):
+    # The spelling that last reached this namespace goes first, so a product
+    # pinned with the python spelling does not pay for the one that 404s on
+    # every feature of every build.
+    spellings = namespace_spellings(namespace)
+    known = transport_cache.preferred(HOST, namespace)
+    if known and known[1] in spellings:
+        spellings.sort(key=lambda s: s != known[1])
+
+    for spelling in spellings:
         real, _ = https_url(spelling, repo)
         result = run(
             ["git", "ls-remote", "--tags", real, f"refs/tags/{tag}"],
@@ -50,6 +60,7 @@ def _check_tag_exists(namespace: str, repo: str, tag: str) -> bool:
             env=_non_interactive_env(),
         )
         if result.returncode == 0 and (result.stdout or "").strip():
+            transport_cache.remember(HOST, namespace, None, spelling)
             return True
     return False
 
@@ -73,7 +84,7 @@ def _check_features_ready(workspace: str, product_dir: str, interactive: bool) -
     Returns True if all features pass.
     """
     pyproject_path = os.path.join(product_dir, "pyproject.toml")
-    data = load_toml(pyproject_path, what="pyproject.toml")
+    data = load_toml(pyproject_path, what="pyproject.toml", copy=False)
 
     features = read_features_from_data(data, "prod")
     if not features:
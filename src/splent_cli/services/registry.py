@@ -7,6 +7,10 @@ of this logic (feature:clone, feature:install, feature:search,
 feature:versions, feature:outdated/upgrade and the release pipeline all
 diverged slightly).
 
+Questions about many repositories at once go through
+:func:`fetch_repo_snapshots`, which batches them over the GraphQL API when
+there is a token and falls back to the REST calls when there is not.
+
 Helpers are quiet where the historical call sites were quiet (return
 ``None`` / ``[]`` on failure) and raise :class:`RegistryError` where the
 caller decides how loud to be. ``RegistryError`` carries the HTTP status
@@ -19,8 +23,12 @@ import dataclasses
 import json
 import os
 import re
+import time
 import urllib.error
 import urllib.request
+from collections.abc import Iterator
+
+from splent_cli.utils import trace
 
 GITHUB_API = "https://api.github.com"
 USER_AGENT = "splent-cli"
@@ -37,11 +45,38 @@ class RegistryError(Exception):
     """A GitHub API request failed (other than a plain 404)."""
 
     def __init__(
-        self, message: str, *, status: int | None = None, rate_limited: bool = False
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        rate_limited: bool = False,
+        retry_after: float | None = None,
     ):
         super().__init__(message)
         self.status = status
         self.rate_limited = rate_limited
+        # Seconds the server asked us to wait, when it said (Retry-After, or
+        # GitHub's X-RateLimit-Reset). None when it did not.
+        self.retry_after = retry_after
+
+
+def _retry_after(headers) -> float | None:
+    """How long a rate-limited response asks the client to wait, if it says."""
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return None
 
 
 def github_token() -> str | None:
@@ -74,26 +109,37 @@ def _status_of(resp, default: int = 200) -> int:
     return status if isinstance(status, int) else default
 
 
-def _request(url: str, headers: dict, timeout: int = 10) -> bytes | None:
-    """GET *url*. Returns the body, ``None`` on 404, raises RegistryError otherwise."""
-    req = urllib.request.Request(url, headers=headers)
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None
-        remaining = e.headers.get("X-RateLimit-Remaining") if e.headers else None
-        rate_limited = e.code == 429 or (e.code == 403 and remaining == "0")
-        raise RegistryError(
-            f"GitHub API error (HTTP {e.code})",
-            status=e.code,
-            rate_limited=rate_limited,
-        )
-    except urllib.error.URLError as e:
-        raise RegistryError(f"Network error: {e.reason}")
-    except TimeoutError:
-        raise RegistryError("Network error: request timed out")
+def _request(
+    url: str, headers: dict, timeout: int = 10, data: bytes | None = None
+) -> bytes | None:
+    """GET *url* (POST *data* when given).
+
+    Returns the body, ``None`` on 404, raises RegistryError otherwise.
+    """
+    req = urllib.request.Request(url, data=data, headers=headers)
+    with trace.span(f"{req.get_method()} {url}", "http", url=url) as span:
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+                span["status"] = getattr(resp, "status", None)
+                span["bytes"] = len(body)
+                return body
+        except urllib.error.HTTPError as e:
+            span["status"] = e.code
+            if e.code == 404:
+                return None
+            remaining = e.headers.get("X-RateLimit-Remaining") if e.headers else None
+            rate_limited = e.code == 429 or (e.code == 403 and remaining == "0")
+            raise RegistryError(
+                f"GitHub API error (HTTP {e.code})",
+                status=e.code,
+                rate_limited=rate_limited,
+                retry_after=_retry_after(e.headers) if rate_limited else None,
+            )
+        except urllib.error.URLError as e:
+            raise RegistryError(f"Network error: {e.reason}")
+        except TimeoutError:
+            raise RegistryError("Network error: request timed out")
 
 
 def github_json(url: str, token: str | None = None, timeout: int = 10):
@@ -149,17 +195,15 @@ def fetch_file(
 # ── Tags & versions ───────────────────────────────────────────────────
 
 
-def list_tags(
+def iter_tag_pages(
     org: str, repo: str, token: str | None = None, max_pages: int = 50
-) -> list[str]:
-    """All tag names of the repo, newest first as GitHub returns them.
+) -> Iterator[list[str]]:
+    """Tag names of the repo one API page at a time, newest first.
 
-    Raises RegistryError on network/API failure, and on a repository that does
-    not exist or the token cannot see (status 404). ``[]`` means the repository
-    answered and has no tags, which is a different fact from "no answer" and
-    must never collapse into it.
+    A page is only requested when the previous one has been consumed, so a
+    caller that finds what it needs on page one never pays for the rest.
+    Raises like :func:`list_tags`.
     """
-    tags: list[str] = []
     for page in range(1, max_pages + 1):
         url = f"{GITHUB_API}/repos/{org}/{repo}/tags?per_page=100&page={page}"
         batch = github_json(url, token)
@@ -169,12 +213,27 @@ def list_tags(
                     f"{org}/{repo} does not exist or this token cannot see it",
                     status=404,
                 )
-            break
+            return
         if not batch:
-            break
-        tags.extend(t.get("name", "") for t in batch if t.get("name"))
+            return
+        yield [t.get("name", "") for t in batch if t.get("name")]
         if len(batch) < 100:
-            break
+            return
+
+
+def list_tags(
+    org: str, repo: str, token: str | None = None, max_pages: int = 50
+) -> list[str]:
+    """All tag names of the repo, newest first as GitHub returns them.
+
+    Raises RegistryError on network/API failure, and on a repository that does
+    not exist or the token cannot see (status 404). ``[]`` means the repository
+    answered and has no tags, which is a different fact from "no answer" and
+    must never collapse into it.
+    """
+    tags: list[str] = []
+    for batch in iter_tag_pages(org, repo, token, max_pages):
+        tags.extend(batch)
     return tags
 
 
@@ -314,6 +373,296 @@ def list_release_tags(
     return names
 
 
+# ── GitHub GraphQL: many repositories per round trip ──────────────────
+#
+# The marketplace index, feature:outdated, feature:versions --all,
+# feature:search and check:releases all want the same few facts about a list
+# of repositories, and over REST that is several requests per repository
+# (metadata, tags, releases, a file). GraphQL answers all of it for ~50
+# repositories in one request, and one GraphQL request costs one point of a
+# 5000-point hourly budget. GraphQL needs a token, so without one the same
+# snapshots are assembled from the REST calls above.
+
+GITHUB_GRAPHQL = f"{GITHUB_API}/graphql"
+# Repositories per query. GitHub caps a query's node count (500k) and its
+# runtime; fifty repositories of 100 tags and 100 releases stays well clear.
+GRAPHQL_BATCH = 50
+# GraphQL connections return at most 100 nodes per page.
+_GRAPHQL_PAGE = 100
+
+
+@dataclasses.dataclass
+class RepoSnapshot:
+    """What one batched lookup knows about a repository.
+
+    ``meta`` uses the REST field names (``html_url``, ``description``,
+    ``pushed_at``, ``stargazers_count``, ``private``, ``archived``) so it can
+    stand in for :func:`fetch_repo`. ``tags`` are newest first; when
+    ``tags_complete`` is False the repository has more tags than were asked
+    for. ``release_tags`` is None unless releases were asked for, and
+    ``file_text`` is the requested file at ``file_ref`` (the latest tag), None
+    when it is not there.
+    """
+
+    org: str
+    repo: str
+    meta: dict
+    tags: list[str]
+    tags_complete: bool
+    release_tags: set[str] | None = None
+    file_ref: str | None = None
+    file_text: str | None = None
+
+    @property
+    def latest_tag(self) -> str | None:
+        """Highest semver tag, else the newest tag, like :func:`latest_semver_tag`."""
+        ordered = semver_sorted(self.tags)
+        if ordered:
+            return ordered[0]
+        return self.tags[0] if self.tags else None
+
+
+def graphql(query: str, token: str, timeout: int = 30) -> dict:
+    """POST a GraphQL *query* and return its ``data``.
+
+    Errors of type NOT_FOUND are left to the caller (their field is null in
+    ``data``), and so is a FORBIDDEN error on one aliased field (a repository
+    behind SSO the token is not authorized for, say): that field reads as
+    null rather than failing the fifty other repositories of the batch. A
+    rate limit or any other error raises RegistryError.
+    """
+    headers = _github_headers(token)
+    headers["Content-Type"] = "application/json"
+    body = _request(
+        GITHUB_GRAPHQL,
+        headers,
+        timeout,
+        data=json.dumps({"query": query}).encode(),
+    )
+    if body is None:
+        raise RegistryError("GitHub GraphQL endpoint not found", status=404)
+    payload = json.loads(body.decode())
+    unreadable = []
+    for error in payload.get("errors") or []:
+        kind = error.get("type")
+        if kind == "NOT_FOUND":
+            continue
+        if kind == "FORBIDDEN" and error.get("path"):
+            unreadable.append(error["path"][0])
+            continue
+        if kind == "RATE_LIMITED":
+            raise RegistryError(
+                "GitHub GraphQL rate limit exceeded", status=403, rate_limited=True
+            )
+        raise RegistryError(f"GitHub GraphQL error: {error.get('message', kind)}")
+    if not isinstance(payload.get("data"), dict):
+        raise RegistryError("GitHub GraphQL answered without data")
+    data = payload["data"]
+    for alias in unreadable:
+        data[alias] = None
+    return data
+
+
+def _gql_str(value: str) -> str:
+    # A JSON string literal is a valid GraphQL string literal.
+    return json.dumps(value)
+
+
+def _snapshot_query(
+    refs: list[str], tags: int, releases: bool, with_meta: bool = True
+) -> str:
+    release_field = (
+        f"releases(first: {_GRAPHQL_PAGE}, "
+        "orderBy: {field: CREATED_AT, direction: DESC}) "
+        "{ totalCount nodes { tagName } }"
+        if releases
+        else ""
+    )
+    meta_fields = (
+        "name owner { login } url description pushedAt stargazerCount "
+        "isPrivate isArchived "
+        if with_meta
+        else ""
+    )
+    fields = (
+        meta_fields + f'refs(refPrefix: "refs/tags/", first: {tags}, '
+        "orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) "
+        "{ totalCount nodes { name } } " + release_field
+    )
+    parts = []
+    for i, ref in enumerate(refs):
+        org, _, repo = ref.partition("/")
+        parts.append(
+            f"r{i}: repository(owner: {_gql_str(org)}, name: {_gql_str(repo)}) "
+            f"{{ {fields} }}"
+        )
+    return "query { " + " ".join(parts) + " }"
+
+
+def _snapshot_from_node(
+    ref: str, node: dict, releases: bool, token: str | None, with_meta: bool = True
+) -> RepoSnapshot:
+    org, _, repo = ref.partition("/")
+    tag_conn = node.get("refs") or {}
+    tags = [n["name"] for n in tag_conn.get("nodes") or [] if n.get("name")]
+    snapshot = RepoSnapshot(
+        org=org,
+        repo=repo,
+        meta={
+            "name": node.get("name"),
+            "full_name": f"{(node.get('owner') or {}).get('login', org)}/"
+            f"{node.get('name', repo)}",
+            "html_url": node.get("url"),
+            "description": node.get("description"),
+            "pushed_at": node.get("pushedAt"),
+            "stargazers_count": node.get("stargazerCount", 0),
+            "private": node.get("isPrivate", False),
+            "archived": node.get("isArchived", False),
+        },
+        tags=tags,
+        tags_complete=tag_conn.get("totalCount", 0) <= len(tags),
+    )
+    if not with_meta:
+        snapshot.meta = {}
+    if releases:
+        rel_conn = node.get("releases") or {}
+        names = {n["tagName"] for n in rel_conn.get("nodes") or [] if n.get("tagName")}
+        if rel_conn.get("totalCount", 0) > len(rel_conn.get("nodes") or []):
+            # More releases than one page: the REST listing pages through all.
+            names = list_release_tags(org, repo, token)
+        snapshot.release_tags = names
+    return snapshot
+
+
+def _file_query(snapshots: list[RepoSnapshot], path: str) -> str:
+    parts = []
+    for i, snap in enumerate(snapshots):
+        expression = _gql_str(f"{snap.file_ref}:{path}")
+        parts.append(
+            f"f{i}: repository(owner: {_gql_str(snap.org)}, "
+            f"name: {_gql_str(snap.repo)}) "
+            f"{{ object(expression: {expression}) {{ ... on Blob {{ text isTruncated }} }} }}"
+        )
+    return "query { " + " ".join(parts) + " }"
+
+
+def _rest_snapshot(
+    ref: str,
+    token: str | None,
+    *,
+    meta: dict | None,
+    with_meta: bool,
+    tags: int,
+    releases: bool,
+    file: str | None,
+) -> RepoSnapshot | None:
+    """The snapshot of one repository from REST, what GraphQL does without a token."""
+    org, _, repo = ref.partition("/")
+    if meta is None and with_meta:
+        meta = fetch_repo(org, repo, token)
+        if meta is None:
+            return None
+    try:
+        names = list_tags(org, repo, token, max_pages=1)
+    except RegistryError as e:
+        if e.status == 404:
+            return None
+        raise
+    snapshot = RepoSnapshot(
+        org=org,
+        repo=repo,
+        meta=meta or {},
+        tags=names[:tags],
+        tags_complete=len(names) <= tags and len(names) < _GRAPHQL_PAGE,
+    )
+    if releases:
+        snapshot.release_tags = list_release_tags(org, repo, token)
+    if file and snapshot.latest_tag:
+        snapshot.file_ref = snapshot.latest_tag
+        snapshot.file_text = fetch_file(
+            org, repo, file, ref=snapshot.file_ref, token=token
+        )
+    return snapshot
+
+
+def fetch_repo_snapshots(
+    refs,
+    token: str | None = None,
+    *,
+    tags: int = _GRAPHQL_PAGE,
+    releases: bool = False,
+    file: str | None = None,
+    known_meta: dict[str, dict] | None = None,
+    with_meta: bool = True,
+    batch: int = GRAPHQL_BATCH,
+) -> dict[str, RepoSnapshot | None]:
+    """Snapshots of many repositories, keyed by ``"org/repo"``.
+
+    Each snapshot carries the repository metadata and its newest *tags*
+    (at most 100); with ``releases`` the tags that have a GitHub Release, and
+    with ``file`` that file's text at the latest tag. A repository that does
+    not exist (or the token cannot see) maps to None.
+
+    With a token this is one GraphQL request per *batch* repositories, plus
+    one more per batch when a file is asked for, since which tag is the
+    latest is only known once the tags are in. Without a token it falls back
+    to REST, one repository at a time; ``known_meta`` (already listed with
+    :func:`list_org_repos`, say) then saves the metadata request, and
+    ``with_meta=False`` skips it for callers that only want tags (``meta`` is
+    then empty, and the GraphQL query leaves the metadata fields out).
+
+    Raises RegistryError when GitHub does not answer, rate limits included:
+    a missing answer is never reported as a repository with no tags.
+    """
+    refs = list(dict.fromkeys(refs))
+    tags = max(1, min(tags, _GRAPHQL_PAGE))
+    known_meta = known_meta or {}
+    if not token:
+        return {
+            ref: _rest_snapshot(
+                ref,
+                None,
+                meta=known_meta.get(ref),
+                with_meta=with_meta,
+                tags=tags,
+                releases=releases,
+                file=file,
+            )
+            for ref in refs
+        }
+
+    snapshots: dict[str, RepoSnapshot | None] = {}
+    for start in range(0, len(refs), batch):
+        chunk = refs[start : start + batch]
+        data = graphql(_snapshot_query(chunk, tags, releases, with_meta), token)
+        for i, ref in enumerate(chunk):
+            node = data.get(f"r{i}")
+            snapshots[ref] = (
+                _snapshot_from_node(ref, node, releases, token, with_meta)
+                if node
+                else None
+            )
+
+    if file:
+        wanted = [s for s in snapshots.values() if s and s.latest_tag]
+        for snap in wanted:
+            snap.file_ref = snap.latest_tag
+        for start in range(0, len(wanted), batch):
+            chunk = wanted[start : start + batch]
+            data = graphql(_file_query(chunk, file), token)
+            for i, snap in enumerate(chunk):
+                blob = (data.get(f"f{i}") or {}).get("object")
+                if blob is None:
+                    continue
+                if blob.get("text") is None or blob.get("isTruncated"):
+                    # Binary or too large for GraphQL; REST serves it raw.
+                    blob["text"] = fetch_file(
+                        snap.org, snap.repo, file, ref=snap.file_ref, token=token
+                    )
+                snap.file_text = blob["text"]
+    return snapshots
+
+
 @dataclasses.dataclass(frozen=True)
 class ReleaseResult:
     """Outcome of creating a GitHub Release."""
@@ -530,6 +879,7 @@ def pypi_project_exists(package: str, timeout: int = 10) -> bool:
             f"PyPI API error (HTTP {e.code})",
             status=e.code,
             rate_limited=e.code == 429,
+            retry_after=_retry_after(e.headers) if e.code == 429 else None,
         )
     except (urllib.error.URLError, TimeoutError) as e:
         raise RegistryError(f"Network error: {getattr(e, 'reason', e)}")
@@ -555,6 +905,7 @@ def pypi_versions(package: str, *, strict: bool = False) -> list[str]:
             f"PyPI API error (HTTP {e.code})",
             status=e.code,
             rate_limited=e.code == 429,
+            retry_after=_retry_after(e.headers) if e.code == 429 else None,
         )
     except (urllib.error.URLError, TimeoutError, ValueError) as e:
         if strict:
@@ -632,6 +983,7 @@ def dockerhub_tag_exists(
             f"Docker Hub API error (HTTP {e.code})",
             status=e.code,
             rate_limited=e.code == 429,
+            retry_after=_retry_after(e.headers) if e.code == 429 else None,
         )
     except (urllib.error.URLError, TimeoutError) as e:
         raise RegistryError(f"Network error: {getattr(e, 'reason', e)}")
@@ -15,6 +15,7 @@ import tomllib
 import click
 
 from splent_cli.services import release_gate
+from splent_cli.utils.io_utils import read_toml
 from splent_cli.utils.proc import require_tool, run
 
 
@@ -247,8 +248,7 @@ def head_is_at_tag(cwd: str, tag: str) -> bool:
 def read_project_version(pyproject_path: str) -> str | None:
     """The version currently written in ``[project].version``."""
     try:
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = read_toml(pyproject_path)
     except (OSError, tomllib.TOMLDecodeError):
         return None
     version = data.get("project", {}).get("version")
@@ -515,8 +515,7 @@ def read_project_name(pyproject_path: str) -> str | None:
     directory name, and it is what the gate must ask PyPI about.
     """
     try:
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = read_toml(pyproject_path)
     except (OSError, tomllib.TOMLDecodeError):
         return None
     name = data.get("project", {}).get("name")
@@ -0,0 +1,124 @@
+"""
+Dependency-aware seeding for ``db:seed``.
+
+Seeders used to run one after another in topological order, so seeding a
+demo dataset cost the sum of every feature's seeder even though most features
+share nothing: auth and notepad do not care which of them goes first, only
+that both go before the features whose rows point at theirs.
+
+The UVL ``requires`` constraints split the features into levels. A feature
+sits one level above the deepest feature it requires, so everything in a
+level depends only on earlier levels, and the features of a level run
+concurrently, each with its own session and therefore its own connection.
+The next level starts when the whole level has finished, and a failure stops
+seeding at the end of its level, as the sequential runner stopped at the
+failing seeder.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+@dataclass
+class SeederTiming:
+    """How one seeder went."""
+
+    feature: str
+    name: str
+    seconds: float
+    error: BaseException | None = None
+
+
+def dependency_levels(
+    features: list[str], requires: dict[str, Iterable[str]]
+) -> list[list[str]]:
+    """Group ``features`` into levels that can each be seeded concurrently.
+
+    ``requires`` maps a feature to the features it needs; anything outside
+    ``features`` is ignored. Within a level the given order is kept. Features
+    caught in a requires cycle cannot be ordered by the model, so they run
+    one per level, in the given order, after everything else.
+    """
+    declared = set(features)
+    needs = {
+        f: {r for r in requires.get(f, ()) if r in declared and r != f}
+        for f in features
+    }
+    levels: list[list[str]] = []
+    placed: set[str] = set()
+    while len(placed) < len(features):
+        level = [f for f in features if f not in placed and needs[f] <= placed]
+        if not level:
+            levels.extend([f] for f in features if f not in placed)
+            break
+        levels.append(level)
+        placed.update(level)
+    return levels
+
+
+def run_seeders(feature: str, seeders: list) -> list[SeederTiming]:
+    """Run one feature's seeders in order, timing each; stop at the first failure."""
+    timings: list[SeederTiming] = []
+    for seeder in seeders:
+        started = time.monotonic()
+        try:
+            seeder.run()
+        except Exception as e:
+            timings.append(
+                SeederTiming(
+                    feature, type(seeder).__name__, time.monotonic() - started, e
+                )
+            )
+            break
+        timings.append(
+            SeederTiming(feature, type(seeder).__name__, time.monotonic() - started)
+        )
+    return timings
+
+
+def run_levels(
+    levels: list[list[str]],
+    groups: dict[str, list],
+    run_group: Callable[[str, list], list[SeederTiming]],
+    jobs: int,
+    on_done: Callable[[list[SeederTiming]], None] | None = None,
+) -> list[SeederTiming]:
+    """Seed level by level, up to ``jobs`` features at a time.
+
+    ``run_group(feature, seeders)`` seeds one feature and runs on a worker
+    thread whenever more than one feature of a level can go at once, so it
+    must set up its own database session. ``on_done`` gets each feature's
+    timings on the calling thread as it finishes. Returns every timing, and
+    stops after the first level in which something failed.
+    """
+    timings: list[SeederTiming] = []
+    for level in levels:
+        level = [f for f in level if groups.get(f)]
+        if not level:
+            continue
+        results: list[list[SeederTiming]] = []
+        if jobs <= 1 or len(level) == 1:
+            for feature in level:
+                result = run_group(feature, groups[feature])
+                results.append(result)
+                if on_done:
+                    on_done(result)
+                if any(t.error for t in result):
+                    break
+        else:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(level))) as pool:
+                futures = [pool.submit(run_group, f, groups[f]) for f in level]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    if on_done:
+                        on_done(result)
+        for result in results:
+            timings.extend(result)
+        if any(t.error for t in timings):
+            break
+    return timings
@@ -54,20 +54,30 @@ particular other repository.
 
 from __future__ import annotations
 
+import json
 import os
 import re
+import tempfile
+import time
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
-from splent_cli.utils.io_utils import atomic_write
+from splent_cli.utils.io_utils import atomic_write, read_toml
 
 WORKING_COPY_PREFIX = "splent_spl_"
 CACHE_ROOT_PARTS = (".splent_cache", "spls")
 METADATA_FILENAME = "metadata.toml"
 DEFAULT_MIRROR = "uvlhub.io"
+LATEST_FILENAME = "uvlhub_latest.json"
+LATEST_TTL_ENV = "SPLENT_UVLHUB_TTL"
+DEFAULT_LATEST_TTL = 3600
+# UVLHub is one host, so a whole-workspace fetch is kept polite.
+FETCH_JOBS = 4
+_CHUNK = 64 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -253,8 +263,7 @@ def uvl_filename(name: str) -> str:
 
 def _load_toml(path: Path) -> dict:
     try:
-        with open(path, "rb") as handle:
-            return tomllib.load(handle)
+        return read_toml(path)
     except (OSError, tomllib.TOMLDecodeError):
         return {}
 
@@ -476,8 +485,14 @@ def write_product_pin(pyproject_path: str | os.PathLike, pin: SplPin) -> None:
         )
 
 
-def write_metadata(directory: str | os.PathLike, pin: SplPin) -> Path:
-    """Write a ``metadata.toml`` describing *pin* into *directory*."""
+def write_metadata(
+    directory: str | os.PathLike, pin: SplPin, *, etag: str | None = None
+) -> Path:
+    """Write a ``metadata.toml`` describing *pin* into *directory*.
+
+    *etag* is what UVLHub answered the download with, recorded so a forced
+    refetch can ask whether the file changed instead of downloading it again.
+    """
     target = Path(directory) / METADATA_FILENAME
     target.parent.mkdir(parents=True, exist_ok=True)
     body = [
@@ -492,10 +507,21 @@ def write_metadata(directory: str | os.PathLike, pin: SplPin) -> Path:
         f'version = "{pin.version or ""}"',
         f'file = "{pin.remote_file}"',
     ]
+    if etag:
+        body.append(f'etag = "{_toml_escape(etag)}"')
     atomic_write(str(target), "\n".join(body) + "\n")
     return target
 
 
+def cached_etag(directory: str | os.PathLike) -> str | None:
+    """The ETag a cache directory's model was downloaded with, if recorded."""
+    data = _load_toml(Path(directory) / METADATA_FILENAME)
+    spl = data.get("spl", {}) if isinstance(data.get("spl"), dict) else {}
+    uvl = spl.get("uvl", {}) if isinstance(spl.get("uvl"), dict) else {}
+    recorded = str(uvl.get("etag") or "").strip()
+    return recorded or None
+
+
 def _toml_escape(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
@@ -546,6 +572,30 @@ def find_uvl(
     return None
 
 
+def _stream_to(target: Path, response) -> None:
+    """Write a streamed response body to *target* atomically.
+
+    The body goes to a temporary file next to *target* a chunk at a time and
+    replaces it only once complete, so a large model is never held in memory
+    and an interrupted download never leaves a truncated UVL in the cache.
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for chunk in response.iter_content(chunk_size=_CHUNK):
+                if chunk:
+                    handle.write(chunk)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def fetch_uvl(
     workspace: str | os.PathLike,
     pin: SplPin,
@@ -557,6 +607,10 @@ def fetch_uvl(
 
     The cache is the only thing written. A working copy belongs to the
     developer and is never overwritten by a fetch.
+
+    A forced refetch of a model that is already cached sends the ETag it was
+    downloaded with. A version DOI almost never changes its bytes, so the
+    usual answer is 304 and the file on disk is kept without a download.
     """
     from splent_cli.commands.uvl.uvl_utils import resolve_uvlhub_raw_url
 
@@ -577,25 +631,77 @@ def fetch_uvl(
     if not quiet:
         click.echo(f"  Downloading UVL from {url}")
 
+    headers = {}
+    etag = cached_etag(target_dir) if target.is_file() else None
+    if etag:
+        headers["If-None-Match"] = etag
+
     import requests
 
     try:
-        response = requests.get(url, timeout=20)
+        response = requests.get(url, timeout=20, stream=True, headers=headers)
     except requests.RequestException as exc:
         raise click.ClickException(f"Failed to download UVL: {exc}")
 
-    if response.status_code != 200:
-        raise click.ClickException(f"UVLHub returned {response.status_code} for {url}")
+    try:
+        if response.status_code == 304 and etag:
+            if not quiet:
+                click.echo(f"  UVL unchanged, keeping {target}")
+            return str(target)
+
+        if response.status_code != 200:
+            raise click.ClickException(
+                f"UVLHub returned {response.status_code} for {url}"
+            )
 
-    target_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write(str(target), response.text)
-    write_metadata(target_dir, pin)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            _stream_to(target, response)
+        except requests.RequestException as exc:
+            raise click.ClickException(f"Failed to download UVL: {exc}")
+        write_metadata(target_dir, pin, etag=response.headers.get("ETag"))
+    finally:
+        response.close()
 
     if not quiet:
         click.echo(f"  UVL cached at {target}")
     return str(target)
 
 
+def fetch_many(
+    workspace: str | os.PathLike,
+    pins: list[SplPin],
+    *,
+    force: bool = False,
+    jobs: int = FETCH_JOBS,
+) -> list[tuple[SplPin, str | None, str | None]]:
+    """Fetch several models at once. Returns ``(pin, path, error)`` in order.
+
+    Pins that land in the same cache directory are fetched once, so two
+    threads never race on one file; every one of them still gets the path.
+    """
+    by_dir: dict[Path, SplPin] = {}
+    for pin in pins:
+        by_dir.setdefault(cache_dir(workspace, pin.name, pin.version, pin.doi), pin)
+
+    def _fetch(pin: SplPin) -> tuple[str | None, str | None]:
+        try:
+            return fetch_uvl(workspace, pin, force=force, quiet=True), None
+        except click.ClickException as exc:
+            return None, exc.format_message()
+
+    unique = list(by_dir.values())
+    if unique:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(unique)))) as pool:
+            outcomes = dict(zip(by_dir, pool.map(_fetch, unique)))
+    else:
+        outcomes = {}
+    return [
+        (pin, *outcomes[cache_dir(workspace, pin.name, pin.version, pin.doi)])
+        for pin in pins
+    ]
+
+
 def resolve_uvl(
     workspace: str | os.PathLike,
     name: str,
@@ -785,6 +891,83 @@ def products_pinning(workspace: str | os.PathLike, name: str) -> list[tuple[str,
     return found
 
 
+def product_pins(workspace: str | os.PathLike) -> list[tuple[str, SplPin]]:
+    """(product, pin) for every product in the workspace that records a DOI."""
+    found: list[tuple[str, SplPin]] = []
+    for entry in _safe_iterdir(Path(workspace)):
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        pin = read_product_pin(workspace, entry.name)
+        if pin and pin.fetchable:
+            found.append((entry.name, pin))
+    return found
+
+
+# ---------------------------------------------------------------------------
+# What UVLHub last said is the newest version of a line
+# ---------------------------------------------------------------------------
+#
+# ``spl:outdated --remote`` asks the same question for every concept DOI on
+# every run, and the answer moves when someone publishes, which is rarely.
+# Answers are kept in the workspace cache for ``SPLENT_UVLHUB_TTL`` seconds
+# (an hour by default). Only real answers are kept: "could not tell" is asked
+# again next time rather than remembered.
+
+
+def latest_cache_path(workspace: str | os.PathLike) -> Path:
+    return Path(workspace) / CACHE_ROOT_PARTS[0] / LATEST_FILENAME
+
+
+def _latest_ttl() -> float:
+    try:
+        return float(os.getenv(LATEST_TTL_ENV, DEFAULT_LATEST_TTL))
+    except ValueError:
+        return DEFAULT_LATEST_TTL
+
+
+def _load_latest(workspace: str | os.PathLike) -> dict:
+    try:
+        data = json.loads(latest_cache_path(workspace).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def cached_latest(
+    workspace: str | os.PathLike, mirror: str, concept_doi: str
+) -> tuple[str, str] | None:
+    """The remembered ``(version_doi, version_label)`` of a line, if still fresh."""
+    entry = _load_latest(workspace).get(f"{mirror}/{concept_doi}")
+    if not isinstance(entry, dict) or not entry.get("doi"):
+        return None
+    if time.time() - entry.get("at", 0) > _latest_ttl():
+        return None
+    return str(entry["doi"]), str(entry.get("version") or "")
+
+
+def remember_latest(
+    workspace: str | os.PathLike,
+    answers: dict[tuple[str, str], tuple[str, str]],
+) -> None:
+    """Record ``{(mirror, concept_doi): (version_doi, label)}`` in one write.
+
+    A cache that cannot be written is simply not kept.
+    """
+    if not answers:
+        return
+    data = _load_latest(workspace)
+    now = time.time()
+    for (mirror, concept_doi), (doi, version) in answers.items():
+        data[f"{mirror}/{concept_doi}"] = {"doi": doi, "version": version, "at": now}
+    try:
+        atomic_write(
+            str(latest_cache_path(workspace)),
+            json.dumps(data, indent=2, sort_keys=True),
+        )
+    except OSError:
+        pass
+
+
 def _safe_iterdir(path: Path) -> list[Path]:
     try:
         return sorted(path.iterdir())
@@ -0,0 +1,313 @@
+"""
+Plan and apply feature upgrades for a whole product in one pass.
+
+feature:upgrade used to walk the product's features one at a time: ask
+GitHub for the latest tag, clone it into the cache, rewrite pyproject.toml,
+fix the symlink, then the next feature. feature:outdated had already asked
+GitHub the same question (through a different call) and, with --upgrade,
+started a new ``splent feature:upgrade`` process per feature, which asked
+again. Upgrading a product across a framework bump was minutes of the same
+lookups and the same file rewritten a dozen times.
+
+A plan is resolved once and applied once:
+
+  * :func:`resolve` asks for the latest version of every feature at the same
+    time, in one GraphQL batch with a token (registry.fetch_repo_snapshots)
+    and concurrent REST lookups for whatever the batch did not answer.
+  * :func:`apply` checks the lifecycle guard for every feature with one read
+    of the manifest, clones all the new versions into the cache in parallel,
+    rewrites pyproject.toml once (atomically, so an interrupted upgrade never
+    leaves it half written) and then fixes every symlink and stamps the cache
+    index in one pass.
+
+A feature whose latest version could not be looked up is reported as
+unchecked, never as current, and is left exactly as declared.
+"""
+
+from __future__ import annotations
+
+import os
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import click
+from packaging.version import InvalidVersion, Version
+
+from splent_cli.services import cache_index, registry
+from splent_cli.utils.feature_utils import normalize_namespace, read_features_from_data
+from splent_cli.utils.io_utils import atomic_write
+
+DEFAULT_JOBS = 8
+
+
+# ── The product's features ───────────────────────────────────────────
+
+
+def read_features(pyproject_path: Path, env: str | None = None) -> list[dict]:
+    """``{name, version, ns_github, ns_fs}`` for every feature the product declares."""
+    if not pyproject_path.exists():
+        return []
+    with open(pyproject_path, "rb") as f:
+        data = tomllib.load(f)
+    result = []
+    for ref in read_features_from_data(data, env):
+        if "/" in ref:
+            ns_part, rest = ref.split("/", 1)
+            ns_fs = normalize_namespace(ns_part)
+            # A pyproject writes the namespace the way a Python package
+            # needs it, splent_io, and GitHub serves it as splent-io. Taking
+            # it verbatim asked the API about an organisation that does not
+            # exist, and every feature was then reported as already up to
+            # date.
+            ns_github = ns_fs.replace("_", "-")
+        else:
+            ns_github = "splent-io"
+            ns_fs = "splent_io"
+            rest = ref
+        if "@" in rest:
+            name, version = rest.split("@", 1)
+        else:
+            name, version = rest, None
+        result.append(
+            {
+                "name": name,
+                "version": version,
+                "ns_github": ns_github,
+                "ns_fs": ns_fs,
+            }
+        )
+    return result
+
+
+# ── Resolving ─────────────────────────────────────────────────────────
+
+
+@dataclass
+class UpgradePlan:
+    """What :func:`resolve` found, features in declaration order.
+
+    ``upgrades`` are feature dicts with a ``latest`` key; ``current`` and
+    ``unchecked`` are feature names; ``latest`` maps every checked feature's
+    ``ns_github/name`` to its latest version.
+    """
+
+    upgrades: list[dict] = field(default_factory=list)
+    current: list[str] = field(default_factory=list)
+    unchecked: list[str] = field(default_factory=list)
+    latest: dict[str, str] = field(default_factory=dict)
+
+
+def _ref(feat: dict) -> str:
+    return f"{feat['ns_github']}/{feat['name']}"
+
+
+def _latest_rest(ref: str, token: str | None) -> str | None:
+    """Latest tag over REST, first page only. Raises RegistryError."""
+    org, repo = ref.split("/", 1)
+    tags = registry.list_tags(org, repo, token, max_pages=1)
+    if not tags:
+        return None
+    ordered = registry.semver_sorted(tags)
+    return ordered[0] if ordered else tags[0]
+
+
+def latest_versions(
+    refs: list[str], token: str | None, *, jobs: int = DEFAULT_JOBS
+) -> tuple[dict[str, str | None], dict[str, registry.RegistryError]]:
+    """The latest tag of every ``org/repo``, all looked up at once.
+
+    Returns ``(latest, errors)``: ``latest[ref]`` is None for a repo with no
+    tags, and a repo that could not be asked is in ``errors`` instead.
+    """
+    refs = list(dict.fromkeys(refs))
+    latest: dict[str, str | None] = {}
+    errors: dict[str, registry.RegistryError] = {}
+
+    if token:
+        try:
+            snapshots = registry.fetch_repo_snapshots(refs, token, with_meta=False)
+        except registry.RegistryError:
+            snapshots = {}
+        for ref, snapshot in snapshots.items():
+            if snapshot is not None:
+                latest[ref] = snapshot.latest_tag
+
+    rest = [ref for ref in refs if ref not in latest]
+    if rest:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(rest)))) as pool:
+            futures = {ref: pool.submit(_latest_rest, ref, token) for ref in rest}
+            for ref, future in futures.items():
+                try:
+                    latest[ref] = future.result()
+                except registry.RegistryError as e:
+                    errors[ref] = e
+    return latest, errors
+
+
+def _is_newer(latest: str, current: str) -> bool:
+    try:
+        return Version(latest.lstrip("v")) > Version(current.lstrip("v"))
+    except InvalidVersion:
+        return latest != current
+
+
+def resolve(
+    features: list[dict], token: str | None, *, jobs: int = DEFAULT_JOBS
+) -> UpgradePlan:
+    """Look up every feature's latest version once and decide what to upgrade.
+
+    An editable feature (no version) is planned to be pinned to the latest
+    one. Lookup failures are reported here, once per feature, in order.
+    """
+    latest, errors = latest_versions([_ref(f) for f in features], token, jobs=jobs)
+    plan = UpgradePlan()
+    for feat in features:
+        ref = _ref(feat)
+        error = errors.get(ref)
+        if error is not None:
+            if error.status == 403 or error.rate_limited:
+                # Most commonly GitHub rate-limiting an unauthenticated request.
+                click.secho(
+                    f"  ⚠  GitHub rate limit hit for {feat['name']} "
+                    f"(HTTP {error.status or 403}); skipping. "
+                    "Set GITHUB_TOKEN to raise the limit.",
+                    fg="yellow",
+                )
+            else:
+                click.secho(
+                    f"  ⚠  {error} fetching {feat['name']}; skipping.", fg="yellow"
+                )
+        version = latest.get(ref)
+        if not version:
+            # Not the same as being up to date, and saying so would be a
+            # lie about the one thing this command is for.
+            plan.unchecked.append(feat["name"])
+            continue
+        plan.latest[ref] = version
+        if feat["version"] is None or _is_newer(version, feat["version"]):
+            plan.upgrades.append({**feat, "latest": version})
+        else:
+            plan.current.append(feat["name"])
+    return plan
+
+
+# ── Applying ──────────────────────────────────────────────────────────
+
+
+def clone_if_missing(ns_fs: str, name: str, version: str, cache_root: Path) -> None:
+    target = cache_root / ns_fs / f"{name}@{version}"
+    if target.exists():
+        return
+    ns_github = ns_fs.replace("_", "-")
+    from splent_cli.utils.cache_utils import git_mirror_path, seal_feature
+    from splent_cli.utils.git_url import CLONE_SUCCESS, clone_shared
+
+    click.echo(f"  ⬇️  Cloning {ns_fs}/{name}@{version}...")
+    # SSH first, then HTTPS. A pinned version that doesn't exist stays an error
+    # here — upgrade must not silently fall back to a different ref. The old
+    # version's objects are already in the repo's mirror, so this fetches
+    # only what changed between the two.
+    mirror = git_mirror_path(str(cache_root.parent.parent), ns_fs, name)
+    outcome, _used, err = clone_shared(
+        ns_github, name, str(target), mirror, ref=version, quiet=True
+    )
+    if outcome != CLONE_SUCCESS:
+        raise click.ClickException(
+            f"Could not clone {ns_fs}/{name}@{version} (tried SSH and HTTPS). {err}".strip()
+        )
+    seal_feature(str(target))
+
+
+def rewrite_pyproject(content: str, upgrades: list[dict]) -> str:
+    """``content`` with every upgraded feature entry pointing at its new version."""
+    for u in upgrades:
+        if u["version"]:
+            content = content.replace(
+                f"{u['name']}@{u['version']}", f"{u['name']}@{u['latest']}"
+            )
+        else:
+            # editable entry: append version
+            content = content.replace(
+                f"{u['ns_github']}/{u['name']}",
+                f"{u['ns_github']}/{u['name']}@{u['latest']}",
+            )
+    return content
+
+
+def update_symlink(product_path: Path, upgrade: dict, cache_root: Path) -> None:
+    ns_fs, name = upgrade["ns_fs"], upgrade["name"]
+    features_dir = product_path / "features" / ns_fs
+    features_dir.mkdir(parents=True, exist_ok=True)
+    if upgrade["version"]:
+        old_link = features_dir / f"{name}@{upgrade['version']}"
+        if old_link.is_symlink():
+            old_link.unlink()
+    new_link = features_dir / f"{name}@{upgrade['latest']}"
+    target = cache_root / ns_fs / f"{name}@{upgrade['latest']}"
+    if new_link.is_symlink():
+        new_link.unlink()
+    new_link.symlink_to(os.path.relpath(str(target), str(features_dir)))
+
+
+def apply(
+    upgrades: list[dict],
+    product_path: Path,
+    workspace: Path,
+    *,
+    jobs: int = DEFAULT_JOBS,
+) -> tuple[list[dict], list[tuple[dict, str]]]:
+    """Carry out ``upgrades`` (from :func:`resolve`). Returns ``(done, failed)``.
+
+    ``failed`` pairs an upgrade with why it was not done. A feature that was
+    not upgraded keeps its declaration, its symlink and its cache entry.
+    """
+    from splent_cli.utils.lifecycle import allowed_keys
+    from splent_cli.utils.manifest import feature_key
+
+    pyproject_path = product_path / "pyproject.toml"
+    cache_root = workspace / ".splent_cache" / "features"
+
+    # Guard: cannot upgrade a feature with applied migrations
+    keys = {feature_key(u["ns_fs"], u["name"], u["version"]): u for u in upgrades}
+    allowed = set(allowed_keys(str(product_path), keys, command="feature:upgrade"))
+    failed = [
+        (u, "blocked by its lifecycle state")
+        for k, u in keys.items()
+        if k not in allowed
+    ]
+    ready = [u for k, u in keys.items() if k in allowed]
+
+    def _clone(u: dict) -> str | None:
+        try:
+            clone_if_missing(u["ns_fs"], u["name"], u["latest"], cache_root)
+        except Exception as e:
+            return str(e)
+        return None
+
+    if ready:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(ready)))) as pool:
+            outcomes = list(pool.map(_clone, ready))
+    else:
+        outcomes = []
+    cloned = [u for u, err in zip(ready, outcomes) if err is None]
+    failed += [(u, err) for u, err in zip(ready, outcomes) if err is not None]
+    if not cloned:
+        return [], failed
+
+    content = pyproject_path.read_text()
+    atomic_write(pyproject_path, rewrite_pyproject(content, cloned))
+
+    done = []
+    for u in cloned:
+        try:
+            update_symlink(product_path, u, cache_root)
+        except OSError as e:
+            failed.append((u, f"symlink not updated ({e})"))
+            continue
+        done.append(u)
+    cache_index.touch(
+        workspace, [f"{u['ns_fs']}/{u['name']}@{u['latest']}" for u in cloned]
+    )
+    return done, failed
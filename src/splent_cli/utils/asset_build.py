@@ -0,0 +1,184 @@
+"""
+Batch and skip webpack builds for feature:compile.
+
+feature:compile used to start ``npx webpack --config <feature>`` once per
+editable feature, through ``docker exec`` when run from the host. Every
+feature paid Node and webpack start-up again, and every bundle was rebuilt
+whether or not a single source file had changed. The product image build
+runs ``splent feature:compile`` for the whole product, so it paid that too.
+
+Two things fix it:
+
+  * One process. :func:`write_multi_config` writes a small generated config
+    that ``require``s every feature's own webpack.config.js and exports them
+    as an array, which webpack runs as one multi-compiler. Each entry gets a
+    persistent filesystem cache of its own (named after the feature and the
+    mode, so two features never share cache entries), which makes the
+    unchanged modules of a changed feature cheap as well.
+  * No build at all for an unchanged feature. :func:`tree_hash` digests the
+    feature's ``assets/`` tree, output excluded, and the digest of the last
+    successful build is kept per product and mode under
+    ``.splent_cache/assets/``. A feature whose sources hash the same, and
+    whose output is still there, is skipped before webpack is started.
+
+A failed build records nothing, so the next run tries again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from splent_cli.utils.io_utils import atomic_write
+
+STAMP_DIR_PARTS = (".splent_cache", "assets")
+MULTI_CONFIG_NAME = "webpack.multi.config.js"
+
+# Build output and installed packages are not sources: hashing them would
+# make every build invalidate itself.
+_IGNORED_DIRS = {"dist", "node_modules", "__pycache__", ".cache"}
+
+
+def assets_root(webpack_file: str | os.PathLike) -> Path:
+    """The ``assets/`` directory a feature's ``assets/js/webpack.config.js`` sits in."""
+    return Path(webpack_file).resolve().parent.parent
+
+
+def output_present(webpack_file: str | os.PathLike) -> bool:
+    """Does the feature's ``assets/dist`` still hold a build?"""
+    dist = assets_root(webpack_file) / "dist"
+    try:
+        return any(dist.iterdir())
+    except OSError:
+        return False
+
+
+def tree_hash(root: str | os.PathLike) -> str:
+    """SHA-256 over every source file under *root*: relative path and bytes."""
+    root = Path(root)
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRS)
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            try:
+                with open(path, "rb") as handle:
+                    for chunk in iter(lambda: handle.read(64 * 1024), b""):
+                        digest.update(chunk)
+            except OSError:
+                continue
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# ── Last successful build, per product ──────────────────────────────
+
+
+def stamp_path(workspace: str | os.PathLike, product: str) -> Path:
+    return Path(workspace).joinpath(*STAMP_DIR_PARTS) / f"{product}.json"
+
+
+def load_stamps(workspace: str | os.PathLike, product: str) -> dict:
+    """``{feature: {mode: digest}}`` for the product's last successful builds."""
+    try:
+        data = json.loads(stamp_path(workspace, product).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def is_fresh(
+    stamps: dict, feature: str, mode: str, digest: str, webpack_file: str
+) -> bool:
+    """Was *feature* last built in *mode* from exactly these sources?"""
+    recorded = stamps.get(feature)
+    if not isinstance(recorded, dict) or recorded.get(mode) != digest:
+        return False
+    return output_present(webpack_file)
+
+
+def record_builds(
+    workspace: str | os.PathLike, product: str, mode: str, built: dict[str, str]
+) -> None:
+    """Remember ``{feature: digest}`` as built in *mode*. One write.
+
+    A stamp file that cannot be written only costs a rebuild next time.
+    """
+    if not built:
+        return
+    stamps = load_stamps(workspace, product)
+    for feature, digest in built.items():
+        entry = stamps.get(feature)
+        if not isinstance(entry, dict):
+            entry = {}
+        entry[mode] = digest
+        stamps[feature] = entry
+    try:
+        atomic_write(
+            stamp_path(workspace, product), json.dumps(stamps, indent=2, sort_keys=True)
+        )
+    except OSError:
+        pass
+
+
+# ── One webpack process for many features ───────────────────────────
+
+
+def cache_directory(workspace: str | os.PathLike, product: str) -> Path:
+    """Where webpack keeps its persistent cache for the product."""
+    return Path(workspace).joinpath(*STAMP_DIR_PARTS) / product / "webpack-cache"
+
+
+def write_multi_config(
+    workspace: str | os.PathLike,
+    product: str,
+    targets: list[tuple[str, str]],
+    mode: str,
+) -> Path:
+    """Write the generated multi-compiler config for ``[(name, config_path)]``.
+
+    A feature config may export an object, an array, or a function of
+    ``(env, argv)``; all three are accepted, as webpack itself does. Every
+    resulting entry is named after its feature so the output says which
+    bundle a message belongs to.
+    """
+    path = Path(workspace).joinpath(*STAMP_DIR_PARTS) / product / MULTI_CONFIG_NAME
+    entries = ",\n".join(
+        f"  [{json.dumps(name)}, {json.dumps(str(Path(config).resolve()))}]"
+        for name, config in targets
+    )
+    body = f"""// Generated by `splent feature:compile`. Do not edit: rewritten every build.
+const MODE = {json.dumps(mode)};
+const CACHE_DIR = {json.dumps(str(cache_directory(workspace, product)))};
+
+const load = (file) => {{
+  const exported = require(file);
+  const config =
+    typeof exported === "function" ? exported({{}}, {{ mode: MODE }}) : exported;
+  return Array.isArray(config) ? config : [config];
+}};
+
+module.exports = [
+{entries}
+].flatMap(([name, file]) =>
+  load(file).map((config, index, all) => {{
+    const id = all.length > 1 ? `${{name}}-${{index}}` : name;
+    return {{
+      ...config,
+      name: id,
+      cache: {{
+        type: "filesystem",
+        name: `${{id}}-${{MODE}}`,
+        cacheDirectory: CACHE_DIR,
+        buildDependencies: {{ config: [file] }},
+      }},
+    }};
+  }})
+);
+"""
+    atomic_write(path, body)
+    return path
@@ -0,0 +1,168 @@
+"""
+Content-addressed store for the files of cached feature snapshots.
+
+Every pinned version in ``.splent_cache/features`` is a full file tree, and
+most of it is the same from one version to the next: templates, migrations,
+static assets. Thirty versions of a feature were thirty copies of nearly the
+same files, and every one of them had to be chmod-walked to protect it and
+chmod-walked again to delete it.
+
+With the store enabled (``SPLENT_CACHE_DEDUPE=1``, or ``splent cache:dedupe``
+on an existing cache), each regular file of a versioned snapshot is hashed
+and hardlinked to ``.splent_cache/blobs/<aa>/<sha256>``. Identical files of
+any version of any feature become one inode. A blob is created read-only and
+is never written again, so a deduplicated snapshot is already protected: the
+chmod walk has nothing left to do.
+
+Because a hardlink shares the inode, its mode and its contents belong to
+every path that links it. The cache helpers therefore never chmod a file
+with more than one link (see cache_utils), and anything that wants to edit a
+snapshot in place first gives it private copies with
+``cache_utils.detach_shared_files``. Deleting a snapshot only unlinks its
+paths; a blob whose only remaining link is the store's own is garbage, and
+:func:`gc` removes it.
+
+The executable bit is part of the inode too, so it is part of the blob name.
+``.git`` is left alone: with the shared mirror its objects are borrowed, not
+copied. A filesystem that cannot hardlink (some container volume drivers)
+simply leaves the snapshot as it was.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+DEDUPE_ENV = "SPLENT_CACHE_DEDUPE"
+STORE_DIRNAME = "blobs"
+
+_CHUNK = 1 << 20
+
+
+def enabled() -> bool:
+    """Is deduplication of new snapshots switched on for this process?"""
+    return os.getenv(DEDUPE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def store_path(workspace: str | os.PathLike) -> Path:
+    return Path(workspace) / ".splent_cache" / STORE_DIRNAME
+
+
+def store_for(snapshot: str | os.PathLike) -> Path:
+    """The store of the cache ``snapshot`` lives in.
+
+    A snapshot is ``.splent_cache/features/<namespace>/<name>@<version>``, so
+    the store is a sibling of ``features`` three levels up.
+    """
+    return Path(snapshot).parents[2] / STORE_DIRNAME
+
+
+@dataclass
+class DedupeStats:
+    """What one or more :func:`dedupe_tree` calls did."""
+
+    files: int = 0  # regular files looked at
+    stored: int = 0  # files that became a new blob
+    linked: int = 0  # files replaced by a link to an existing blob
+    bytes_saved: int = 0  # size of the files replaced by links
+    unsupported: bool = False  # the filesystem refused to hardlink
+
+
+def _digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def blob_path(store: Path, digest: str, executable: bool) -> Path:
+    return store / digest[:2] / (digest + ("x" if executable else ""))
+
+
+def _stat(path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def dedupe_tree(
+    path: str | os.PathLike, store: Path, stats: DedupeStats | None = None
+) -> DedupeStats:
+    """Hardlink every regular file under ``path`` (outside ``.git``) into ``store``.
+
+    Files already linked to their blob are skipped, so running it twice is
+    cheap and converts nothing twice. Safe to run on several snapshots at once:
+    two of them storing the same new blob settle on whichever got there first.
+    """
+    stats = stats or DedupeStats()
+    for root, dirs, files in os.walk(path):
+        if ".git" in dirs:
+            dirs.remove(".git")
+        for name in files:
+            fp = os.path.join(root, name)
+            st = os.lstat(fp)
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            stats.files += 1
+            executable = bool(st.st_mode & stat.S_IXUSR)
+            blob = blob_path(store, _digest(fp), executable)
+
+            existing = _stat(blob)
+            if existing is None:
+                # A new blob: the file itself becomes it, sealed first so the
+                # blob is read-only from the moment it exists.
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                os.chmod(fp, 0o555 if executable else 0o444)
+                try:
+                    os.link(fp, blob)
+                    stats.stored += 1
+                    continue
+                except FileExistsError:
+                    existing = _stat(blob)
+                except OSError:
+                    stats.unsupported = True
+                    return stats
+                if existing is None:
+                    continue
+
+            if (existing.st_dev, existing.st_ino) == (st.st_dev, st.st_ino):
+                continue
+            tmp = os.path.join(root, f".{name}.{uuid.uuid4().hex}.splent")
+            try:
+                os.link(blob, tmp)
+                os.replace(tmp, fp)
+            except OSError:
+                if os.path.lexists(tmp):
+                    os.unlink(tmp)
+                stats.unsupported = True
+                return stats
+            stats.linked += 1
+            stats.bytes_saved += st.st_size
+    return stats
+
+
+def gc(store: Path) -> tuple[int, int]:
+    """Remove blobs no snapshot links any more. Returns ``(blobs, bytes)``."""
+    removed = freed = 0
+    if not store.is_dir():
+        return removed, freed
+    for bucket in store.iterdir():
+        if not bucket.is_dir():
+            continue
+        for blob in bucket.iterdir():
+            st = blob.lstat()
+            if st.st_nlink == 1:
+                blob.unlink()
+                removed += 1
+                freed += st.st_size
+        try:
+            bucket.rmdir()
+        except OSError:
+            pass
+    return removed, freed
@@ -3,6 +3,12 @@ Utilities for managing the .splent_cache directory.
 
 Provides helpers to protect versioned (pinned) features from accidental
 modification by setting filesystem permissions to read-only.
+
+A file with more than one link is a blob of the content-addressed store
+(utils/blob_store): its mode and contents are shared with every other
+snapshot that links it. None of these helpers ever chmods one; deleting it
+only needs the directory to be writable, and editing it needs a private copy
+first (:func:`detach_shared_files`).
 """
 
 import os
@@ -11,6 +17,18 @@ import stat
 import sys
 
 
+def git_mirror_path(workspace: str, namespace_safe: str, repo: str) -> str:
+    """The bare mirror every cached version of <namespace>/<repo> borrows
+    its git objects from (see git_url.clone_shared).
+
+    Lives beside ``features/`` rather than inside it, so nothing that walks
+    the versioned checkouts mistakes it for one.
+    """
+    return os.path.join(
+        workspace, ".splent_cache", "git", namespace_safe, f"{repo}.git"
+    )
+
+
 def make_feature_readonly(path: str) -> None:
     """Remove write permissions from all files in a cached feature.
 
@@ -28,11 +46,52 @@ def make_feature_readonly(path: str) -> None:
         for name in files:
             fp = os.path.join(root, name)
             try:
+                if _is_shared(fp):
+                    continue  # a blob: read-only since the day it was stored
                 os.chmod(fp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
             except OSError:
                 pass
 
 
+def _is_shared(path: str) -> bool:
+    st = os.lstat(path)
+    return stat.S_ISREG(st.st_mode) and st.st_nlink > 1
+
+
+def seal_feature(path: str) -> None:
+    """Protect a freshly cached snapshot: deduplicate it into the blob store
+    when that is enabled (SPLENT_CACHE_DEDUPE), then make the rest read-only.
+    """
+    from splent_cli.utils import blob_store
+
+    if blob_store.enabled():
+        blob_store.dedupe_tree(path, blob_store.store_for(path))
+    make_feature_readonly(path)
+
+
+def detach_shared_files(path: str) -> int:
+    """Give every blob-linked file under ``path`` a private copy of its own.
+
+    For a snapshot about to be edited in place (feature:fork): writing to a
+    linked file would change that file in every version that shares it.
+    Returns the number of files detached.
+    """
+    detached = 0
+    for root, dirs, files in os.walk(path):
+        if ".git" in dirs:
+            dirs.remove(".git")
+        for name in files:
+            fp = os.path.join(root, name)
+            if not _is_shared(fp):
+                continue
+            tmp = os.path.join(root, f".{name}.detach")
+            shutil.copyfile(fp, tmp)
+            shutil.copymode(fp, tmp)
+            os.replace(tmp, fp)
+            detached += 1
+    return detached
+
+
 def make_feature_writable(path: str) -> None:
     """Restore write permissions across a cached feature so it can be edited
     or deleted.
@@ -66,6 +125,8 @@ def make_feature_writable(path: str) -> None:
         for name in files:
             fp = os.path.join(root, name)
             try:
+                if _is_shared(fp):
+                    continue  # unlinking a blob needs only the directory
                 os.chmod(
                     fp,
                     stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH,
@@ -83,8 +144,13 @@ def _force_writable_onerror(func, path, exc_info):
     Without this, the first read-only file/dir aborts the whole deletion and
     leaves the cache folder in a partial state.
     """
+    target = path
+    if os.path.lexists(path) and _is_shared(path):
+        # Never unlock a blob other snapshots share; what blocks removing
+        # it is the directory it sits in.
+        target = os.path.dirname(path)
     try:
-        os.chmod(path, stat.S_IRWXU)
+        os.chmod(target, stat.S_IRWXU)
     except OSError:
         raise
     func(path)
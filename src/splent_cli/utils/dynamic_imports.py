@@ -45,7 +45,9 @@ def install_features_if_needed():
         return
 
     installed = {dist.metadata["Name"] for dist in distributions()}
-    pyproject = load_toml(pyproject_path, what=f"{module_name}/pyproject.toml")
+    pyproject = load_toml(
+        pyproject_path, what=f"{module_name}/pyproject.toml", copy=False
+    )
 
     features = (
         pyproject.get("project", {})
@@ -58,7 +60,9 @@ def install_features_if_needed():
         if not os.path.exists(pyproject_feature):
             continue
 
-        feature_toml = load_toml(pyproject_feature, what=f"{feature}/pyproject.toml")
+        feature_toml = load_toml(
+            pyproject_feature, what=f"{feature}/pyproject.toml", copy=False
+        )
         name = feature_toml.get("project", {}).get("name")
         if not name:
             click.secho(
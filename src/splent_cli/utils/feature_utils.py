@@ -343,16 +343,17 @@ def prune_feature_links(
 def load_product_pyproject(product_dir: str) -> dict:
     """Load and return the parsed pyproject.toml dict for a product directory.
 
+    The document is the shared, read-only one from io_utils.read_toml.
     Raises FileNotFoundError if the file does not exist.
     """
     import os
-    import tomllib
+
+    from splent_cli.utils.io_utils import read_toml
 
     path = os.path.join(product_dir, "pyproject.toml")
     if not os.path.isfile(path):
         raise FileNotFoundError(f"pyproject.toml not found: {path}")
-    with open(path, "rb") as f:
-        return tomllib.load(f)
+    return read_toml(path)
 
 
 def load_product_features(product_dir: str, env: str | None = None) -> list[str]:
@@ -15,6 +15,10 @@ Two related concerns live here:
    of). The old global probe made splent commit to SSH and then fail, instead of
    trying HTTPS — exactly the "it worked for me, not for the room" failure mode.
 
+   clone_shared() wraps it for the versioned cache: each repo gets one bare
+   mirror, every version is fetched into it and then checked out from it, so a
+   new version only transfers the objects the mirror does not already hold.
+
 2. build_git_url() / _ssh_available()  — legacy single-url builder still used by
    the release / install / upgrade / unlock paths. Kept for compatibility.
 """
@@ -25,8 +29,11 @@ import subprocess
 
 import click
 
+from splent_cli.utils import transport_cache
 from splent_cli.utils.proc import run
 
+HOST = "github.com"
+
 
 # ---------------------------------------------------------------------------
 # URL builders
@@ -66,15 +73,35 @@ def namespace_spellings(namespace: str) -> list[str]:
 def candidate_urls(namespace: str, repo: str) -> list[tuple[str, str, str]]:
     """Ordered clone candidates: SSH first, then HTTPS, per namespace spelling.
 
-    Each item is (real_url, display_url, transport).
+    Each item is (real_url, display_url, transport). Whatever last reached
+    this namespace (see transport_cache) moves to the front; the rest keep
+    their order behind it.
     """
-    candidates: list[tuple[str, str, str]] = []
+    candidates: list[tuple[str, str, str, str]] = []
     for spelling in namespace_spellings(namespace):
         ssh = ssh_url(spelling, repo)
         https_real, https_display = https_url(spelling, repo)
-        candidates.append((ssh, ssh, "ssh"))
-        candidates.append((https_real, https_display, "https"))
-    return candidates
+        candidates.append((ssh, ssh, "ssh", spelling))
+        candidates.append((https_real, https_display, "https", spelling))
+    known = transport_cache.preferred(HOST, namespace)
+    if known:
+        transport, spelling = known
+        # Stable sort: the known spelling first, and within it the known
+        # transport, if one is on file.
+        candidates.sort(
+            key=lambda c: (c[3] != spelling, bool(transport) and c[2] != transport)
+        )
+    return [c[:3] for c in candidates]
+
+
+def _spelling_in(display_url: str) -> str:
+    """The namespace part of a URL built by ssh_url() or https_url()."""
+    path = display_url.split(HOST, 1)[-1].lstrip(":/")
+    return path.split("/", 1)[0]
+
+
+def _remember(namespace: str, display_url: str, transport: str) -> None:
+    transport_cache.remember(HOST, namespace, transport, _spelling_in(display_url))
 
 
 # ---------------------------------------------------------------------------
@@ -85,8 +112,12 @@ def candidate_urls(namespace: str, repo: str) -> list[tuple[str, str, str]]:
 def _is_ref_not_found(stderr_lc: str) -> bool:
     """The repo was reached but the requested tag/branch does not exist."""
     return (
-        "remote branch" in stderr_lc and "not found" in stderr_lc
-    ) or "could not find remote branch" in stderr_lc
+        ("remote branch" in stderr_lc and "not found" in stderr_lc)
+        or "could not find remote branch" in stderr_lc
+        # What `git fetch <url> <ref>` says where `git clone --branch` says
+        # "Remote branch ... not found".
+        or "couldn't find remote ref" in stderr_lc
+    )
 
 
 def _is_access_or_network(stderr_lc: str) -> bool:
@@ -144,9 +175,13 @@ def clone(
     dest: str,
     ref: str | None = None,
     depth: int = 1,
+    quiet: bool = False,
 ) -> tuple[str, str, str]:
     """Clone <namespace>/<repo> into ``dest``, trying SSH then HTTPS.
 
+    ``quiet`` keeps the transport fallback note off the terminal, for callers
+    that clone several repos at once and report each result themselves.
+
     Returns ``(outcome, display_url, stderr)``:
       * ``CLONE_SUCCESS``       — cloned; ``display_url`` is the transport used.
       * ``CLONE_REF_NOT_FOUND`` — a transport reached the repo but ``ref`` is
@@ -177,6 +212,7 @@ def clone(
         # which is what happens on a machine with no SSH key.
         result = run(cmd, check=False, capture=True, env=_non_interactive_env())
         if result.returncode == 0:
+            _remember(namespace, display_url, transport)
             return CLONE_SUCCESS, display_url, ""
 
         stderr = (result.stderr or result.stdout or "").strip()
@@ -191,19 +227,193 @@ def clone(
             return CLONE_REF_NOT_FOUND, display_url, stderr
 
         # Access / network / unknown failure → try the next transport (HTTPS).
-        if transport == "ssh":
+        if transport == "ssh" and not quiet:
             click.secho("  SSH could not reach the repo — trying HTTPS…", fg="yellow")
 
     return CLONE_FAILED, "", last_stderr
 
 
+# ---------------------------------------------------------------------------
+# Clone through a per-repo bare mirror (the versioned feature cache)
+# ---------------------------------------------------------------------------
+
+
+def _git(*args: str, env: dict | None = None):
+    return run(["git", *args], check=False, capture=True, env=env)
+
+
+def _fetch_into_mirror(
+    namespace: str, repo: str, mirror: str, ref: str, quiet: bool
+) -> tuple[str, str, str]:
+    """Fetch ``ref`` into ``mirror`` as refs/splent/<ref>, SSH then HTTPS.
+
+    Same outcomes as clone(), plus ``""`` when the failure looks local (a
+    locked mirror, a broken object store) rather than the remote's doing, in
+    which case a plain clone is still worth a try.
+    """
+    last_stderr = ""
+    remote_failures = True
+    for real_url, display_url, transport in candidate_urls(namespace, repo):
+        # --depth 1 keeps the mirror as shallow as the clones it replaces. The
+        # commits it already holds are offered as haves, so the server only
+        # sends the objects the new version does not share with them.
+        result = _git(
+            "-C",
+            mirror,
+            "fetch",
+            "--quiet",
+            "--no-tags",
+            "--depth",
+            "1",
+            real_url,
+            f"+{ref}:refs/splent/{ref}",
+            env=_non_interactive_env(),
+        )
+        if result.returncode == 0:
+            _remember(namespace, display_url, transport)
+            return CLONE_SUCCESS, display_url, ""
+
+        stderr = (result.stderr or result.stdout or "").strip()
+        last_stderr = stderr
+        stderr_lc = stderr.lower()
+        if _is_ref_not_found(stderr_lc) and not _is_access_or_network(stderr_lc):
+            return CLONE_REF_NOT_FOUND, display_url, stderr
+        if not _is_access_or_network(stderr_lc):
+            remote_failures = False
+        if transport == "ssh" and not quiet:
+            click.secho("  SSH could not reach the repo — trying HTTPS…", fg="yellow")
+
+    return (CLONE_FAILED if remote_failures else ""), "", last_stderr
+
+
+def _checkout_from_mirror(mirror: str, dest: str, ref: str, origin: str) -> bool:
+    """Materialise refs/splent/<ref> of ``mirror`` as a checkout at ``dest``.
+
+    The new repository borrows the mirror's object store through
+    objects/info/alternates instead of copying it. The alternates path is
+    relative, so the workspace can be mounted somewhere else (as it is inside
+    the containers) and the checkout still finds its objects. The commit is
+    marked shallow the same way a --depth 1 clone marks it, and a tag or
+    branch of the same name is recreated, so the result reads like the clone
+    it replaces.
+    """
+    tip = _git("-C", mirror, "rev-parse", "--verify", f"refs/splent/{ref}")
+    commit = _git(
+        "-C", mirror, "rev-parse", "--verify", f"refs/splent/{ref}^{{commit}}"
+    )
+    if tip.returncode != 0 or commit.returncode != 0:
+        return False
+    tip_sha, sha = tip.stdout.strip(), commit.stdout.strip()
+
+    if _git("init", "--quiet", dest).returncode != 0:
+        return False
+    objects = os.path.join(dest, ".git", "objects")
+    with open(os.path.join(objects, "info", "alternates"), "w") as fh:
+        fh.write(os.path.relpath(os.path.join(mirror, "objects"), objects) + "\n")
+    with open(os.path.join(dest, ".git", "shallow"), "w") as fh:
+        fh.write(sha + "\n")
+
+    # FETCH_HEAD says whether the name was a branch or a tag on the remote.
+    try:
+        with open(os.path.join(mirror, "FETCH_HEAD")) as fh:
+            is_branch = f"branch '{ref}' of" in fh.read()
+    except OSError:
+        is_branch = False
+
+    steps = [("remote", "add", "origin", origin)]
+    if is_branch:
+        steps.append(("checkout", "--quiet", "-B", ref, sha))
+    else:
+        steps.append(("update-ref", f"refs/tags/{ref}", tip_sha))
+        steps.append(("checkout", "--quiet", "--detach", sha))
+    for step in steps:
+        if _git("-C", dest, "-c", "advice.detachedHead=false", *step).returncode:
+            return False
+    return True
+
+
+def dissociate(dest: str, source: str | None = None) -> bool:
+    """Give the checkout at ``dest`` its own copy of the objects it borrows.
+
+    A checkout made by :func:`clone_shared` finds its objects through a
+    relative objects/info/alternates, which stops resolving once the checkout
+    is copied to a different depth (feature:unlock copies one to the
+    workspace root) and is gone with the mirror. ``source`` is the checkout
+    ``dest`` was copied from, which is where a relative path still resolves.
+    The borrowed objects are repacked into ``dest`` and the alternates file is
+    removed. True when ``dest`` no longer depends on a mirror.
+    """
+    alternates = os.path.join(dest, ".git", "objects", "info", "alternates")
+    try:
+        with open(alternates) as fh:
+            lines = [line.strip() for line in fh if line.strip()]
+    except FileNotFoundError:
+        return True
+    base = os.path.join(source or dest, ".git", "objects")
+    with open(alternates, "w") as fh:
+        for line in lines:
+            fh.write(os.path.normpath(os.path.join(base, line)) + "\n")
+    if _git("-C", dest, "repack", "-a", "-d", "-q").returncode != 0:
+        return False
+    os.remove(alternates)
+    return True
+
+
+def clone_shared(
+    namespace: str,
+    repo: str,
+    dest: str,
+    mirror: str,
+    ref: str | None = None,
+    quiet: bool = False,
+) -> tuple[str, str, str]:
+    """Clone <namespace>/<repo>@<ref> into ``dest`` by way of a bare ``mirror``.
+
+    Every version of a feature used to be a separate shallow clone, so
+    bumping auth from v1.4.0 to v1.4.1 downloaded the whole repository again
+    and kept a second full copy of its objects on disk. Here ``ref`` is
+    fetched into the repo's mirror, which shares the objects of every version
+    fetched before it, and ``dest`` is checked out on top of the mirror's
+    object store. Deleting the mirror therefore breaks the git history of
+    every checkout made from it; the working files are unaffected. A checkout
+    that leaves the cache goes through :func:`dissociate` first.
+
+    Returns what clone() returns. ``ref=None`` (the default branch) and any
+    failure that is not the remote's answer go through clone() instead, so
+    the mirror is an optimisation and never the reason a clone fails.
+    """
+    if ref:
+        ready = os.path.isdir(os.path.join(mirror, "objects"))
+        if not ready:
+            os.makedirs(os.path.dirname(mirror), exist_ok=True)
+            # Checkouts point into the mirror's objects: never let an
+            # automatic gc prune one that no ref of the mirror reaches.
+            ready = (
+                _git("init", "--quiet", "--bare", mirror).returncode == 0
+                and _git("-C", mirror, "config", "gc.auto", "0").returncode == 0
+            )
+        if ready:
+            outcome, display_url, stderr = _fetch_into_mirror(
+                namespace, repo, mirror, ref, quiet
+            )
+            if outcome == CLONE_SUCCESS:
+                if _checkout_from_mirror(mirror, dest, ref, display_url):
+                    return CLONE_SUCCESS, display_url, ""
+                shutil.rmtree(dest, ignore_errors=True)
+            elif outcome:
+                return outcome, display_url, stderr
+
+    return clone(namespace, repo, dest, ref=ref, quiet=quiet)
+
+
 # ---------------------------------------------------------------------------
 # Legacy single-url builder (release / install / upgrade / unlock)
 # ---------------------------------------------------------------------------
 
 # Cache the SSH probe for the lifetime of the process: the probe spawns
 # `ssh -T git@github.com` (up to ~10s when offline) and can otherwise run on
-# every git op. None = not yet probed.
+# every git op. None = not yet probed. Across processes transport_cache keeps
+# a success for a few hours and a failure for a few minutes.
 _ssh_available_cache: bool | None = None
 
 
@@ -220,6 +430,11 @@ def _ssh_available() -> bool:
     if _ssh_available_cache is not None:
         return _ssh_available_cache
 
+    remembered = transport_cache.ssh_probe(HOST)
+    if remembered is not None:
+        _ssh_available_cache = remembered
+        return remembered
+
     try:
         result = subprocess.run(
             [
@@ -239,6 +454,7 @@ def _ssh_available() -> bool:
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         _ssh_available_cache = False
 
+    transport_cache.remember_ssh_probe(HOST, _ssh_available_cache)
     return _ssh_available_cache
 
 
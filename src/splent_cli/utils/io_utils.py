@@ -10,6 +10,22 @@ Two recurring "happy-path" hazards across the CLI:
     with no backup → a crash mid-write can corrupt or truncate the file.
 
 These helpers give actionable errors and atomic, optionally-backed-up writes.
+
+Parsing is memoized for the life of the process. One command reads the
+product's pyproject.toml from half a dozen places (preflight, product:build,
+product:env, the feature list) and every feature's pyproject again for its
+config, contract and refinement, and tomllib is pure Python: on a large
+product that was hundreds of identical parses per command. :func:`read_toml`
+and :func:`read_json` keep the parsed document per path, valid while the
+file's ``(st_mtime_ns, st_size, st_ino)`` is unchanged; :func:`atomic_write`
+drops the entry for the file it replaces, so a write within the same clock
+tick is never missed.
+
+The cached document is shared, so it is read-only: its dicts and lists
+raise ``TypeError`` on any change. :func:`load_toml` and :func:`load_json`
+hand out a mutable copy by default, because most of their callers edit
+what they load and write it back; ``copy=False`` skips the copy for a
+caller that only reads.
 """
 
 from __future__ import annotations
@@ -17,39 +33,154 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+import threading
+import time
 import tomllib
 from pathlib import Path
 
 import click
 
+from splent_cli.utils import trace
+
+
+# ── Memoized parsing ───────────────────────────────────────────────
+
+
+class FrozenDict(dict):
+    """A dict that refuses changes. ``dict(d)`` or :func:`thaw` to edit."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "parsed documents are shared and read-only; thaw() a copy to edit"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """A list that refuses changes. ``list(l)`` or :func:`thaw` to edit."""
+
+    _readonly = FrozenDict._readonly
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value):
+    """*value* with every dict and list in it made read-only."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """A mutable deep copy of a (possibly frozen) document."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
 
-def load_toml(path: str | os.PathLike, *, what: str | None = None) -> dict:
-    """Load a TOML file, raising a clear ClickException on missing/invalid input."""
+
+_parsed: dict[tuple[str, str], tuple[tuple[int, int, int], object]] = {}
+_parsed_lock = threading.Lock()
+# A file modified this recently may be modified again within the same
+# timestamp tick, same size, same inode, and the stamp would not tell. It is
+# parsed every time until it is older than this (git's "racily clean" rule).
+RACY_NS = 2_000_000_000
+
+
+def _read_cached(kind: str, path: str | os.PathLike, parse):
+    key = (kind, os.path.abspath(path))
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _parsed_lock:
+        hit = _parsed.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with open(path, "rb") as handle:
+        document = freeze(parse(handle))
+    if time.time_ns() - st.st_mtime_ns > RACY_NS:
+        with _parsed_lock:
+            _parsed[key] = (stamp, document)
+    return document
+
+
+def read_toml(path: str | os.PathLike) -> dict:
+    """Parsed TOML, memoized and read-only. Raises OSError / TOMLDecodeError."""
+    return _read_cached("toml", path, tomllib.load)
+
+
+def read_json(path: str | os.PathLike):
+    """Parsed JSON, memoized and read-only. Raises OSError / JSONDecodeError."""
+    return _read_cached("json", path, json.load)
+
+
+def forget(path: str | os.PathLike) -> None:
+    """Drop whatever was parsed from *path*."""
+    absolute = os.path.abspath(path)
+    with _parsed_lock:
+        for kind in ("toml", "json"):
+            _parsed.pop((kind, absolute), None)
+
+
+def clear_parse_cache() -> None:
+    with _parsed_lock:
+        _parsed.clear()
+
+
+def load_toml(
+    path: str | os.PathLike, *, what: str | None = None, copy: bool = True
+) -> dict:
+    """Load a TOML file, raising a clear ClickException on missing/invalid input.
+
+    ``copy=False`` returns the shared read-only document.
+    """
     p = Path(path)
     label = what or str(p)
     if not p.is_file():
         raise click.ClickException(f"{label} not found at: {p}")
     try:
-        with p.open("rb") as f:
-            return tomllib.load(f)
+        data = read_toml(p)
     except tomllib.TOMLDecodeError as e:
         raise click.ClickException(f"{label} is not valid TOML ({p}):\n  {e}")
     except OSError as e:
         raise click.ClickException(f"Could not read {label} ({p}): {e}")
+    return thaw(data) if copy else data
+
 
+def load_json(
+    path: str | os.PathLike, *, what: str | None = None, copy: bool = True
+) -> dict:
+    """Load a JSON file, raising a clear ClickException on missing/invalid input.
 
-def load_json(path: str | os.PathLike, *, what: str | None = None) -> dict:
-    """Load a JSON file, raising a clear ClickException on missing/invalid input."""
+    ``copy=False`` returns the shared read-only document.
+    """
     p = Path(path)
     label = what or str(p)
     if not p.is_file():
         raise click.ClickException(f"{label} not found at: {p}")
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        data = read_json(p)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise click.ClickException(f"{label} is not valid JSON ({p}):\n  {e}")
     except OSError as e:
         raise click.ClickException(f"Could not read {label} ({p}): {e}")
+    return thaw(data) if copy else data
 
 
 def backup_file(path: str | os.PathLike, suffix: str = ".bak") -> Path | None:
@@ -73,20 +204,25 @@ def atomic_write(
     ``pyproject.toml`` that must never be corrupted.
     """
     p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    fd, tmp = tempfile.mkstemp(dir=str(p.parent), prefix=f".{p.name}.", suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w", encoding=encoding) as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp, p)
-    except BaseException:
+    with trace.span(f"write {p.name}", "fs", path=str(p)) as span:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=str(p.parent), prefix=f".{p.name}.", suffix=".tmp"
+        )
         try:
-            os.unlink(tmp)
-        except OSError:
-            pass
-        raise
+            with os.fdopen(fd, "w", encoding=encoding) as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+                span["bytes"] = os.fstat(f.fileno()).st_size
+            os.replace(tmp, p)
+            forget(p)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
 
 def env_line(key: str, value: str) -> str:
@@ -120,18 +120,7 @@ def require_state(
     current = get_feature_state(product_path, key)
 
     # Check blocked states for this command
-    blocked = BLOCKED_STATES.get(command, set())
-    if current in blocked:
-        guidance = BLOCKED_GUIDANCE.get(current, "")
-        msg = f"Feature '{key}' is in state '{current}' — cannot run '{command}'."
-        if guidance:
-            msg += f"\n   {guidance}"
-
-        if force:
-            click.secho(f"⚠️  {msg} (--force: continuing anyway)", fg="yellow")
-        else:
-            click.secho(f"❌ {msg}", fg="red")
-            raise SystemExit(1)
+    _refuse_blocked(key, current, command, force)
 
     # Check minimum state
     if min_state is not None and current is not None:
@@ -149,6 +138,41 @@ def require_state(
     return current
 
 
+def _refuse_blocked(key: str, current: str | None, command: str, force: bool) -> None:
+    """Abort (or warn, with force) when ``current`` blocks ``command``."""
+    blocked = BLOCKED_STATES.get(command, set())
+    if current not in blocked:
+        return
+    guidance = BLOCKED_GUIDANCE.get(current, "")
+    msg = f"Feature '{key}' is in state '{current}' — cannot run '{command}'."
+    if guidance:
+        msg += f"\n   {guidance}"
+
+    if force:
+        click.secho(f"⚠️  {msg} (--force: continuing anyway)", fg="yellow")
+    else:
+        click.secho(f"❌ {msg}", fg="red")
+        raise SystemExit(1)
+
+
+def allowed_keys(product_path: str, keys, *, command: str) -> list[str]:
+    """The ``keys`` whose state does not block ``command``, one manifest read.
+
+    For commands that act on many features at once (feature:upgrade of a
+    whole product): each blocked key gets the same refusal as
+    :func:`require_state`, and is left out instead of aborting the rest.
+    """
+    states = read_manifest(product_path).get("features", {})
+    allowed = []
+    for key in keys:
+        try:
+            _refuse_blocked(key, (states.get(key) or {}).get("state"), command, False)
+        except SystemExit:
+            continue
+        allowed.append(key)
+    return allowed
+
+
 def advance_state(
     product_path: str,
     product_name: str,
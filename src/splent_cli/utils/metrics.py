@@ -0,0 +1,271 @@
+"""
+A local record of how long every CLI command takes.
+
+``--trace`` answers "where did this one run spend its time"; it has to be
+asked for before the run, and it says nothing about whether ``product:up``
+is slower this month than last. So every invocation also appends one line
+to a small store under the workspace,
+``.splent_cache/metrics/metrics.jsonl``::
+
+    {"ts": 1760000000.0, "cmd": "product:up", "product": "my_app",
+     "version": "1.4.0", "ms": 8412.3, "subprocess": [14, 7980.1],
+     "http": [0, 0.0], "exit": 0}
+
+that is: when, which command, for which product, under which CLI version,
+how long it took, how many subprocesses and HTTP requests it made and how
+long they took together, and how it exited. ``splent stats`` reads it back.
+
+The counts come from the spans utils/trace.py records, through a tally that
+needs no trace file. Subprocesses run in worker threads are counted too, so
+their summed time can exceed the command's own.
+
+The store never gets in the way of the command it measures:
+
+  * nothing is written without a workspace directory, and nothing at all
+    with ``SPLENT_METRICS=0``;
+  * the line is written with one append, so parallel ``splent`` runs do not
+    interleave, and any error writing it is ignored;
+  * when the file passes :data:`MAX_BYTES` it is rotated to
+    ``metrics.1.jsonl`` (and so on, :data:`KEEP` files deep), so the store
+    stays a few megabytes however long the workspace lives.
+"""
+
+from __future__ import annotations
+
+import importlib.metadata
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import click
+
+from splent_cli.utils import trace
+
+METRICS_ENV = "SPLENT_METRICS"
+STORE_DIR_PARTS = (".splent_cache", "metrics")
+FILENAME = "metrics.jsonl"
+MAX_BYTES = 1_000_000
+KEEP = 3
+
+
+def enabled() -> bool:
+    return os.getenv(METRICS_ENV, "1").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def store_dir(workspace: str | os.PathLike) -> Path:
+    return Path(workspace).joinpath(*STORE_DIR_PARTS)
+
+
+def store_files(workspace: str | os.PathLike) -> list[Path]:
+    """The store's files that exist, oldest first."""
+    directory = store_dir(workspace)
+    candidates = [directory / f"metrics.{n}.jsonl" for n in range(KEEP, 0, -1)] + [
+        directory / FILENAME
+    ]
+    return [path for path in candidates if path.is_file()]
+
+
+@lru_cache(maxsize=1)
+def cli_version() -> str:
+    try:
+        return importlib.metadata.version("splent_cli")
+    except Exception:
+        return "unknown"
+
+
+# ── Writing ─────────────────────────────────────────────────────────
+
+
+def _rotate(directory: Path) -> None:
+    """metrics.jsonl → metrics.1.jsonl → ... ; the oldest falls off."""
+    oldest = directory / f"metrics.{KEEP}.jsonl"
+    if oldest.exists():
+        oldest.unlink()
+    for n in range(KEEP - 1, 0, -1):
+        path = directory / f"metrics.{n}.jsonl"
+        if path.exists():
+            os.replace(path, directory / f"metrics.{n + 1}.jsonl")
+    os.replace(directory / FILENAME, directory / "metrics.1.jsonl")
+
+
+def append(workspace: str | os.PathLike, record: dict) -> None:
+    """Add one record to the store. Raises OSError; :func:`timed` ignores it."""
+    directory = store_dir(workspace)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / FILENAME
+    try:
+        if path.stat().st_size >= MAX_BYTES:
+            _rotate(directory)
+    except FileNotFoundError:
+        pass
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def exit_code(exc: BaseException) -> int:
+    """The exit status *exc* ends the CLI with, as Click's main would."""
+    if isinstance(exc, SystemExit):
+        if exc.code is None:
+            return 0
+        return exc.code if isinstance(exc.code, int) else 1
+    if isinstance(exc, click.exceptions.Exit):
+        return exc.exit_code
+    if isinstance(exc, click.ClickException):
+        return exc.exit_code
+    if isinstance(exc, KeyboardInterrupt):
+        return 130
+    return 1
+
+
+@contextmanager
+def timed(command: str | None):
+    """Record the block as one run of *command*, if there is a store for it."""
+    workspace = os.getenv("WORKING_DIR", "/workspace")
+    if not command or not enabled() or not os.path.isdir(workspace):
+        yield
+        return
+
+    code = 0
+    trace.start_tally()
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as exc:
+        code = exit_code(exc)
+        raise
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        tally = trace.stop_tally()
+        record = {
+            "ts": round(time.time(), 3),
+            "cmd": command,
+            "product": os.getenv("SPLENT_APP") or None,
+            "version": cli_version(),
+            "ms": round(elapsed, 1),
+        }
+        for cat in ("subprocess", "http"):
+            count, ms = tally.get(cat, (0, 0.0))
+            record[cat] = [count, round(ms, 1)]
+        record["exit"] = code
+        try:
+            append(workspace, record)
+        except OSError:
+            pass
+
+
+# ── Reading ─────────────────────────────────────────────────────────
+
+
+def load(workspace: str | os.PathLike) -> list[dict]:
+    """Every record in the store, oldest first. Unreadable lines are skipped."""
+    records = []
+    for path in store_files(workspace):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get("cmd"):
+                        records.append(record)
+        except OSError:
+            continue
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
+@dataclass
+class CommandStats:
+    cmd: str
+    version: str
+    runs: int
+    failures: int
+    p50: float
+    p95: float
+    subprocess_ms: float
+    http_ms: float
+
+
+def summarize(records: list[dict]) -> list[CommandStats]:
+    """Per command and CLI version: runs, p50/p95 and average time in I/O.
+
+    Commands are sorted by name, and each command's versions in the order
+    they were first used, so the last row of a command is its current one.
+    """
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for record in records:
+        key = (record["cmd"], str(record.get("version") or "unknown"))
+        groups.setdefault(key, []).append(record)
+
+    stats = []
+    for (cmd, version), runs in sorted(groups.items(), key=lambda kv: kv[0][0]):
+        durations = [float(r.get("ms") or 0) for r in runs]
+        stats.append(
+            CommandStats(
+                cmd=cmd,
+                version=version,
+                runs=len(runs),
+                failures=sum(1 for r in runs if r.get("exit")),
+                p50=percentile(durations, 50),
+                p95=percentile(durations, 95),
+                subprocess_ms=_average_ms(runs, "subprocess"),
+                http_ms=_average_ms(runs, "http"),
+            )
+        )
+    return stats
+
+
+def _average_ms(runs: list[dict], cat: str) -> float:
+    total = 0.0
+    for record in runs:
+        entry = record.get(cat)
+        if isinstance(entry, list) and len(entry) == 2:
+            total += float(entry[1] or 0)
+    return total / len(runs) if runs else 0.0
+
+
+def regressions(
+    stats: list[CommandStats], *, threshold: float = 20.0, min_runs: int = 5
+) -> dict[str, tuple[CommandStats, CommandStats]]:
+    """Commands whose p95 under their latest CLI version grew past *threshold*.
+
+    Compared with the version used just before it, and only when both have
+    at least *min_runs* runs: a p95 of three samples is noise.
+    Returns ``{cmd: (previous, latest)}``.
+    """
+    by_cmd: dict[str, list[CommandStats]] = {}
+    for entry in stats:
+        by_cmd.setdefault(entry.cmd, []).append(entry)
+
+    flagged = {}
+    for cmd, versions in by_cmd.items():
+        if len(versions) < 2:
+            continue
+        previous, latest = versions[-2], versions[-1]
+        if previous.runs < min_runs or latest.runs < min_runs or not previous.p95:
+            continue
+        if 100.0 * (latest.p95 - previous.p95) / previous.p95 > threshold:
+            flagged[cmd] = (previous, latest)
+    return flagged
@@ -133,6 +133,40 @@ def count_changed_lines(diff: list[str]) -> int:
     )
 
 
+def gitignore_update(path: Path, template_text: str) -> str | None:
+    """``path`` with the ignore patterns of ``template_text`` it lacks appended.
+
+    A product's .gitignore is the developer's as much as SPLENT's, so it is
+    never replaced by the template. The patterns a newer template added
+    (docker/docker-bake.json, say) are appended instead, each with the
+    comment above it. None when nothing is missing or there is no file.
+    """
+    try:
+        current = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    present = {line.strip() for line in current.splitlines()}
+
+    added: list[str] = []
+    comments: list[str] = []
+    for line in template_text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            comments = []
+        elif stripped.startswith("#"):
+            comments.append(line)
+        else:
+            if stripped not in present:
+                if added:
+                    added.append("")
+                added.extend(comments + [line])
+                present.add(stripped)
+            comments = []
+    if not added:
+        return None
+    return current.rstrip("\n") + "\n\n" + "\n".join(added) + "\n"
+
+
 # ── Stored version reader ─────────────────────────────────────────────────────
 
 
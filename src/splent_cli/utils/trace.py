@@ -0,0 +1,263 @@
+"""
+Chrome trace-event recording of where a CLI run spends its time.
+
+``splent --trace out.json product:up`` (or ``SPLENT_TRACE=out.json``) writes
+a trace that Perfetto (ui.perfetto.dev) or chrome://tracing opens as a
+timeline: the Click command as the outer span, and under it every docker,
+git, pip or HTTP call it made, with its arguments, duration, exit code and
+how many bytes came back. A slow ``feature:release`` stops being a guess.
+
+What is recorded:
+
+  * every ``subprocess.run`` in the process. The CLI shells out through
+    utils/proc.run and through dozens of direct ``subprocess.run`` calls
+    (services/compose.py and services/release.py alone have thirty), so
+    rather than wrap each call site, tracing replaces ``subprocess.run``
+    itself while it is on. ``subprocess.check_output`` goes through it too.
+    Detached ``Popen`` processes (watchers, ``docker exec -d``) are not
+    waited for by the CLI and are not spans;
+  * HTTP requests made by registry._request and the marketplace client;
+  * atomic_write, the one way the CLI rewrites config files.
+
+Credentials in a URL (the ``https://<token>@github.com/...`` that git is
+handed when GITHUB_TOKEN is set) are replaced by ``***`` before anything is
+recorded: a trace is made to be shared.
+
+Nothing changes when tracing is off: :func:`span` is a no-op context and
+``subprocess.run`` is left alone.
+
+The same spans feed a cheaper consumer that needs no trace file: a tally
+(:func:`start_tally` / :func:`stop_tally`) keeps only how many spans of each
+category ran and for how long. utils/metrics.py opens one around every
+command to record how much of it was subprocesses and HTTP. While a tally is
+open ``subprocess.run`` is wrapped exactly as under tracing, and restored to
+whatever it was when the tally closes.
+
+The ``SPLENT_TRACE`` variable is removed from the environment once tracing
+is on, so a ``splent`` subprocess (feature:release runs feature:compile)
+does not overwrite the parent's trace; it shows up as one subprocess span.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+
+TRACE_ENV = "SPLENT_TRACE"
+
+_original_run = subprocess.run
+_lock = threading.Lock()
+_events: list[dict] | None = None
+# Open tallies, innermost last: {category: [count, microseconds]} each.
+_tallies: list[dict[str, list[int]]] = []
+_path: str | None = None
+_origin = 0
+_threads: dict[int, int] = {}
+_ARG_LIMIT = 500
+# The user:password@ (or token@) part of a URL, as in git_url.https_url.
+_USERINFO = re.compile(r"://[^@/\s]+@")
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def _install() -> None:
+    """Route ``subprocess.run`` through :func:`_traced_run`, once."""
+    global _original_run
+    if subprocess.run is not _traced_run:
+        _original_run = subprocess.run
+        subprocess.run = _traced_run
+
+
+def _uninstall() -> None:
+    """Put ``subprocess.run`` back once neither tracing nor a tally needs it."""
+    if _events is None and not _tallies and subprocess.run is _traced_run:
+        subprocess.run = _original_run
+
+
+def _now() -> int:
+    """Microseconds since tracing started."""
+    return (time.perf_counter_ns() - _origin) // 1000
+
+
+def _tid() -> int:
+    """A small, stable id per thread, so the timeline has readable rows."""
+    ident = threading.get_ident()
+    with _lock:
+        if ident not in _threads:
+            _threads[ident] = len(_threads) + 1
+        return _threads[ident]
+
+
+def redact(text: str) -> str:
+    """*text* with the credentials of any URL in it replaced by ``***``."""
+    return _USERINFO.sub("://***@", text)
+
+
+def _clip(value):
+    if not isinstance(value, str):
+        return value
+    value = redact(value)
+    if len(value) > _ARG_LIMIT:
+        return value[:_ARG_LIMIT] + "…"
+    return value
+
+
+def enable(path: str) -> None:
+    """Start recording; the trace is written to *path* when the process exits."""
+    global _events, _path, _origin
+    if _events is not None:
+        return
+    _origin = time.perf_counter_ns()
+    _events = []
+    _path = path
+    _threads.clear()
+    os.environ.pop(TRACE_ENV, None)
+    _install()
+    atexit.register(flush)
+
+
+def disable() -> None:
+    """Stop recording and forget what was recorded. Does not write anything."""
+    global _events, _path
+    _events = None
+    _path = None
+    _uninstall()
+    atexit.unregister(flush)
+
+
+def start_tally() -> None:
+    """Start counting spans per category, tracing or not. Tallies nest."""
+    with _lock:
+        _tallies.append({})
+    _install()
+
+
+def stop_tally() -> dict[str, tuple[int, float]]:
+    """Close the innermost tally: ``{category: (count, milliseconds)}``."""
+    with _lock:
+        tally = _tallies.pop() if _tallies else {}
+    _uninstall()
+    return {cat: (count, us / 1000) for cat, (count, us) in tally.items()}
+
+
+@contextmanager
+def span(name: str, cat: str, **args):
+    """Record the block as one complete event. Yields its ``args`` dict.
+
+    The caller adds what it learns along the way (status, exit code, bytes)
+    to the yielded dict. An exception is recorded by type and re-raised.
+    """
+    if _events is None and not _tallies:
+        yield args
+        return
+    start = _now()
+    try:
+        yield args
+    except BaseException as exc:
+        args.setdefault("error", type(exc).__name__)
+        raise
+    finally:
+        duration = max(_now() - start, 0)
+        with _lock:
+            for tally in _tallies:
+                entry = tally.setdefault(cat, [0, 0])
+                entry[0] += 1
+                entry[1] += duration
+        if _events is not None:
+            _record(name, cat, start, duration, args)
+
+
+def _record(name: str, cat: str, start: int, duration: int, args: dict) -> None:
+    event = {
+        "name": redact(name),
+        "cat": cat,
+        "ph": "X",
+        "ts": start,
+        "dur": duration,
+        "pid": os.getpid(),
+        "tid": _tid(),
+        "args": {k: _clip(v) for k, v in args.items() if v is not None},
+    }
+    with _lock:
+        if _events is not None:
+            _events.append(event)
+
+
+def flush() -> str | None:
+    """Write the trace recorded so far. Returns the path written, if any."""
+    if _events is None or not _path:
+        return None
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+        threads = dict(_threads)
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "splent"}}]
+    for number in threads.values():
+        meta.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": number,
+                "args": {"name": "main" if number == 1 else f"worker {number - 1}"},
+            }
+        )
+    payload = {"traceEvents": meta + events, "displayTimeUnit": "ms"}
+    try:
+        with open(_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+    except OSError:
+        return None
+    return _path
+
+
+# ── subprocess.run, while tracing ───────────────────────────────────
+
+
+def _command_name(cmd) -> str:
+    """``docker compose`` / ``git fetch``: the tool and what it was asked to do."""
+    if isinstance(cmd, (list, tuple)):
+        parts = [str(p) for p in cmd]
+    else:
+        parts = str(cmd).split()
+    if not parts:
+        return "subprocess"
+    head = [os.path.basename(parts[0])]
+    if len(parts) > 1 and not parts[1].startswith("-"):
+        head.append(parts[1])
+    return " ".join(head)
+
+
+def _size(value) -> int | None:
+    if not value:
+        return None
+    return len(value.encode()) if isinstance(value, str) else len(value)
+
+
+def _traced_run(*popenargs, **kwargs):
+    cmd = popenargs[0] if popenargs else kwargs.get("args")
+    argv = " ".join(map(str, cmd)) if isinstance(cmd, (list, tuple)) else str(cmd)
+    cwd = kwargs.get("cwd")
+    with span(
+        _command_name(cmd),
+        "subprocess",
+        argv=argv,
+        cwd=str(cwd) if cwd else None,
+    ) as args:
+        try:
+            result = _original_run(*popenargs, **kwargs)
+        except subprocess.CalledProcessError as exc:
+            args["exit_code"] = exc.returncode
+            raise
+        args["exit_code"] = result.returncode
+        args["stdout_bytes"] = _size(result.stdout)
+        args["stderr_bytes"] = _size(result.stderr)
+        return result
@@ -0,0 +1,130 @@
+"""
+Remember, across CLI processes, which way git could reach a namespace.
+
+On a machine with no SSH key every fresh ``splent`` process paid the same
+multi-second toll: the ``ssh -T git@github.com`` probe behind build_git_url(),
+and an SSH attempt per repo in clone() before it fell back to HTTPS. The
+in-process memo only saved the second call of the same process, and most
+commands are one process each.
+
+This cache holds the answers on disk for a while (``SPLENT_TRANSPORT_TTL``
+seconds, six hours by default):
+
+  * per host, whether the SSH probe authenticated;
+  * per host and namespace, the transport and namespace spelling that last
+    worked.
+
+A namespace entry only reorders what clone() tries, so a stale one costs one
+failed attempt before the usual order takes over. The SSH probe is different:
+build_git_url() picks SSH or HTTPS from it and tries nothing else, so a stale
+"no SSH" would keep a user who has just added a key, and has no GITHUB_TOKEN,
+off their private repos. A failed probe is therefore remembered for five
+minutes at most (:data:`NEGATIVE_TTL`), enough to spare a burst of commands
+the timeout and short enough that a new key is noticed soon.
+
+The file is per user rather than per workspace (``~/.cache/splent``, or
+``SPLENT_TRANSPORT_CACHE``), because it describes the SSH keys and token of
+whoever runs the CLI, and the host and the container share a workspace but
+not their keys.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from splent_cli.utils.io_utils import atomic_write
+
+CACHE_ENV = "SPLENT_TRANSPORT_CACHE"
+TTL_ENV = "SPLENT_TRANSPORT_TTL"
+DEFAULT_TTL = 6 * 3600
+# How long a failed SSH probe is trusted; see the module docstring.
+NEGATIVE_TTL = 300
+
+_lock = threading.Lock()
+
+
+def cache_path() -> Path:
+    override = os.getenv(CACHE_ENV)
+    if override:
+        return Path(override).expanduser()
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "splent" / "transport.json"
+
+
+def _ttl() -> float:
+    try:
+        return float(os.getenv(TTL_ENV, DEFAULT_TTL))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def _load() -> dict:
+    try:
+        data = json.loads(cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _fresh(entry, ttl: float | None = None) -> dict | None:
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("at", 0) > (_ttl() if ttl is None else ttl):
+        return None
+    return entry
+
+
+def _store(key: str, entry: dict) -> None:
+    """Write one entry. A cache that cannot be written is simply not kept."""
+    with _lock:
+        data = _load()
+        data[key] = {**entry, "at": time.time()}
+        try:
+            atomic_write(cache_path(), json.dumps(data, indent=2, sort_keys=True))
+        except OSError:
+            pass
+
+
+def ssh_probe(host: str) -> bool | None:
+    """The remembered SSH probe result for ``host``, or None if unknown.
+
+    A failure is forgotten after :data:`NEGATIVE_TTL`, a success after the
+    full TTL.
+    """
+    entry = _fresh(_load().get(f"ssh:{host}"))
+    if entry is None:
+        return None
+    if not entry.get("ok"):
+        return None if _fresh(entry, min(NEGATIVE_TTL, _ttl())) is None else False
+    return True
+
+
+def remember_ssh_probe(host: str, ok: bool) -> None:
+    _store(f"ssh:{host}", {"ok": ok})
+
+
+def preferred(host: str, namespace: str) -> tuple[str, str] | None:
+    """``(transport, spelling)`` that last reached ``namespace`` on ``host``."""
+    entry = _fresh(_load().get(f"ns:{host}/{namespace}"))
+    if entry is None:
+        return None
+    return entry.get("transport", ""), entry.get("spelling", "")
+
+
+def remember(host: str, namespace: str, transport: str | None, spelling: str) -> None:
+    """Record what just worked, unless it is already what is on file.
+
+    ``transport=None`` records only the spelling, keeping the transport on
+    file: an anonymous ``ls-remote`` proves which spelling exists but says
+    nothing about whether SSH would have worked too.
+    """
+    known = preferred(host, namespace)
+    if transport is None:
+        transport = known[0] if known and known[1] == spelling else ""
+    if known == (transport, spelling):
+        return
+    _store(f"ns:{host}/{namespace}", {"transport": transport, "spelling": spelling})
@@ -22,6 +22,14 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_transport_cache(tmp_path_factory, monkeypatch):
+    """Keep git transport negotiation (utils/transport_cache) out of ~/.cache,
+    and one test's remembered transport out of the next test."""
+    path = tmp_path_factory.mktemp("transport") / "transport.json"
+    monkeypatch.setenv("SPLENT_TRANSPORT_CACHE", str(path))
+
+
 @pytest.fixture
 def runner():
     """A Click CliRunner that mixes stdout/stderr into a single stream."""
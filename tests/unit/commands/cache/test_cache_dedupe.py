@@ -0,0 +1,45 @@
+"""
+Tests for the cache:dedupe command.
+"""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from splent_cli.commands.cache.cache_dedupe import cache_dedupe
+
+
+@pytest.fixture
+def runner():
+    return CliRunner(mix_stderr=False)
+
+
+def _make_cache(workspace, dir_name, content):
+    path = workspace / ".splent_cache" / "features" / "splent_io" / dir_name
+    path.mkdir(parents=True)
+    (path / "template.html").write_text(content)
+    return path
+
+
+class TestCacheDedupe:
+    def test_empty_cache_shows_info(self, runner, workspace):
+        result = runner.invoke(cache_dedupe, [])
+        assert result.exit_code == 0
+        assert "No versioned snapshots" in result.output
+
+    def test_links_identical_files_across_versions(self, runner, workspace):
+        v1 = _make_cache(workspace, "auth@v1", "<p>same</p>")
+        v2 = _make_cache(workspace, "auth@v2", "<p>same</p>")
+        result = runner.invoke(cache_dedupe, [])
+        assert result.exit_code == 0, result.output
+        assert "1 of 2 file(s) now share a blob" in result.output
+        assert (
+            os.stat(v1 / "template.html").st_ino == os.stat(v2 / "template.html").st_ino
+        )
+
+    def test_editable_entries_are_skipped(self, runner, workspace):
+        editable = _make_cache(workspace, "auth", "<p>same</p>")
+        _make_cache(workspace, "auth@v1", "<p>same</p>")
+        runner.invoke(cache_dedupe, [])
+        assert os.stat(editable / "template.html").st_nlink == 1
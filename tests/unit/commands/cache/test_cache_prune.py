@@ -137,3 +137,52 @@ class TestBrokenSymlinks:
         result = runner.invoke(cache_prune, ["--yes"])
         assert result.exit_code == 0
         assert "No broken symlinks" in result.output
+
+
+# ---------------------------------------------------------------------------
+# --max-size: LRU eviction of unreferenced entries
+# ---------------------------------------------------------------------------
+
+
+class TestMaxSize:
+    def _sized(self, workspace, name, version, size, last_used):
+        from splent_cli.services import cache_index
+
+        entry = _make_cache(workspace, "splent_io", name, version)
+        (entry / "blob").write_bytes(b"x" * size)
+        cache_index.CacheIndex(workspace).entries()
+        index = cache_index.CacheIndex(workspace)
+        index.touch([f"splent_io/{name}@{version}"], when=last_used)
+        index.save()
+        return entry
+
+    def test_evicts_least_recently_used_until_within_budget(self, runner, workspace):
+        oldest = self._sized(workspace, "a", "v1", 600, last_used=1)
+        newer = self._sized(workspace, "b", "v1", 600, last_used=2)
+        used = self._sized(workspace, "c", "v1", 600, last_used=0)
+        _make_product(workspace, "app", ["splent_io/c@v1"])
+
+        result = runner.invoke(cache_prune, ["--yes", "--max-size", "1300"])
+        assert result.exit_code == 0, result.output
+        assert not oldest.exists()
+        assert newer.exists()
+        assert used.exists()
+
+    def test_within_budget_evicts_nothing(self, runner, workspace):
+        entry = self._sized(workspace, "a", "v1", 10, last_used=1)
+        result = runner.invoke(cache_prune, ["--yes", "--max-size", "5G"])
+        assert result.exit_code == 0
+        assert "within budget" in result.output
+        assert entry.exists()
+
+    def test_referenced_entries_are_never_evicted(self, runner, workspace):
+        entry = self._sized(workspace, "a", "v1", 100, last_used=1)
+        _make_product(workspace, "app", ["splent_io/a@v1"])
+        result = runner.invoke(cache_prune, ["--yes", "--max-size", "1"])
+        assert result.exit_code == 0
+        assert "used by a product" in result.output
+        assert entry.exists()
+
+    def test_bad_size_is_a_usage_error(self, runner, workspace):
+        result = runner.invoke(cache_prune, ["--max-size", "huge"])
+        assert result.exit_code == 2
@@ -100,6 +100,21 @@ class TestCheckContracts:
         assert "not local" in result.output
         assert "auth" in result.output
 
+    def test_a_broken_contract_is_reported_not_read_as_empty(
+        self, tmp_path, monkeypatch
+    ):
+        _workspace(
+            tmp_path,
+            monkeypatch,
+            {"auth": [], "team": ["media"], "media": [], "notes": []},
+        )
+        (tmp_path / "splent_feature_team" / "pyproject.toml").write_text("[tool\n")
+        result = CliRunner().invoke(check_contracts, [])
+        assert "splent_feature_team pyproject.toml is not valid TOML" in result.output
+        # Passed over, like a feature that is not local, not a contract
+        # that requires nothing.
+        assert "does not" not in result.output
+
 
 class TestAFeatureTheModelOffersButNobodyWrote:
     """A variability model is a promise about which products can be built.
@@ -11,7 +11,13 @@ import pytest
 from click.testing import CliRunner
 
 from splent_cli.commands.check import check_releases as mod
-from splent_cli.services import registry
+from splent_cli.services import host_gate, registry
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff_sleep(monkeypatch):
+    """Rate-limited answers are retried at once instead of after seconds."""
+    monkeypatch.setattr(host_gate, "BACKOFF", 0.0)
 
 
 # ── The comparison itself ─────────────────────────────────────────────
@@ -365,3 +371,107 @@ class TestCheckReleasesCommand:
         result = CliRunner(mix_stderr=False).invoke(mod.check_releases, [])
         assert result.exit_code == 0
         assert "No releasable packages" in result.output
+
+
+# ── Concurrency ───────────────────────────────────────────────────────
+
+
+class TestConcurrentLookups:
+    def test_report_keeps_package_order_whoever_answers_first(self, workspace):
+        import threading
+
+        # No tag lookup answers until all four are in flight at once; done one
+        # at a time the barrier would break.
+        others_asked = threading.Barrier(4, timeout=5)
+        repos = {
+            str(workspace / n): f"org/{n}"
+            for n in ("innosoft_app", "splent_cli", "splent_feature_alpha")
+        }
+        repos[str(workspace / "splent_feature_beta")] = "org/splent_feature_beta"
+
+        def _tags(org, name, token=None, quiet=True):
+            others_asked.wait()
+            return ["v1.0.0"]
+
+        with (
+            patch.object(mod, "_repo_of", side_effect=lambda p: repos[p]),
+            patch.object(registry, "list_semver_tags", _tags),
+            patch.object(registry, "pypi_versions", lambda p, strict=False: ["1.0.0"]),
+            patch.object(registry, "list_release_tags", lambda *a, **k: {"v1.0.0"}),
+        ):
+            result = CliRunner(mix_stderr=False).invoke(mod.check_releases, [])
+
+        assert result.exit_code == 0, result.output
+        order = [
+            result.output.index(n)
+            for n in (
+                "innosoft_app",
+                "splent_cli",
+                "splent_feature_alpha",
+                "splent_feature_beta",
+            )
+        ]
+        assert order == sorted(order)
+
+    def test_rate_limit_is_learned_once_for_every_package(self, workspace):
+        asked = []
+
+        def _tags(org, name, token=None, quiet=True):
+            asked.append(name)
+            raise registry.RegistryError(
+                "limit", status=403, rate_limited=True, retry_after=3600
+            )
+
+        with (
+            patch.object(mod, "_repo_of", return_value="org/repo"),
+            patch.object(registry, "list_semver_tags", _tags),
+            patch.object(registry, "pypi_versions", lambda p, strict=False: []),
+            patch.object(registry, "list_release_tags", lambda *a, **k: set()),
+        ):
+            result = CliRunner(mix_stderr=False).invoke(
+                mod.check_releases, ["--jobs", "1"]
+            )
+
+        assert result.exit_code == 1
+        # The first answer said to wait an hour; nobody asked again.
+        assert len(asked) == 1
+        assert result.output.count("GitHub is rate limiting this token") == 8
+        assert "4 package(s) could NOT be checked" in result.output
+
+
+class TestGraphQLBatch:
+    def test_with_a_token_complete_snapshots_skip_the_rest_lookups(
+        self, workspace, monkeypatch
+    ):
+        monkeypatch.setenv("GITHUB_TOKEN", "t0k")
+        asked = []
+
+        def _snapshots(refs, token, releases=False):
+            asked.append(list(refs))
+            return {
+                ref: registry.RepoSnapshot(
+                    org="org",
+                    repo="repo",
+                    meta={},
+                    tags=["v1.0.0", "nightly"],
+                    tags_complete=True,
+                    release_tags={"v1.0.0"},
+                )
+                for ref in refs
+            }
+
+        def _rest(*a, **k):
+            raise AssertionError("answered by the batch")
+
+        with (
+            patch.object(mod, "_repo_of", return_value="org/repo"),
+            patch.object(registry, "fetch_repo_snapshots", _snapshots),
+            patch.object(registry, "list_semver_tags", _rest),
+            patch.object(registry, "list_release_tags", _rest),
+            patch.object(registry, "pypi_versions", lambda p, strict=False: ["1.0.0"]),
+        ):
+            result = CliRunner(mix_stderr=False).invoke(mod.check_releases, [])
+
+        assert result.exit_code == 0, result.output
+        assert len(asked) == 1
+        assert "agree for all 4 package(s)" in result.output
@@ -29,3 +29,41 @@ class TestDbDumpEnvValidation:
         result = runner.invoke(db_dump, [])
         assert result.exit_code == 1
         assert "Missing" in result.output
+
+    def test_gzip_with_parallel_is_a_usage_error(self, monkeypatch):
+        monkeypatch.setenv("SPLENT_APP", "test_app")
+        runner = CliRunner(mix_stderr=True)
+        result = runner.invoke(db_dump, ["--parallel", "4", "--gzip"])
+        assert result.exit_code == 2
+        assert "always gzip-compressed" in result.output
+
+
+class TestPruneParallelDumps:
+    def test_retention_counts_dump_directories(self, tmp_path):
+        import os
+
+        from splent_cli.commands.database.db_dump import _prune_old_dumps
+
+        names = [
+            "dump_mydb_20250101_000000",
+            "dump_mydb_20250102_000000.sql",
+            "dump_mydb_20250103_000000",
+        ]
+        for i, name in enumerate(names):
+            path = tmp_path / name
+            if name.endswith(".sql"):
+                path.write_text("-- dump")
+            else:
+                path.mkdir()
+                (path / "manifest.json").write_text("{}")
+            os.utime(path, (i, i))
+        # Same shape but no manifest: not a dump, never deleted.
+        (tmp_path / "dump_mydb_20240101_000000").mkdir()
+
+        _prune_old_dumps(str(tmp_path), names[-1], 2)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "dump_mydb_20240101_000000",
+            "dump_mydb_20250102_000000.sql",
+            "dump_mydb_20250103_000000",
+        ]
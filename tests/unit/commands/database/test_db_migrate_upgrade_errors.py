@@ -606,3 +606,84 @@ class TestDbUpgradeRetriesDependents:
         assert "Migration upgrade failed for: slider" in (
             result.output + str(result.stderr)
         )
+
+
+class TestDbUpgradeSkipsCurrentFeatures:
+    """A feature whose database revision already equals its head is never
+    handed to Alembic: entrypoints run db:upgrade on every start."""
+
+    def _run(self, tmp_path, monkeypatch, db_revisions, recorded):
+        monkeypatch.setenv("WORKING_DIR", str(tmp_path))
+        monkeypatch.setenv("SPLENT_APP", "test_app")
+        dirs = {
+            "auth": _make_versions_dir(tmp_path, "auth"),
+            "media": _make_versions_dir(tmp_path, "media"),
+        }
+        _write_revision(dirs["auth"], "a1")
+        _write_revision(dirs["auth"], "a2", "a1")
+        _write_revision(dirs["media"], "m1")
+
+        upgrade = MagicMock(return_value=None)
+        update = MagicMock(return_value=None)
+        with (
+            patch("splent_cli.commands.database.db_upgrade.current_app", MagicMock()),
+            patch(
+                "splent_cli.commands.database.db_upgrade."
+                "MigrationManager.get_all_feature_migration_dirs",
+                return_value=dirs,
+            ),
+            patch(
+                "splent_cli.commands.database.db_upgrade.get_features_from_pyproject",
+                return_value=[],
+            ),
+            patch(
+                "splent_cli.commands.database.db_upgrade._db_revisions",
+                return_value=db_revisions,
+            ),
+            patch(
+                "splent_cli.commands.database.db_upgrade."
+                "MigrationManager.get_all_status",
+                return_value=recorded,
+            ),
+            patch(
+                "splent_cli.commands.database.db_upgrade."
+                "MigrationManager.get_current_feature_revision",
+                return_value="a2",
+            ),
+            patch(
+                "splent_cli.commands.database.db_upgrade."
+                "MigrationManager.update_feature_status",
+                update,
+            ),
+            patch("splent_cli.commands.database.db_upgrade.alembic_upgrade", upgrade),
+        ):
+            result = CliRunner(mix_stderr=False).invoke(db_upgrade, [])
+        return result, upgrade, update
+
+    def test_noop_upgrade_never_calls_alembic(self, tmp_path, monkeypatch):
+        result, upgrade, update = self._run(
+            tmp_path,
+            monkeypatch,
+            db_revisions={"auth": "a2", "media": "m1"},
+            recorded=[("auth", "a2"), ("media", "m1")],
+        )
+        assert result.exit_code == 0, result.output
+        assert "2 feature(s) already at head" in result.output
+        upgrade.assert_not_called()
+        update.assert_not_called()
+
+    def test_only_features_behind_their_head_are_upgraded(self, tmp_path, monkeypatch):
+        result, upgrade, update = self._run(
+            tmp_path,
+            monkeypatch,
+            db_revisions={"auth": "a1", "media": "m1"},
+            recorded=[("auth", "a1")],
+        )
+        assert result.exit_code == 0, result.output
+        upgrade.assert_called_once()
+        assert upgrade.call_args.kwargs["directory"].endswith(
+            os.path.join("auth", "migrations")
+        )
+        # media was current but splent_migrations had no row for it.
+        assert ("media", "m1") in [c.args[1:] for c in update.call_args_list]
+        assert "auth -> a2" in result.output
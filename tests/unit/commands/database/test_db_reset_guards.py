@@ -258,3 +258,93 @@ class TestConfirmationGuard:
 
         assert result.exit_code != 0  # click abort
         engine.begin.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# --from-template
+# ---------------------------------------------------------------------------
+
+
+class TestFromTemplate:
+    def _run(self, monkeypatch, tmp_path, meta, heads=None, args=("--yes",)):
+        monkeypatch.setenv("SPLENT_APP", "test_app")
+        monkeypatch.setenv("WORKING_DIR", str(tmp_path))
+
+        conn = MagicMock(name="conn")
+        engine, _ = _make_engine(conn=conn)
+        fake_meta = MagicMock()
+        fake_meta.sorted_tables = []
+
+        mm = MagicMock()
+        mm.get_all_feature_migration_dirs.return_value = {"feat_a": "/m/feat_a"}
+        mm.get_current_feature_revision.return_value = "abc123"
+
+        template = MagicMock()
+        template.read_template.return_value = meta
+        template.stale_features.side_effect = (
+            lambda m, h: [] if m["heads"] == h else ["feat_a"]
+        )
+        upgrade = MagicMock()
+
+        runner = CliRunner(mix_stderr=False)
+        with (
+            patch.object(db_reset_mod, "db", _patches(engine)),
+            patch.object(db_reset_mod, "current_app", MagicMock()),
+            patch.object(db_reset_mod, "MetaData", return_value=fake_meta),
+            patch.object(db_reset_mod, "MigrationManager", mm),
+            patch.object(db_reset_mod, "alembic_upgrade", upgrade),
+            patch.object(db_reset_mod, "get_features_from_pyproject", return_value=[]),
+            patch.object(db_reset_mod, "advance_state", MagicMock()),
+            patch.object(db_reset_mod, "PathUtils", MagicMock()),
+            patch.object(db_reset_mod, "clear_uploads", MagicMock()),
+            patch.object(
+                db_reset_mod,
+                "filesystem_head",
+                side_effect=lambda mdir: (heads or {}).get(mdir),
+            ),
+            patch.object(db_reset_mod, "db_template", template),
+        ):
+            result = runner.invoke(db_reset, [*args, "--from-template"])
+        return result, template, upgrade
+
+    def test_current_template_skips_migrations(self, monkeypatch, tmp_path):
+        result, template, upgrade = self._run(
+            monkeypatch,
+            tmp_path,
+            meta={"heads": {"feat_a": "abc123"}},
+            heads={"/m/feat_a": "abc123"},
+        )
+
+        assert result.exit_code == 0, result.output
+        template.load_template.assert_called_once()
+        upgrade.assert_not_called()
+        assert "reset from template complete" in result.output
+
+    def test_stale_template_migrates(self, monkeypatch, tmp_path):
+        result, template, upgrade = self._run(
+            monkeypatch,
+            tmp_path,
+            meta={"heads": {"feat_a": "old"}},
+            heads={"/m/feat_a": "abc123"},
+        )
+
+        assert result.exit_code == 0, result.output
+        template.load_template.assert_not_called()
+        upgrade.assert_called_once()
+        assert "predates migration changes in: feat_a" in result.output
+
+    def test_missing_template_migrates(self, monkeypatch, tmp_path):
+        result, template, upgrade = self._run(monkeypatch, tmp_path, meta=None)
+
+        assert result.exit_code == 0, result.output
+        template.load_template.assert_not_called()
+        upgrade.assert_called_once()
+        assert "No template saved" in result.output
+
+    def test_cannot_be_combined_with_a_feature(self, monkeypatch, tmp_path):
+        result, template, _ = self._run(
+            monkeypatch, tmp_path, meta=None, args=("--yes", "projects")
+        )
+
+        assert result.exit_code == 2
+        template.read_template.assert_not_called()
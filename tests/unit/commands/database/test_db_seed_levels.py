@@ -0,0 +1,39 @@
+"""Tests for db:seed's seeding levels — which features may seed concurrently."""
+
+import pytest
+
+from splent_cli.commands.database import db_seed
+
+
+@pytest.fixture
+def groups(monkeypatch):
+    monkeypatch.setenv("SPLENT_APP", "my_app")
+    return [
+        ("splent_feature_auth", []),
+        ("splent_feature_profile", []),
+        ("splent_feature_mail", []),
+        ("my_app", []),
+    ]
+
+
+def test_without_requires_features_seed_one_at_a_time_in_order(groups, monkeypatch):
+    monkeypatch.setattr(db_seed, "_requires_map", lambda: {})
+    assert db_seed._seeding_levels(groups) == [
+        ["splent_feature_auth"],
+        ["splent_feature_profile"],
+        ["splent_feature_mail"],
+        ["my_app"],
+    ]
+
+
+def test_requires_let_independent_features_share_a_level(groups, monkeypatch):
+    monkeypatch.setattr(
+        db_seed,
+        "_requires_map",
+        lambda: {"splent_feature_profile": ["splent_feature_auth"]},
+    )
+    assert db_seed._seeding_levels(groups) == [
+        ["splent_feature_auth", "splent_feature_mail"],
+        ["splent_feature_profile"],
+        ["my_app"],
+    ]
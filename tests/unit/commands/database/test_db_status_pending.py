@@ -0,0 +1,20 @@
+"""Tests for db:status's count of revisions left to apply."""
+
+from splent_cli.commands.database.db_status import _behind
+from splent_cli.services.migration_graph import RevisionGraph
+
+GRAPH = RevisionGraph({"a": (), "b": ("a",), "c": ("b",)})
+
+
+def test_counts_the_revisions_between_the_database_and_the_head():
+    assert _behind(GRAPH, "a") == " (2)"
+    assert _behind(GRAPH, None) == " (3)"
+
+
+def test_nothing_to_count():
+    assert _behind(GRAPH, "c") == ""
+    assert _behind(None, "a") == ""
+
+
+def test_a_revision_the_scripts_do_not_have_is_not_counted():
+    assert _behind(GRAPH, "gone") == ""
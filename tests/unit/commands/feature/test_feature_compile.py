@@ -2,14 +2,25 @@
 Tests for feature_compile command helpers.
 
 Focus: _is_product_container() and the container/direct branching in
-_compile_in_container(). Full integration (docker exec) is not testable
+_run_webpack(). Full integration (docker exec) is not testable
 in unit tests — those paths require a running container.
 """
 
+from types import SimpleNamespace
 from unittest.mock import patch
+
+import pytest
+
+from splent_cli.commands.feature import feature_compile as mod
 from splent_cli.commands.feature.feature_compile import (
     _is_product_container,
-    _compile_in_container,
+    _resolve_webpack,
+    _run_webpack,
+)
+
+WEBPACK_FILE = (
+    "/workspace/splent_feature_auth/src/splent_io/splent_feature_auth"
+    "/assets/js/webpack.config.js"
 )
 
 
@@ -45,25 +56,22 @@ class TestIsInsideContainer:
 
 
 # ---------------------------------------------------------------------------
-# _compile_in_container — direct mode (no container_id)
+# _run_webpack — direct mode (no container_id)
 # ---------------------------------------------------------------------------
 
 
-class TestCompileInContainerDirect:
+class TestRunWebpackDirect:
     """When container_id is None the command runs webpack directly."""
 
     def _call(self, watch=False, production=False, extra_patch=None):
         with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=True,
-            ),
             patch("subprocess.run") as mock_run,
             patch("subprocess.Popen") as mock_popen,
         ):
-            _compile_in_container(
+            _run_webpack(
                 container_id=None,
                 feature="splent_io/splent_feature_auth",
+                webpack_file=WEBPACK_FILE,
                 watch=watch,
                 production=production,
                 workspace="/workspace",
@@ -97,22 +105,17 @@ class TestCompileInContainerDirect:
 
 
 # ---------------------------------------------------------------------------
-# _compile_in_container — docker exec mode (container_id present)
+# _run_webpack — docker exec mode (container_id present)
 # ---------------------------------------------------------------------------
 
 
-class TestCompileInContainerViaDocker:
+class TestRunWebpackViaDocker:
     def test_uses_docker_exec_when_container_id_given(self):
-        with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=True,
-            ),
-            patch("subprocess.run") as mock_run,
-        ):
-            _compile_in_container(
+        with patch("subprocess.run") as mock_run:
+            _run_webpack(
                 container_id="abc123",
                 feature="splent_io/splent_feature_auth",
+                webpack_file=WEBPACK_FILE,
                 watch=False,
                 production=False,
                 workspace="/workspace",
@@ -124,19 +127,143 @@ class TestCompileInContainerViaDocker:
         assert "abc123" in cmd
 
     def test_skips_when_no_webpack_config(self):
-        with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=False,
-            ),
-            patch("subprocess.run") as mock_run,
+        with patch(
+            "splent_cli.commands.feature.feature_compile.os.path.exists",
+            return_value=False,
         ):
-            _compile_in_container(
-                container_id="abc123",
-                feature="splent_io/splent_feature_auth",
-                watch=False,
-                production=False,
-                workspace="/workspace",
-                product="my_app",
+            webpack_file = _resolve_webpack(
+                "splent_io/splent_feature_auth", "/workspace", "my_app"
             )
-        mock_run.assert_not_called()
+        assert webpack_file is None
+
+    def test_resolves_the_editable_features_config(self):
+        with patch(
+            "splent_cli.commands.feature.feature_compile.os.path.exists",
+            return_value=True,
+        ):
+            webpack_file = _resolve_webpack(
+                "splent_io/splent_feature_auth", "/workspace", "my_app"
+            )
+        assert webpack_file == WEBPACK_FILE
+
+
+# ---------------------------------------------------------------------------
+# feature:compile — one webpack for all features, unchanged ones skipped
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def editable_product(workspace, monkeypatch):
+    """A product with two editable features and webpack replaced by a recorder."""
+    (workspace / "my_app").mkdir()
+    names = ["splent_feature_auth", "splent_feature_notes"]
+    for name in names:
+        js = workspace / name / "src" / "splent_io" / name / "assets" / "js"
+        js.mkdir(parents=True)
+        (js / "webpack.config.js").write_text("module.exports = {};\n")
+        (js / "scripts.js").write_text("1;\n")
+    monkeypatch.setenv("SPLENT_APP", "my_app")
+    monkeypatch.setenv("SPLENT_CONTAINER", "product")
+    monkeypatch.setattr(
+        mod, "get_features_from_pyproject", lambda: [f"splent_io/{n}" for n in names]
+    )
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd[-1])
+        # What webpack would leave behind.
+        for name in names:
+            dist = workspace / name / "src" / "splent_io" / name / "assets" / "dist"
+            dist.mkdir(exist_ok=True)
+            (dist / f"{name}.bundle.js").write_text("built")
+        return SimpleNamespace(returncode=fake_run.returncode)
+
+    fake_run.returncode = 0
+    monkeypatch.setattr(mod, "run", fake_run)
+    return SimpleNamespace(path=workspace, names=names, calls=calls, run=fake_run)
+
+
+class TestSingleProcessBuild:
+    def test_all_features_go_to_one_webpack(self, editable_product, runner):
+        result = runner.invoke(mod.feature_compile, [])
+
+        assert result.exit_code == 0, result.output
+        assert len(editable_product.calls) == 1
+        assert "webpack.multi.config.js" in editable_product.calls[0]
+        assert "--no-cache" not in editable_product.calls[0]
+
+    def test_per_feature_keeps_one_webpack_each(self, editable_product, runner):
+        result = runner.invoke(mod.feature_compile, ["--per-feature"])
+
+        assert result.exit_code == 0, result.output
+        assert len(editable_product.calls) == 2
+
+    def test_an_unchanged_feature_is_not_built_again(self, editable_product, runner):
+        runner.invoke(mod.feature_compile, [])
+        name = editable_product.names[1]
+        scripts = (
+            editable_product.path
+            / name
+            / "src"
+            / "splent_io"
+            / name
+            / "assets"
+            / "js"
+            / "scripts.js"
+        )
+        scripts.write_text("2;\n")
+
+        result = runner.invoke(mod.feature_compile, [])
+
+        assert "splent_feature_auth unchanged" in result.output
+        assert len(editable_product.calls) == 2
+        # One feature left to build: no multi-compiler needed for it.
+        assert "webpack.multi.config.js" not in editable_product.calls[1]
+        assert name in editable_product.calls[1]
+
+        runner.invoke(mod.feature_compile, [])
+        assert len(editable_product.calls) == 2
+
+        runner.invoke(mod.feature_compile, ["--force"])
+        assert len(editable_product.calls) == 3
+
+    def test_a_failed_build_is_retried_next_time(self, editable_product, runner):
+        editable_product.run.returncode = 2
+        result = runner.invoke(mod.feature_compile, [])
+        assert "Error compiling" in result.output
+
+        editable_product.run.returncode = 0
+        runner.invoke(mod.feature_compile, [])
+        assert len(editable_product.calls) == 2
+        assert "webpack.multi.config.js" in editable_product.calls[1]
+
+
+class TestUnifiedWatch:
+    def test_one_watcher_for_every_feature(self, editable_product, runner):
+        with patch("subprocess.Popen") as popen:
+            result = runner.invoke(mod.feature_compile, ["--watch"])
+
+        assert result.exit_code == 0, result.output
+        popen.assert_called_once()
+        shell_cmd = popen.call_args[0][0][-1]
+        assert "webpack.multi.config.js" in shell_cmd
+        assert "--watch" in shell_cmd
+        assert "Watching 2 features" in result.output
+        assert editable_product.calls == []
+
+    def test_per_feature_keeps_one_watcher_each(self, editable_product, runner):
+        with patch("subprocess.Popen") as popen:
+            runner.invoke(mod.feature_compile, ["--watch", "--per-feature"])
+
+        assert popen.call_count == 2
+        assert all(
+            "webpack.multi.config.js" not in c[0][0][-1] for c in popen.call_args_list
+        )
+
+    def test_watching_never_skips_an_unchanged_feature(self, editable_product, runner):
+        runner.invoke(mod.feature_compile, [])
+        with patch("subprocess.Popen") as popen:
+            result = runner.invoke(mod.feature_compile, ["--watch"])
+
+        popen.assert_called_once()
+        assert "unchanged" not in result.output
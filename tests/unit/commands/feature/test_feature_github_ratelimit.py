@@ -298,7 +298,7 @@ class TestHappyPath:
         runner = CliRunner(mix_stderr=False)
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr(
-                "splent_cli.commands.feature.feature_upgrade._latest_remote_version",
+                "splent_cli.services.upgrade_plan._latest_rest",
                 lambda *a, **k: "v1.0.0",
             )
             result = runner.invoke(feature_upgrade, [])
@@ -20,11 +20,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
-from splent_cli.commands.feature.feature_compile import _compile_in_container
+from splent_cli.commands.feature.feature_compile import _run_webpack
 from splent_cli.commands.feature.feature_env import feature_env
 from splent_cli.commands.feature.feature_git import feature_git
 
 
+WEBPACK_FILE = (
+    "/workspace/splent_feature_auth/src/splent_io/splent_feature_auth"
+    "/assets/js/webpack.config.js"
+)
+
+
 @pytest.fixture
 def runner():
     return CliRunner(mix_stderr=False)
@@ -42,7 +48,7 @@ def _no_traceback(text: str) -> bool:
 # ---------------------------------------------------------------------------
 # feature:compile — bash / docker / npx guards
 #
-# _compile_in_container() is the unit that actually shells out. The non-watch
+# _run_webpack() is the unit that actually shells out. The non-watch
 # path goes through proc.run (→ subprocess.run); the watch path uses
 # subprocess.Popen directly inside a try/except FileNotFoundError.
 # ---------------------------------------------------------------------------
@@ -50,15 +56,11 @@ def _no_traceback(text: str) -> bool:
 
 class TestCompileToolMissing:
     def _run(self, container_id, watch, missing):
-        """Drive _compile_in_container with the shell-out boundary patched.
+        """Drive _run_webpack with the shell-out boundary patched.
 
         ``missing`` raises FileNotFoundError from the boundary (tool absent).
         """
         with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=True,
-            ),
             patch(
                 "splent_cli.utils.proc.subprocess.run",
                 side_effect=FileNotFoundError() if missing else None,
@@ -70,9 +72,10 @@ class TestCompileToolMissing:
         ):
             if not missing:
                 mock_run.return_value = MagicMock(returncode=0)
-            _compile_in_container(
+            _run_webpack(
                 container_id=container_id,
                 feature="splent_io/splent_feature_auth",
+                webpack_file=WEBPACK_FILE,
                 watch=watch,
                 production=False,
                 workspace="/workspace",
@@ -117,19 +120,14 @@ class TestCompileToolMissing:
 class TestCompileToolFails:
     def test_webpack_nonzero_exit_surfaced_cleanly(self, capsys):
         # webpack present but exits non-zero → caller reports, does not raise.
-        with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=True,
-            ),
-            patch(
-                "splent_cli.utils.proc.subprocess.run",
-                return_value=MagicMock(returncode=1, stdout="", stderr=""),
-            ),
+        with patch(
+            "splent_cli.utils.proc.subprocess.run",
+            return_value=MagicMock(returncode=1, stdout="", stderr=""),
         ):
-            _compile_in_container(
+            _run_webpack(
                 container_id=None,
                 feature="splent_io/splent_feature_auth",
+                webpack_file=WEBPACK_FILE,
                 watch=False,
                 production=False,
                 workspace="/workspace",
@@ -141,19 +139,14 @@ class TestCompileToolFails:
         assert _no_traceback(out)
 
     def test_webpack_success_reports_done(self, capsys):
-        with (
-            patch(
-                "splent_cli.commands.feature.feature_compile.os.path.exists",
-                return_value=True,
-            ),
-            patch(
-                "splent_cli.utils.proc.subprocess.run",
-                return_value=MagicMock(returncode=0, stdout="", stderr=""),
-            ),
+        with patch(
+            "splent_cli.utils.proc.subprocess.run",
+            return_value=MagicMock(returncode=0, stdout="", stderr=""),
         ):
-            _compile_in_container(
+            _run_webpack(
                 container_id=None,
                 feature="splent_io/splent_feature_auth",
+                webpack_file=WEBPACK_FILE,
                 watch=False,
                 production=False,
                 workspace="/workspace",
@@ -0,0 +1,52 @@
+"""Tests for feature:unlock copying a cached version out to the workspace."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from splent_cli.commands.feature.feature_unlock import copy_out_of_cache
+from splent_cli.utils import git_url
+from splent_cli.utils.cache_utils import git_mirror_path, make_feature_readonly
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_unlocked_copy_of_a_mirror_backed_feature_has_history(tmp_path, monkeypatch):
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    _git(upstream, "init", "--quiet", "-b", "main")
+    _git(upstream, "config", "user.email", "t@example.com")
+    _git(upstream, "config", "user.name", "t")
+    (upstream / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    _git(upstream, "add", ".")
+    _git(upstream, "commit", "--quiet", "-m", "first release")
+    _git(upstream, "tag", "v1.0.0")
+    url = f"file://{upstream}"
+    monkeypatch.setattr(
+        git_url, "candidate_urls", lambda ns, name: [(url, url, "https")]
+    )
+
+    workspace = tmp_path / "workspace"
+    name = "splent_feature_demo"
+    versioned = (
+        workspace / ".splent_cache" / "features" / "splent_io" / f"{name}@v1.0.0"
+    )
+    mirror = git_mirror_path(str(workspace), "splent_io", name)
+    outcome, _, _ = git_url.clone_shared(
+        "splent-io", name, str(versioned), mirror, ref="v1.0.0"
+    )
+    assert outcome == git_url.CLONE_SUCCESS
+    make_feature_readonly(str(versioned))
+
+    editable = workspace / name
+    copy_out_of_cache(str(versioned), str(editable))
+
+    assert _git(editable, "log", "--format=%s") == "first release"
+    assert not (editable / ".git" / "objects" / "info" / "alternates").exists()
@@ -0,0 +1,137 @@
+"""Tests for feature:versions --all — concurrent lookups, rows in product order."""
+
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from splent_cli.commands.feature import feature_versions as fv
+from splent_cli.services import registry
+
+
+@pytest.fixture
+def features(monkeypatch):
+    entries = [
+        "splent-io/splent_feature_auth@v1.0.0",
+        "splent-io/splent_feature_mail@v2.0.0",
+        "splent-io/splent_feature_notes",
+    ]
+    monkeypatch.setattr(fv, "_load_active_product_features", lambda: entries)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    return entries
+
+
+def _pages(tag_pages):
+    def fake(org, repo, token=None, max_pages=50):
+        for page in tag_pages[repo]:
+            fake.fetched.append((repo, page[0] if page else None))
+            yield page
+
+    fake.fetched = []
+    return fake
+
+
+class TestTagsThrough:
+    def test_stops_at_the_page_holding_the_declared_version(self, monkeypatch):
+        fake = _pages({"r": [["v3", "v2"], ["v1", "v0"], ["old"]]})
+        monkeypatch.setattr(registry, "iter_tag_pages", fake)
+        assert fv._tags_through("o", "r", None, "v1") == ["v3", "v2", "v1", "v0"]
+        assert len(fake.fetched) == 2
+
+    def test_editable_needs_only_the_first_page(self, monkeypatch):
+        fake = _pages({"r": [["v3"], ["v2"]]})
+        monkeypatch.setattr(registry, "iter_tag_pages", fake)
+        assert fv._tags_through("o", "r", None, None) == ["v3"]
+
+
+class TestCmdAll:
+    def test_rows_stream_in_product_order(self, features, monkeypatch):
+        # The first feature answers last; its row must still come first.
+        gate = threading.Event()
+
+        def fake(org, repo, token, declared):
+            if repo == "splent_feature_auth":
+                assert gate.wait(5)
+            else:
+                gate.set()
+            return {"splent_feature_auth": ["v1.1.0", "v1.0.0"]}.get(repo, ["v2.0.0"])
+
+        monkeypatch.setattr(fv, "_tags_through", fake)
+        result = CliRunner(mix_stderr=False).invoke(fv.feature_versions, ["--all"])
+        assert result.exit_code == 0, result.output
+        out = result.output
+        assert (
+            out.index("splent_feature_auth")
+            < out.index("splent_feature_mail")
+            < out.index("splent_feature_notes")
+        )
+        assert "1 behind" in out
+        assert "up to date" in out
+
+    def test_rate_limit_warns_once(self, features, monkeypatch):
+        def limited(*a):
+            raise registry.RegistryError("limited", status=403, rate_limited=True)
+
+        monkeypatch.setattr(fv, "_tags_through", limited)
+        result = CliRunner(mix_stderr=False).invoke(fv.feature_versions, ["--all"])
+        assert result.exit_code == 0
+        assert result.output.count("rate limit or access denied") == 1
+        assert "unknown" in result.output
+
+    def test_missing_repo_stops_the_table(self, features, monkeypatch):
+        def gone(org, repo, token, declared):
+            if repo == "splent_feature_mail":
+                raise registry.RegistryError("splent-io/mail is gone", status=404)
+            return ["v1.0.0"]
+
+        monkeypatch.setattr(fv, "_tags_through", gone)
+        result = CliRunner(mix_stderr=False).invoke(fv.feature_versions, ["--all"])
+        assert result.exit_code == 1
+        assert "splent_feature_auth" in result.output
+        assert "is gone" in result.output
+        assert "splent_feature_notes" not in result.output
+
+
+class TestBatchedTags:
+    def _snapshot(self, tags, complete):
+        return registry.RepoSnapshot(
+            org="splent-io", repo="r", meta={}, tags=tags, tags_complete=complete
+        )
+
+    def test_batch_answers_what_it_can_the_rest_goes_over_rest(
+        self, features, monkeypatch
+    ):
+        monkeypatch.setenv("GITHUB_TOKEN", "t0k")
+        monkeypatch.setattr(
+            registry,
+            "fetch_repo_snapshots",
+            lambda refs, token, with_meta: {
+                # Declared v1.0.0 is in the batch.
+                "splent-io/splent_feature_auth": self._snapshot(
+                    ["v1.1.0", "v1.0.0"], False
+                ),
+                # Declared v2.0.0 is older than the newest tags the batch holds.
+                "splent-io/splent_feature_mail": self._snapshot(["v9.0.0"], False),
+                "splent-io/splent_feature_notes": self._snapshot(["v0.1.0"], True),
+            },
+        )
+        rest = []
+
+        def fake(org, repo, token, declared):
+            rest.append(repo)
+            return ["v9.0.0", "v2.0.0"]
+
+        monkeypatch.setattr(fv, "_tags_through", fake)
+        result = CliRunner(mix_stderr=False).invoke(fv.feature_versions, ["--all"])
+        assert result.exit_code == 0, result.output
+        assert rest == ["splent_feature_mail"]
+        assert "1 behind" in result.output
+
+    def test_without_a_token_there_is_no_batch(self, features, monkeypatch):
+        def no_batch(*a, **k):
+            raise AssertionError("GraphQL needs a token")
+
+        monkeypatch.setattr(registry, "fetch_repo_snapshots", no_batch)
+        monkeypatch.setattr(fv, "_tags_through", lambda *a: ["v1.0.0"])
+        result = CliRunner(mix_stderr=False).invoke(fv.feature_versions, ["--all"])
+        assert result.exit_code == 0, result.output
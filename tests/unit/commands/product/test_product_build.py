@@ -2,14 +2,20 @@
 Tests for the product:build command.
 
 product:build is pure filesystem: reads env files + docker-compose YAML,
-merges them, and writes output files. No subprocess calls.
+merges them, and writes output files. The image build is the only subprocess
+step, and its tests replace subprocess.run.
 """
 
+import json
+import subprocess
+
 import yaml
 import pytest
 from click.testing import CliRunner
 
+from splent_cli.commands.product import product_build as product_build_module
 from splent_cli.commands.product.product_build import (
+    bake_definition,
     product_build,
     load_env_file,
     merge_env_dicts,
@@ -312,3 +318,184 @@ class TestProductBuildCommand:
         content = (docker_dir / ".env.deploy.example").read_text()
         assert "REDIS_HOST_PORT=" in content
         assert "REDIS_HOST_PORT=6379\n" not in content
+
+
+# ---------------------------------------------------------------------------
+# Image build: docker buildx bake
+# ---------------------------------------------------------------------------
+
+
+class TestBakeDefinition:
+    def _compose(self):
+        return {
+            "services": {
+                "test_app_web_deploy": {"image": "test_app:latest"},
+                "splent_feature_nginx": {
+                    "image": "splent/splent_feature_nginx:latest",
+                    "build": {
+                        "context": "features/splent_feature_nginx",
+                        "dockerfile": "Dockerfile",
+                    },
+                },
+            }
+        }
+
+    def test_one_target_per_image(self):
+        definition = bake_definition("test_app", "1.0.0", self._compose())
+        assert definition["group"]["default"]["targets"] == [
+            "test_app",
+            "splent_feature_nginx",
+        ]
+
+    def test_product_target_builds_from_the_workspace(self):
+        target = bake_definition("test_app", "1.0.0", {})["target"]["test_app"]
+        assert target["context"] == "../.."
+        assert target["dockerfile"] == "test_app/docker/Dockerfile.test_app.prod"
+        assert target["tags"] == ["test_app:1.0.0", "test_app:latest"]
+
+    def test_feature_target_is_tagged_with_the_compose_image(self):
+        target = bake_definition("test_app", "1.0.0", self._compose())["target"][
+            "splent_feature_nginx"
+        ]
+        assert target["context"] == "features/splent_feature_nginx"
+        assert target["tags"] == ["splent/splent_feature_nginx:latest"]
+
+    def test_each_target_gets_its_own_local_cache(self):
+        definition = bake_definition(
+            "test_app", "1.0.0", self._compose(), "../../.splent_cache/buildx"
+        )
+        target = definition["target"]["splent_feature_nginx"]
+        cache = "../../.splent_cache/buildx/splent_feature_nginx"
+        assert target["cache-from"] == [f"type=local,src={cache}"]
+        assert target["cache-to"] == [f"type=local,dest={cache},mode=max"]
+
+    def test_no_cache_entries_without_a_cache_root(self):
+        target = bake_definition("test_app", "1.0.0", {})["target"]["test_app"]
+        assert "cache-from" not in target
+        assert "cache-to" not in target
+
+
+class TestProductBuildImages:
+    def _setup(self, workspace):
+        docker_dir = workspace / "test_app" / "docker"
+        (docker_dir / "Dockerfile.test_app.prod").write_text("FROM scratch\n")
+        return docker_dir
+
+    def _fake_docker(self, driver, calls):
+        def fake_run(cmd, *args, **kwargs):
+            calls.append((cmd, kwargs))
+            if cmd[:3] == ["docker", "buildx", "inspect"]:
+                if driver is None:
+                    return subprocess.CompletedProcess(cmd, 1, "", "no buildx")
+                return subprocess.CompletedProcess(
+                    cmd, 0, f"Name: default\nDriver:   {driver}\n", ""
+                )
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        return fake_run
+
+    def test_bakes_every_image_with_a_local_cache(
+        self, runner, product_workspace, monkeypatch
+    ):
+        docker_dir = self._setup(product_workspace)
+        calls = []
+        monkeypatch.setattr(
+            product_build_module.subprocess,
+            "run",
+            self._fake_docker("docker-container", calls),
+        )
+
+        result = runner.invoke(product_build, ["--skip-preflight"])
+
+        assert result.exit_code == 0, result.output
+        bake = json.loads((docker_dir / "docker-bake.json").read_text())
+        assert "cache-to" in bake["target"]["test_app"]
+        assert (product_workspace / ".splent_cache" / "buildx" / "test_app").is_dir()
+        cmd, kwargs = calls[-1]
+        assert cmd == ["docker", "buildx", "bake", "-f", "docker-bake.json"]
+        assert kwargs["cwd"] == str(docker_dir)
+
+    def test_docker_driver_bakes_without_a_cache(
+        self, runner, product_workspace, monkeypatch
+    ):
+        docker_dir = self._setup(product_workspace)
+        calls = []
+        monkeypatch.setattr(
+            product_build_module.subprocess, "run", self._fake_docker("docker", calls)
+        )
+
+        result = runner.invoke(product_build, ["--skip-preflight"])
+
+        assert result.exit_code == 0, result.output
+        bake = json.loads((docker_dir / "docker-bake.json").read_text())
+        assert "cache-to" not in bake["target"]["test_app"]
+
+    def test_without_buildx_falls_back_to_docker_build(
+        self, runner, product_workspace, monkeypatch
+    ):
+        docker_dir = self._setup(product_workspace)
+        (docker_dir / "docker-bake.json").write_text("{}")
+        calls = []
+        monkeypatch.setattr(
+            product_build_module.subprocess, "run", self._fake_docker(None, calls)
+        )
+
+        result = runner.invoke(product_build, ["--skip-preflight"])
+
+        assert result.exit_code == 0, result.output
+        assert calls[-1][0][:2] == ["docker", "build"]
+        # A bake file left by an earlier build would tell product:deploy the
+        # feature images are current.
+        assert not (docker_dir / "docker-bake.json").exists()
+
+    def test_no_image_drops_a_stale_bake_file(self, runner, product_workspace):
+        docker_dir = self._setup(product_workspace)
+        (docker_dir / "docker-bake.json").write_text("{}")
+
+        result = runner.invoke(product_build, ["--skip-preflight", "--no-image"])
+
+        assert result.exit_code == 0, result.output
+        assert not (docker_dir / "docker-bake.json").exists()
+
+    def test_missing_dockerfile_drops_a_stale_bake_file(
+        self, runner, product_workspace
+    ):
+        docker_dir = product_workspace / "test_app" / "docker"
+        (docker_dir / "docker-bake.json").write_text("{}")
+
+        result = runner.invoke(product_build, ["--skip-preflight"])
+
+        assert result.exit_code == 0, result.output
+        assert not (docker_dir / "docker-bake.json").exists()
+
+    def test_a_failed_bake_leaves_no_bake_file(
+        self, runner, product_workspace, monkeypatch
+    ):
+        docker_dir = self._setup(product_workspace)
+        fake = self._fake_docker("docker-container", [])
+
+        def failing_bake(cmd, *args, **kwargs):
+            if cmd[:3] == ["docker", "buildx", "bake"]:
+                raise subprocess.CalledProcessError(1, cmd)
+            return fake(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(product_build_module.subprocess, "run", failing_bake)
+
+        result = runner.invoke(product_build, ["--skip-preflight"])
+
+        assert result.exit_code == 1
+        assert not (docker_dir / "docker-bake.json").exists()
+
+    def test_no_bake_skips_buildx(self, runner, product_workspace, monkeypatch):
+        self._setup(product_workspace)
+        calls = []
+        monkeypatch.setattr(
+            product_build_module.subprocess,
+            "run",
+            self._fake_docker("docker-container", calls),
+        )
+
+        result = runner.invoke(product_build, ["--skip-preflight", "--no-bake"])
+
+        assert result.exit_code == 0, result.output
+        assert [c[0][:2] for c in calls] == [["docker", "build"]]
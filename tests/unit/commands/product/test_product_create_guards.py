@@ -227,6 +227,13 @@ class TestHappyPath:
         class _Response:
             status_code = 200
             text = "features\n  Root\n"
+            headers = {}
+
+            def iter_content(self, chunk_size=1):
+                yield self.text.encode()
+
+            def close(self):
+                pass
 
         import requests
 
@@ -303,6 +303,48 @@ class TestHappyPath:
         assert "Traceback" not in result.output
 
 
+class TestPrebuiltImages:
+    """product:build leaves docker-bake.json when it built every image."""
+
+    def _up_cmd(self, runner, tmp_path, monkeypatch, baked):
+        docker_dir = _deploy_workspace(tmp_path, monkeypatch)
+        if baked:
+            (docker_dir / "docker-bake.json").write_text("{}")
+        calls = []
+
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            if "exec" in cmd:
+                return MagicMock(returncode=0, stdout="200", stderr="")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch("splent_cli.commands.product.product_deploy.require_docker"),
+            patch(
+                "splent_cli.commands.product.product_derive._extract_host_ports",
+                return_value=[],
+            ),
+            patch(
+                "splent_cli.commands.product.product_derive._containers_using_port",
+                return_value=[],
+            ),
+            patch(
+                "splent_cli.commands.product.product_deploy.subprocess.run",
+                side_effect=fake_run,
+            ),
+        ):
+            result = runner.invoke(product_deploy, [])
+
+        assert result.exit_code == 0
+        return next(c for c in calls if "up" in c)
+
+    def test_baked_images_are_not_rebuilt(self, runner, tmp_path, monkeypatch):
+        assert "--build" not in self._up_cmd(runner, tmp_path, monkeypatch, True)
+
+    def test_without_a_bake_compose_builds(self, runner, tmp_path, monkeypatch):
+        assert "--build" in self._up_cmd(runner, tmp_path, monkeypatch, False)
+
+
 # ---------------------------------------------------------------------------
 # User-tunable env vars survive the .env.deploy sync
 # ---------------------------------------------------------------------------
@@ -251,22 +251,91 @@ class TestProductSyncHappyPath:
         )
         cache_dir = _make_cache_dir(tmp_path)
 
-        # Replace feature_clone with a stand-in click command whose callback
-        # re-creates the cache dir, simulating a successful clone. The command
-        # invokes it via ``ctx.invoke(feature_clone, ...)``.
-        import click as _click
-
-        @_click.command("feature:clone")
-        @_click.argument("full_name")
-        def fake_clone(full_name):
+        # Replace the clone with a stand-in that re-creates the cache dir,
+        # simulating a successful clone.
+        from splent_cli.commands.feature.feature_clone import CloneResult
+
+        def fake_clone(workspace, namespace, repo, version, quiet=False):
             os.makedirs(cache_dir, exist_ok=True)
+            return CloneResult(True, cache_dir)
 
-        with patch(
-            "splent_cli.commands.product.product_resolve.feature_clone",
-            fake_clone,
+        with (
+            patch(
+                "splent_cli.commands.product.product_resolve.clone_to_cache",
+                side_effect=fake_clone,
+            ),
+            patch("splent_cli.commands.product.product_resolve.require_tool"),
         ):
             result = runner.invoke(product_sync, ["--force", "--yes"])
 
         assert result.exit_code == 0, result.output
         assert "Synced" in result.output
         assert "Traceback" not in result.output
+
+
+class TestParallelClones:
+    FEATURES = ["splent_feature_a", "splent_feature_b", "splent_feature_c"]
+
+    def _run(self, tmp_path, monkeypatch, runner, fake_clone, args=()):
+        monkeypatch.setenv("WORKING_DIR", str(tmp_path))
+        monkeypatch.setenv("SPLENT_APP", "test_app")
+        monkeypatch.delenv("SPLENT_ENV", raising=False)
+        entries = ", ".join(f'"splent-io/{f}@v1.0.0"' for f in self.FEATURES)
+        TestProductSyncHappyPath()._write_pyproject(
+            tmp_path, f"[tool.splent]\nfeatures = [{entries}]\n"
+        )
+        with (
+            patch(
+                "splent_cli.commands.product.product_resolve.clone_to_cache",
+                side_effect=fake_clone,
+            ),
+            patch("splent_cli.commands.product.product_resolve.require_tool"),
+        ):
+            return runner.invoke(product_sync, list(args))
+
+    def test_missing_features_clone_concurrently_then_link(
+        self, tmp_path, monkeypatch, runner
+    ):
+        import threading
+
+        from splent_cli.commands.feature.feature_clone import CloneResult
+
+        # Every clone waits for the other two: only a concurrent run finishes.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_clone(workspace, namespace, repo, version, quiet=False):
+            assert quiet
+            barrier.wait()
+            path = _make_cache_dir(workspace, name=repo, version=version)
+            return CloneResult(True, path)
+
+        result = self._run(tmp_path, monkeypatch, runner, fake_clone)
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("cloned") == 3
+        links = tmp_path / "test_app" / "features" / "splent_io"
+        assert sorted(p.name for p in links.iterdir()) == [
+            f"{f}@v1.0.0" for f in self.FEATURES
+        ]
+
+    def test_one_failed_clone_does_not_stop_the_rest(
+        self, tmp_path, monkeypatch, runner
+    ):
+        from splent_cli.commands.feature.feature_clone import CloneResult
+
+        def fake_clone(workspace, namespace, repo, version, quiet=False):
+            if repo == "splent_feature_b":
+                return CloneResult(False, "", error="fatal: repository not found")
+            path = _make_cache_dir(workspace, name=repo, version=version)
+            return CloneResult(True, path)
+
+        result = self._run(tmp_path, monkeypatch, runner, fake_clone, ["-j", "1"])
+
+        assert result.exit_code == 0, result.output
+        assert "clone failed" in result.output
+        assert "fatal: repository not found" in result.output
+        links = tmp_path / "test_app" / "features" / "splent_io"
+        assert sorted(p.name for p in links.iterdir()) == [
+            "splent_feature_a@v1.0.0",
+            "splent_feature_c@v1.0.0",
+        ]
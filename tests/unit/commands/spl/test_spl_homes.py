@@ -161,6 +161,13 @@ class TestSplFetch:
         class _Response:
             status_code = 200
             text = UVL
+            headers = {}
+
+            def iter_content(self, chunk_size=1):
+                yield self.text.encode()
+
+            def close(self):
+                pass
 
         def _get(url, **kwargs):
             seen.append(url)
@@ -195,6 +202,13 @@ class TestSplFetch:
         class _Response:
             status_code = 200
             text = UVL
+            headers = {}
+
+            def iter_content(self, chunk_size=1):
+                yield self.text.encode()
+
+            def close(self):
+                pass
 
         import requests
 
@@ -206,6 +220,67 @@ class TestSplFetch:
         assert "you are editing" in _out(result)
 
 
+class TestSplFetchAll:
+    def test_every_pinned_version_is_fetched(self, workspace, runner, monkeypatch):
+        _product(workspace, name="app_a", doi="10.5281/zenodo.1", version="v1")
+        _product(workspace, name="app_b", doi="10.5281/zenodo.2", version="v2")
+        _product(workspace, name="app_c", doi="10.5281/zenodo.2", version="v2")
+        seen = []
+
+        class _Response:
+            status_code = 200
+            text = UVL
+            headers = {}
+
+            def iter_content(self, chunk_size=1):
+                yield self.text.encode()
+
+            def close(self):
+                pass
+
+        def _get(url, **kwargs):
+            seen.append(url)
+            return _Response()
+
+        import requests
+
+        monkeypatch.setattr(requests, "get", _get)
+
+        result = runner.invoke(spl_fetch, ["--all"])
+
+        assert result.exit_code == 0, _out(result)
+        assert len(seen) == 2
+        for product in ("app_a", "app_b", "app_c"):
+            assert product in result.output
+        for version in ("v1", "v2"):
+            assert (
+                workspace / ".splent_cache" / "spls" / f"demo_spl@{version}"
+            ).is_dir()
+
+    def test_a_failed_model_fails_the_command(self, workspace, runner, monkeypatch):
+        _product(workspace)
+
+        class _Missing:
+            status_code = 404
+
+            def close(self):
+                pass
+
+        import requests
+
+        monkeypatch.setattr(requests, "get", lambda url, **k: _Missing())
+
+        result = runner.invoke(spl_fetch, ["--all"])
+
+        assert result.exit_code != 0
+        assert "404" in result.output
+        assert "Traceback" not in _out(result)
+
+    def test_a_name_and_all_do_not_mix(self, workspace, runner, no_network):
+        result = runner.invoke(spl_fetch, ["demo_spl", "--all"])
+        assert result.exit_code != 0
+
+
 # ---------------------------------------------------------------------------
 # spl:pin
 # ---------------------------------------------------------------------------
@@ -313,6 +388,66 @@ class TestSplOutdated:
         assert "did not say" in result.output
         assert "up to date" not in result.output
 
+    def test_every_line_is_asked_at_once(self, workspace, runner, monkeypatch):
+        import threading
+
+        import splent_cli.commands.spl.spl_outdated as mod
+
+        _product(workspace, name="app_a", spl="a_spl")
+        _product(workspace, name="app_b", spl="b_spl")
+        together = threading.Barrier(2, timeout=5)
+
+        def _latest(mirror, concept_doi):
+            together.wait()
+            return ("10.5281/zenodo.NEWEST", "v5")
+
+        monkeypatch.setattr(mod, "latest_version_doi", _latest)
+        # Both products record the same concept DOI; make them two lines.
+        monkeypatch.setattr(
+            mod.spl_store,
+            "read_pin",
+            lambda ws, name: spl_store.SplPin(name=name, concept_doi=f"c/{name}"),
+        )
+
+        result = runner.invoke(spl_outdated, ["--remote"])
+
+        assert result.exit_code == 0, _out(result)
+        assert result.output.count("the line is on v5") == 2
+
+    def test_an_answer_is_reused_until_refresh(self, workspace, runner, monkeypatch):
+        import splent_cli.commands.spl.spl_outdated as mod
+
+        _product(workspace, doi=DOI, version="v2")
+        asked = []
+
+        def _latest(mirror, concept_doi):
+            asked.append(concept_doi)
+            return ("10.5281/zenodo.NEWEST", "v5")
+
+        monkeypatch.setattr(mod, "latest_version_doi", _latest)
+
+        runner.invoke(spl_outdated, ["--remote"])
+        again = runner.invoke(spl_outdated, ["--remote"])
+        assert asked == [CONCEPT]
+        assert "the line is on v5" in again.output
+
+        runner.invoke(spl_outdated, ["--remote", "--refresh"])
+        assert asked == [CONCEPT, CONCEPT]
+
+    def test_could_not_tell_is_not_remembered(self, workspace, runner, monkeypatch):
+        import splent_cli.commands.spl.spl_outdated as mod
+
+        _product(workspace, doi=DOI, version="v2")
+        asked = []
+        monkeypatch.setattr(
+            mod, "latest_version_doi", lambda *a: asked.append(a) and None
+        )
+
+        runner.invoke(spl_outdated, ["--remote"])
+        runner.invoke(spl_outdated, ["--remote"])
+
+        assert len(asked) == 2
+
 
 # ---------------------------------------------------------------------------
 # spl:migrate-catalog
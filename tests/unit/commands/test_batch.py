@@ -0,0 +1,131 @@
+"""Tests for splent batch and splent run-many."""
+
+import click
+import pytest
+
+from splent_cli.commands import batch as mod
+
+
+class TestParsing:
+    def test_separators(self):
+        assert mod.split_steps(["db:upgrade", ";", "db:seed", "-y", ";"]) == [
+            ["db:upgrade"],
+            ["db:seed", "-y"],
+        ]
+
+    def test_script_lines(self):
+        script = (
+            "# bring the database up\n"
+            "\n"
+            "splent db:upgrade\n"
+            "db:seed -y  # demo data\n"
+            "feature:compile \\\n"
+            "  --force ; version --json\n"
+            "env:set NAME 'two words'\n"
+        )
+        assert mod.parse_script(script) == [
+            ["db:upgrade"],
+            ["db:seed", "-y"],
+            ["feature:compile", "--force"],
+            ["version", "--json"],
+            ["env:set", "NAME", "two words"],
+        ]
+
+    def test_unbalanced_quotes_name_the_line(self):
+        with pytest.raises(click.ClickException, match="Line 2"):
+            mod.parse_script("version\necho 'oops\n")
+
+    def test_semicolons_need_no_spaces(self):
+        assert mod.parse_script("db:upgrade; db:seed -y;version") == [
+            ["db:upgrade"],
+            ["db:seed", "-y"],
+            ["version"],
+        ]
+        assert mod.parse_script("env:set NAME 'a;b'") == [["env:set", "NAME", "a;b"]]
+
+    def test_errors_name_the_physical_line_after_a_continuation(self):
+        with pytest.raises(click.ClickException, match="Line 3"):
+            mod.parse_script("feature:compile \\\n  --force\necho 'oops\n")
+
+
+@pytest.fixture
+def probes(workspace):
+    """Commands that record their runs, registered on the real CLI group."""
+    from splent_cli.cli import cli
+
+    ran = []
+
+    @click.command("probe-ok")
+    @click.argument("label", required=False)
+    def ok(label):
+        ran.append(("ok", label))
+
+    @click.command("probe-fail")
+    def fail():
+        ran.append(("fail", None))
+        raise SystemExit(3)
+
+    @click.command("probe-click-error")
+    def click_error():
+        ran.append(("click-error", None))
+        raise click.ClickException("nope")
+
+    for command in (ok, fail, click_error):
+        cli.add_command(command)
+    yield cli, ran
+    for command in (ok, fail, click_error):
+        cli.commands.pop(command.name, None)
+
+
+class TestRunMany:
+    def test_every_command_runs_in_order(self, probes, runner):
+        cli, ran = probes
+        result = runner.invoke(
+            cli, ["run-many", "probe-ok", "a", ";", "probe-ok", "--", "-b"]
+        )
+        assert result.exit_code == 0, result.output
+        assert ran == [("ok", "a"), ("ok", "-b")]
+        assert "2 command(s) ran" in result.output
+
+    def test_stops_at_the_first_failure_with_its_status(self, probes, runner):
+        cli, ran = probes
+        result = runner.invoke(
+            cli, ["run-many", "probe-fail", ";", "probe-ok", "never"]
+        )
+        assert result.exit_code == 3
+        assert ran == [("fail", None)]
+        assert "1 of 1 command(s) failed, 1 not run" in result.output
+
+    def test_keep_going(self, probes, runner):
+        cli, ran = probes
+        result = runner.invoke(
+            cli,
+            ["run-many", "-k", "probe-click-error", ";", "probe-ok", "x"],
+        )
+        assert result.exit_code == 1
+        assert ran == [("click-error", None), ("ok", "x")]
+        assert "Error: nope" in result.stderr
+
+    def test_an_unknown_command_is_a_failed_step(self, probes, runner):
+        cli, ran = probes
+        result = runner.invoke(cli, ["run-many", "probe-nope", ";", "probe-ok"])
+        assert result.exit_code == 2
+        assert ran == []
+
+
+class TestBatch:
+    def test_reads_stdin(self, probes, runner):
+        cli, ran = probes
+        result = runner.invoke(
+            cli, ["batch", "-"], input="probe-ok one\n# skipped\nprobe-ok two\n"
+        )
+        assert result.exit_code == 0, result.output
+        assert ran == [("ok", "one"), ("ok", "two")]
+
+    def test_reads_a_file(self, probes, runner, tmp_path):
+        cli, ran = probes
+        script = tmp_path / "steps.splent"
+        script.write_text("splent probe-ok\nprobe-fail\nprobe-ok after\n")
+        result = runner.invoke(cli, ["batch", str(script)])
+        assert result.exit_code == 3
+        assert ran == [("ok", None), ("fail", None)]
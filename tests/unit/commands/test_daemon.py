@@ -0,0 +1,37 @@
+"""Tests for splent daemon, daemon:status and daemon:stop."""
+
+from splent_cli.commands import daemon as mod
+
+
+class TestControl:
+    def test_status_and_stop_without_a_daemon(self, workspace, runner):
+        result = runner.invoke(mod.daemon_status, [])
+        assert result.exit_code == 0 and "No daemon running" in result.output
+        result = runner.invoke(mod.daemon_stop, [])
+        assert result.exit_code == 0 and "No daemon running" in result.output
+
+    def test_start_is_a_no_op_when_one_is_running(self, workspace, runner, monkeypatch):
+        monkeypatch.setattr(
+            mod.daemon,
+            "request",
+            lambda ws, product, op: {"pid": 42, "started": 0, "served": 3},
+        )
+        monkeypatch.setattr(
+            mod.daemon, "serve", lambda *a: (_ for _ in ()).throw(AssertionError)
+        )
+        result = runner.invoke(mod.daemon_start, ["--foreground"])
+        assert result.exit_code == 0
+        assert "already running: pid 42" in result.output
+
+    def test_a_detached_daemon_that_dies_is_reported(
+        self, workspace, runner, monkeypatch
+    ):
+        class Dead:
+            def poll(self):
+                return 1
+
+        monkeypatch.setattr(mod.daemon, "request", lambda *a: None)
+        monkeypatch.setattr(mod.subprocess, "Popen", lambda *a, **k: Dead())
+        result = runner.invoke(mod.daemon_start, [])
+        assert result.exit_code == 1
+        assert "exited while warming up" in result.stderr
@@ -0,0 +1,233 @@
+"""Tests for splent locust --headless and locust:compare."""
+
+import json
+from types import SimpleNamespace
+
+import click
+import pytest
+
+from splent_cli.commands import locust as mod
+from splent_cli.services import bench
+
+STATS = (
+    "Type,Name,Request Count,Failure Count,Median Response Time,"
+    "Average Response Time,Requests/s,50%,95%,99%\n"
+    "GET,/auth,100,0,20,22,10.0,20,80,100\n"
+)
+
+
+@pytest.fixture
+def product(workspace, monkeypatch):
+    (workspace / "my_app").mkdir()
+    monkeypatch.setenv("SPLENT_APP", "my_app")
+    return workspace / "my_app"
+
+
+@pytest.fixture
+def docker(product, monkeypatch):
+    """A running web container whose Locust writes STATS where it was told to."""
+    calls = []
+
+    def fake_run(cmd, check=True, capture=False, **kwargs):
+        calls.append(cmd)
+        snippet = cmd[-1]
+        if "--headless" in snippet:
+            prefix = snippet.split("--csv ", 1)[1].split()[0]
+            host_prefix = product.parent / prefix[len("/workspace/") :]
+            host_prefix.parent.mkdir(parents=True, exist_ok=True)
+            (host_prefix.parent / f"{host_prefix.name}_stats.csv").write_text(STATS)
+            return SimpleNamespace(returncode=fake_run.exit_code, stdout="")
+        if "--master-host" in snippet:
+            fake_run.workers.append(str(100 + len(fake_run.workers)))
+        if "pgrep" in cmd and mod.WORKER_PATTERN in cmd:
+            pids = "\n".join(fake_run.workers)
+            return SimpleNamespace(returncode=0 if pids else 1, stdout=pids)
+        if "kill" in cmd:
+            fake_run.workers.clear()
+        return SimpleNamespace(returncode=0, stdout="abc\n")
+
+    fake_run.exit_code = 0
+    fake_run.workers = []
+    monkeypatch.setattr(mod, "run", fake_run)
+    monkeypatch.setattr(mod, "require_docker", lambda: None)
+    return SimpleNamespace(calls=calls, run=fake_run)
+
+
+def _store(product, name, p95, rps=10.0):
+    run_dir = product / bench.BENCH_DIRNAME / name
+    run_dir.mkdir(parents=True)
+    summary = {
+        "run": {},
+        "endpoints": [
+            {
+                "method": "GET",
+                "name": "/auth",
+                "requests": 100,
+                "failures": 0,
+                "rps": rps,
+                "p50": 20,
+                "p95": p95,
+                "p99": 100,
+            }
+        ],
+    }
+    (run_dir / bench.SUMMARY_FILENAME).write_text(json.dumps(summary))
+    return run_dir
+
+
+class TestHeadless:
+    def test_the_run_is_stored_in_the_product(self, product, docker, runner):
+        result = runner.invoke(
+            mod.locust, ["--headless", "-u", "50", "-r", "5", "-t", "30s"]
+        )
+
+        assert result.exit_code == 0, result.output
+        snippet = docker.calls[-1][-1]
+        assert "--headless --users 50 --spawn-rate 5 --run-time 30s" in snippet
+        (run_dir,) = bench.list_runs(product)
+        summary = bench.load_summary(run_dir)
+        assert summary["run"]["users"] == 50
+        assert summary["endpoints"][0]["p95"] == 80.0
+        assert "Results stored in" in result.output
+
+    def test_failed_requests_still_keep_the_results(self, product, docker, runner):
+        docker.run.exit_code = 1
+        result = runner.invoke(mod.locust, ["--headless"])
+
+        assert result.exit_code == 0, result.output
+        assert len(bench.list_runs(product)) == 1
+
+    def test_a_running_web_ui_does_not_block_a_headless_run(
+        self, product, docker, runner
+    ):
+        runner.invoke(mod.locust, ["--headless"])
+        assert not any("pgrep" in " ".join(c) for c in docker.calls)
+
+
+class TestDistributed:
+    def test_workers_join_a_master_in_the_web_container(self, product, docker, runner):
+        result = runner.invoke(mod.locust, ["--headless", "--workers", "3"])
+
+        assert result.exit_code == 0, result.output
+        started = [c for c in docker.calls if "--master-host" in c[-1]]
+        assert len(started) == 3
+        # Run in the web container itself, where the entrypoint installed the
+        # framework and the features and the product's env_file applies.
+        assert started[0] == [
+            "docker",
+            "exec",
+            "-d",
+            "-e",
+            "WORKING_DIR=/workspace",
+            "my_app_web",
+            "sh",
+            "-c",
+            f"exec {mod.LOCUSTFILE_SNIPPET} --worker --master-host 127.0.0.1",
+        ]
+        assert not any(c[1] == "run" for c in docker.calls)
+
+        (master,) = [c for c in docker.calls if "--headless" in c[-1]]
+        assert master[:2] == ["docker", "exec"]
+        assert "--master" in master[-1]
+        assert "--expect-workers 3" in master[-1]
+        # The locustfiles' own host (LOCUST_TARGET_URL) is not overridden.
+        assert "--host" not in master[-1]
+        # Workers go first, so the master finds them when it starts counting.
+        assert docker.calls.index(started[-1]) < docker.calls.index(master)
+
+    def test_workers_are_removed_after_a_headless_run(self, product, docker, runner):
+        runner.invoke(mod.locust, ["--headless", "-w", "2"])
+
+        assert docker.run.workers == []
+        (run_dir,) = bench.list_runs(product)
+        assert bench.load_summary(run_dir)["run"]["workers"] == 2
+
+    def test_a_worker_that_fails_to_start_takes_the_others_down(
+        self, product, docker, runner, monkeypatch
+    ):
+        fake_run = docker.run
+
+        def second_worker_fails(cmd, check=True, capture=False, **kwargs):
+            if "--master-host" in cmd[-1] and fake_run.workers:
+                raise click.ClickException("docker exec failed")
+            return fake_run(cmd, check=check, capture=capture, **kwargs)
+
+        monkeypatch.setattr(mod, "run", second_worker_fails)
+        result = runner.invoke(mod.locust, ["--headless", "-w", "3"])
+
+        assert result.exit_code == 1
+        assert docker.run.workers == []
+        assert not any("--headless" in c[-1] for c in docker.calls)
+
+    def test_without_workers_nothing_extra_starts(self, product, docker, runner):
+        runner.invoke(mod.locust, ["--headless"])
+
+        assert not any("--master-host" in c[-1] for c in docker.calls)
+        assert "--master" not in docker.calls[-1][-1]
+
+    def test_stop_removes_workers_started_with_the_web_ui(
+        self, product, docker, runner
+    ):
+        docker.run.workers.extend(["101", "102"])
+        result = runner.invoke(mod.locust_stop, [])
+
+        assert "Stopped 2 Locust worker process(es)" in result.output
+        assert ["docker", "exec", "my_app_web", "kill", "101", "102"] in docker.calls
+        assert docker.run.workers == []
+
+
+class TestCompare:
+    def test_the_two_latest_runs_by_default(self, product, runner):
+        _store(product, "20260101T000000Z", 80)
+        _store(product, "20260102T000000Z", 80)
+        _store(product, "20260103T000000Z", 81)
+
+        result = runner.invoke(mod.locust_compare, [])
+
+        assert result.exit_code == 0, result.output
+        assert "20260102T000000Z → 20260103T000000Z" in result.output
+        assert "No regressions" in result.output
+
+    def test_a_regression_fails_the_command(self, product, runner):
+        base = _store(product, "base", 80)
+        _store(product, "head", 120)
+
+        result = runner.invoke(mod.locust_compare, [base.name, "head"])
+
+        assert result.exit_code == 1
+        assert "p95 80 → 120 ms" in result.output
+
+    def test_the_threshold_is_configurable(self, product, runner):
+        _store(product, "base", 80)
+        _store(product, "head", 120)
+
+        result = runner.invoke(
+            mod.locust_compare, ["base", "head", "--threshold", "60"]
+        )
+        assert result.exit_code == 0, result.output
+
+    def test_one_run_is_not_enough(self, product, runner):
+        _store(product, "only", 80)
+        result = runner.invoke(mod.locust_compare, [])
+        assert result.exit_code != 0
+        assert "locust --headless" in result.output + (result.stderr or "")
+
+    def test_base_alone_is_compared_with_the_latest_run(self, product, runner):
+        _store(product, "20260101T000000Z", 80)
+        _store(product, "20260102T000000Z", 80)
+        result = runner.invoke(mod.locust_compare, ["20260101T000000Z"])
+        assert result.exit_code == 0, result.output
+        assert "20260101T000000Z → 20260102T000000Z" in result.output
+
+    def test_base_alone_with_no_stored_run_is_an_error(self, product, runner, tmp_path):
+        elsewhere = _store(tmp_path / "other", "run", 80)
+        result = runner.invoke(mod.locust_compare, [str(elsewhere)])
+        assert result.exit_code == 1
+        assert "No stored run" in result.stderr
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    def test_base_alone_that_is_the_latest_run_is_an_error(self, product, runner):
+        _store(product, "20260101T000000Z", 80)
+        result = runner.invoke(mod.locust_compare, ["20260101T000000Z"])
+        assert result.exit_code == 1
+        assert "is the run it would be compared with" in result.stderr
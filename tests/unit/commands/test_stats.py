@@ -0,0 +1,57 @@
+"""Tests for splent stats."""
+
+import json
+import time
+
+from splent_cli.commands.stats import stats
+from splent_cli.utils import metrics
+
+
+def _seed(workspace, cmd, version, ms, runs=5, product="my_app"):
+    for _ in range(runs):
+        metrics.append(
+            workspace,
+            {
+                "ts": time.time(),
+                "cmd": cmd,
+                "product": product,
+                "version": version,
+                "ms": ms,
+                "subprocess": [1, ms / 2],
+                "http": [0, 0.0],
+                "exit": 0,
+            },
+        )
+
+
+class TestStats:
+    def test_empty_store(self, workspace, runner):
+        result = runner.invoke(stats, [])
+        assert result.exit_code == 0
+        assert "No command runs recorded" in result.output
+
+    def test_table_and_regression(self, workspace, runner):
+        _seed(workspace, "product:up", "1.0.0", 1000)
+        _seed(workspace, "product:up", "1.1.0", 2000)
+        _seed(workspace, "db:seed", "1.1.0", 50)
+
+        result = runner.invoke(stats, [])
+        assert result.exit_code == 0, result.output
+        assert "db:seed" in result.output and "50ms" in result.output
+        assert "product:up: p95 1.00s → 2.00s (+100%) since 1.0.0 → 1.1.0" in (
+            result.output
+        )
+
+    def test_filters_and_json(self, workspace, runner):
+        _seed(workspace, "product:up", "1.0.0", 1000, product="other")
+        _seed(workspace, "db:seed", "1.0.0", 50)
+
+        result = runner.invoke(stats, ["--json", "--product", "my_app"])
+        payload = json.loads(result.output)
+        assert [c["cmd"] for c in payload["commands"]] == ["db:seed"]
+        assert payload["regressions"] == {}
+
+        result = runner.invoke(stats, ["--json", "-c", "product:"])
+        assert [c["cmd"] for c in json.loads(result.output)["commands"]] == [
+            "product:up"
+        ]
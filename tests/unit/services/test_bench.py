@@ -0,0 +1,109 @@
+"""Tests for services/bench.py: stored headless Locust runs and their diff."""
+
+import pytest
+
+from splent_cli.services import bench
+
+HEADER = (
+    "Type,Name,Request Count,Failure Count,Median Response Time,"
+    "Average Response Time,Min Response Time,Max Response Time,"
+    "Average Content Size,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,"
+    "99%,99.9%,99.99%,100%\n"
+)
+
+
+def _row(method, name, reqs, fails, rps, p50, p95, p99):
+    return (
+        f"{method},{name},{reqs},{fails},{p50},{p50},1,{p99},100,{rps},0,"
+        f"{p50},{p50},{p50},{p95},{p95},{p95},{p99},{p99},{p99},{p99},{p99}\n"
+    )
+
+
+def _summary(*endpoints):
+    keys = ("method", "name", "requests", "failures", "rps", "p50", "p95", "p99")
+    return {"endpoints": [dict(zip(keys, e)) for e in endpoints]}
+
+
+class TestRuns:
+    def test_a_summary_is_derived_from_the_stats_csv(self, tmp_path):
+        run_dir = bench.new_run_dir(tmp_path)
+        (run_dir / "stats_stats.csv").write_text(
+            HEADER
+            + _row("GET", "/auth", 100, 2, 10.5, 20, 80, 120)
+            + ",Aggregated,100,2,20,20,1,120,100,10.5,0,N/A,N/A,N/A,N/A,N/A,N/A,"
+            "N/A,N/A,N/A,N/A,N/A\n"
+        )
+        summary = bench.write_summary(run_dir, {"users": 5})
+
+        first, aggregated = summary["endpoints"]
+        assert first == {
+            "method": "GET",
+            "name": "/auth",
+            "requests": 100,
+            "failures": 2,
+            "rps": 10.5,
+            "avg": 20.0,
+            "p50": 20.0,
+            "p95": 80.0,
+            "p99": 120.0,
+        }
+        assert bench.endpoint_key(aggregated) == "Aggregated"
+        assert aggregated["p95"] == 0.0
+        assert bench.list_runs(tmp_path) == [run_dir]
+        assert bench.load_summary(run_dir)["run"] == {"users": 5}
+
+    def test_no_stats_is_an_error(self, tmp_path):
+        with pytest.raises(Exception, match="no stats"):
+            bench.write_summary(bench.new_run_dir(tmp_path), {})
+
+    def test_two_runs_in_one_second_do_not_collide(self, tmp_path):
+        assert bench.new_run_dir(tmp_path) != bench.new_run_dir(tmp_path)
+
+    def test_a_run_is_named_or_pathed(self, tmp_path):
+        run_dir = bench.new_run_dir(tmp_path)
+        (run_dir / bench.SUMMARY_FILENAME).write_text("{}")
+        assert bench.resolve_run(tmp_path, run_dir.name) == run_dir
+        assert bench.resolve_run(tmp_path, str(run_dir)) == run_dir
+        with pytest.raises(Exception, match="No benchmark run"):
+            bench.resolve_run(tmp_path, "nope")
+
+
+class TestCompare:
+    def test_slower_percentiles_are_regressions(self):
+        (diff,) = bench.compare(
+            _summary(("GET", "/a", 100, 0, 10, 20, 80, 100)),
+            _summary(("GET", "/a", 100, 0, 10, 20, 100, 100)),
+        )
+        assert diff.regressions == ["p95 80 → 100 ms (+25%)"]
+
+    def test_a_tiny_absolute_change_is_noise(self):
+        (diff,) = bench.compare(
+            _summary(("GET", "/a", 100, 0, 10, 2, 2, 2)),
+            _summary(("GET", "/a", 100, 0, 10, 3, 3, 3)),
+        )
+        assert diff.regressions == []
+
+    def test_lower_rps_and_more_failures(self):
+        (diff,) = bench.compare(
+            _summary(("GET", "/a", 100, 0, 10, 20, 80, 100)),
+            _summary(("GET", "/a", 100, 5, 8, 20, 80, 100)),
+        )
+        assert diff.regressions == ["RPS 10.0 → 8.0 (-20%)", "failures 0.0% → 5.0%"]
+
+    def test_within_threshold_is_fine(self):
+        (diff,) = bench.compare(
+            _summary(("GET", "/a", 100, 0, 10, 20, 80, 100)),
+            _summary(("GET", "/a", 100, 0, 9.5, 21, 85, 105)),
+        )
+        assert diff.regressions == []
+
+    def test_endpoints_in_one_run_only_are_listed_not_failed(self):
+        diffs = bench.compare(
+            _summary(("GET", "/old", 1, 0, 1, 1, 1, 1)),
+            _summary(("GET", "/new", 1, 0, 1, 1, 1, 1)),
+        )
+        assert [(d.key, d.base is None, d.head is None) for d in diffs] == [
+            ("GET /new", True, False),
+            ("GET /old", False, True),
+        ]
+        assert all(not d.regressions for d in diffs)
@@ -0,0 +1,116 @@
+"""Tests for services/cache_index.py — the maintained .splent_cache index."""
+
+import json
+import os
+
+import pytest
+
+from splent_cli.services import cache_index
+from splent_cli.services.cache_index import CacheIndex, parse_size
+
+
+def _entry(workspace, namespace, dir_name, size=10):
+    path = workspace / ".splent_cache" / "features" / namespace / dir_name
+    path.mkdir(parents=True)
+    (path / "f.py").write_bytes(b"x" * size)
+    return path
+
+
+def _product(workspace, name, features, key="features"):
+    product = workspace / name
+    product.mkdir(exist_ok=True)
+    items = ", ".join(f'"{f}"' for f in features)
+    (product / "pyproject.toml").write_text(f"[tool.splent]\n{key} = [{items}]\n")
+    return product
+
+
+class TestEntries:
+    def test_versioned_sizes_are_measured_once(self, tmp_path, monkeypatch):
+        _entry(tmp_path, "ns", "auth@v1", size=100)
+        index = CacheIndex(tmp_path)
+        assert index.entries(sizes=True)[0]["size"] == 100
+        index.save()
+
+        def no_walk(path):
+            raise AssertionError("re-measured an unchanged versioned entry")
+
+        monkeypatch.setattr(cache_index, "dir_size", no_walk)
+        assert CacheIndex(tmp_path).entries(sizes=True)[0]["size"] == 100
+
+    def test_editable_entries_are_always_measured(self, tmp_path):
+        path = _entry(tmp_path, "ns", "auth", size=5)
+        index = CacheIndex(tmp_path)
+        index.entries(sizes=True)
+        index.save()
+        (path / "more.py").write_bytes(b"y" * 7)
+        assert CacheIndex(tmp_path).entries(sizes=True)[0]["size"] == 12
+
+    def test_vanished_entries_leave_the_index(self, tmp_path):
+        path = _entry(tmp_path, "ns", "auth@v1")
+        index = CacheIndex(tmp_path)
+        index.entries()
+        index.save()
+        path.joinpath("f.py").unlink()
+        path.rmdir()
+        index = CacheIndex(tmp_path)
+        assert index.entries() == []
+        index.save()
+        data = json.loads(cache_index.index_path(tmp_path).read_text())
+        assert data["entries"] == {}
+
+    def test_touch_sets_last_used(self, tmp_path):
+        _entry(tmp_path, "ns", "auth@v1")
+        cache_index.touch(tmp_path, ["ns/auth@v1"])
+        (entry,) = CacheIndex(tmp_path).entries()
+        assert entry["last_used"] > 0
+
+    def test_broken_index_is_rebuilt(self, tmp_path):
+        _entry(tmp_path, "ns", "auth@v1", size=3)
+        path = cache_index.index_path(tmp_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{nope")
+        assert CacheIndex(tmp_path).entries(sizes=True)[0]["size"] == 3
+
+
+class TestProducts:
+    def test_all_lists_and_namespace_stripped(self, tmp_path):
+        _product(tmp_path, "app", ["ns/auth@v1"])
+        with open(tmp_path / "app" / "pyproject.toml", "a") as fh:
+            fh.write('features_dev = ["ns/debug"]\n')
+        assert cache_index.product_refs(tmp_path) == {"app": ["auth@v1", "debug"]}
+
+    def test_unchanged_pyproject_is_not_reparsed(self, tmp_path, monkeypatch):
+        _product(tmp_path, "app", ["ns/auth@v1"])
+        cache_index.product_refs(tmp_path)
+        monkeypatch.setattr(
+            cache_index,
+            "_read_product_entries",
+            lambda p: pytest.fail("reparsed an unchanged pyproject"),
+        )
+        assert cache_index.product_refs(tmp_path) == {"app": ["auth@v1"]}
+
+    def test_changed_pyproject_is_reparsed(self, tmp_path):
+        _product(tmp_path, "app", ["ns/auth@v1"])
+        cache_index.product_refs(tmp_path)
+        pyproject = _product(tmp_path, "app", ["ns/auth@v2"]) / "pyproject.toml"
+        os.utime(pyproject, ns=(1, 1))
+        assert cache_index.product_refs(tmp_path) == {"app": ["auth@v2"]}
+
+
+class TestParseSize:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("5G", 5 << 30),
+            ("500MB", 500 << 20),
+            ("1.5k", 1536),
+            ("2GiB", 2 << 30),
+            ("42", 42),
+        ],
+    )
+    def test_units(self, text, expected):
+        assert parse_size(text) == expected
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            parse_size("lots")
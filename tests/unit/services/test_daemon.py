@@ -0,0 +1,186 @@
+"""Tests for services/daemon.py: a warm splent behind a Unix socket."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from splent_cli.services import daemon
+
+
+class TestPaths:
+    def test_product_comes_from_the_env_then_the_workspace_env_file(
+        self, workspace, monkeypatch
+    ):
+        assert daemon.current_product(str(workspace)) is None
+        (workspace / ".env").write_text("WORKING_DIR=/workspace\nSPLENT_APP=my_app\n")
+        assert daemon.current_product(str(workspace)) == "my_app"
+        monkeypatch.setenv("SPLENT_APP", "other")
+        assert daemon.current_product(str(workspace)) == "other"
+
+    def test_one_socket_per_product(self, tmp_path):
+        a = daemon.socket_path(str(tmp_path), "a")
+        assert a.endswith(os.path.join(".splent_cache", "daemon", "a.sock"))
+        assert daemon.socket_path(str(tmp_path), None).endswith("_workspace.sock")
+
+    def test_a_long_workspace_path_still_gets_a_usable_socket(self, tmp_path):
+        path = daemon.socket_path(str(tmp_path / ("x" * 120)), "my_app")
+        assert len(path) <= daemon._MAX_SOCKET_PATH
+        assert path == daemon.socket_path(str(tmp_path / ("x" * 120)), "my_app")
+
+    def test_the_long_path_fallback_is_a_directory_of_this_user(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        path = daemon.socket_path(str(tmp_path / ("x" * 120)), "my_app")
+        assert os.path.dirname(path) == str(tmp_path / "splent")
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        path = daemon.socket_path(str(tmp_path / ("x" * 120)), "my_app")
+        assert os.path.basename(os.path.dirname(path)) == f"splent-{os.getuid()}"
+
+    def test_an_open_fallback_directory_is_refused(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        (tmp_path / "splent").mkdir(mode=0o777)
+        os.chmod(tmp_path / "splent", 0o777)
+        server = daemon.Daemon(str(tmp_path / ("x" * 120)), None)
+        with pytest.raises(RuntimeError, match="only this user"):
+            server.bind()
+
+
+class TestFingerprint:
+    def test_changes_with_the_pyproject_and_feature_sources(self, workspace):
+        product = workspace / "my_app"
+        feature = workspace / "splent_feature_auth" / "src"
+        feature.mkdir(parents=True)
+        (feature / "routes.py").write_text("x = 1\n")
+        (product / "features" / "splent_io").mkdir(parents=True)
+        (product / "features" / "splent_io" / "splent_feature_auth").symlink_to(
+            workspace / "splent_feature_auth"
+        )
+        (product / "pyproject.toml").write_text("[project]\n")
+
+        first = daemon.fingerprint(str(workspace), "my_app")
+        assert daemon.fingerprint(str(workspace), "my_app") == first
+
+        os.utime(feature / "routes.py", ns=(1, 1))
+        second = daemon.fingerprint(str(workspace), "my_app")
+        assert second != first
+
+        (product / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        os.utime(product / "pyproject.toml", ns=(2, 2))
+        assert daemon.fingerprint(str(workspace), "my_app") != second
+
+
+class TestDeclines:
+    def test_another_product_or_env_is_not_served(self, workspace, monkeypatch):
+        monkeypatch.setenv("SPLENT_APP", "my_app")
+        monkeypatch.setenv("SPLENT_ENV", "dev")
+        server = daemon.Daemon(str(workspace), "my_app")
+        server.fingerprint = daemon.fingerprint(str(workspace), "my_app")
+
+        assert server.declines({"env": {"SPLENT_APP": "my_app"}}) is None
+        assert server.declines({"env": {"SPLENT_APP": "other"}})
+        assert server.declines({"env": {"SPLENT_ENV": "prod"}})
+        assert not server.restart
+
+    def test_changed_sources_mean_a_restart(self, workspace):
+        server = daemon.Daemon(str(workspace), None)
+        server.fingerprint = "stale"
+        assert server.declines({"env": {}}) == "sources changed"
+        assert server.restart
+
+
+class TestForward:
+    def test_no_daemon_runs_in_process(self, workspace):
+        assert daemon.forward(["version"]) is None
+
+    def test_a_socket_of_another_user_is_never_used(self, tmp_path, monkeypatch):
+        server = daemon.Daemon(str(tmp_path), None)
+        server.path = str(tmp_path / "d.sock")
+        server.bind()
+        try:
+            connection = daemon._connect(server.path, timeout=1)
+            assert connection is not None
+            connection.close()
+            monkeypatch.setattr(daemon.os, "getuid", lambda: os.geteuid() + 1)
+            assert daemon._connect(server.path, timeout=1) is None
+        finally:
+            server.close()
+
+    def test_daemon_commands_and_the_opt_out_are_never_forwarded(
+        self, workspace, monkeypatch
+    ):
+        monkeypatch.setattr(daemon, "_connect", lambda *a, **k: pytest.fail("sent"))
+        assert daemon.forward(["daemon:stop"]) is None
+        monkeypatch.setenv(daemon.DAEMON_ENV, "0")
+        assert daemon.forward(["version"]) is None
+
+
+@pytest.fixture
+def running(workspace):
+    env = {
+        **os.environ,
+        "WORKING_DIR": str(workspace),
+        "PYTHONPATH": os.pathsep.join(sys.path),
+        "SPLENT_METRICS": "0",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "splent_cli", "daemon", "--foreground"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while daemon.request(str(workspace), None, "status") is None:
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.skip("the daemon could not start here")
+        time.sleep(0.1)
+    yield workspace
+    daemon.request(str(workspace), None, "stop")
+    process.wait(timeout=10)
+
+
+class TestRoundTrip:
+    def test_the_command_writes_to_our_stdout_and_returns_its_status(
+        self, running, capfd, monkeypatch
+    ):
+        monkeypatch.setenv("SPLENT_METRICS", "0")
+        assert daemon.forward(["stats"]) == 0
+        assert "No command runs recorded" in capfd.readouterr().out
+
+        assert daemon.forward(["no-such-command"]) == 2
+        assert "No such command" in capfd.readouterr().err
+
+        status = daemon.request(str(running), None, "status")
+        assert status["served"] == 2
+
+
+class TestSignals:
+    def test_command_children_end_on_sigterm(self):
+        saved = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        signal.signal(signal.SIGTERM, lambda *_: None)  # the server's handler
+        try:
+            daemon._child_signals()
+            assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+            assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+        finally:
+            for sig, handler in saved.items():
+                signal.signal(sig, handler)
+
+    def test_only_the_server_removes_the_socket(self, tmp_path):
+        server = daemon.Daemon(str(tmp_path), None)
+        server.path = str(tmp_path / "d.sock")
+        server.bind()
+        pid = os.fork()
+        if pid == 0:
+            # As a command child does when SIGTERM reaches the server's handler.
+            server.close()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.path.exists(server.path)
+        server.close()
+        assert not os.path.exists(server.path)
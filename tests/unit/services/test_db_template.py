@@ -0,0 +1,156 @@
+"""Tests for splent_cli.services.db_template.
+
+A template is a dump of a migrated and seeded database plus the migration
+heads it was taken at. The behaviours locked in here:
+
+  * credentials come from the MARIADB_* env vars, every missing one named;
+  * a template only counts when both the dump and its metadata are readable;
+  * a template is stale as soon as one feature's head differs, including a
+    feature added or removed since it was saved;
+  * saving never leaves a partial dump in place of the previous one, and the
+    password never reaches the command line.
+
+mysqldump / mysql are never run: proc.subprocess.run is patched.
+"""
+
+import json
+import os
+import subprocess
+
+import click
+import pytest
+
+from splent_cli.services import db_template
+
+
+CREDS = {
+    "MARIADB_HOSTNAME": "db",
+    "MARIADB_USER": "root",
+    "MARIADB_PASSWORD": "s3cret",
+    "MARIADB_DATABASE": "app_db",
+}
+
+
+@pytest.fixture
+def creds_env(monkeypatch):
+    for k, v in CREDS.items():
+        monkeypatch.setenv(k, v)
+
+
+class TestCredentials:
+    def test_reads_the_env(self, creds_env):
+        assert db_template.mariadb_credentials() == CREDS
+
+    def test_names_every_missing_var(self, monkeypatch):
+        for k in CREDS:
+            monkeypatch.delenv(k, raising=False)
+        monkeypatch.setenv("MARIADB_HOSTNAME", "db")
+        with pytest.raises(click.ClickException) as exc:
+            db_template.mariadb_credentials()
+        msg = exc.value.format_message()
+        assert "MARIADB_USER" in msg and "MARIADB_DATABASE" in msg
+        assert "MARIADB_HOSTNAME" not in msg
+
+
+class TestReadTemplate:
+    def _write(self, tmp_path, meta):
+        sql_path, meta_path = db_template.template_paths(str(tmp_path), "app")
+        os.makedirs(os.path.dirname(sql_path))
+        with open(sql_path, "w") as f:
+            f.write("-- dump")
+        with open(meta_path, "w") as f:
+            f.write(meta)
+
+    def test_no_template(self, tmp_path):
+        assert db_template.read_template(str(tmp_path), "app") is None
+
+    def test_valid_template(self, tmp_path):
+        self._write(tmp_path, json.dumps({"heads": {"feat": "abc"}}))
+        assert db_template.read_template(str(tmp_path), "app")["heads"] == {
+            "feat": "abc"
+        }
+
+    def test_corrupt_metadata_is_no_template(self, tmp_path):
+        self._write(tmp_path, "{not json")
+        assert db_template.read_template(str(tmp_path), "app") is None
+
+    def test_metadata_without_heads_is_no_template(self, tmp_path):
+        self._write(tmp_path, json.dumps({"created": "today"}))
+        assert db_template.read_template(str(tmp_path), "app") is None
+
+
+class TestStaleFeatures:
+    def test_matching_heads(self):
+        meta = {"heads": {"a": "1", "b": None}}
+        assert db_template.stale_features(meta, {"a": "1", "b": None}) == []
+
+    def test_changed_head(self):
+        meta = {"heads": {"a": "1", "b": "2"}}
+        assert db_template.stale_features(meta, {"a": "1", "b": "3"}) == ["b"]
+
+    def test_added_and_removed_features(self):
+        meta = {"heads": {"a": "1", "gone": "2"}}
+        assert db_template.stale_features(meta, {"a": "1", "new": "9"}) == [
+            "gone",
+            "new",
+        ]
+
+
+def _fake_run(calls, returncode=0):
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        out = kwargs.get("stdout")
+        if out is not None and hasattr(out, "write"):
+            out.write(b"-- dump body")
+        return subprocess.CompletedProcess(cmd, returncode, b"", b"boom")
+
+    return fake_run
+
+
+class TestSaveTemplate:
+    def test_writes_dump_and_heads(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr("splent_cli.utils.proc.subprocess.run", _fake_run(calls))
+
+        path = db_template.save_template(str(tmp_path), "app", {"feat": "abc"}, CREDS)
+
+        assert open(path, "rb").read() == b"-- dump body"
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        meta = db_template.read_template(str(tmp_path), "app")
+        assert meta["heads"] == {"feat": "abc"}
+        assert meta["database"] == "app_db"
+        cmd, kwargs = calls[0]
+        assert cmd[0] == "mysqldump"
+        assert not any("s3cret" in arg for arg in cmd)
+        assert kwargs["env"]["MYSQL_PWD"] == "s3cret"
+
+    def test_failed_dump_keeps_the_previous_template(self, tmp_path, monkeypatch):
+        sql_path, _ = db_template.template_paths(str(tmp_path), "app")
+        os.makedirs(os.path.dirname(sql_path))
+        with open(sql_path, "w") as f:
+            f.write("-- previous")
+        monkeypatch.setattr(
+            "splent_cli.utils.proc.subprocess.run", _fake_run([], returncode=2)
+        )
+
+        with pytest.raises(click.ClickException):
+            db_template.save_template(str(tmp_path), "app", {}, CREDS)
+
+        assert open(sql_path).read() == "-- previous"
+        assert os.listdir(os.path.dirname(sql_path)) == ["app.sql"]
+
+
+class TestLoadTemplate:
+    def test_feeds_the_dump_to_mysql(self, tmp_path, monkeypatch):
+        sql_path, _ = db_template.template_paths(str(tmp_path), "app")
+        os.makedirs(os.path.dirname(sql_path))
+        with open(sql_path, "w") as f:
+            f.write("-- dump")
+        calls = []
+        monkeypatch.setattr("splent_cli.utils.proc.subprocess.run", _fake_run(calls))
+
+        db_template.load_template(str(tmp_path), "app", CREDS)
+
+        cmd, kwargs = calls[0]
+        assert cmd == ["mysql", "-hdb", "-uroot", "app_db"]
+        assert kwargs["stdin"].name == sql_path
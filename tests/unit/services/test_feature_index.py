@@ -0,0 +1,196 @@
+"""Tests for services/feature_index.py — the workspace feature-metadata index."""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from splent_cli.services import feature_index
+from splent_cli.services.feature_index import FeatureIndex, version_key
+
+CONTRACT = """\
+[project]
+name = "{name}"
+version = "{version}"
+
+[tool.splent.contract.provides]
+services = ["{service}"]
+
+[tool.splent.contract.requires]
+features = ["auth"]
+
+[tool.splent.refinement]
+refines = "base"
+"""
+
+
+def _feature(path, service="MailService", version="1.0.0", old=True):
+    path.mkdir(parents=True, exist_ok=True)
+    pyproject = path / "pyproject.toml"
+    pyproject.write_text(
+        CONTRACT.format(name=path.name.split("@")[0], version=version, service=service)
+    )
+    if old:
+        # Past the racy window, so the index keeps the row's stamp.
+        stamp = time.time() - 60
+        os.utime(pyproject, (stamp, stamp))
+    return path
+
+
+def _cache(workspace, namespace, entry):
+    return workspace / ".splent_cache" / "features" / namespace / entry
+
+
+def _no_parse(pyproject):
+    raise AssertionError(f"parsed {pyproject} again")
+
+
+class TestScan:
+    def test_finds_workspace_and_cache_features(self, tmp_path):
+        _feature(tmp_path / "splent_feature_mail")
+        (tmp_path / "my_product").mkdir()
+        _feature(_cache(tmp_path, "splent_io", "splent_feature_auth@v1.2.0"))
+        _feature(_cache(tmp_path, "splent_io", "splent_feature_auth"))
+
+        records = FeatureIndex(tmp_path).records()
+        assert [(r.source, r.entry) for r in records] == [
+            ("workspace", "splent_feature_mail"),
+            ("cache", "splent_feature_auth"),
+            ("cache", "splent_feature_auth@v1.2.0"),
+        ]
+        snapshot = records[2]
+        assert snapshot.namespace == "splent_io"
+        assert snapshot.name == "splent_feature_auth"
+        assert snapshot.version == "v1.2.0"
+        assert snapshot.short == "auth"
+
+    def test_reads_the_contract(self, tmp_path):
+        _feature(tmp_path / "splent_feature_mail", version="2.1.0")
+        record = FeatureIndex(tmp_path).records()[0]
+        assert record.project_version == "2.1.0"
+        assert record.provides["services"] == ["MailService"]
+        assert record.requires["features"] == ["auth"]
+        assert record.refinement["refines"] == "base"
+
+    def test_document_is_read_only(self, tmp_path):
+        _feature(tmp_path / "splent_feature_mail")
+        record = FeatureIndex(tmp_path).records()[0]
+        with pytest.raises(TypeError):
+            record.provides["services"].append("Other")
+
+    def test_missing_or_broken_pyproject_has_an_empty_document(self, tmp_path):
+        (tmp_path / "splent_feature_bare").mkdir()
+        broken = tmp_path / "splent_feature_broken"
+        broken.mkdir()
+        (broken / "pyproject.toml").write_text("[tool.splent\n")
+        records = FeatureIndex(tmp_path).records()
+        assert [r.entry for r in records] == [
+            "splent_feature_bare",
+            "splent_feature_broken",
+        ]
+        assert all(r.raw is None and r.contract == {} for r in records)
+
+    def test_a_broken_pyproject_keeps_its_error(self, tmp_path, monkeypatch):
+        path = _feature(tmp_path / "splent_feature_broken")
+        (path / "pyproject.toml").write_text("[tool.splent\n")
+        stamp = time.time() - 60
+        os.utime(path / "pyproject.toml", (stamp, stamp))
+        record = FeatureIndex(tmp_path).records()[0]
+        assert "is not valid TOML" in record.parse_error
+        assert str(path / "pyproject.toml") in record.parse_error
+
+        # Read back from the row, not parsed again.
+        monkeypatch.setattr(feature_index, "_parse", _no_parse)
+        assert FeatureIndex(tmp_path).records()[0].parse_error == record.parse_error
+
+    def test_a_feature_without_a_pyproject_is_not_an_error(self, tmp_path):
+        (tmp_path / "splent_feature_bare").mkdir()
+        assert FeatureIndex(tmp_path).records()[0].parse_error is None
+
+
+class TestFind:
+    def test_workspace_root_wins(self, tmp_path):
+        _feature(tmp_path / "splent_feature_auth")
+        _feature(_cache(tmp_path, "splent_io", "splent_feature_auth@v1.0.0"))
+        record = FeatureIndex(tmp_path).find("splent_feature_auth", version="v1.0.0")
+        assert record.source == "workspace"
+
+    def test_pinned_version(self, tmp_path):
+        for entry in ("splent_feature_auth@v1.0.0", "splent_feature_auth@v2.0.0"):
+            _feature(_cache(tmp_path, "splent_io", entry))
+        index = FeatureIndex(tmp_path)
+        assert index.find("splent_feature_auth", version="v2.0.0").version == "v2.0.0"
+        assert index.find("splent_feature_auth", version="v3.0.0") is None
+
+    def test_editable_cache_entry_before_snapshots(self, tmp_path):
+        _feature(_cache(tmp_path, "splent_io", "splent_feature_auth@v1.0.0"))
+        _feature(_cache(tmp_path, "splent_io", "splent_feature_auth"))
+        assert FeatureIndex(tmp_path).find("splent_feature_auth").version is None
+
+    def test_namespace_narrows_the_cache(self, tmp_path):
+        _feature(_cache(tmp_path, "other_org", "splent_feature_auth@v1.0.0"))
+        index = FeatureIndex(tmp_path)
+        assert index.find("splent_feature_auth", namespace="splent_io") is None
+        assert index.find("splent_feature_auth", namespace="other_org") is not None
+
+
+class TestRefresh:
+    def test_unchanged_pyproject_is_not_parsed_again(self, tmp_path, monkeypatch):
+        _feature(tmp_path / "splent_feature_mail")
+        FeatureIndex(tmp_path)
+        monkeypatch.setattr(feature_index, "_parse", _no_parse)
+        record = FeatureIndex(tmp_path).records()[0]
+        assert record.provides["services"] == ["MailService"]
+
+    def test_changed_pyproject_is_parsed_again(self, tmp_path):
+        path = _feature(tmp_path / "splent_feature_mail")
+        FeatureIndex(tmp_path)
+        _feature(path, service="PostService")
+        record = FeatureIndex(tmp_path).records()[0]
+        assert record.provides["services"] == ["PostService"]
+
+    def test_racy_pyproject_is_parsed_again(self, tmp_path, monkeypatch):
+        _feature(tmp_path / "splent_feature_mail", old=False)
+        FeatureIndex(tmp_path)
+        monkeypatch.setattr(feature_index, "_parse", _no_parse)
+        with pytest.raises(AssertionError, match="parsed"):
+            FeatureIndex(tmp_path)
+
+    def test_snapshots_are_not_stat_again(self, tmp_path, monkeypatch):
+        path = _cache(tmp_path, "splent_io", "splent_feature_auth@v1.0.0")
+        _feature(path)
+        FeatureIndex(tmp_path)
+        monkeypatch.setattr(feature_index, "_parse", _no_parse)
+        (path / "pyproject.toml").unlink()
+        record = FeatureIndex(tmp_path).records()[0]
+        assert record.provides["services"] == ["MailService"]
+
+    def test_vanished_features_are_dropped(self, tmp_path):
+        path = _feature(tmp_path / "splent_feature_mail")
+        FeatureIndex(tmp_path)
+        (path / "pyproject.toml").unlink()
+        path.rmdir()
+        assert FeatureIndex(tmp_path).records() == []
+        db = sqlite3.connect(feature_index.index_path(tmp_path))
+        assert db.execute("SELECT COUNT(*) FROM features").fetchone()[0] == 0
+        db.close()
+
+    def test_corrupt_database_is_rebuilt(self, tmp_path):
+        _feature(tmp_path / "splent_feature_mail")
+        db = feature_index.index_path(tmp_path)
+        db.parent.mkdir(parents=True)
+        db.write_bytes(b"not a database" * 100)
+        assert len(FeatureIndex(tmp_path).records()) == 1
+        assert len(FeatureIndex(tmp_path).records()) == 1
+
+
+class TestVersionKey:
+    def test_orders_by_semver(self):
+        versions = ["v1.10.0", "v1.2.0", "v1.9.3", "latest"]
+        assert sorted(versions, key=version_key) == [
+            "latest",
+            "v1.2.0",
+            "v1.9.3",
+            "v1.10.0",
+        ]
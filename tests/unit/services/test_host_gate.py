@@ -0,0 +1,127 @@
+"""Tests for services/host_gate.py: per-host concurrency and shared backoff."""
+
+import threading
+import time
+
+import pytest
+
+from splent_cli.services.host_gate import HostGate
+from splent_cli.services.registry import RegistryError
+
+
+def _limited(retry_after=None):
+    return RegistryError(
+        "slow down", status=429, rate_limited=True, retry_after=retry_after
+    )
+
+
+@pytest.fixture
+def gate():
+    """A gate on a fake clock: sleeping records the wait and moves time on."""
+    g = HostGate("api.example.com", 2, retries=2, max_wait=30, backoff=1)
+    g.waits = []
+    now = {"t": 100.0}
+
+    def sleep(seconds):
+        g.waits.append(seconds)
+        now["t"] += seconds
+
+    g.clock = lambda: now["t"]
+    g.sleep = sleep
+    return g
+
+
+class TestConcurrency:
+    def test_never_more_than_limit_in_flight(self):
+        gate = HostGate("h", 2)
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def work():
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.02)
+            with lock:
+                state["now"] -= 1
+
+        threads = [threading.Thread(target=gate.call, args=(work,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert state["peak"] == 2
+
+    def test_returns_the_result(self, gate):
+        assert gate.call(lambda a, b=0: a + b, 1, b=2) == 3
+
+
+class TestBackoff:
+    def test_rate_limit_is_retried_after_the_server_wait(self, gate):
+        answers = [_limited(retry_after=5), "ok"]
+
+        def fn():
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        assert gate.call(fn) == "ok"
+        assert gate.waits == [5.0]
+
+    def test_without_a_server_wait_the_backoff_doubles(self, gate):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            raise _limited()
+
+        with pytest.raises(RegistryError):
+            gate.call(fn)
+        assert len(calls) == 3
+        assert gate.waits == [1, 2]
+
+    def test_a_long_wait_gives_up_at_once(self, gate):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            raise _limited(retry_after=3600)
+
+        with pytest.raises(RegistryError):
+            gate.call(fn)
+        assert len(calls) == 1
+        assert gate.waits == []
+        assert gate.exhausted
+
+    def test_after_giving_up_the_host_is_not_asked_again(self, gate):
+        def limited():
+            raise _limited(retry_after=3600)
+
+        with pytest.raises(RegistryError):
+            gate.call(limited)
+
+        asked = []
+        with pytest.raises(RegistryError) as err:
+            gate.call(asked.append, "x")
+        assert asked == []
+        assert err.value.rate_limited
+
+    def test_other_errors_are_not_retried(self, gate):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            raise RegistryError("nope", status=401)
+
+        with pytest.raises(RegistryError):
+            gate.call(fn)
+        assert len(calls) == 1
+        assert not gate.exhausted
+
+    def test_a_backoff_pauses_every_caller(self, gate):
+        # Another caller was just told to wait 3 seconds...
+        gate._rate_limited(_limited(retry_after=3), attempt=0)
+        # ...so this one waits them out before asking at all.
+        assert gate.call(lambda: "next") == "next"
+        assert gate.waits == [3.0]
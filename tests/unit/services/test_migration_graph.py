@@ -0,0 +1,128 @@
+"""Tests for services/migration_graph.py — revision graphs and their caches."""
+
+import json
+import os
+
+import pytest
+
+from splent_cli.services import migration_graph
+from splent_cli.services.migration_graph import (
+    RevisionGraph,
+    filesystem_head,
+    load_graphs,
+    parse_versions,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    migration_graph._memo.clear()
+    yield
+    migration_graph._memo.clear()
+
+
+def _write(mdir, revision, down=None, annotated=False):
+    versions = mdir / "versions"
+    versions.mkdir(parents=True, exist_ok=True)
+    if isinstance(down, tuple):
+        down_src = repr(down)
+    else:
+        down_src = f'"{down}"' if down else "None"
+    if annotated:
+        head = (
+            f'revision: str = "{revision}"\n'
+            f"down_revision: Union[str, None] = {down_src}\n"
+        )
+    else:
+        head = f'revision = "{revision}"\ndown_revision = {down_src}\n'
+    path = versions / f"{revision}.py"
+    path.write_text(head + "\n\ndef upgrade():\n    pass\n")
+    return path
+
+
+class TestParseVersions:
+    def test_chain_and_head(self, tmp_path):
+        _write(tmp_path, "a1")
+        _write(tmp_path, "b2", "a1", annotated=True)
+        graph = parse_versions(str(tmp_path / "versions"))
+        assert graph.revisions == {"a1": (), "b2": ("a1",)}
+        assert graph.head == "b2"
+
+    def test_merge_revision_lists_both_parents(self, tmp_path):
+        _write(tmp_path, "a1")
+        _write(tmp_path, "b1", "a1")
+        _write(tmp_path, "c1", "a1")
+        _write(tmp_path, "m1", ("b1", "c1"))
+        graph = parse_versions(str(tmp_path / "versions"))
+        assert graph.heads == ["m1"]
+        assert graph.pending("a1") == ["b1", "c1", "m1"]
+
+    def test_missing_directory_is_an_empty_graph(self, tmp_path):
+        graph = parse_versions(str(tmp_path / "nope"))
+        assert graph.revisions == {}
+        assert graph.head is None
+
+
+class TestRevisionGraph:
+    graph = RevisionGraph({"a": (), "b": ("a",), "c": ("b",)})
+
+    def test_is_current_only_at_the_single_head(self):
+        assert self.graph.is_current("c")
+        assert not self.graph.is_current("b")
+        assert not self.graph.is_current(None)
+
+    def test_several_heads_are_never_current(self):
+        forked = RevisionGraph({"a": (), "b": ("a",), "c": ("a",)})
+        assert not forked.is_current("b")
+
+    def test_pending_from_scratch_and_midway(self):
+        assert self.graph.pending(None) == ["a", "b", "c"]
+        assert self.graph.pending("a") == ["b", "c"]
+        assert self.graph.pending("c") == []
+
+
+class TestLoadGraphs:
+    def test_disk_cache_round_trip(self, tmp_path):
+        mdir = tmp_path / "auth" / "migrations"
+        _write(mdir, "a1")
+        cache = tmp_path / "cache.json"
+
+        graphs = load_graphs({"auth": str(mdir)}, str(cache))
+        assert graphs["auth"].head == "a1"
+        data = json.loads(cache.read_text())
+        assert data["graphs"][str(mdir / "versions")]["revisions"] == {"a1": []}
+
+    def test_cached_graph_is_used_while_scripts_are_unchanged(
+        self, tmp_path, monkeypatch
+    ):
+        mdir = tmp_path / "auth" / "migrations"
+        _write(mdir, "a1")
+        cache = tmp_path / "cache.json"
+        load_graphs({"auth": str(mdir)}, str(cache))
+        migration_graph._memo.clear()
+
+        def no_parsing(_):
+            raise AssertionError("scripts parsed despite a valid cache")
+
+        monkeypatch.setattr(migration_graph, "parse_versions", no_parsing)
+        assert load_graphs({"auth": str(mdir)}, str(cache))["auth"].head == "a1"
+
+    def test_changed_script_invalidates_the_cache(self, tmp_path):
+        mdir = tmp_path / "auth" / "migrations"
+        _write(mdir, "a1")
+        cache = tmp_path / "cache.json"
+        load_graphs({"auth": str(mdir)}, str(cache))
+
+        path = _write(mdir, "b2", "a1")
+        os.utime(path, ns=(1, 1))
+        assert load_graphs({"auth": str(mdir)}, str(cache))["auth"].head == "b2"
+
+    def test_unreadable_cache_is_ignored(self, tmp_path):
+        mdir = tmp_path / "auth" / "migrations"
+        _write(mdir, "a1")
+        cache = tmp_path / "cache.json"
+        cache.write_text("{not json")
+        assert load_graphs({"auth": str(mdir)}, str(cache))["auth"].head == "a1"
+
+    def test_filesystem_head_without_scripts(self, tmp_path):
+        assert filesystem_head(str(tmp_path)) is None
@@ -0,0 +1,396 @@
+"""Tests for services/parallel_dump.py — chunked dumps and the deferred-index restore."""
+
+import gzip
+import json
+
+import click
+import pytest
+
+from splent_cli.services import parallel_dump
+from splent_cli.services.parallel_dump import (
+    dump_database,
+    load_manifest,
+    restore_database,
+    split_create_table,
+)
+
+CREDS = {
+    "MARIADB_HOSTNAME": "db",
+    "MARIADB_USER": "app",
+    "MARIADB_PASSWORD": "secret",
+    "MARIADB_DATABASE": "appdb",
+}
+
+USER_CREATE = (
+    "CREATE TABLE `user` (\n"
+    "  `id` int(11) NOT NULL AUTO_INCREMENT,\n"
+    "  `email` varchar(256) NOT NULL,\n"
+    "  `role_id` int(11) DEFAULT NULL,\n"
+    "  PRIMARY KEY (`id`),\n"
+    "  UNIQUE KEY `email` (`email`),\n"
+    "  KEY `role_id` (`role_id`),\n"
+    "  CONSTRAINT `user_ibfk_1` FOREIGN KEY (`role_id`) REFERENCES `role` (`id`)\n"
+    ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+)
+
+ROLE_CREATE = (
+    "CREATE TABLE `role` (\n"
+    "  `id` int(11) NOT NULL,\n"
+    "  PRIMARY KEY (`id`)\n"
+    ") ENGINE=InnoDB"
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, sql):
+        self.conn.log.append(sql)
+        self.rows = self.conn.db.answer(sql)
+
+    def fetchall(self):
+        return self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+        self.log = []
+        self.closed = False
+        db.connections.append(self)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def escape(self, value):
+        if value is None:
+            return "NULL"
+        if isinstance(value, int):
+            return str(value)
+        return "'" + str(value).replace("'", "\\'").replace("\n", "\\n") + "'"
+
+    def close(self):
+        self.closed = True
+
+
+VIEW_CREATE = (
+    "CREATE ALGORITHM=UNDEFINED DEFINER=`app`@`%` SQL SECURITY DEFINER "
+    "VIEW `admins` AS select `user`.`id` AS `id` from `user`"
+)
+
+TRIGGER_CREATE = (
+    "CREATE DEFINER=`app`@`%` TRIGGER `user_bi` BEFORE INSERT ON `user` "
+    "FOR EACH ROW BEGIN SET NEW.email = LOWER(NEW.email); END"
+)
+
+
+class FakeDatabase:
+    def __init__(self, tables, views=None, routines=None, triggers=None):
+        # name -> (create, rows, size)
+        self.tables = tables
+        # name -> create; routines: name -> (kind, create)
+        self.views = views or {}
+        self.routines = routines or {}
+        self.triggers = triggers or {}
+        self.connections = []
+
+    def connect(self, creds):
+        return FakeConn(self)
+
+    def answer(self, sql):
+        if "information_schema.VIEWS" in sql:
+            return [(name,) for name in self.views]
+        if "information_schema.ROUTINES" in sql:
+            return [(kind, name) for name, (kind, _) in self.routines.items()]
+        if "information_schema.TRIGGERS" in sql:
+            return [(name,) for name in self.triggers]
+        if sql.startswith("SHOW CREATE VIEW"):
+            name = sql.split("`")[1]
+            return [(name, self.views[name], "utf8mb4", "utf8mb4_general_ci")]
+        if sql.startswith(("SHOW CREATE FUNCTION", "SHOW CREATE PROCEDURE")):
+            name = sql.split("`")[1]
+            return [(name, "STRICT_TRANS_TABLES", self.routines[name][1])]
+        if sql.startswith("SHOW CREATE TRIGGER"):
+            name = sql.split("`")[1]
+            return [(name, "STRICT_TRANS_TABLES", self.triggers[name])]
+        if sql.startswith("SELECT TABLE_NAME"):
+            return [(name, size) for name, (_, _, size) in self.tables.items()]
+        if sql.startswith("SHOW CREATE TABLE"):
+            name = sql.split("`")[1]
+            return [(name, self.tables[name][0])]
+        if sql.startswith("SELECT * FROM"):
+            return self.tables[sql.split("`")[1]][1]
+        return []
+
+
+def _read_chunks(directory, manifest, table):
+    text = b""
+    for chunk in manifest["tables"][table]["chunks"]:
+        with gzip.open(directory / chunk, "rb") as f:
+            text += f.read()
+    return text.decode()
+
+
+class TestSplitCreateTable:
+    def test_defers_secondary_indexes_and_foreign_keys(self):
+        schema = split_create_table(USER_CREATE)
+        assert schema.indexes == [
+            "UNIQUE KEY `email` (`email`)",
+            "KEY `role_id` (`role_id`)",
+        ]
+        assert schema.foreign_keys == [
+            "CONSTRAINT `user_ibfk_1` FOREIGN KEY (`role_id`) REFERENCES `role` (`id`)"
+        ]
+        assert "PRIMARY KEY (`id`)\n)" in schema.create
+        assert "KEY `email`" not in schema.create
+        assert "FOREIGN KEY" not in schema.create
+
+    def test_table_without_indexes_is_unchanged(self):
+        schema = split_create_table(ROLE_CREATE)
+        assert schema.create == ROLE_CREATE
+        assert schema.indexes == [] and schema.foreign_keys == []
+
+    def test_auto_increment_without_primary_key_keeps_indexes(self):
+        create = (
+            "CREATE TABLE `log` (\n"
+            "  `id` int(11) NOT NULL AUTO_INCREMENT,\n"
+            "  KEY `id` (`id`)\n"
+            ") ENGINE=InnoDB"
+        )
+        schema = split_create_table(create)
+        assert schema.indexes == []
+        assert "KEY `id` (`id`)" in schema.create
+
+
+class TestDumpDatabase:
+    def _db(self):
+        return FakeDatabase(
+            {
+                "role": (ROLE_CREATE, [(1,), (2,)], 10),
+                "user": (
+                    USER_CREATE,
+                    [(1, "a@x.io", 1), (2, "it's\nme", None)],
+                    1000,
+                ),
+            }
+        )
+
+    def test_writes_chunks_and_manifest(self, tmp_path):
+        db = self._db()
+        manifest = dump_database(CREDS, str(tmp_path), 2, connect=db.connect)
+
+        on_disk = json.loads((tmp_path / "manifest.json").read_text())
+        assert on_disk == manifest
+        assert manifest["database"] == "appdb"
+        assert manifest["tables"]["user"]["rows"] == 2
+        assert manifest["tables"]["user"]["create"] == USER_CREATE
+        sql = _read_chunks(tmp_path, manifest, "user")
+        assert sql == (
+            "INSERT INTO `user` VALUES (1,'a@x.io',1),(2,'it\\'s\\nme',NULL);\n"
+        )
+
+    def test_every_statement_is_one_line(self, tmp_path):
+        db = self._db()
+        manifest = dump_database(
+            CREDS, str(tmp_path), 1, connect=db.connect, insert_bytes=1
+        )
+        lines = _read_chunks(tmp_path, manifest, "user").splitlines()
+        assert len(lines) == 2
+        assert all(line.startswith("INSERT INTO `user` VALUES ") for line in lines)
+
+    def test_large_tables_split_into_several_chunks(self, tmp_path):
+        db = FakeDatabase({"t": (ROLE_CREATE, [(i,) for i in range(50)], 1)})
+        manifest = dump_database(
+            CREDS,
+            str(tmp_path),
+            1,
+            connect=db.connect,
+            chunk_bytes=64,
+            insert_bytes=16,
+        )
+        chunks = manifest["tables"]["t"]["chunks"]
+        assert len(chunks) > 1
+        assert chunks[0] == "t.00001.sql.gz"
+        assert _read_chunks(tmp_path, manifest, "t").count("(") == 50
+
+    def test_snapshots_are_opened_under_read_locks(self, tmp_path):
+        db = self._db()
+        dump_database(CREDS, str(tmp_path), 2, connect=db.connect)
+
+        control = next(c for c in db.connections if any("LOCK" in q for q in c.log))
+        assert control.log[0].startswith("LOCK TABLES")
+        assert "`role` READ" in control.log[0] and "`user` READ" in control.log[0]
+        assert control.log[-1] == "UNLOCK TABLES"
+        workers = [
+            c
+            for c in db.connections
+            if "START TRANSACTION WITH CONSISTENT SNAPSHOT" in c.log
+        ]
+        assert len(workers) == 2
+        assert all(c.closed for c in db.connections)
+
+    def test_views_routines_and_triggers_go_into_the_manifest(self, tmp_path):
+        db = FakeDatabase(
+            {"user": (USER_CREATE, [], 1)},
+            views={"admins": VIEW_CREATE},
+            routines={
+                "audit": ("PROCEDURE", "CREATE PROCEDURE `audit`() BEGIN END"),
+                "slug": ("FUNCTION", "CREATE FUNCTION `slug`() RETURNS int RETURN 1"),
+            },
+            triggers={"user_bi": TRIGGER_CREATE},
+        )
+        manifest = dump_database(CREDS, str(tmp_path), 1, connect=db.connect)
+
+        objects = manifest["objects"]
+        assert [(o["kind"], o["name"]) for o in objects] == [
+            ("FUNCTION", "slug"),
+            ("PROCEDURE", "audit"),
+            ("VIEW", "admins"),
+            ("TRIGGER", "user_bi"),
+        ]
+        assert objects[2]["create"] == (
+            "CREATE ALGORITHM=UNDEFINED SQL SECURITY DEFINER "
+            "VIEW `admins` AS select `user`.`id` AS `id` from `user`"
+        )
+        assert objects[2]["sql_mode"] is None
+        assert objects[3]["sql_mode"] == "STRICT_TRANS_TABLES"
+        assert "DEFINER" not in objects[3]["create"]
+
+    def test_an_unreadable_routine_fails_the_dump(self, tmp_path):
+        db = FakeDatabase(
+            {"user": (USER_CREATE, [], 1)}, routines={"secret": ("PROCEDURE", None)}
+        )
+        with pytest.raises(click.ClickException, match="privilege"):
+            dump_database(CREDS, str(tmp_path), 1, connect=db.connect)
+
+    def test_missing_driver_is_a_click_error(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def no_pymysql(name, *args, **kwargs):
+            if name.startswith("pymysql"):
+                raise ModuleNotFoundError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_pymysql)
+        with pytest.raises(click.ClickException, match="pymysql"):
+            parallel_dump._connect(CREDS)
+
+
+class TestRestoreDatabase:
+    def _dump(self, tmp_path):
+        db = FakeDatabase(
+            {
+                "role": (ROLE_CREATE, [(1,)], 10),
+                "user": (USER_CREATE, [(1, "a@x.io", 1)], 1000),
+            }
+        )
+        dump_database(CREDS, str(tmp_path), 2, connect=db.connect)
+
+    def test_schema_then_data_then_indexes_then_foreign_keys(self, tmp_path):
+        self._dump(tmp_path)
+        calls = []
+        reported = []
+
+        restore_database(
+            CREDS,
+            str(tmp_path),
+            2,
+            on_table=lambda r, done, total: reported.append((r.name, done, total)),
+            execute=lambda creds, sql: calls.append(sql.decode()),
+        )
+
+        ddl = calls[0]
+        assert "DROP TABLE IF EXISTS `user`;" in ddl
+        assert "KEY `email`" not in ddl and "FOREIGN KEY" not in ddl
+
+        loads = [c for c in calls if "INSERT INTO" in c]
+        assert len(loads) == 2
+        assert all(c.startswith(parallel_dump._LOAD_HEADER.decode()) for c in loads)
+        assert all(c.endswith("COMMIT;\n") for c in loads)
+
+        index = calls.index(
+            "ALTER TABLE `user` ADD UNIQUE KEY `email` (`email`), "
+            "ADD KEY `role_id` (`role_id`);\n"
+        )
+        user_load = next(i for i, c in enumerate(calls) if "INSERT INTO `user`" in c)
+        assert user_load < index
+        assert "FOREIGN KEY" in calls[-1]
+        assert sorted(name for name, _, _ in reported) == ["role", "user"]
+        assert reported[-1][1:] == (2, 2)
+
+    def test_objects_come_last_and_a_view_waits_for_its_view(self, tmp_path):
+        db = FakeDatabase(
+            {"user": (USER_CREATE, [(1, "a@x.io", None)], 1)},
+            views={
+                # Listed first, but built on the view after it.
+                "a_view": "CREATE VIEW `a_view` AS select * from `admins`",
+                "admins": VIEW_CREATE,
+            },
+            triggers={"user_bi": TRIGGER_CREATE},
+        )
+        dump_database(CREDS, str(tmp_path), 1, connect=db.connect)
+        calls = []
+
+        def execute(creds, sql):
+            sql = sql.decode()
+            if "`a_view` AS" in sql and not any("VIEW `admins`" in c for c in calls):
+                raise click.ClickException("Table 'appdb.admins' doesn't exist")
+            calls.append(sql)
+
+        restore_database(CREDS, str(tmp_path), 1, execute=execute)
+
+        created = [c for c in calls if "DELIMITER ;;" in c]
+        assert len(created) == 3
+        assert "VIEW `admins`" in created[0] and "VIEW `a_view`" in created[2]
+        assert "TRIGGER `user_bi`" in created[1]
+        assert created[1].startswith("SET SESSION sql_mode = 'STRICT_TRANS_TABLES';")
+        assert "DROP TRIGGER IF EXISTS `user_bi`;" in created[1]
+        assert calls.index(created[0]) > max(
+            i for i, c in enumerate(calls) if "INSERT INTO" in c
+        )
+
+    def test_an_object_that_never_builds_fails_the_restore(self, tmp_path):
+        db = FakeDatabase({"user": (USER_CREATE, [], 1)}, views={"v": VIEW_CREATE})
+        dump_database(CREDS, str(tmp_path), 1, connect=db.connect)
+
+        def execute(creds, sql):
+            if b"VIEW" in sql:
+                raise click.ClickException("broken view")
+
+        with pytest.raises(click.ClickException, match="broken view"):
+            restore_database(CREDS, str(tmp_path), 1, execute=execute)
+
+    def test_format_1_dumps_still_restore(self, tmp_path):
+        self._dump(tmp_path)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        manifest["format"] = 1
+        del manifest["objects"]
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        calls = []
+        restore_database(CREDS, str(tmp_path), 1, execute=lambda c, s: calls.append(s))
+        assert not any(b"DELIMITER" in c for c in calls)
+
+    def test_missing_chunk_is_refused_before_any_sql(self, tmp_path):
+        self._dump(tmp_path)
+        next(tmp_path.glob("user.*.sql.gz")).unlink()
+        calls = []
+        with pytest.raises(click.ClickException, match="incomplete"):
+            restore_database(
+                CREDS, str(tmp_path), 2, execute=lambda c, s: calls.append(s)
+            )
+        assert calls == []
+
+    def test_unknown_format_is_refused(self, tmp_path):
+        (tmp_path / "manifest.json").write_text('{"format": 99, "tables": {}}')
+        with pytest.raises(click.ClickException, match="can restore"):
+            load_manifest(str(tmp_path))
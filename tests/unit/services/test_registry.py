@@ -211,6 +211,22 @@ class TestListSemverTags:
         assert registry.list_tags("org", "repo") == []
 
 
+class TestIterTagPages:
+    def test_next_page_is_requested_only_when_consumed(self, monkeypatch):
+        requested = []
+
+        def _urlopen(req, *a, **k):
+            requested.append(req.full_url)
+            return _response([{"name": f"v{i}"} for i in range(100)])
+
+        monkeypatch.setattr(registry.urllib.request, "urlopen", _urlopen)
+        pages = registry.iter_tag_pages("org", "repo")
+        assert len(next(pages)) == 100
+        assert len(requested) == 1
+        next(pages)
+        assert "page=2" in requested[-1]
+
+
 class TestListReleaseTags:
     """One call answers "which tags have a release" for every tag."""
 
@@ -0,0 +1,253 @@
+"""Tests for registry.fetch_repo_snapshots, the batched multi-repo lookup.
+
+GraphQL requests are mocked at urllib.request.urlopen inside the registry
+module; the REST fallback is mocked at the registry helpers it calls.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from splent_cli.services import registry
+
+
+def _response(payload):
+    class _Resp:
+        status = 200
+
+        def __init__(self, body: bytes):
+            self._body = body
+
+        def read(self):
+            return self._body
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *a):
+            return False
+
+    return _Resp(json.dumps(payload).encode())
+
+
+def _repo_node(name, tags=(), total=None, releases=None, release_total=None):
+    node = {
+        "name": name,
+        "owner": {"login": "splent-io"},
+        "url": f"https://github.com/splent-io/{name}",
+        "description": f"{name} desc",
+        "pushedAt": "2026-01-01T00:00:00Z",
+        "stargazerCount": 3,
+        "isPrivate": False,
+        "isArchived": False,
+        "refs": {
+            "totalCount": len(tags) if total is None else total,
+            "nodes": [{"name": t} for t in tags],
+        },
+    }
+    if releases is not None:
+        node["releases"] = {
+            "totalCount": len(releases) if release_total is None else release_total,
+            "nodes": [{"tagName": t} for t in releases],
+        }
+    return node
+
+
+@pytest.fixture
+def graphql_server(monkeypatch):
+    """Answers GraphQL queries from ``server.repos`` / ``server.files``."""
+
+    server = SimpleNamespace(repos={}, files={}, queries=[], errors=[])
+
+    def fake_urlopen(req, timeout=None):
+        assert req.full_url == registry.GITHUB_GRAPHQL
+        assert req.headers["Authorization"] == "token t0k"
+        query = json.loads(req.data)["query"]
+        server.queries.append(query)
+        data = {}
+        for alias, name in re.findall(
+            r'(\w+): repository\(owner: "[^"]*", name: "([^"]*)"\)', query
+        ):
+            if alias.startswith("r"):
+                data[alias] = server.repos.get(name)
+            else:
+                expr = re.search(
+                    alias + r': repository\([^)]*\) \{ object\(expression: "([^"]*)"\)',
+                    query,
+                ).group(1)
+                text = server.files.get((name, expr))
+                data[alias] = {
+                    "object": None
+                    if text is None
+                    else {"text": text, "isTruncated": False}
+                }
+        payload = {"data": data}
+        if server.errors:
+            payload["errors"] = server.errors
+        return _response(payload)
+
+    monkeypatch.setattr(registry.urllib.request, "urlopen", fake_urlopen)
+    return server
+
+
+class TestGraphQL:
+    def test_one_request_per_batch(self, graphql_server):
+        names = [f"splent_feature_{i}" for i in range(120)]
+        for n in names:
+            graphql_server.repos[n] = _repo_node(n, ["v1.0.0"])
+        snaps = registry.fetch_repo_snapshots([f"splent-io/{n}" for n in names], "t0k")
+        assert len(graphql_server.queries) == 3
+        assert len(snaps) == 120
+        snap = snaps["splent-io/splent_feature_7"]
+        assert snap.tags == ["v1.0.0"]
+        assert snap.tags_complete
+        assert snap.meta["html_url"].endswith("/splent_feature_7")
+        assert snap.meta["stargazers_count"] == 3
+
+    def test_a_missing_repo_is_none(self, graphql_server):
+        graphql_server.errors = [{"type": "NOT_FOUND", "path": ["r0"], "message": "x"}]
+        snaps = registry.fetch_repo_snapshots(["splent-io/ghost"], "t0k")
+        assert snaps == {"splent-io/ghost": None}
+
+    def test_a_forbidden_repo_is_none_and_the_batch_goes_on(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v1.0.0"])
+        graphql_server.repos["sso"] = _repo_node("sso", ["v2.0.0"])
+        graphql_server.errors = [
+            {"type": "FORBIDDEN", "path": ["r1"], "message": "SAML enforcement"}
+        ]
+        snaps = registry.fetch_repo_snapshots(["splent-io/a", "splent-io/sso"], "t0k")
+        assert snaps["splent-io/a"].tags == ["v1.0.0"]
+        assert snaps["splent-io/sso"] is None
+
+    def test_a_forbidden_query_still_raises(self, graphql_server):
+        graphql_server.errors = [{"type": "FORBIDDEN", "message": "bad token"}]
+        with pytest.raises(registry.RegistryError):
+            registry.fetch_repo_snapshots(["splent-io/a"], "t0k")
+
+    def test_tags_only_leaves_the_metadata_out_of_the_query(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v1.0.0"])
+        snap = registry.fetch_repo_snapshots(["splent-io/a"], "t0k", with_meta=False)[
+            "splent-io/a"
+        ]
+        assert snap.tags == ["v1.0.0"] and snap.meta == {}
+        assert "stargazerCount" not in graphql_server.queries[0]
+
+    def test_rate_limit_raises(self, graphql_server):
+        graphql_server.errors = [{"type": "RATE_LIMITED", "message": "slow down"}]
+        with pytest.raises(registry.RegistryError) as err:
+            registry.fetch_repo_snapshots(["splent-io/a"], "t0k")
+        assert err.value.rate_limited
+
+    def test_more_tags_than_asked_is_marked_incomplete(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v2.0.0", "v1.0.0"], total=250)
+        snap = registry.fetch_repo_snapshots(["splent-io/a"], "t0k", tags=2)[
+            "splent-io/a"
+        ]
+        assert not snap.tags_complete
+        assert "first: 2" in graphql_server.queries[0]
+
+    def test_latest_tag_is_semver_highest(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v1.9.0", "v1.10.0", "nightly"])
+        snap = registry.fetch_repo_snapshots(["splent-io/a"], "t0k")["splent-io/a"]
+        assert snap.latest_tag == "v1.10.0"
+
+    def test_releases(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v1.0.0"], releases=["v1.0.0"])
+        snap = registry.fetch_repo_snapshots(["splent-io/a"], "t0k", releases=True)[
+            "splent-io/a"
+        ]
+        assert snap.release_tags == {"v1.0.0"}
+
+    def test_more_releases_than_a_page_are_listed_over_rest(
+        self, graphql_server, monkeypatch
+    ):
+        graphql_server.repos["a"] = _repo_node(
+            "a", ["v1.0.0"], releases=["v1.0.0"], release_total=150
+        )
+        monkeypatch.setattr(
+            registry, "list_release_tags", lambda org, repo, token=None: {"all"}
+        )
+        snap = registry.fetch_repo_snapshots(["splent-io/a"], "t0k", releases=True)[
+            "splent-io/a"
+        ]
+        assert snap.release_tags == {"all"}
+
+    def test_file_at_the_latest_tag(self, graphql_server):
+        graphql_server.repos["a"] = _repo_node("a", ["v1.0.0", "v1.2.0"])
+        graphql_server.repos["b"] = _repo_node("b", [])
+        graphql_server.files[("a", "v1.2.0:pyproject.toml")] = "[project]\n"
+        snaps = registry.fetch_repo_snapshots(
+            ["splent-io/a", "splent-io/b"], "t0k", file="pyproject.toml"
+        )
+        assert snaps["splent-io/a"].file_ref == "v1.2.0"
+        assert snaps["splent-io/a"].file_text == "[project]\n"
+        # A repo with no tags has nothing to read the file at.
+        assert snaps["splent-io/b"].file_text is None
+        assert len(graphql_server.queries) == 2
+        assert "f1:" not in graphql_server.queries[1]
+
+
+class TestRestFallback:
+    @pytest.fixture(autouse=True)
+    def _no_graphql(self, monkeypatch):
+        def forbidden(*a, **k):
+            raise AssertionError("GraphQL needs a token")
+
+        monkeypatch.setattr(registry, "graphql", forbidden)
+
+    def test_without_a_token_rest_answers(self, monkeypatch):
+        monkeypatch.setattr(
+            registry, "fetch_repo", lambda org, repo, token=None: {"html_url": "u"}
+        )
+        monkeypatch.setattr(
+            registry,
+            "list_tags",
+            lambda org, repo, token=None, max_pages=50: ["v1.0.0", "v1.1.0"],
+        )
+        monkeypatch.setattr(
+            registry,
+            "fetch_file",
+            lambda org, repo, path, ref=None, token=None: f"{path}@{ref}",
+        )
+        snap = registry.fetch_repo_snapshots(["o/a"], None, file="pyproject.toml")[
+            "o/a"
+        ]
+        assert snap.meta == {"html_url": "u"}
+        assert snap.latest_tag == "v1.1.0"
+        assert snap.file_text == "pyproject.toml@v1.1.0"
+
+    def test_known_metadata_is_not_fetched_again(self, monkeypatch):
+        def no_fetch(*a, **k):
+            raise AssertionError("metadata was already known")
+
+        monkeypatch.setattr(registry, "fetch_repo", no_fetch)
+        monkeypatch.setattr(
+            registry, "list_tags", lambda org, repo, token=None, max_pages=50: []
+        )
+        snap = registry.fetch_repo_snapshots(
+            ["o/a"], None, known_meta={"o/a": {"name": "a"}}
+        )["o/a"]
+        assert snap.meta == {"name": "a"} and snap.tags == []
+
+    def test_tags_only_skips_metadata_and_maps_404_to_none(self, monkeypatch):
+        def no_fetch(*a, **k):
+            raise AssertionError("metadata not wanted")
+
+        def missing(org, repo, token=None, max_pages=50):
+            raise registry.RegistryError("gone", status=404)
+
+        monkeypatch.setattr(registry, "fetch_repo", no_fetch)
+        monkeypatch.setattr(registry, "list_tags", missing)
+        assert registry.fetch_repo_snapshots(["o/a"], None, with_meta=False) == {
+            "o/a": None
+        }
+
+    def test_failures_still_raise(self, monkeypatch):
+        def limited(org, repo, token=None, max_pages=50):
+            raise registry.RegistryError("x", status=429, rate_limited=True)
+
+        monkeypatch.setattr(registry, "list_tags", limited)
+        with pytest.raises(registry.RegistryError):
+            registry.fetch_repo_snapshots(["o/a"], None, with_meta=False)
@@ -0,0 +1,100 @@
+"""Tests for services/seeding.py — dependency levels and the level runner."""
+
+import threading
+
+from splent_cli.services.seeding import (
+    SeederTiming,
+    dependency_levels,
+    run_levels,
+    run_seeders,
+)
+
+
+class _Seeder:
+    def __init__(self, log, fail=False):
+        self.log = log
+        self.fail = fail
+
+    def run(self):
+        self.log.append(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("boom")
+
+
+class TestDependencyLevels:
+    def test_independent_features_share_a_level(self):
+        levels = dependency_levels(
+            ["auth", "notepad", "profile"], {"profile": ["auth"]}
+        )
+        assert levels == [["auth", "notepad"], ["profile"]]
+
+    def test_requirements_outside_the_product_are_ignored(self):
+        assert dependency_levels(["a"], {"a": ["not_installed"]}) == [["a"]]
+
+    def test_cycles_run_one_per_level_at_the_end(self):
+        levels = dependency_levels(["x", "a", "b"], {"a": ["b"], "b": ["a"]})
+        assert levels == [["x"], ["a"], ["b"]]
+
+
+class TestRunSeeders:
+    def test_stops_at_the_first_failure(self):
+        log = []
+        timings = run_seeders("f", [_Seeder(log, fail=True), _Seeder(log)])
+        assert len(log) == 1
+        assert [t.name for t in timings] == ["_Seeder"]
+        assert isinstance(timings[0].error, RuntimeError)
+
+
+class TestRunLevels:
+    def test_levels_run_in_order_and_features_concurrently(self):
+        started = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run_group(feature, seeders):
+            started.append(feature)
+            if feature in ("a", "b"):
+                # Both features of level one must be running at once.
+                barrier.wait()
+            return [SeederTiming(feature, "S", 0.0)]
+
+        done = []
+        timings = run_levels(
+            [["a", "b"], ["c"]],
+            {"a": [1], "b": [1], "c": [1]},
+            run_group,
+            jobs=2,
+            on_done=done.append,
+        )
+        assert started[-1] == "c"
+        assert sorted(t.feature for t in timings) == ["a", "b", "c"]
+        assert len(done) == 3
+
+    def test_a_failure_stops_after_its_level(self):
+        def run_group(feature, seeders):
+            error = RuntimeError("x") if feature == "a" else None
+            return [SeederTiming(feature, "S", 0.0, error)]
+
+        timings = run_levels(
+            [["a", "b"], ["c"]], {"a": [1], "b": [1], "c": [1]}, run_group, jobs=2
+        )
+        assert sorted(t.feature for t in timings) == ["a", "b"]
+
+    def test_one_job_runs_sequentially_on_the_calling_thread(self):
+        threads = []
+
+        def run_group(feature, seeders):
+            threads.append(threading.current_thread())
+            return [SeederTiming(feature, "S", 0.0)]
+
+        run_levels([["a", "b"]], {"a": [1], "b": [1]}, run_group, jobs=1)
+        assert threads == [threading.current_thread()] * 2
+
+    def test_features_without_seeders_are_skipped(self):
+        calls = []
+        run_levels(
+            [["a", "b"]],
+            {"a": [], "b": [1]},
+            lambda f, s: calls.append(f) or [],
+            jobs=2,
+        )
+        assert calls == ["b"]
@@ -182,9 +182,18 @@ class TestTheProductCarriesTheDoi:
 
 
 class FakeResponse:
-    def __init__(self, text="", status_code=200):
+    def __init__(self, text="", status_code=200, headers=None):
         self.text = text
         self.status_code = status_code
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=1):
+        data = self.text.encode()
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    def close(self):
+        pass
 
 
 @pytest.fixture
@@ -275,6 +284,136 @@ class TestFetching:
         assert fake_get == []
 
 
+class TestRevalidation:
+    """A forced refetch asks with the ETag and keeps the file on a 304."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        seen = []
+        answers = []
+
+        def _get(url, **kwargs):
+            seen.append(kwargs.get("headers") or {})
+            return answers.pop(0)
+
+        import requests
+
+        monkeypatch.setattr(requests, "get", _get)
+        return seen, answers
+
+    def test_the_etag_is_recorded_and_sent_back(self, tmp_path, server):
+        seen, answers = server
+        pin = spl_store.SplPin(name="demo_spl", doi=DOI, version="v2")
+        answers.append(FakeResponse(UVL, headers={"ETag": '"abc"'}))
+        path = spl_store.fetch_uvl(tmp_path, pin, quiet=True)
+
+        answers.append(FakeResponse("", status_code=304))
+        assert spl_store.fetch_uvl(tmp_path, pin, force=True, quiet=True) == path
+
+        assert seen == [{}, {"If-None-Match": '"abc"'}]
+        assert open(path).read() == UVL
+
+    def test_a_changed_model_replaces_the_cached_one(self, tmp_path, server):
+        _, answers = server
+        pin = spl_store.SplPin(name="demo_spl", doi=DOI, version="v2")
+        answers.append(FakeResponse(UVL, headers={"ETag": '"abc"'}))
+        spl_store.fetch_uvl(tmp_path, pin, quiet=True)
+
+        answers.append(FakeResponse("features\n\tnew\n", headers={"ETag": '"def"'}))
+        path = spl_store.fetch_uvl(tmp_path, pin, force=True, quiet=True)
+
+        assert open(path).read() == "features\n\tnew\n"
+        assert (
+            spl_store.cached_etag(spl_store.cache_dir(tmp_path, "demo_spl", "v2"))
+            == '"def"'
+        )
+
+    def test_an_interrupted_download_leaves_the_cached_file_intact(
+        self, tmp_path, server
+    ):
+        import requests
+
+        _, answers = server
+        pin = spl_store.SplPin(name="demo_spl", doi=DOI, version="v2")
+        answers.append(FakeResponse(UVL))
+        path = spl_store.fetch_uvl(tmp_path, pin, quiet=True)
+
+        class _Broken(FakeResponse):
+            def iter_content(self, chunk_size=1):
+                yield b"features\n"
+                raise requests.ConnectionError("reset")
+
+        answers.append(_Broken())
+        with pytest.raises(Exception, match="reset"):
+            spl_store.fetch_uvl(tmp_path, pin, force=True, quiet=True)
+
+        assert open(path).read() == UVL
+        leftovers = [p.name for p in (tmp_path / ".splent_cache").rglob("*.tmp")]
+        assert leftovers == []
+
+
+class TestFetchMany:
+    def test_every_pin_in_flight_at_once_and_shared_dirs_fetched_once(
+        self, tmp_path, monkeypatch
+    ):
+        import threading
+
+        import requests
+
+        together = threading.Barrier(2, timeout=5)
+        seen = []
+
+        def _get(url, **kwargs):
+            seen.append(url)
+            together.wait()
+            return FakeResponse(UVL)
+
+        monkeypatch.setattr(requests, "get", _get)
+        v1 = spl_store.SplPin(name="demo_spl", doi="10.5281/zenodo.1", version="v1")
+        v2 = spl_store.SplPin(name="demo_spl", doi="10.5281/zenodo.2", version="v2")
+
+        results = spl_store.fetch_many(tmp_path, [v1, v2, v1])
+
+        assert len(seen) == 2
+        assert [pin for pin, _, _ in results] == [v1, v2, v1]
+        assert results[0][1] == results[2][1]
+        assert all(error is None for _, _, error in results)
+
+    def test_a_failure_is_reported_not_raised(self, tmp_path, fake_get):
+        results = spl_store.fetch_many(
+            tmp_path,
+            [spl_store.SplPin(name="demo_spl", doi=DOI), spl_store.SplPin(name="x")],
+        )
+        assert results[0][1] and results[0][2] is None
+        assert results[1][1] is None and "nothing to download" in results[1][2]
+
+
+class TestLatestCache:
+    def test_an_answer_is_remembered_until_the_ttl(self, tmp_path, monkeypatch):
+        spl_store.remember_latest(
+            tmp_path, {("uvlhub.io", CONCEPT): ("10.5281/zenodo.9", "v9")}
+        )
+        assert spl_store.cached_latest(tmp_path, "uvlhub.io", CONCEPT) == (
+            "10.5281/zenodo.9",
+            "v9",
+        )
+
+        monkeypatch.setenv(spl_store.LATEST_TTL_ENV, "0")
+        assert spl_store.cached_latest(tmp_path, "uvlhub.io", CONCEPT) is None
+
+    def test_the_cache_file_is_not_mistaken_for_a_model(self, tmp_path):
+        spl_store.remember_latest(
+            tmp_path, {("uvlhub.io", CONCEPT): ("10.5281/zenodo.9", "v9")}
+        )
+        assert spl_store.known_spls(tmp_path) == []
+
+    def test_a_corrupt_cache_is_ignored(self, tmp_path):
+        path = spl_store.latest_cache_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert spl_store.cached_latest(tmp_path, "uvlhub.io", CONCEPT) is None
+
+
 # ---------------------------------------------------------------------------
 # Writing the pin
 # ---------------------------------------------------------------------------
@@ -0,0 +1,261 @@
+"""Tests for services/upgrade_plan.py: resolve every feature once, apply once."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from splent_cli.services import registry, upgrade_plan
+
+
+def _feat(name, version=None, ns="splent_io"):
+    return {
+        "name": name,
+        "version": version,
+        "ns_fs": ns,
+        "ns_github": ns.replace("_", "-"),
+    }
+
+
+class TestReadFeatures:
+    def test_namespace_spellings(self, tmp_path):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            "[tool.splent]\n"
+            'features = ["splent_io/splent_feature_auth@v1.0.0", "splent_feature_mail"]\n'
+        )
+        assert upgrade_plan.read_features(pyproject) == [
+            _feat("splent_feature_auth", "v1.0.0"),
+            _feat("splent_feature_mail"),
+        ]
+
+    def test_missing_pyproject(self, tmp_path):
+        assert upgrade_plan.read_features(tmp_path / "pyproject.toml") == []
+
+
+class TestResolve:
+    def test_every_lookup_is_in_flight_at_once(self, monkeypatch):
+        names = [f"splent_feature_{i}" for i in range(4)]
+        together = threading.Barrier(len(names), timeout=5)
+
+        def latest(ref, token):
+            together.wait()
+            return "v2.0.0"
+
+        monkeypatch.setattr(upgrade_plan, "_latest_rest", latest)
+        plan = upgrade_plan.resolve([_feat(n, "v1.0.0") for n in names], None)
+        assert [u["name"] for u in plan.upgrades] == names
+        assert all(u["latest"] == "v2.0.0" for u in plan.upgrades)
+
+    def test_buckets(self, monkeypatch):
+        answers = {
+            "splent-io/new": "v2.0.0",
+            "splent-io/same": "v1.0.0",
+            "splent-io/editable": "v0.3.0",
+            "splent-io/untagged": None,
+        }
+
+        def latest(ref, token):
+            if ref == "splent-io/limited":
+                raise registry.RegistryError("x", status=403, rate_limited=True)
+            return answers[ref]
+
+        monkeypatch.setattr(upgrade_plan, "_latest_rest", latest)
+        plan = upgrade_plan.resolve(
+            [
+                _feat("new", "v1.0.0"),
+                _feat("same", "v1.0.0"),
+                _feat("editable"),
+                _feat("untagged", "v1.0.0"),
+                _feat("limited", "v1.0.0"),
+            ],
+            None,
+        )
+        assert [(u["name"], u["latest"]) for u in plan.upgrades] == [
+            ("new", "v2.0.0"),
+            ("editable", "v0.3.0"),
+        ]
+        assert plan.current == ["same"]
+        # Neither is reported as current: nothing was compared.
+        assert plan.unchecked == ["untagged", "limited"]
+
+    def test_with_a_token_only_unanswered_repos_go_over_rest(self, monkeypatch):
+        monkeypatch.setattr(
+            registry,
+            "fetch_repo_snapshots",
+            lambda refs, token, with_meta=True: {
+                "splent-io/a": registry.RepoSnapshot(
+                    org="splent-io",
+                    repo="a",
+                    meta={},
+                    tags=["v1.2.0", "v1.10.0"],
+                    tags_complete=True,
+                ),
+                "splent-io/b": None,
+            },
+        )
+        asked = []
+
+        def latest(ref, token):
+            asked.append(ref)
+            return "v3.0.0"
+
+        monkeypatch.setattr(upgrade_plan, "_latest_rest", latest)
+        latest_tags, errors = upgrade_plan.latest_versions(
+            ["splent-io/a", "splent-io/b"], "t0k"
+        )
+        assert latest_tags == {"splent-io/a": "v1.10.0", "splent-io/b": "v3.0.0"}
+        assert asked == ["splent-io/b"] and errors == {}
+
+
+class TestRewritePyproject:
+    def test_all_entries_in_one_pass(self):
+        content = (
+            'features = ["splent-io/splent_feature_auth@v1.0.0", '
+            '"splent-io/splent_feature_mail"]\n'
+        )
+        upgrades = [
+            {**_feat("splent_feature_auth", "v1.0.0"), "latest": "v1.1.0"},
+            {**_feat("splent_feature_mail"), "latest": "v0.2.0"},
+        ]
+        assert upgrade_plan.rewrite_pyproject(content, upgrades) == (
+            'features = ["splent-io/splent_feature_auth@v1.1.0", '
+            '"splent-io/splent_feature_mail@v0.2.0"]\n'
+        )
+
+
+@pytest.fixture
+def product(tmp_path):
+    workspace = tmp_path
+    product_path = workspace / "app"
+    product_path.mkdir()
+    (product_path / "pyproject.toml").write_text(
+        "[tool.splent]\n"
+        'features = ["splent-io/splent_feature_auth@v1.0.0", '
+        '"splent-io/splent_feature_mail@v1.0.0", '
+        '"splent-io/splent_feature_notes@v1.0.0"]\n'
+    )
+    features_dir = product_path / "features" / "splent_io"
+    features_dir.mkdir(parents=True)
+    for name in ("splent_feature_auth", "splent_feature_mail", "splent_feature_notes"):
+        (features_dir / f"{name}@v1.0.0").symlink_to("nowhere")
+    return workspace, product_path
+
+
+def _upgrades(*names):
+    return [{**_feat(n, "v1.0.0"), "latest": "v2.0.0"} for n in names]
+
+
+class TestApply:
+    def test_clones_in_parallel_and_writes_the_pyproject_once(
+        self, product, monkeypatch
+    ):
+        workspace, product_path = product
+        together = threading.Barrier(2, timeout=5)
+
+        def clone(ns_fs, name, version, cache_root):
+            together.wait()
+            (cache_root / ns_fs / f"{name}@{version}").mkdir(parents=True)
+
+        writes = []
+        real_write = upgrade_plan.atomic_write
+
+        def counting_write(path, content):
+            writes.append(Path(path).name)
+            real_write(path, content)
+
+        monkeypatch.setattr(upgrade_plan, "clone_if_missing", clone)
+        monkeypatch.setattr(upgrade_plan, "atomic_write", counting_write)
+        done, failed = upgrade_plan.apply(
+            _upgrades("splent_feature_auth", "splent_feature_mail"),
+            product_path,
+            workspace,
+        )
+
+        assert [u["name"] for u in done] == [
+            "splent_feature_auth",
+            "splent_feature_mail",
+        ]
+        assert failed == []
+        assert writes.count("pyproject.toml") == 1
+        text = (product_path / "pyproject.toml").read_text()
+        assert "splent_feature_auth@v2.0.0" in text
+        assert "splent_feature_mail@v2.0.0" in text
+        assert "splent_feature_notes@v1.0.0" in text
+        features_dir = product_path / "features" / "splent_io"
+        assert (features_dir / "splent_feature_auth@v2.0.0").is_symlink()
+        assert not (features_dir / "splent_feature_auth@v1.0.0").is_symlink()
+        index = json.loads((workspace / ".splent_cache" / "index.json").read_text())
+        assert "splent_io/splent_feature_mail@v2.0.0" in index["entries"]
+
+    def test_a_failed_clone_leaves_that_feature_alone(self, product, monkeypatch):
+        workspace, product_path = product
+
+        def clone(ns_fs, name, version, cache_root):
+            if name == "splent_feature_mail":
+                raise RuntimeError("no such tag")
+            (cache_root / ns_fs / f"{name}@{version}").mkdir(parents=True)
+
+        monkeypatch.setattr(upgrade_plan, "clone_if_missing", clone)
+        done, failed = upgrade_plan.apply(
+            _upgrades("splent_feature_auth", "splent_feature_mail"),
+            product_path,
+            workspace,
+        )
+        assert [u["name"] for u in done] == ["splent_feature_auth"]
+        assert [(u["name"], why) for u, why in failed] == [
+            ("splent_feature_mail", "no such tag")
+        ]
+        text = (product_path / "pyproject.toml").read_text()
+        assert "splent_feature_mail@v1.0.0" in text
+        assert (
+            product_path / "features" / "splent_io" / "splent_feature_mail@v1.0.0"
+        ).is_symlink()
+
+    def test_a_blocked_feature_is_skipped_with_one_manifest_read(
+        self, product, monkeypatch
+    ):
+        workspace, product_path = product
+        (product_path / "splent.manifest.json").write_text(
+            json.dumps(
+                {
+                    "features": {
+                        "splent_io/splent_feature_auth@v1.0.0": {"state": "migrated"}
+                    }
+                }
+            )
+        )
+        reads = []
+        from splent_cli.utils import lifecycle
+
+        # No state blocks an upgrade today; the guard must hold if one does.
+        monkeypatch.setitem(lifecycle.BLOCKED_STATES, "feature:upgrade", {"migrated"})
+        real_read = lifecycle.read_manifest
+        monkeypatch.setattr(
+            lifecycle,
+            "read_manifest",
+            lambda p: reads.append(p) or real_read(p),
+        )
+        monkeypatch.setattr(
+            upgrade_plan,
+            "clone_if_missing",
+            lambda ns, n, v, root: (root / ns / f"{n}@{v}").mkdir(parents=True),
+        )
+        done, failed = upgrade_plan.apply(
+            _upgrades(
+                "splent_feature_auth", "splent_feature_mail", "splent_feature_notes"
+            ),
+            product_path,
+            workspace,
+        )
+        assert len(reads) == 1
+        assert [u["name"] for u, _ in failed] == ["splent_feature_auth"]
+        assert [u["name"] for u in done] == [
+            "splent_feature_mail",
+            "splent_feature_notes",
+        ]
+        assert (
+            "splent_feature_auth@v1.0.0"
+            in (product_path / "pyproject.toml").read_text()
+        )
@@ -0,0 +1,87 @@
+"""Tests for utils/asset_build.py: assets hashing, build stamps, multi config."""
+
+import json
+
+from splent_cli.utils import asset_build
+
+
+def _feature(tmp_path, name="splent_feature_auth"):
+    js = tmp_path / name / "assets" / "js"
+    js.mkdir(parents=True)
+    (js / "scripts.js").write_text("console.log(1);\n")
+    config = js / "webpack.config.js"
+    config.write_text("module.exports = {};\n")
+    return config
+
+
+class TestTreeHash:
+    def test_a_source_change_changes_the_hash(self, tmp_path):
+        config = _feature(tmp_path)
+        root = asset_build.assets_root(config)
+        before = asset_build.tree_hash(root)
+        (config.parent / "scripts.js").write_text("console.log(2);\n")
+        assert asset_build.tree_hash(root) != before
+
+    def test_build_output_is_not_a_source(self, tmp_path):
+        config = _feature(tmp_path)
+        root = asset_build.assets_root(config)
+        before = asset_build.tree_hash(root)
+        (root / "dist").mkdir()
+        (root / "dist" / "bundle.js").write_text("built")
+        assert asset_build.tree_hash(root) == before
+
+    def test_a_rename_changes_the_hash(self, tmp_path):
+        config = _feature(tmp_path)
+        root = asset_build.assets_root(config)
+        before = asset_build.tree_hash(root)
+        (config.parent / "scripts.js").rename(config.parent / "main.js")
+        assert asset_build.tree_hash(root) != before
+
+
+class TestStamps:
+    def test_fresh_only_for_the_same_mode_and_with_output(self, tmp_path):
+        config = _feature(tmp_path)
+        asset_build.record_builds(tmp_path, "app", "development", {"f": "abc"})
+        stamps = asset_build.load_stamps(tmp_path, "app")
+
+        # No dist yet: the last build's output is gone, so build again.
+        assert not asset_build.is_fresh(stamps, "f", "development", "abc", config)
+
+        dist = asset_build.assets_root(config) / "dist"
+        dist.mkdir()
+        (dist / "f.bundle.js").write_text("built")
+        assert asset_build.is_fresh(stamps, "f", "development", "abc", config)
+        assert not asset_build.is_fresh(stamps, "f", "production", "abc", config)
+        assert not asset_build.is_fresh(stamps, "f", "development", "def", config)
+
+    def test_modes_are_kept_side_by_side(self, tmp_path):
+        asset_build.record_builds(tmp_path, "app", "development", {"f": "a"})
+        asset_build.record_builds(tmp_path, "app", "production", {"f": "b"})
+        assert asset_build.load_stamps(tmp_path, "app") == {
+            "f": {"development": "a", "production": "b"}
+        }
+
+    def test_a_corrupt_stamp_file_means_rebuild(self, tmp_path):
+        path = asset_build.stamp_path(tmp_path, "app")
+        path.parent.mkdir(parents=True)
+        path.write_text("{")
+        assert asset_build.load_stamps(tmp_path, "app") == {}
+
+
+class TestMultiConfig:
+    def test_every_feature_is_named_and_cached_apart(self, tmp_path):
+        a = _feature(tmp_path, "splent_feature_a")
+        b = _feature(tmp_path, "splent_feature_b")
+        path = asset_build.write_multi_config(
+            tmp_path,
+            "app",
+            [("splent_feature_a", str(a)), ("splent_feature_b", str(b))],
+            "production",
+        )
+        text = path.read_text()
+        assert json.dumps(str(a.resolve())) in text
+        assert json.dumps(str(b.resolve())) in text
+        assert '"splent_feature_a"' in text and '"splent_feature_b"' in text
+        assert 'type: "filesystem"' in text
+        assert 'const MODE = "production";' in text
+        assert str(asset_build.cache_directory(tmp_path, "app")) in text
@@ -0,0 +1,114 @@
+"""Tests for utils/blob_store.py — hardlinked, content-addressed snapshots."""
+
+import os
+import stat
+
+from splent_cli.utils import blob_store
+from splent_cli.utils.cache_utils import (
+    detach_shared_files,
+    make_feature_readonly,
+    make_feature_writable,
+    rmtree_force,
+    seal_feature,
+)
+
+
+def _snapshot(tmp_path, name, files):
+    path = tmp_path / ".splent_cache" / "features" / "ns" / name
+    for rel, content in files.items():
+        fp = path / rel
+        fp.parent.mkdir(parents=True, exist_ok=True)
+        fp.write_text(content)
+    return path
+
+
+def _store(tmp_path):
+    return blob_store.store_path(tmp_path)
+
+
+class TestDedupeTree:
+    def test_identical_files_share_one_inode(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {"a.html": "same", "b.py": "one"})
+        v2 = _snapshot(tmp_path, "auth@v2", {"a.html": "same", "b.py": "two"})
+        stats = blob_store.DedupeStats()
+        blob_store.dedupe_tree(v1, _store(tmp_path), stats)
+        blob_store.dedupe_tree(v2, _store(tmp_path), stats)
+
+        assert os.stat(v1 / "a.html").st_ino == os.stat(v2 / "a.html").st_ino
+        assert os.stat(v1 / "b.py").st_ino != os.stat(v2 / "b.py").st_ino
+        assert stats.linked == 1 and stats.bytes_saved == 4
+        assert not os.stat(v2 / "a.html").st_mode & stat.S_IWUSR
+
+    def test_second_run_changes_nothing(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {"a": "x"})
+        blob_store.dedupe_tree(v1, _store(tmp_path))
+        again = blob_store.dedupe_tree(v1, _store(tmp_path))
+        assert (again.stored, again.linked) == (0, 0)
+
+    def test_git_directory_is_left_alone(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {".git/config": "x", "a": "x"})
+        stats = blob_store.dedupe_tree(v1, _store(tmp_path))
+        assert stats.files == 1
+        assert os.stat(v1 / ".git" / "config").st_nlink == 1
+
+    def test_executable_bit_is_part_of_the_blob(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {"run.sh": "echo", "data": "echo"})
+        os.chmod(v1 / "run.sh", 0o755)
+        blob_store.dedupe_tree(v1, _store(tmp_path))
+        assert os.stat(v1 / "run.sh").st_ino != os.stat(v1 / "data").st_ino
+        assert os.stat(v1 / "run.sh").st_mode & stat.S_IXUSR
+
+
+class TestGc:
+    def test_only_unlinked_blobs_are_removed(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {"a": "keep"})
+        v2 = _snapshot(tmp_path, "auth@v2", {"a": "drop me"})
+        blob_store.dedupe_tree(v1, _store(tmp_path))
+        blob_store.dedupe_tree(v2, _store(tmp_path))
+        rmtree_force(v2)
+
+        assert blob_store.gc(_store(tmp_path)) == (1, len("drop me"))
+        assert (v1 / "a").read_text() == "keep"
+
+
+class TestCacheUtilsWithBlobs:
+    def _shared(self, tmp_path):
+        v1 = _snapshot(tmp_path, "auth@v1", {"a": "same"})
+        v2 = _snapshot(tmp_path, "auth@v2", {"a": "same"})
+        blob_store.dedupe_tree(v1, _store(tmp_path))
+        blob_store.dedupe_tree(v2, _store(tmp_path))
+        return v1, v2
+
+    def test_deleting_a_snapshot_keeps_shared_blobs_read_only(self, tmp_path):
+        v1, v2 = self._shared(tmp_path)
+        make_feature_writable(str(v2))
+        rmtree_force(v2)
+        assert not v2.exists()
+        assert not os.stat(v1 / "a").st_mode & stat.S_IWUSR
+
+    def test_detach_gives_a_private_writable_copy(self, tmp_path):
+        v1, v2 = self._shared(tmp_path)
+        assert detach_shared_files(str(v2)) == 1
+        make_feature_writable(str(v2))
+        (v2 / "a").write_text("edited")
+        assert (v1 / "a").read_text() == "same"
+
+    def test_readonly_walk_skips_blobs(self, tmp_path, monkeypatch):
+        v1, _ = self._shared(tmp_path)
+        chmodded = []
+        real_chmod = os.chmod
+        monkeypatch.setattr(
+            os, "chmod", lambda p, m: chmodded.append(p) or real_chmod(p, m)
+        )
+        make_feature_readonly(str(v1))
+        assert chmodded == []
+
+    def test_seal_dedupes_only_when_enabled(self, tmp_path, monkeypatch):
+        v1 = _snapshot(tmp_path, "auth@v1", {"a": "x"})
+        seal_feature(str(v1))
+        assert os.stat(v1 / "a").st_nlink == 1
+
+        monkeypatch.setenv(blob_store.DEDUPE_ENV, "1")
+        v2 = _snapshot(tmp_path, "auth@v2", {"a": "x"})
+        seal_feature(str(v2))
+        assert os.stat(v2 / "a").st_nlink == 2
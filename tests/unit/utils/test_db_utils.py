@@ -0,0 +1,102 @@
+"""Tests for splent_cli.utils.db_utils: truncate_data_tables and bulk_insert.
+
+For truncate_data_tables sqlalchemy.inspect and the dedicated connection are
+patched, so no database is needed. What matters: migration bookkeeping
+survives, every data table is TRUNCATEd in one script that turns foreign key
+checks off once, and the connection is closed even when a TRUNCATE fails.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from splent_cli.utils import db_utils
+from splent_cli.utils.db_utils import bulk_insert, truncate_data_tables
+
+
+def _connection(conn):
+    return patch.object(db_utils, "_multi_statement_connection", return_value=conn)
+
+
+def _inspector(names):
+    inspector = MagicMock()
+    inspector.get_table_names.return_value = names
+    return patch("sqlalchemy.inspect", return_value=inspector)
+
+
+def test_truncates_data_tables_only_in_one_script():
+    conn = MagicMock(name="conn")
+    cursor = conn.cursor.return_value
+    cursor.nextset.side_effect = [True, True, None]
+    with _inspector(["user", "alembic_auth", "splent_migrations", "post"]):
+        with _connection(conn):
+            cleared = truncate_data_tables(
+                MagicMock(name="engine"), skip_names=("splent_migrations",)
+            )
+
+    assert cleared == ["user", "post"]
+    cursor.execute.assert_called_once_with(
+        "SET FOREIGN_KEY_CHECKS = 0;\nTRUNCATE TABLE `user`;\nTRUNCATE TABLE `post`;\n"
+    )
+    assert cursor.nextset.call_count == 3
+    conn.commit.assert_called_once()
+    conn.close.assert_called_once()
+
+
+def test_nothing_to_truncate_opens_no_connection():
+    with _inspector(["alembic_auth"]), _connection(None) as connect:
+        assert truncate_data_tables(MagicMock(name="engine")) == []
+    connect.assert_not_called()
+
+
+def test_connection_closed_on_failure():
+    conn = MagicMock(name="conn")
+    conn.cursor.return_value.nextset.side_effect = RuntimeError("lost connection")
+    with _inspector(["user"]), _connection(conn), pytest.raises(RuntimeError):
+        truncate_data_tables(MagicMock(name="engine"))
+
+    conn.commit.assert_not_called()
+    conn.close.assert_called_once()
+
+
+class TestBulkInsert:
+    """bulk_insert runs against a real in-memory SQLite session."""
+
+    def _session(self):
+        from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+        from sqlalchemy.orm import Session
+
+        metadata = MetaData()
+        table = Table(
+            "item",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20)),
+        )
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+        return Session(engine), table
+
+    def test_inserts_every_row_in_batches(self):
+        session, table = self._session()
+        rows = ({"id": i, "name": f"n{i}"} for i in range(25))
+
+        with patch.object(session, "execute", wraps=session.execute) as execute:
+            count = bulk_insert(table, rows, session=session, batch_size=10)
+
+        assert count == 25
+        assert [len(c.args[1]) for c in execute.call_args_list] == [10, 10, 5]
+        assert session.execute(table.select()).fetchall()[-1] == (24, "n24")
+
+    def test_accepts_a_model_class(self):
+        session, table = self._session()
+        model = type("Item", (), {"__table__": table})
+
+        assert bulk_insert(model, [{"id": 1, "name": "a"}], session=session) == 1
+
+    def test_no_rows_still_commits(self):
+        _, table = self._session()
+        session = MagicMock()
+        assert bulk_insert(table, [], session=session) == 0
+        session.execute.assert_not_called()
+        session.commit.assert_called_once()
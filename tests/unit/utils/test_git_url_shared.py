@@ -0,0 +1,143 @@
+"""Tests for git_url.clone_shared — versions checked out from one bare mirror."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from splent_cli.utils import git_url
+from splent_cli.utils.git_url import (
+    CLONE_FAILED,
+    CLONE_REF_NOT_FOUND,
+    CLONE_SUCCESS,
+    clone_shared,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """A local repo with tags v1 and v2 and a branch, served as the only candidate."""
+    repo = tmp_path / "upstream"
+    repo.mkdir()
+    _git(repo, "init", "--quiet", "-b", "main")
+    _git(repo, "config", "user.email", "t@example.com")
+    _git(repo, "config", "user.name", "t")
+    (repo / "big.txt").write_text("shared " * 2000)
+    (repo / "version.txt").write_text("1\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "--quiet", "-m", "v1")
+    _git(repo, "tag", "-a", "v1", "-m", "v1")
+    (repo / "version.txt").write_text("2\n")
+    _git(repo, "commit", "--quiet", "-am", "v2")
+    _git(repo, "tag", "v2")
+    _git(repo, "branch", "develop")
+
+    url = f"file://{repo}"
+    monkeypatch.setattr(
+        git_url, "candidate_urls", lambda ns, name: [(url, url, "https")]
+    )
+    return repo
+
+
+def _clone(tmp_path, ref):
+    dest = tmp_path / "cache" / f"repo@{ref}"
+    mirror = tmp_path / "git" / "repo.git"
+    return clone_shared("ns", "repo", str(dest), str(mirror), ref=ref), dest, mirror
+
+
+class TestCloneShared:
+    def test_versions_share_the_mirror_objects(self, tmp_path, upstream):
+        (outcome, _, _), v1, mirror = _clone(tmp_path, "v1")
+        assert outcome == CLONE_SUCCESS
+        (outcome, _, _), v2, _ = _clone(tmp_path, "v2")
+        assert outcome == CLONE_SUCCESS
+
+        assert (v1 / "version.txt").read_text() == "1\n"
+        assert (v2 / "version.txt").read_text() == "2\n"
+        for dest in (v1, v2):
+            alternates = dest / ".git" / "objects" / "info" / "alternates"
+            assert not os.path.isabs(alternates.read_text().strip())
+            # Nothing was copied: every object lives in the mirror.
+            assert _git(dest, "count-objects", "-v").startswith("count: 0")
+            # Raises if any object the checkout needs is missing.
+            _git(dest, "fsck", "--connectivity-only", "--no-progress")
+        assert _git(mirror, "rev-parse", "refs/splent/v1^{commit}") == _git(
+            upstream, "rev-parse", "v1^{commit}"
+        )
+
+    def test_tag_and_branch_read_like_a_clone(self, tmp_path, upstream):
+        _, v1, _ = _clone(tmp_path, "v1")
+        assert _git(v1, "describe", "--tags", "--exact-match") == "v1"
+        assert _git(v1, "remote", "get-url", "origin").startswith("file://")
+
+        _, develop, _ = _clone(tmp_path, "develop")
+        assert _git(develop, "rev-parse", "--abbrev-ref", "HEAD") == "develop"
+
+    def test_checkout_survives_moving_the_workspace(self, tmp_path, upstream):
+        _clone(tmp_path, "v1")
+        moved = tmp_path.parent / (tmp_path.name + "-moved")
+        shutil.move(str(tmp_path), str(moved))
+        try:
+            assert _git(moved / "cache" / "repo@v1", "log", "--oneline").endswith("v1")
+        finally:
+            shutil.move(str(moved), str(tmp_path))
+
+    def test_missing_ref_is_reported_without_a_directory(self, tmp_path, upstream):
+        (outcome, _, stderr), dest, _ = _clone(tmp_path, "v9")
+        assert outcome == CLONE_REF_NOT_FOUND
+        assert not dest.exists()
+
+    def test_unreachable_repo_fails_without_a_second_attempt(
+        self, tmp_path, monkeypatch
+    ):
+        calls = []
+        real_clone = git_url.clone
+        monkeypatch.setattr(
+            git_url,
+            "candidate_urls",
+            lambda ns, name: [("file:///nowhere", "file:///nowhere", "https")],
+        )
+        monkeypatch.setattr(git_url, "_is_access_or_network", lambda stderr_lc: True)
+        monkeypatch.setattr(
+            git_url, "clone", lambda *a, **k: calls.append(a) or real_clone(*a, **k)
+        )
+        (outcome, _, _), dest, _ = _clone(tmp_path, "v1")
+        assert outcome == CLONE_FAILED
+        assert calls == []
+        assert not dest.exists()
+
+    def test_local_mirror_trouble_falls_back_to_a_plain_clone(self, tmp_path, upstream):
+        mirror = tmp_path / "git" / "repo.git"
+        mirror.parent.mkdir(parents=True)
+        mirror.write_text("not a repository")
+        dest = tmp_path / "cache" / "repo@v2"
+        outcome, _, _ = clone_shared("ns", "repo", str(dest), str(mirror), ref="v2")
+        assert outcome == CLONE_SUCCESS
+        assert (dest / "version.txt").read_text() == "2\n"
+        assert not (dest / ".git" / "objects" / "info" / "alternates").exists()
+
+
+class TestDissociate:
+    def test_copy_gets_its_own_objects(self, tmp_path, upstream):
+        _, v1, mirror = _clone(tmp_path, "v1")
+        copy = tmp_path / "elsewhere" / "deeper" / "repo"
+        shutil.copytree(v1, copy, symlinks=True)
+
+        assert git_url.dissociate(str(copy), source=str(v1))
+        assert not (copy / ".git" / "objects" / "info" / "alternates").exists()
+        shutil.rmtree(mirror)
+        assert _git(copy, "log", "--format=%s") == "v1"
+
+    def test_repo_without_alternates_is_left_alone(self, tmp_path):
+        repo = tmp_path / "plain"
+        _git(tmp_path, "init", "--quiet", str(repo))
+        assert git_url.dissociate(str(repo))
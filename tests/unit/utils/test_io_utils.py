@@ -9,10 +9,14 @@ Covers the hardened behaviors:
     removes the temp file.
   * backup_file returns None when the source is absent and produces a
     byte-identical ``.bak`` copy when present.
+  * read_toml / read_json parse a file once while it is unchanged, hand out
+    a read-only document, and notice changes and atomic_write rewrites.
 
 No docker / git / network / db: pure filesystem against pytest tmp_path.
 """
 
+import os
+
 import click
 import pytest
 
@@ -167,3 +171,89 @@ class TestBackupFile:
         bak = backup_file(src, suffix=".orig")
         assert bak == tmp_path / "pyproject.toml.orig"
         assert bak.read_text(encoding="utf-8") == "data"
+
+
+# --------------------------------------------------------------------------- #
+# memoized parsing
+# --------------------------------------------------------------------------- #
+def _aged(path, seconds=10):
+    """Backdate *path* past the racy window, so it may be cached."""
+    when = path.stat().st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(when, when))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    io_utils.clear_parse_cache()
+    calls = []
+    real = io_utils.tomllib.load
+
+    def counting(handle):
+        calls.append(handle.name)
+        return real(handle)
+
+    monkeypatch.setattr(io_utils.tomllib, "load", counting)
+    yield calls
+    io_utils.clear_parse_cache()
+
+
+class TestParseCache:
+    def test_an_unchanged_file_is_parsed_once(self, tmp_path, parses):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "app"\n')
+        _aged(path)
+        first = io_utils.read_toml(path)
+        assert io_utils.read_toml(path) is first
+        assert load_toml(path)["project"]["name"] == "app"
+        assert len(parses) == 1
+
+    def test_the_shared_document_is_read_only(self, tmp_path, parses):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[tool.splent]\nfeatures = ["a"]\n')
+        shared = load_toml(path, copy=False)
+        with pytest.raises(TypeError):
+            shared["tool"]["splent"]["features"].append("b")
+        with pytest.raises(TypeError):
+            shared["project"] = {}
+        assert isinstance(shared["tool"], dict)
+        assert isinstance(shared["tool"]["splent"]["features"], list)
+
+        copy = load_toml(path)
+        copy["tool"]["splent"]["features"].append("b")
+        assert load_toml(path, copy=False)["tool"]["splent"]["features"] == ["a"]
+
+    def test_a_change_of_size_or_mtime_is_seen(self, tmp_path, parses):
+        path = tmp_path / "data.json"
+        path.write_text('{"v": 1}')
+        _aged(path)
+        assert io_utils.read_json(path) == {"v": 1}
+        path.write_text('{"v": 22}')
+        assert io_utils.read_json(path) == {"v": 22}
+
+    def test_a_just_written_file_is_not_trusted_yet(self, tmp_path, parses):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('version = "1.0.0"\n')
+        io_utils.read_toml(path)
+        # Same size, same inode, quite possibly the same timestamp tick.
+        path.write_text('version = "1.0.1"\n')
+        assert io_utils.read_toml(path)["version"] == "1.0.1"
+
+    def test_atomic_write_invalidates(self, tmp_path, parses):
+        path = tmp_path / "pyproject.toml"
+        path.write_text('version = "1.0.0"\n')
+        _aged(path)
+        io_utils.read_toml(path)
+        assert ("toml", str(path)) in io_utils._parsed
+        atomic_write(path, 'version = "2.0.0"\n')
+        assert ("toml", str(path)) not in io_utils._parsed
+        assert io_utils.read_toml(path)["version"] == "2.0.0"
+
+    def test_copies_and_pickles_are_plain(self, tmp_path):
+        import copy
+        import pickle
+
+        frozen = io_utils.freeze({"a": [1, {"b": 2}]})
+        thawed = copy.deepcopy(frozen)
+        thawed["a"].append(3)
+        assert type(thawed) is dict and type(thawed["a"]) is list
+        assert pickle.loads(pickle.dumps(frozen)) == {"a": [1, {"b": 2}]}
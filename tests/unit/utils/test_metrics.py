@@ -0,0 +1,134 @@
+"""Tests for utils/metrics.py: one record per command run, and its summary."""
+
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from splent_cli.utils import metrics, trace
+
+
+def _record(cmd="product:up", version="1.0.0", ms=100.0, exit=0, **extra):
+    return {"cmd": cmd, "version": version, "ms": ms, "exit": exit, **extra}
+
+
+class TestTimed:
+    def test_a_run_is_appended_with_its_subprocess_tally(self, workspace, monkeypatch):
+        monkeypatch.setenv("SPLENT_APP", "my_app")
+        with metrics.timed("feature:list"):
+            subprocess.run([sys.executable, "-c", "pass"])
+            subprocess.run([sys.executable, "-c", "pass"])
+
+        (record,) = metrics.load(workspace)
+        assert record["cmd"] == "feature:list"
+        assert record["product"] == "my_app"
+        assert record["exit"] == 0
+        assert record["subprocess"][0] == 2
+        assert record["http"] == [0, 0.0]
+        assert record["ms"] >= record["subprocess"][1] > 0
+        assert subprocess.run is trace._original_run
+
+    def test_the_exit_code_is_kept(self, workspace):
+        with pytest.raises(SystemExit):
+            with metrics.timed("product:up"):
+                raise SystemExit(3)
+        with pytest.raises(click.ClickException):
+            with metrics.timed("product:up"):
+                raise click.ClickException("no")
+        assert [r["exit"] for r in metrics.load(workspace)] == [3, 1]
+
+    def test_nothing_is_written_when_turned_off(self, workspace, monkeypatch):
+        monkeypatch.setenv(metrics.METRICS_ENV, "0")
+        with metrics.timed("product:up"):
+            pass
+        assert not metrics.store_dir(workspace).exists()
+
+    def test_no_workspace_no_record(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("WORKING_DIR", str(tmp_path / "missing"))
+        with metrics.timed("product:up"):
+            pass
+        assert not (tmp_path / "missing").exists()
+
+    def test_a_store_that_cannot_be_written_does_not_fail_the_command(
+        self, workspace, monkeypatch
+    ):
+        def boom(*a, **k):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(metrics, "append", boom)
+        with metrics.timed("product:up"):
+            pass
+
+    def test_every_cli_invocation_is_recorded(self, workspace):
+        from splent_cli.cli import cli
+
+        @click.command("metrics-probe")
+        def probe():
+            pass
+
+        cli.add_command(probe)
+        try:
+            runner = CliRunner()
+            assert runner.invoke(cli, ["metrics-probe"]).exit_code == 0
+            assert runner.invoke(cli, ["metrics-probe", "--help"]).exit_code == 0
+        finally:
+            cli.commands.pop("metrics-probe", None)
+        assert [r["cmd"] for r in metrics.load(workspace)] == ["metrics-probe"]
+
+
+class TestStore:
+    def test_rotation_keeps_a_bounded_number_of_files(self, workspace, monkeypatch):
+        monkeypatch.setattr(metrics, "MAX_BYTES", 10)
+        for n in range(6):
+            metrics.append(workspace, _record(ms=n))
+        files = metrics.store_files(workspace)
+        assert len(files) == metrics.KEEP + 1
+        assert [r["ms"] for r in metrics.load(workspace)] == [2, 3, 4, 5]
+
+    def test_broken_lines_are_skipped(self, workspace):
+        metrics.append(workspace, _record())
+        path = metrics.store_dir(workspace) / metrics.FILENAME
+        with open(path, "a") as handle:
+            handle.write('{"cmd": "x"\n')
+        assert len(metrics.load(workspace)) == 1
+        assert json.loads(path.read_text().splitlines()[0])["cmd"] == "product:up"
+
+
+class TestSummary:
+    def test_percentiles(self):
+        values = list(range(1, 101))
+        assert metrics.percentile(values, 50) == 50
+        assert metrics.percentile(values, 95) == 95
+        assert metrics.percentile([], 95) == 0.0
+
+    def test_per_command_and_version_in_first_use_order(self):
+        records = [
+            _record(version="1.1.0", ms=10, subprocess=[1, 4.0]),
+            _record(version="1.0.0", ms=20),
+            _record(cmd="db:seed", ms=5, exit=1),
+        ]
+        summary = metrics.summarize(records)
+        assert [(s.cmd, s.version, s.runs) for s in summary] == [
+            ("db:seed", "1.0.0", 1),
+            ("product:up", "1.1.0", 1),
+            ("product:up", "1.0.0", 1),
+        ]
+        assert summary[0].failures == 1
+        assert summary[1].subprocess_ms == 4.0
+
+    def test_a_slower_latest_version_is_flagged(self):
+        records = [_record(version="1.0.0", ms=100) for _ in range(5)]
+        records += [_record(version="1.1.0", ms=150) for _ in range(5)]
+        records += [_record(cmd="db:seed", version=v, ms=100) for v in "ab" * 5]
+        flagged = metrics.regressions(metrics.summarize(records), threshold=20)
+        assert list(flagged) == ["product:up"]
+        old, new = flagged["product:up"]
+        assert (old.version, new.version) == ("1.0.0", "1.1.0")
+
+    def test_too_few_runs_are_not_compared(self):
+        records = [_record(version="1.0.0", ms=100) for _ in range(5)]
+        records += [_record(version="1.1.0", ms=500) for _ in range(2)]
+        assert metrics.regressions(metrics.summarize(records)) == {}
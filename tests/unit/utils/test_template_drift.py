@@ -6,6 +6,7 @@ from splent_cli.utils.template_drift import (
     feature_ctx,
     file_diff,
     get_stored_cli_version,
+    gitignore_update,
     product_ctx,
     resolve_feature_rel,
     resolve_product_rel,
@@ -228,3 +229,34 @@ class TestResolveFeatureRel:
     def test_only_org_placeholder(self):
         result = resolve_feature_rel("src/{org}/base.py", "splent_io", "auth")
         assert result == "src/splent_io/base.py"
+
+
+# ---------------------------------------------------------------------------
+# gitignore_update
+# ---------------------------------------------------------------------------
+
+TEMPLATE_GITIGNORE = """\
+# Python
+__pycache__/
+
+# Read by product:deploy.
+docker/docker-bake.json
+"""
+
+
+class TestGitignoreUpdate:
+    def test_appends_missing_patterns_with_their_comment(self, tmp_path):
+        path = tmp_path / ".gitignore"
+        path.write_text("__pycache__/\nmy_local_notes.txt\n")
+        assert gitignore_update(path, TEMPLATE_GITIGNORE) == (
+            "__pycache__/\nmy_local_notes.txt\n\n"
+            "# Read by product:deploy.\ndocker/docker-bake.json\n"
+        )
+
+    def test_nothing_missing(self, tmp_path):
+        path = tmp_path / ".gitignore"
+        path.write_text("docker/docker-bake.json\n__pycache__/\n")
+        assert gitignore_update(path, TEMPLATE_GITIGNORE) is None
+
+    def test_no_gitignore(self, tmp_path):
+        assert gitignore_update(tmp_path / ".gitignore", TEMPLATE_GITIGNORE) is None
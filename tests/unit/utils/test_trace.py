@@ -0,0 +1,162 @@
+"""Tests for utils/trace.py: Chrome trace spans for subprocess and HTTP calls."""
+
+import json
+import os
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from splent_cli.utils import trace
+
+
+@pytest.fixture
+def tracing(tmp_path):
+    path = tmp_path / "trace.json"
+    trace.enable(str(path))
+    yield path
+    trace.disable()
+
+
+def _spans(path):
+    trace.flush()
+    return [e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"]
+
+
+class TestOff:
+    def test_nothing_is_wrapped_or_recorded(self):
+        assert subprocess.run is trace._original_run
+        with trace.span("x", "test") as args:
+            args["k"] = 1
+        assert not trace.enabled()
+        assert trace.flush() is None
+
+
+class TestSubprocess:
+    def test_every_run_is_a_span(self, tracing):
+        subprocess.run(
+            [sys.executable, "-c", "print('hello')"], capture_output=True, check=True
+        )
+        subprocess.run([sys.executable, "-c", "import sys; sys.exit(3)"])
+
+        ok, failed = _spans(tracing)
+        assert ok["cat"] == "subprocess"
+        assert ok["name"].startswith("python")
+        assert ok["args"]["exit_code"] == 0
+        assert ok["args"]["stdout_bytes"] == len("hello\n")
+        assert failed["args"]["exit_code"] == 3
+        assert ok["dur"] >= 0 and ok["ts"] <= failed["ts"]
+
+    def test_check_output_goes_through_it_too(self, tracing):
+        subprocess.check_output([sys.executable, "-c", "print(1)"])
+        (span,) = _spans(tracing)
+        assert span["args"]["exit_code"] == 0
+
+    def test_a_raised_failure_keeps_its_exit_code(self, tracing):
+        with pytest.raises(subprocess.CalledProcessError):
+            subprocess.run([sys.executable, "-c", "raise SystemExit(2)"], check=True)
+        (span,) = _spans(tracing)
+        assert span["args"]["exit_code"] == 2
+        assert span["args"]["error"] == "CalledProcessError"
+
+    def test_url_credentials_never_reach_the_trace(self, tracing, monkeypatch):
+        from splent_cli.utils import git_url
+
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_secret123")
+        url, _ = git_url.https_url("splent-io", "splent_feature_auth")
+        assert "ghp_secret123" in url
+        subprocess.run([sys.executable, "-c", "pass", url])
+
+        (span,) = _spans(tracing)
+        assert "ghp_secret123" not in tracing.read_text()
+        assert "https://***@github.com/" in span["args"]["argv"]
+
+    def test_disable_restores_subprocess_run(self, tmp_path):
+        trace.enable(str(tmp_path / "t.json"))
+        trace.disable()
+        assert subprocess.run is trace._original_run
+
+    def test_the_command_name_is_tool_and_verb(self):
+        assert trace._command_name(["/usr/bin/git", "fetch", "origin"]) == "git fetch"
+        assert trace._command_name(["docker", "-H", "x", "ps"]) == "docker"
+        assert trace._command_name("npx webpack --watch") == "npx webpack"
+
+
+class TestSpans:
+    def test_nested_spans_share_a_thread_and_nest_in_time(self, tracing):
+        with trace.span("outer", "command"):
+            with trace.span("inner", "http", url="u") as args:
+                args["status"] = 200
+        inner, outer = _spans(tracing)
+        assert inner["tid"] == outer["tid"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert inner["args"] == {"url": "u", "status": 200}
+
+    def test_atomic_write_is_a_span_with_its_size(self, tracing, tmp_path):
+        from splent_cli.utils.io_utils import atomic_write
+
+        atomic_write(tmp_path / "pyproject.toml", "x = 1\n")
+        (span,) = _spans(tracing)
+        assert span["cat"] == "fs"
+        assert span["args"]["bytes"] == 6
+
+    def test_registry_requests_record_status_and_bytes(self, tracing, monkeypatch):
+        from splent_cli.services import registry
+
+        class _Resp:
+            status = 200
+
+            def read(self):
+                return b"{}"
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *a):
+                return False
+
+        monkeypatch.setattr(
+            registry.urllib.request, "urlopen", lambda req, timeout=None: _Resp()
+        )
+        registry._request("https://api.github.com/x", {})
+        (span,) = _spans(tracing)
+        assert span["name"] == "GET https://api.github.com/x"
+        assert span["args"]["status"] == 200 and span["args"]["bytes"] == 2
+
+
+class TestCli:
+    def test_trace_option_wraps_the_command(self, tmp_path, monkeypatch):
+        from splent_cli.cli import cli
+
+        @click.command("trace-probe")
+        def probe():
+            subprocess.run([sys.executable, "-c", "pass"])
+
+        cli.add_command(probe)
+        out = tmp_path / "out.json"
+        try:
+            result = CliRunner().invoke(cli, ["--trace", str(out), "trace-probe"])
+            assert result.exit_code == 0, result.output
+            spans = _spans(out)
+        finally:
+            cli.commands.pop("trace-probe", None)
+            trace.disable()
+
+        command = next(s for s in spans if s["cat"] == "command")
+        child = next(s for s in spans if s["cat"] == "subprocess")
+        assert command["name"] == "splent trace-probe"
+        assert command["ts"] <= child["ts"]
+        assert child["ts"] + child["dur"] <= command["ts"] + command["dur"]
+
+    def test_the_env_var_is_not_inherited_by_child_processes(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv(trace.TRACE_ENV, str(tmp_path / "t.json"))
+        trace.enable(str(tmp_path / "t.json"))
+        try:
+            assert trace.TRACE_ENV not in os.environ
+        finally:
+            trace.disable()
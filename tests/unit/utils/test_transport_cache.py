@@ -0,0 +1,115 @@
+"""Tests for utils/transport_cache.py and how git_url and preflight use it."""
+
+import json
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from splent_cli.utils import git_url, transport_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_probe_memo():
+    git_url._ssh_available_cache = None
+    yield
+    git_url._ssh_available_cache = None
+
+
+class TestCacheFile:
+    def test_round_trip(self):
+        transport_cache.remember("github.com", "splent_io", "https", "splent-io")
+        assert transport_cache.preferred("github.com", "splent_io") == (
+            "https",
+            "splent-io",
+        )
+        assert transport_cache.preferred("github.com", "other") is None
+
+    def test_entries_expire(self, monkeypatch):
+        transport_cache.remember_ssh_probe("github.com", False)
+        monkeypatch.setenv(transport_cache.TTL_ENV, "0")
+        assert transport_cache.ssh_probe("github.com") is None
+
+    def test_a_failed_ssh_probe_is_forgotten_sooner(self, monkeypatch):
+        now = 1_000_000.0
+        monkeypatch.setattr(transport_cache.time, "time", lambda: now)
+        transport_cache.remember_ssh_probe("github.com", False)
+        transport_cache.remember_ssh_probe("gitlab.com", True)
+        assert transport_cache.ssh_probe("github.com") is False
+
+        now += transport_cache.NEGATIVE_TTL + 1
+        # A key added since then gets its chance: the probe runs again.
+        assert transport_cache.ssh_probe("github.com") is None
+        assert transport_cache.ssh_probe("gitlab.com") is True
+
+    def test_unreadable_file_is_an_empty_cache(self):
+        transport_cache.cache_path().write_text("{broken")
+        assert transport_cache.ssh_probe("github.com") is None
+        transport_cache.remember_ssh_probe("github.com", True)
+        assert json.loads(transport_cache.cache_path().read_text())
+
+    def test_spelling_only_keeps_the_known_transport(self):
+        transport_cache.remember("github.com", "ns", "ssh", "ns")
+        transport_cache.remember("github.com", "ns", None, "ns")
+        assert transport_cache.preferred("github.com", "ns") == ("ssh", "ns")
+        transport_cache.remember("github.com", "ns", None, "other")
+        assert transport_cache.preferred("github.com", "ns") == ("", "other")
+
+
+class TestGitUrl:
+    def test_ssh_probe_is_not_repeated_by_a_new_process(self, monkeypatch):
+        calls = []
+
+        def probe(*a, **k):
+            calls.append(a)
+            raise subprocess.TimeoutExpired(cmd="ssh", timeout=10)
+
+        monkeypatch.setattr(git_url.subprocess, "run", probe)
+        assert git_url._ssh_available() is False
+        git_url._ssh_available_cache = None  # what a fresh process starts with
+        assert git_url._ssh_available() is False
+        assert len(calls) == 1
+
+    def test_working_transport_is_tried_first_next_time(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        tried = []
+
+        def fake_run(cmd, **kwargs):
+            url = cmd[-2]
+            tried.append(url)
+            if url == "https://github.com/my-org/repo.git":
+                return MagicMock(returncode=0, stderr="", stdout="")
+            return MagicMock(returncode=128, stderr="Permission denied", stdout="")
+
+        monkeypatch.setattr(git_url, "run", fake_run)
+        dest = str(tmp_path / "d")
+        assert git_url.clone("my_org", "repo", dest)[0] == git_url.CLONE_SUCCESS
+        assert len(tried) == 4
+
+        tried.clear()
+        assert git_url.clone("my_org", "repo", dest)[0] == git_url.CLONE_SUCCESS
+        assert tried == ["https://github.com/my-org/repo.git"]
+
+    def test_without_an_entry_ssh_still_goes_first(self):
+        urls = git_url.candidate_urls("acme", "widgets")
+        assert [u[2] for u in urls] == ["ssh", "https"]
+
+
+class TestPreflightTagCheck:
+    def test_remembered_spelling_is_asked_first(self, monkeypatch):
+        from splent_cli.services import preflight
+
+        asked = []
+
+        def fake_run(cmd, **kwargs):
+            asked.append(cmd[3])
+            found = "my-org" in cmd[3]
+            return MagicMock(returncode=0, stdout="abc\trefs/tags/v1" if found else "")
+
+        monkeypatch.setattr("splent_cli.utils.proc.run", fake_run)
+        assert preflight._check_tag_exists("my_org", "repo", "v1")
+        assert len(asked) == 2
+
+        asked.clear()
+        assert preflight._check_tag_exists("my_org", "repo", "v1")
+        assert len(asked) == 1 and "my-org" in asked[0]